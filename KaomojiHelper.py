@@ -1,6 +1,21 @@
 import sys
+from startupProfiler import profiler
+
+if __name__ == '__main__' and '--profile-startup' in sys.argv:
+    profiler.start() # before the imports below, so they get timed
+
+from singleInstance import InstanceServer, parseArguments, sendCommand
+
+if __name__ == '__main__':
+    # A running instance takes the command, before anything heavy gets imported
+    if sendCommand(parseArguments(sys.argv[1:])[0].command):
+        sys.exit()
+
+import os
 import json
-from pynput import keyboard
+import time
+from collections.abc import Sequence
+from lazyImport import lazyImport
 from PySide6.QtWidgets import (
     QApplication,
     QWidget,
@@ -11,15 +26,42 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QFrame,
     QGraphicsEffect,
-    QHeaderView
+    QHeaderView,
+    QAbstractSlider,
+    QCompleter,
+    QMenu,
+    QSystemTrayIcon
 )
-from PySide6.QtCore import Qt, Signal, QObject
-from PySide6.QtGui import QStandardItemModel, QStandardItem
+from PySide6.QtCore import Qt, Signal, QObject, QThreadPool, QStringListModel, QEvent, QResource, QTimer
+from PySide6.QtGui import QKeySequence, QIcon, QCloseEvent
+# Generated with pyside6-uic, e.g. pyside6-uic settingsTab.ui -o settingsTabUi.py
 from ui import Ui_Form
+from recentlyUsedTabUi import Ui_RecentlyUsedTab
+from favoritesTabUi import Ui_FavoritesTab
+from settingsTabUi import Ui_SettingsTab
 from keybinds import Keybinds
 from tabs import Tabs
 from tableItemDelegate import TableItemDelegate
 from tabData import TabData
+from searchIndex import SearchIndex, haystack, normalize
+from searchWorker import SearchSignals, SearchWorker
+from settings import Settings
+from kaomojiCache import KaomojiCache
+from kaomojiStore import KaomojiStore
+from tagTable import TagTable
+from tagCompleter import TagCompleter
+from searchQuery import splitLastWord
+from recentStore import RecentStore
+from journal import Journal
+
+# Keyboard control and monitoring aren't needed for the first paint, pynput is only loaded afterwards
+keyboard = lazyImport('pynput.keyboard')
+keybindMatcher = lazyImport('keybindMatcher')
+clipboardInjector = lazyImport('clipboardInjector')
+
+# Icons, memory-mapped by Qt. Rebuild with: pyside6-rcc --binary resources/resources.qrc -o resources.rcc
+# The .ui files don't include resources.qrc, so uic doesn't generate an import for a compiled resources module
+RESOURCE_BUNDLE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resources.rcc')
 
 class MainWindow(QWidget):
     keyboardSignal = Signal(Keybinds) # signal for keybinds callbacks to be executed in main thread instead of keyboard monitoring thread
@@ -33,48 +75,64 @@ class MainWindow(QWidget):
         self.favoritesData = TabData(Tabs.Favorites)
         self.settingsData = TabData(Tabs.Settings)
         self.currentTab = TabData()
+        self.settings = Settings()
+        self.resident: bool = False # hidden instead of closed, shown again by the hotkey, tray or a later invocation
+        self.trayIcon: QSystemTrayIcon | None = None
 
         # Initialization
+        self.recentlyUsedData.list = RecentStore(self.recentlyUsedData.limit)
         self.mainUI = Ui_Form()
-        self.searchData.list = self.load()
-        self.mainUI.setupUi(self)
-        
-        # Assign UI Labels to tabs
-        self.searchData.label = self.mainUI.SearchStatusLabel
-        self.recentlyUsedData.label = self.mainUI.RecentlyUsedStatusLabel
-        self.favoritesData.label = self.mainUI.FavoritesStatusLabel
+        self.recentlyUsedUI = Ui_RecentlyUsedTab()
+        self.favoritesUI = Ui_FavoritesTab()
+        self.settingsUI = Ui_SettingsTab()
+        if not QResource.registerResource(RESOURCE_BUNDLE):
+            print(f"Could not register {RESOURCE_BUNDLE}, icons will be missing", file=sys.stderr)
+        with profiler.phase('load()'):
+            self.searchData.list, haystacks, tagTable = self.load()
+        with profiler.phase('SearchIndex'):
+            self.searchData.index = SearchIndex(self.searchData.list, haystacks, tagTable)
+            self.tagCompleter = TagCompleter(self.searchData.index)
+        with profiler.phase('journal replay'):
+            self.journal = Journal('kaomojis.journal')
+            self.journal.replay(self.recentlyUsedData.list, self.favoritesData.list, self.searchData.list)
+        with profiler.phase('setupUi'):
+            self.mainUI.setupUi(self)
         
-        # Assign table views to tabs
-        self.searchData.tableView = self.mainUI.SearchTableView
-        self.recentlyUsedData.tableView = self.mainUI.RecentlyUsedTableView
-        self.favoritesData.tableView = self.mainUI.FavoritesTableView
-
-        # For keyboard input and monitoring
-        self.controller: keyboard.Controller = keyboard.Controller()
-        self.listener: keyboard.Listener = keyboard.Listener(onRelease=self.onRelease)
-        self.listener.start()
-
+        self.builtTabs: set[Tabs] = {Tabs.Search} # the other tabs are built the first time they are opened
+        for data in (self.searchData, self.recentlyUsedData, self.favoritesData):
+            data.pagination = self.settings.pagination
+        self.setupTable(self.searchData, self.mainUI.SearchTableView, self.mainUI.SearchStatusLabel)
+
+        # For keyboard input and monitoring, set up once the window is up
+        self.controller = None
+        self.clipboardInjector = None
+        self.keybindMatcher = None
+        self.listener = None
         self.keyboardSignal.connect(self.keybindsCallback)
+        QTimer.singleShot(0, self.startKeyboard)
+
+        # Searches run on a single worker thread, only the latest query gets published
+        self.searchPool = QThreadPool(self)
+        self.searchPool.setMaxThreadCount(1)
+        self.searchGeneration: int = 0
+        self.searchSignals = SearchSignals(self)
+        self.searchSignals.finished.connect(self.searchFinished)
 
         # Search model
-        self.mainUI.SearchTableView.setModel(self.searchData.model)
         self.mainUI.SearchVerticalLayout.addWidget(self.mainUI.SearchTableView)
-        self.mainUI.SearchTableView.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self.mainUI.RecentlyUsedTableView.setModel(self.recentlyUsedData.model)
-        self.mainUI.RecentlyUsedTableView.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self.mainUI.FavoritesTableView.setModel(self.favoritesData.model)
-        self.mainUI.FavoritesTableView.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         
         # Delegate for table view actions
         self.tableItemDelegate = TableItemDelegate()
-        self.mainUI.SearchTableView.verticalHeader().hide()
         self.mainUI.SearchTableView.setItemDelegateForColumn(0, self.tableItemDelegate)
-        self.mainUI.RecentlyUsedTableView.verticalHeader().hide()
-        self.mainUI.RecentlyUsedTableView.setItemDelegate(self.tableItemDelegate)
-        self.mainUI.FavoritesTableView.verticalHeader().hide()
-        self.mainUI.FavoritesTableView.setItemDelegate(self.tableItemDelegate)
         self.tableItemDelegate.kaomojiClicked.connect(self.insertKaomoji)
 
+        # Completion of the tag being typed
+        self.completionModel = QStringListModel(self)
+        self.completer = QCompleter(self.completionModel, self)
+        self.completer.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
+        self.completer.setWidget(self.mainUI.SearchLineEdit)
+        self.completer.activated.connect(self.insertCompletion)
+
         # Connect UI
         self.mainUI.SearchLineEdit.textChanged.connect(self.searchChanged)
         self.mainUI.TabsWidget.currentChanged.connect(self.tabChanged)
@@ -84,61 +142,176 @@ class MainWindow(QWidget):
         self.mainUI.SearchNextButton.clicked.connect(self.nextPage)
         self.mainUI.SearchLastButton.clicked.connect(self.lastPage)
 
-        self.mainUI.RecentlyUsedFirstButton.clicked.connect(self.firstPage)
-        self.mainUI.RecentlyUsedPreviousButton.clicked.connect(self.previousPage)
-        self.mainUI.RecentlyUsedNextButton.clicked.connect(self.nextPage)
-        self.mainUI.RecentlyUsedLastButton.clicked.connect(self.lastPage)
+        self.currentTab = self.searchData
+        with profiler.phase('first updateTab'):
+            self.updateTab(Tabs.Search)
 
-        self.mainUI.FavoritesFirstButton.clicked.connect(self.firstPage)
-        self.mainUI.FavoritesPreviousButton.clicked.connect(self.previousPage)
-        self.mainUI.FavoritesNextButton.clicked.connect(self.nextPage)
-        self.mainUI.FavoritesLastButton.clicked.connect(self.lastPage)
+    def startKeyboard(self):
+        if self.listener is not None:
+            return
+        with profiler.phase('keyboard setup'):
+            self.controller = keyboard.Controller()
+            self.clipboardInjector = clipboardInjector.ClipboardInjector(self.controller)
+            self.keybindMatcher = keybindMatcher.KeybindMatcher({keybind: self.settings.keySequence(keybind) for keybind in Keybinds})
+            self.keybindMatcher.setWindowActive(self.isActiveWindow())
+            self.listener = keyboard.Listener(on_press=self.onPress, on_release=self.keybindMatcher.release)
+            self.listener.start()
+
+    def buildTab(self, tab: Tabs):
+        if tab in self.builtTabs:
+            return
+        self.builtTabs.add(tab)
 
-        self.currentTab = self.searchData
-        self.updateTab(Tabs.Search)
-        self.updateTab(Tabs.RecentlyUsed)
-        self.updateTab(Tabs.Favorites)
+        if tab == Tabs.RecentlyUsed:
+            self.recentlyUsedUI.setupUi(self.mainUI.RecentlyUsedTab)
+            self.setupTable(self.recentlyUsedData, self.recentlyUsedUI.RecentlyUsedTableView, self.recentlyUsedUI.RecentlyUsedStatusLabel)
+            self.recentlyUsedUI.RecentlyUsedTableView.setItemDelegate(self.tableItemDelegate)
+            self.recentlyUsedUI.RecentlyUsedFirstButton.clicked.connect(self.firstPage)
+            self.recentlyUsedUI.RecentlyUsedPreviousButton.clicked.connect(self.previousPage)
+            self.recentlyUsedUI.RecentlyUsedNextButton.clicked.connect(self.nextPage)
+            self.recentlyUsedUI.RecentlyUsedLastButton.clicked.connect(self.lastPage)
+            self.updateTab(tab)
+        if tab == Tabs.Favorites:
+            self.favoritesUI.setupUi(self.mainUI.FavoritesTab)
+            self.setupTable(self.favoritesData, self.favoritesUI.FavoritesTableView, self.favoritesUI.FavoritesStatusLabel)
+            self.favoritesUI.FavoritesTableView.setItemDelegate(self.tableItemDelegate)
+            self.favoritesUI.FavoritesFirstButton.clicked.connect(self.firstPage)
+            self.favoritesUI.FavoritesPreviousButton.clicked.connect(self.previousPage)
+            self.favoritesUI.FavoritesNextButton.clicked.connect(self.nextPage)
+            self.favoritesUI.FavoritesLastButton.clicked.connect(self.lastPage)
+            self.updateTab(tab)
+        if tab == Tabs.Settings:
+            self.settingsUI.setupUi(self.mainUI.SettingsTab)
+            self.setupSettings()
+
+    def setupTable(self, data: TabData, tableView, label):
+        data.tableView = tableView
+        data.label = label
+        tableView.setModel(data.model)
+        tableView.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        tableView.verticalHeader().hide()
+
+        # Rows are only measured once they scroll into view when pagination is disabled
+        tableView.verticalScrollBar().valueChanged.connect(lambda value: self.tableScrolled(data))
+        data.model.rowsInserted.connect(lambda parent, first, last: self.tableScrolled(data))
+        tableView.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        tableView.customContextMenuRequested.connect(lambda position: self.showContextMenu(data, position))
+
+    def setupSettings(self):
+        self.settingsUI.PaginationCheckbox.setChecked(self.settings.pagination)
+        self.settingsUI.PaginationCheckbox.toggled.connect(self.paginationChanged)
+        self.settingsUI.MappedStoreCheckbox.setChecked(self.settings.mappedStore)
+        self.settingsUI.MappedStoreCheckbox.toggled.connect(self.mappedStoreChanged)
+        self.settingsUI.PasteInsertionCheckbox.setChecked(self.settings.pasteInsertion)
+        self.settingsUI.PasteInsertionCheckbox.toggled.connect(self.pasteInsertionChanged)
+        self.settingsUI.FuzzyDistanceSpinBox.setValue(self.settings.fuzzyDistance)
+        self.settingsUI.FuzzyDistanceSpinBox.valueChanged.connect(self.fuzzyDistanceChanged)
+
+        self.keySequenceEdits = {
+            Keybinds.Show: self.settingsUI.ShowWindowKeySequence,
+            Keybinds.Hide: self.settingsUI.HideWindowKeySequence,
+            Keybinds.Prev: self.settingsUI.PreviousPageKeySequence,
+            Keybinds.Next: self.settingsUI.NextPageKeySequence,
+        }
+        for keybind, keySequenceEdit in self.keySequenceEdits.items():
+            keySequenceEdit.setKeySequence(QKeySequence.fromString(self.settings.keySequence(keybind), QKeySequence.SequenceFormat.PortableText))
+            keySequenceEdit.keySequenceChanged.connect(lambda keySequence, keybind=keybind: self.keySequenceChanged(keybind, keySequence))
         
-    def load(self):
+    def load(self, path: str = 'kaomojis.json'):
+        cache = KaomojiCache.open(path)
+        if cache is None:
+            kaomojis, haystacks, tagTable, source, stat = self.loadJson(path)
+            try:
+                KaomojiCache.write(path, source, stat, kaomojis, haystacks, tagTable)
+            except (OSError, ValueError):
+                return kaomojis, haystacks, tagTable # the cache is only an optimization, e.g. the directory may be read-only
+            if not self.settings.mappedStore:
+                return kaomojis, haystacks, tagTable
+            cache = KaomojiCache.open(path)
+            if cache is None:
+                return kaomojis, haystacks, tagTable
+
+        if self.settings.mappedStore:
+            store = KaomojiStore(cache)
+            return store, store.haystacks, store.tagTable
+        kaomojis, haystacks, tagTable = cache.load()
+        cache.close()
+        return kaomojis, haystacks, tagTable
+
+    def loadJson(self, path: str):
         kaomojis = {}
-        with open('kaomojis.json', 'r', encoding='utf-8') as file:
-            data = json.load(file)
+        haystacks = [] # normalized tags, parallel to kaomojis
+        tagTable = TagTable() # every tag occurrence shares one string
+        with open(path, 'rb') as file:
+            stat = os.fstat(file.fileno()) # matches what is read, even if the file is saved meanwhile
+            source = file.read()
+            data = json.loads(source.decode('utf-8'))
             for kaomoji, info in data.items():
                 tags = info.get('tags')
                 if isinstance(kaomoji, str) and isinstance(tags, list) and all(isinstance(tag, str) for tag in tags):
-                    kaomojis[kaomoji] = tags
+                    kaomojis[kaomoji] = tagTable.add(tags)
+                    haystacks.append(haystack(tags))
                 else:
                     raise ValueError("Invalid structure in JSON data.")
-        return kaomojis
+        return kaomojis, haystacks, tagTable, source, stat
 
     def insertKaomoji(self, index):
-        kaomoji = self.currentTab.model.itemFromIndex(index).text()
+        self.useKaomoji(index.data(Qt.ItemDataRole.DisplayRole))
+
+    def useKaomoji(self, kaomoji: str):
+        self.startKeyboard() # an insert command may arrive before it was started
+        if self.isVisible():
+            self.showMinimized()
+        # Typing stays the fallback when the clipboard can't be used
+        if not (self.settings.pasteInsertion and self.clipboardInjector.paste(kaomoji)):
+            self.controller.type(kaomoji)
     
-        self.showMinimized()
-        self.controller.type(kaomoji)
-    
-        recentKaomojis = self.recentlyUsedData.list
-        if kaomoji not in recentKaomojis:
-            recentKaomojis[kaomoji] = self.searchData.list.get(kaomoji, [])
-    
-        recentKaomojis = dict(list(recentKaomojis.items())[-self.recentlyUsedData.limit:])
-        self.recentlyUsedData.list = recentKaomojis
+        now = time.time()
+        self.recentlyUsedData.list.use(kaomoji, self.searchData.list.get(kaomoji, []), now)
+        self.recentlyUsedData.listChanged()
+        self.journal.use(kaomoji, now)
+        self.journal.compact(self.recentlyUsedData.list, self.favoritesData.list)
+        self.clearSearchHistory() # frecency changes the ranking
         self.updateTab(Tabs.RecentlyUsed)
 
-    def onRelease(self, key: keyboard.Key):
-        if hasattr(key, 'char'):
-            if (key.char == 'k'):
-                self.keyboardSignal.emit(Keybinds.Show)
-        if key == keyboard.Key.esc:
-            self.keyboardSignal.emit(Keybinds.Hide)
-        if key == keyboard.Key.left:
-            self.keyboardSignal.emit(Keybinds.Prev)
-        if key == keyboard.Key.right:
-            self.keyboardSignal.emit(Keybinds.Next)
+    def toggleFavorite(self, kaomoji: str):
+        favorites = self.favoritesData.list
+        favorite = kaomoji not in favorites
+        if favorite:
+            favorites[kaomoji] = self.searchData.list.get(kaomoji, [])
+        else:
+            del favorites[kaomoji]
+        self.favoritesData.listChanged()
+        self.journal.favorite(kaomoji, favorite)
+        self.journal.compact(self.recentlyUsedData.list, favorites)
+        self.favoritesData.history.clear()
+        self.updateTab(Tabs.Favorites)
+
+    def showContextMenu(self, data: TabData, position):
+        index = data.tableView.indexAt(position)
+        if not index.isValid():
+            return
+        kaomoji = data.model.index(index.row(), 0).data(Qt.ItemDataRole.DisplayRole)
+        menu = QMenu(self)
+        text = "Remove from favorites" if kaomoji in self.favoritesData.list else "Add to favorites"
+        menu.addAction(text, lambda: self.toggleFavorite(kaomoji))
+        menu.exec(data.tableView.viewport().mapToGlobal(position))
+
+    # Runs in the listener thread for every key pressed system-wide
+    def onPress(self, key):
+        keybind = self.keybindMatcher.press(key)
+        if keybind is not None:
+            self.keyboardSignal.emit(keybind)
+
+    # Hide, previous and next page only listen while the window is active
+    def changeEvent(self, event: QEvent):
+        if event.type() == QEvent.Type.ActivationChange and self.keybindMatcher is not None:
+            self.keybindMatcher.setWindowActive(self.isActiveWindow())
+        super().changeEvent(event)
 
     def keybindsCallback(self, key: Keybinds):
         if key == Keybinds.Show:
-            self.show()
+            self.showWindow()
         if key == Keybinds.Hide:
             self.hide()
         if key == Keybinds.Prev:
@@ -146,7 +319,57 @@ class MainWindow(QWidget):
         if key == Keybinds.Next:
             self.nextPage()
 
+    def setResident(self, resident: bool):
+        self.resident = resident
+        if resident and self.trayIcon is None and QSystemTrayIcon.isSystemTrayAvailable():
+            menu = QMenu(self)
+            menu.addAction("Show", self.showWindow)
+            menu.addAction("Quit", QApplication.quit)
+            self.trayIcon = QSystemTrayIcon(QIcon(':/search/search.png'), self)
+            self.trayIcon.setToolTip("KaomojiHelper")
+            self.trayIcon.setContextMenu(menu)
+            self.trayIcon.activated.connect(self.trayIconActivated)
+        if self.trayIcon is not None:
+            self.trayIcon.setVisible(resident)
+
+    def trayIconActivated(self, reason: QSystemTrayIcon.ActivationReason):
+        if reason == QSystemTrayIcon.ActivationReason.Trigger:
+            self.showWindow()
+
+    def showWindow(self):
+        if self.isMinimized():
+            self.showNormal()
+        self.show()
+        self.raise_()
+        self.activateWindow()
+        self.mainUI.SearchLineEdit.setFocus()
+        self.mainUI.SearchLineEdit.selectAll()
+
+    def runCommand(self, command: list):
+        name, arguments = command[0], command[1:]
+        if name == 'show':
+            self.showWindow()
+        elif name == 'search' and arguments and isinstance(arguments[0], str):
+            self.mainUI.TabsWidget.setCurrentIndex(Tabs.Search.value)
+            self.showWindow()
+            self.mainUI.SearchLineEdit.setText(arguments[0])
+        elif name == 'insert' and arguments and isinstance(arguments[0], int):
+            kaomojis = self.searchData.index.kaomojis
+            if 0 <= arguments[0] < len(kaomojis):
+                self.useKaomoji(kaomojis[arguments[0]])
+
+    def closeEvent(self, event: QCloseEvent):
+        if self.resident:
+            event.ignore()
+            self.hide()
+            return
+        super().closeEvent(event)
+
     def previousPage(self):
+        if not self.currentTab.pagination:
+            self.currentTab.tableView.verticalScrollBar().triggerAction(QAbstractSlider.SliderAction.SliderPageStepSub)
+            return
+
         currentPage = self.currentTab.currentPage
 
         if currentPage > 1:
@@ -154,6 +377,10 @@ class MainWindow(QWidget):
             self.updateTab()
 
     def nextPage(self):
+        if not self.currentTab.pagination:
+            self.currentTab.tableView.verticalScrollBar().triggerAction(QAbstractSlider.SliderAction.SliderPageStepAdd)
+            return
+
         results = self.currentTab.results
         resultsPerPage = self.currentTab.resultsPerPage
         currentPage = self.currentTab.currentPage
@@ -164,11 +391,20 @@ class MainWindow(QWidget):
             self.updateTab()
 
     def firstPage(self):
+        if not self.currentTab.pagination:
+            self.currentTab.tableView.scrollToTop()
+            return
+
         if self.currentTab.currentPage != 1:
             self.currentTab.currentPage = 1
             self.updateTab()
 
     def lastPage(self):
+        if not self.currentTab.pagination:
+            self.currentTab.model.fetchAll()
+            self.currentTab.tableView.scrollToBottom()
+            return
+
         results = self.currentTab.results
         resultsPerPage = self.currentTab.resultsPerPage
         currentPage = self.currentTab.currentPage
@@ -180,12 +416,74 @@ class MainWindow(QWidget):
             self.currentTab.currentPage = totalPages
             self.updateTab()
 
+    def paginationChanged(self, enabled: bool):
+        self.settings.pagination = enabled
+        for data in (self.searchData, self.recentlyUsedData, self.favoritesData):
+            data.pagination = enabled
+            data.currentPage = 1
+            self.updateTab(data.tab)
+
+    def mappedStoreChanged(self, enabled: bool):
+        self.settings.mappedStore = enabled # applied on next start
+
+    def keySequenceChanged(self, keybind: Keybinds, keySequence: QKeySequence):
+        self.settings.setKeySequence(keybind, keySequence.toString(QKeySequence.SequenceFormat.PortableText))
+        if self.keybindMatcher is not None:
+            self.keybindMatcher.compile({keybind: self.settings.keySequence(keybind) for keybind in Keybinds})
+
+    def pasteInsertionChanged(self, enabled: bool):
+        self.settings.pasteInsertion = enabled
+
+    def fuzzyDistanceChanged(self, distance: int):
+        self.settings.fuzzyDistance = distance
+        self.clearSearchHistory()
+        for data in (self.searchData, self.recentlyUsedData, self.favoritesData):
+            data.stale = True
+
+    def clearSearchHistory(self):
+        for data in (self.searchData, self.recentlyUsedData, self.favoritesData):
+            data.history.clear()
+
+    def tableScrolled(self, data: TabData):
+        if not data.pagination:
+            self.resizeVisibleRows(data)
+            self.updateStatus(data)
+
+    def resizeVisibleRows(self, data: TabData):
+        tableView = data.tableView
+        row = tableView.rowAt(0)
+        if row < 0:
+            return
+        rowCount = data.model.rowCount()
+        height = tableView.viewport().height()
+        while row < rowCount and tableView.rowViewportPosition(row) < height:
+            tableView.resizeRowToContents(row)
+            row += 1
+
     def searchChanged(self, text):
         self.search(text)
+        if self.mainUI.SearchLineEdit.hasFocus():
+            self.updateCompletions(text)
+
+    def updateCompletions(self, text: str):
+        word = normalize(splitLastWord(text)[1])
+        completions = self.tagCompleter.complete(word) if word else []
+        if not completions or completions == [word]:
+            self.completer.popup().hide()
+            return
+        self.completionModel.setStringList(completions)
+        self.completer.complete()
+
+    def insertCompletion(self, tag: str):
+        head = splitLastWord(self.mainUI.SearchLineEdit.text())[0]
+        if ' ' in tag and not head.endswith('"'):
+            tag = f'"{tag}"' # keep multi-word tags a single term
+        self.mainUI.SearchLineEdit.setText(head + tag)
 
     def tabChanged(self, index):
         self.currentTab.searchQuery = self.mainUI.SearchLineEdit.text()
         currentTab = Tabs(index)
+        self.buildTab(currentTab)
         
         if currentTab == Tabs.Search:
             self.currentTab = self.searchData
@@ -196,44 +494,77 @@ class MainWindow(QWidget):
         if currentTab == Tabs.Settings:
             self.currentTab = self.settingsData
         self.mainUI.SearchLineEdit.setText(self.currentTab.searchQuery)
+        if self.currentTab.stale: # setText didn't search, the query is unchanged
+            self.search(self.currentTab.searchQuery)
 
     def search(self, query: str):
-        self.currentTab.results.clear()
-        for kaomoji, tags in self.currentTab.list.items():
-            if query.lower() in ' '.join(tags).lower():
-                self.currentTab.results.append((kaomoji, tags))
-        self.currentTab.currentPage = 1
-        self.updateTab()
-
-    def updateSearch(self, data: TabData):
-        data.model.clear()
+        data = self.currentTab
+        data.stale = False
+        query = normalize(query)
+        self.searchGeneration += 1
+        self.searchPool.clear()
+
+        # Nothing to rank, every kaomoji is listed in its own order
+        if not query.strip():
+            self.searchFinished(self.searchGeneration, data, query, [], data.allResults())
+            return
 
-        startIndex = (data.currentPage - 1) * data.resultsPerPage
-        endIndex = startIndex + data.resultsPerPage
+        # A query seen before is reused as is
+        previous = data.history.lookup(query) if query else None
+        if previous is not None and previous[0] == query:
+            self.searchFinished(self.searchGeneration, data, query, previous[1], previous[2])
+            return
 
-        if not self.mainUI.SearchLineEdit.text().strip():
-            data.results.clear()
-            data.results += data.list.items()
-            displayedResults = data.results[startIndex:endIndex]
+        # The index beats filtering, tabs without one narrow their previous results when the query is extended
+        index = self.searchData.index
+        items = list(data.list.items()) if data.index is None else None
+        if data.index is not None:
+            exact = lambda: data.index.results(query)
+        elif previous is not None:
+            exact = lambda: index.filter(query, previous[1])
         else:
-            if not data.results:
-                displayedResults = []
-            else:
-                displayedResults = data.results[startIndex:endIndex]
-
-        data.model.setHorizontalHeaderLabels(["Kaomoji", "Tags"])
-
-        for kaomoji, tags in displayedResults:
-            tagsJoined = ', '.join(tags)
+            exact = lambda: index.filter(query, items)
+
+        # Typo tolerant matches come after the exact ones
+        fuzzyDistance = self.settings.fuzzyDistance
+        if not fuzzyDistance:
+            fuzzy = lambda: []
+        elif data.index is not None:
+            fuzzy = lambda: data.index.fuzzyResults(query, fuzzyDistance)
+        else:
+            fuzzy = lambda: index.fuzzyFilter(query, fuzzyDistance, items)
+
+        # The Search tab is ranked by relevance, the others keep their own order
+        usage = self.recentlyUsedData.list.frecencies()
+        def search():
+            found = exact()
+            if data.index is None:
+                return found, found + fuzzy()
+            return found, data.index.rank(query, found, usage, fuzzy())
+        self.searchPool.start(SearchWorker(self.searchSignals, self.searchGeneration, self.isCurrentSearch, data, query, search))
+
+    def isCurrentSearch(self, generation: int) -> bool:
+        return generation == self.searchGeneration
+
+    def searchFinished(self, generation: int, data: TabData, query: str, exact: list[tuple[str, list[str]]], results: Sequence[tuple[str, list[str]]]):
+        if not self.isCurrentSearch(generation):
+            return
+        if query:
+            data.history.push(query, exact, results)
+        data.results = results
+        data.currentPage = 1
+        self.updateTab(data.tab)
 
-            kaomojiItem = QStandardItem(kaomoji)
-            tagsItem = QStandardItem(tagsJoined)
-            kaomojiItem.setEditable(False)
-            tagsItem.setEditable(False)
+    def updateSearch(self, data: TabData):
+        if not self.mainUI.SearchLineEdit.text().strip():
+            data.results = data.allResults()
 
-            data.model.appendRow([kaomojiItem, tagsItem])
-        
-        data.tableView.resizeRowsToContents()
+        data.model.refresh()
+        if data.pagination:
+            data.tableView.resizeRowsToContents()
+        else:
+            data.tableView.scrollToTop()
+            self.resizeVisibleRows(data)
 
     def updateStatus(self, data: TabData):
         results = data.results
@@ -243,12 +574,18 @@ class MainWindow(QWidget):
             data.label.setText('0-0 results | 0 (total)')
             return
 
-        startIndex = (data.currentPage - 1) * data.resultsPerPage + 1
-        endIndex = min(startIndex + data.resultsPerPage - 1, totalResults)
+        if data.pagination:
+            startIndex = (data.currentPage - 1) * data.resultsPerPage + 1
+            endIndex = min(startIndex + data.resultsPerPage - 1, totalResults)
+        else:
+            tableView = data.tableView
+            startIndex = max(tableView.rowAt(0), 0) + 1
+            lastRow = tableView.rowAt(tableView.viewport().height() - 1)
+            endIndex = lastRow + 1 if lastRow >= 0 else data.model.rowCount()
         data.label.setText(f'{startIndex}-{endIndex} results | {totalResults} (total)')
     
     def updateTab(self, tab=None):
-        data: TabData
+        data: TabData = self.settingsData
 
         if tab is None:
             tab = self.currentTab.tab
@@ -260,6 +597,8 @@ class MainWindow(QWidget):
             data = self.recentlyUsedData
         if tab == Tabs.Favorites:
             data = self.favoritesData
+        if data.tableView is None:
+            return # not built yet, filled when first opened
 
         self.updateSearch(data)
         self.updateStatus(data)
@@ -272,9 +611,23 @@ class MainWindow(QWidget):
         self.move(frameGeometry.topLeft())
 
 def main():
-    app = QApplication(sys.argv)
+    arguments, qtArguments = parseArguments(sys.argv[1:])
+    app = QApplication(sys.argv[:1] + qtArguments)
+    instanceServer = InstanceServer(app)
+    if not instanceServer.listen():
+        sendCommand(arguments.command) # another instance got there first
+        return
     mainWindow = MainWindow()
-    mainWindow.show()
+    instanceServer.commandReceived.connect(mainWindow.runCommand)
+    if arguments.resident:
+        # The window is fully built up front, showing it only maps it
+        app.setQuitOnLastWindowClosed(False)
+        mainWindow.setResident(True)
+        mainWindow.winId()
+        mainWindow.center()
+    if arguments.command is not None:
+        mainWindow.runCommand(arguments.command)
+    QTimer.singleShot(0, profiler.report)
     app.exec()
     mainWindow.center()
 
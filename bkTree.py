@@ -0,0 +1,69 @@
+# Levenshtein distance with the bit-parallel algorithm of Myers/Hyyrö,
+# the columns of the dynamic programming table are packed into integers
+def editDistance(a: str, b: str) -> int:
+    if len(a) < len(b):
+        a, b = b, a
+    length = len(b)
+    if not length:
+        return len(a)
+
+    peq: dict[str, int] = {}
+    for i, char in enumerate(b):
+        peq[char] = peq.get(char, 0) | (1 << i)
+    mask = (1 << length) - 1
+    last = 1 << (length - 1)
+    pv, mv, score = mask, 0, length
+
+    for char in a:
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        ph = (ph << 1) | 1
+        mh = mh << 1
+        pv = (mh | ~(xv | ph)) & mask
+        mv = ph & xv & mask
+    return score
+
+class BKTree():
+    def __init__(self, words=()):
+        self.root: tuple[str, dict[int, tuple]] | None = None # (word, distance -> child)
+        for word in words:
+            self.add(word)
+
+    def add(self, word: str):
+        if self.root is None:
+            self.root = (word, {})
+            return
+        node = self.root
+        while True:
+            distance = editDistance(word, node[0])
+            if distance == 0:
+                return
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = (word, {})
+                return
+            node = child
+
+    # Words within the given distance, as (distance, word) pairs
+    def search(self, word: str, maxDistance: int) -> list[tuple[int, str]]:
+        matches = []
+        if self.root is None:
+            return matches
+        nodes = [self.root]
+        while nodes:
+            nodeWord, children = nodes.pop()
+            distance = editDistance(word, nodeWord)
+            if distance <= maxDistance:
+                matches.append((distance, nodeWord))
+            # Triangle inequality: only children at distance-max..distance+max can match
+            for childDistance, child in children.items():
+                if distance - maxDistance <= childDistance <= distance + maxDistance:
+                    nodes.append(child)
+        return matches
@@ -0,0 +1,49 @@
+import sys
+from pynput import keyboard
+from PySide6.QtCore import QMimeData, QTimer
+from PySide6.QtGui import QGuiApplication
+
+PASTE_MODIFIER = keyboard.Key.cmd if sys.platform == 'darwin' else keyboard.Key.ctrl
+RESTORE_DELAY = 250 # ms left to the target application to read the clipboard
+
+def copyMimeData(mimeData: QMimeData | None) -> QMimeData:
+    copy = QMimeData()
+    if mimeData is not None:
+        for format in mimeData.formats():
+            copy.setData(format, mimeData.data(format))
+    return copy
+
+# Inserts text with a single paste chord, then puts the previous clipboard contents back
+class ClipboardInjector():
+    def __init__(self, controller: keyboard.Controller):
+        self.controller = controller
+        self.saved: QMimeData | None = None
+        self.pasted: str | None = None
+        self.restoreTimer = QTimer()
+        self.restoreTimer.setSingleShot(True)
+        self.restoreTimer.timeout.connect(self.restore)
+
+    # Returns False when the clipboard could not be taken over, so the caller can type instead
+    def paste(self, text: str) -> bool:
+        clipboard = QGuiApplication.clipboard()
+        if self.saved is None: # pastes in a row keep the contents from before the first one
+            self.saved = copyMimeData(clipboard.mimeData())
+        clipboard.setText(text)
+        if clipboard.text() != text:
+            self.restore()
+            return False
+
+        self.pasted = text
+        with self.controller.pressed(PASTE_MODIFIER):
+            self.controller.tap('v')
+        self.restoreTimer.start(RESTORE_DELAY)
+        return True
+
+    def restore(self):
+        self.restoreTimer.stop()
+        clipboard = QGuiApplication.clipboard()
+        # Leave alone anything copied in the meantime
+        if self.saved is not None and self.pasted is not None and clipboard.text() == self.pasted:
+            clipboard.setMimeData(self.saved)
+        self.saved = None
+        self.pasted = None
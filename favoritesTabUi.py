@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'favoritesTab.ui'
+##
+## Created by: Qt User Interface Compiler version 6.7.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QHBoxLayout, QHeaderView, QLabel,
+    QPushButton, QSizePolicy, QTableView, QVBoxLayout,
+    QWidget)
+
+class Ui_FavoritesTab(object):
+    def setupUi(self, FavoritesTab):
+        if not FavoritesTab.objectName():
+            FavoritesTab.setObjectName(u"FavoritesTab")
+        self.verticalLayout_4 = QVBoxLayout(FavoritesTab)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.FavoritesVerticalLayout = QVBoxLayout()
+        self.FavoritesVerticalLayout.setObjectName(u"FavoritesVerticalLayout")
+        self.FavoritesTableView = QTableView(FavoritesTab)
+        self.FavoritesTableView.setObjectName(u"FavoritesTableView")
+
+        self.FavoritesVerticalLayout.addWidget(self.FavoritesTableView)
+
+
+        self.verticalLayout_4.addLayout(self.FavoritesVerticalLayout)
+
+        self.FavoritesHorizontalLayout = QHBoxLayout()
+        self.FavoritesHorizontalLayout.setSpacing(8)
+        self.FavoritesHorizontalLayout.setObjectName(u"FavoritesHorizontalLayout")
+        self.FavoritesFirstButton = QPushButton(FavoritesTab)
+        self.FavoritesFirstButton.setObjectName(u"FavoritesFirstButton")
+        icon = QIcon()
+        icon.addFile(u":/first/first.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        self.FavoritesFirstButton.setIcon(icon)
+
+        self.FavoritesHorizontalLayout.addWidget(self.FavoritesFirstButton)
+
+        self.FavoritesPreviousButton = QPushButton(FavoritesTab)
+        self.FavoritesPreviousButton.setObjectName(u"FavoritesPreviousButton")
+        icon1 = QIcon()
+        icon1.addFile(u":/previous/previous.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        self.FavoritesPreviousButton.setIcon(icon1)
+
+        self.FavoritesHorizontalLayout.addWidget(self.FavoritesPreviousButton)
+
+        self.FavoritesStatusLabel = QLabel(FavoritesTab)
+        self.FavoritesStatusLabel.setObjectName(u"FavoritesStatusLabel")
+        self.FavoritesStatusLabel.setMinimumSize(QSize(180, 24))
+        self.FavoritesStatusLabel.setAlignment(Qt.AlignCenter)
+
+        self.FavoritesHorizontalLayout.addWidget(self.FavoritesStatusLabel)
+
+        self.FavoritesNextButton = QPushButton(FavoritesTab)
+        self.FavoritesNextButton.setObjectName(u"FavoritesNextButton")
+        icon2 = QIcon()
+        icon2.addFile(u":/next/next.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        self.FavoritesNextButton.setIcon(icon2)
+
+        self.FavoritesHorizontalLayout.addWidget(self.FavoritesNextButton)
+
+        self.FavoritesLastButton = QPushButton(FavoritesTab)
+        self.FavoritesLastButton.setObjectName(u"FavoritesLastButton")
+        icon3 = QIcon()
+        icon3.addFile(u":/last/last.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        self.FavoritesLastButton.setIcon(icon3)
+
+        self.FavoritesHorizontalLayout.addWidget(self.FavoritesLastButton)
+
+
+        self.verticalLayout_4.addLayout(self.FavoritesHorizontalLayout)
+
+
+        self.retranslateUi(FavoritesTab)
+
+        QMetaObject.connectSlotsByName(FavoritesTab)
+    # setupUi
+
+    def retranslateUi(self, FavoritesTab):
+        self.FavoritesFirstButton.setText("")
+        self.FavoritesPreviousButton.setText("")
+        self.FavoritesStatusLabel.setText(QCoreApplication.translate("FavoritesTab", u"0-0 results | 0 (total)", None))
+        self.FavoritesNextButton.setText("")
+        self.FavoritesLastButton.setText("")
+        pass
+    # retranslateUi
+
@@ -0,0 +1,116 @@
+import json
+import os
+import threading
+from PySide6.QtCore import QRunnable, QThreadPool
+
+# Append-only log of recently used and favorite kaomojis, one JSON array per line:
+# ['u', time, kaomoji] use, ['f', kaomoji] / ['r', kaomoji] favorite toggled,
+# ['s', score, lastUsed, kaomoji] recent entry written by a compaction
+USE = 'u'
+FAVORITE = 'f'
+UNFAVORITE = 'r'
+RECENT = 's'
+
+class JournalCompaction(QRunnable):
+    def __init__(self, journal: 'Journal', records: list[list], offset: int):
+        super().__init__()
+        self.journal = journal
+        self.records = records
+        self.offset = offset
+
+    def run(self):
+        self.journal.rewrite(self.records, self.offset)
+
+class Journal():
+    def __init__(self, path: str, compactAfter: int = 1024):
+        self.path = path
+        self.compactAfter = compactAfter # records beyond the current state before compacting
+        self.lock = threading.Lock() # guards the file against a compaction swapping it
+        self.file = None
+        self.records: int = 0
+        self.torn: bool = False # the last line was cut short, e.g. by a crash
+        self.compacting: bool = False
+
+    def replay(self, recent, favorites: dict[str, list[str]], kaomojis):
+        self.records = 0
+        try:
+            with open(self.path, 'rb') as file:
+                for line in file:
+                    self.records += 1
+                    self.torn = not line.endswith(b'\n')
+                    try:
+                        record = json.loads(line)
+                        kind, kaomoji = record[0], record[-1]
+                        if kind == USE:
+                            recent.use(kaomoji, kaomojis.get(kaomoji, []), float(record[1]))
+                        elif kind == RECENT:
+                            recent.restore(kaomoji, kaomojis.get(kaomoji, []), float(record[1]), float(record[2]))
+                        elif kind == FAVORITE:
+                            favorites[kaomoji] = kaomojis.get(kaomoji, [])
+                        elif kind == UNFAVORITE:
+                            favorites.pop(kaomoji, None)
+                    except (ValueError, TypeError, IndexError, KeyError):
+                        continue # skip damaged records
+        except OSError:
+            pass
+
+    def use(self, kaomoji: str, now: float):
+        self.append([USE, now, kaomoji])
+
+    def favorite(self, kaomoji: str, favorite: bool):
+        self.append([FAVORITE if favorite else UNFAVORITE, kaomoji])
+
+    def append(self, record: list):
+        line = (json.dumps(record, ensure_ascii=False) + '\n').encode('utf-8')
+        with self.lock:
+            try:
+                if self.file is None:
+                    self.file = open(self.path, 'ab')
+                if self.torn:
+                    line = b'\n' + line
+                    self.torn = False
+                self.file.write(line)
+                self.file.flush()
+            except OSError:
+                return # history is best effort, e.g. the directory may be read-only
+            self.records += 1
+
+    # Rewrites the journal as the current state on a worker thread once enough records piled up
+    def compact(self, recent, favorites: dict[str, list[str]]):
+        if self.compacting or self.records <= self.compactAfter + len(recent) + len(favorites):
+            return
+        records = [[RECENT, entry.score, entry.lastUsed, kaomoji] for kaomoji, entry in recent.entries.items()]
+        records += [[FAVORITE, kaomoji] for kaomoji in favorites]
+        with self.lock:
+            try:
+                offset = self.file.tell() if self.file is not None else os.path.getsize(self.path)
+            except OSError:
+                return
+        self.compacting = True
+        QThreadPool.globalInstance().start(JournalCompaction(self, records, offset))
+
+    def rewrite(self, records: list[list], offset: int):
+        temporaryPath = self.path + '.tmp'
+        try:
+            with open(temporaryPath, 'wb') as file:
+                for record in records:
+                    file.write((json.dumps(record, ensure_ascii=False) + '\n').encode('utf-8'))
+                with self.lock:
+                    # Carry over what was appended since the snapshot, then swap the files
+                    if self.file is not None:
+                        self.file.close()
+                        self.file = None
+                    with open(self.path, 'rb') as journal:
+                        journal.seek(offset)
+                        tail = journal.read()
+                    file.write(tail)
+                    file.close()
+                    os.replace(temporaryPath, self.path)
+                    self.records = len(records) + tail.count(b'\n')
+        except OSError:
+            try:
+                os.remove(temporaryPath)
+            except OSError:
+                pass
+        finally:
+            self.compacting = False
@@ -0,0 +1,179 @@
+import hashlib
+import mmap
+import os
+import struct
+from array import array
+from tagTable import TagTable
+
+# Binary copy of a parsed kaomoji set, stored next to its JSON source:
+# header, source path, then uint32 arrays (kaomoji offsets, haystack offsets,
+# tag offsets, first tag entry of each kaomoji, tag ids, kaomoji ids sorted by
+# their utf-8 bytes) and the utf-8 string table.
+# Every string is followed by a NUL so a whole section can be decoded and split at once
+MAGIC = b'KMJC'
+VERSION = 2
+HEADER = struct.Struct('=4sIQQ32sIIIII') # magic, version, mtime_ns, size, sha256, path length, kaomojis, tags, tag entries, strings length
+MTIME = struct.Struct('=Q')
+MTIME_OFFSET = 8
+
+def cachePath(path: str) -> str:
+    return path + '.cache'
+
+def sourceDigest(source: bytes) -> bytes:
+    return hashlib.sha256(source).digest()
+
+class KaomojiCache():
+    def __init__(self, file, buffer: mmap.mmap):
+        self.file = file
+        self.buffer = buffer
+        view = memoryview(buffer)
+
+        (magic, version, self.mtime, self.size, self.digest, pathLength,
+            self.count, self.tagCount, entryCount, stringsLength) = HEADER.unpack_from(buffer)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Invalid kaomoji cache header.")
+
+        offset = HEADER.size
+        self.path = bytes(view[offset:offset + pathLength]).decode('utf-8')
+        offset += (pathLength + 3) & ~3
+
+        def uints(length: int) -> memoryview:
+            nonlocal offset
+            values = view[offset:offset + length * 4].cast('I')
+            offset += length * 4
+            return values
+
+        self.kaomojiOffsets = uints(self.count + 1)
+        self.haystackOffsets = uints(self.count + 1)
+        self.tagOffsets = uints(self.tagCount + 1)
+        self.tagStarts = uints(self.count + 1)
+        self.tagIds = uints(entryCount)
+        self.kaomojiOrder = uints(self.count)
+        self.strings = view[offset:offset + stringsLength]
+        if len(self.strings) != stringsLength:
+            raise ValueError("Truncated kaomoji cache.")
+
+    @classmethod
+    def open(cls, path: str) -> 'KaomojiCache | None':
+        # Returns None when the cache is missing, unreadable or older than its source
+        try:
+            stat = os.stat(path)
+            file = open(cachePath(path), 'rb')
+        except OSError:
+            return None
+        try:
+            cache = cls(file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+        except (OSError, ValueError, struct.error, TypeError):
+            file.close()
+            return None
+        try:
+            if cache.isFresh(path, stat):
+                return cache
+        except OSError:
+            pass
+        cache.close()
+        return None
+
+    def isFresh(self, path: str, stat: os.stat_result) -> bool:
+        if self.path != os.path.abspath(path) or self.size != stat.st_size:
+            return False
+        if self.mtime == stat.st_mtime_ns:
+            return True
+        # Same size but touched or copied, compare contents
+        with open(path, 'rb') as file:
+            if sourceDigest(file.read()) != self.digest:
+                return False
+        self.updateMtime(path, stat)
+        return True
+
+    # Records the mtime of unchanged contents, so later starts don't hash the source again
+    def updateMtime(self, path: str, stat: os.stat_result):
+        try:
+            with open(cachePath(path), 'r+b') as file:
+                file.seek(MTIME_OFFSET)
+                file.write(MTIME.pack(stat.st_mtime_ns))
+        except OSError:
+            return # e.g. a read-only directory, the contents will be compared again
+        self.mtime = stat.st_mtime_ns
+
+    def string(self, offsets, index: int) -> str:
+        return str(self.strings[offsets[index]:offsets[index + 1] - 1], 'utf-8')
+
+    def section(self, offsets, count: int) -> list[str]:
+        if not count:
+            return []
+        return str(self.strings[offsets[0]:offsets[count] - 1], 'utf-8').split('\0')
+
+    def kaomoji(self, index: int) -> str:
+        return self.string(self.kaomojiOffsets, index)
+
+    def kaomojiBytes(self, index: int) -> bytes:
+        return bytes(self.strings[self.kaomojiOffsets[index]:self.kaomojiOffsets[index + 1] - 1])
+
+    def haystack(self, index: int) -> str:
+        return self.string(self.haystackOffsets, index)
+
+    def tag(self, tagId: int) -> str:
+        return self.string(self.tagOffsets, tagId)
+
+    def tagTable(self, copy: bool = True) -> TagTable:
+        tags = self.section(self.tagOffsets, self.tagCount)
+        if not copy:
+            return TagTable(tags, self.tagStarts, self.tagIds)
+        return TagTable(tags, array('I', self.tagStarts), array('I', self.tagIds))
+
+    def load(self) -> tuple[dict[str, list[str]], list[str], TagTable]:
+        tagTable = self.tagTable()
+        tags = tagTable.tags
+        tagIds, tagStarts = tagTable.tagIds.tolist(), tagTable.tagStarts.tolist()
+        kaomojis = {}
+        for index, kaomoji in enumerate(self.section(self.kaomojiOffsets, self.count)):
+            kaomojis[kaomoji] = [tags[tagId] for tagId in tagIds[tagStarts[index]:tagStarts[index + 1]]]
+        return kaomojis, self.section(self.haystackOffsets, self.count), tagTable
+
+    def close(self):
+        self.strings.release()
+        for values in (self.kaomojiOffsets, self.haystackOffsets, self.tagOffsets, self.tagStarts, self.tagIds, self.kaomojiOrder):
+            values.release()
+        self.buffer.close()
+        self.file.close()
+
+    @staticmethod
+    def write(path: str, source: bytes, stat: os.stat_result, kaomojis: dict[str, list[str]], haystacks: list[str], tagTable: TagTable):
+        strings = bytearray()
+
+        def addString(text: str, offsets: array):
+            if '\0' in text:
+                raise ValueError("Kaomoji set contains NUL characters.")
+            strings.extend(text.encode('utf-8'))
+            strings.append(0)
+            offsets.append(len(strings))
+
+        kaomojiOffsets = array('I', [0])
+        haystackOffsets = array('I')
+        tagOffsets = array('I')
+        encodedKaomojis = [kaomoji.encode('utf-8') for kaomoji in kaomojis]
+        kaomojiOrder = array('I', sorted(range(len(encodedKaomojis)), key=encodedKaomojis.__getitem__))
+
+        for kaomoji in kaomojis:
+            addString(kaomoji, kaomojiOffsets)
+        haystackOffsets.append(len(strings))
+        for text in haystacks:
+            addString(text, haystackOffsets)
+        tagOffsets.append(len(strings))
+        for tag in tagTable.tags:
+            addString(tag, tagOffsets)
+
+        absolutePath = os.path.abspath(path).encode('utf-8')
+        header = HEADER.pack(MAGIC, VERSION, stat.st_mtime_ns, stat.st_size, sourceDigest(source), len(absolutePath),
+            len(kaomojis), len(tagTable), len(tagTable.tagIds), len(strings))
+
+        # Written aside then swapped in, so a running instance never maps a partial file
+        temporaryPath = cachePath(path) + '.tmp'
+        with open(temporaryPath, 'wb') as file:
+            file.write(header)
+            file.write(absolutePath.ljust((len(absolutePath) + 3) & ~3, b'\0'))
+            for values in (kaomojiOffsets, haystackOffsets, tagOffsets, tagTable.tagStarts, tagTable.tagIds, kaomojiOrder):
+                values.tofile(file)
+            file.write(strings)
+        os.replace(temporaryPath, cachePath(path))
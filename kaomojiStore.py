@@ -0,0 +1,111 @@
+from bisect import bisect_left
+from collections.abc import ItemsView, Mapping, Sequence, ValuesView
+from kaomojiCache import KaomojiCache
+from tagTable import TagTable
+
+# Read-only kaomoji set served straight from a memory-mapped KaomojiCache.
+# Only the distinct tags are decoded up front, kaomojis and haystacks are decoded on access.
+
+class StringColumn(Sequence):
+    def __init__(self, cache: KaomojiCache, offsets):
+        self.cache = cache
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        return self.cache.count
+
+    def __getitem__(self, index: int) -> str:
+        if not 0 <= index < self.cache.count:
+            raise IndexError(index)
+        return self.cache.string(self.offsets, index)
+
+    def __iter__(self):
+        return iter(self.cache.section(self.offsets, self.cache.count))
+
+class TagColumn(Sequence):
+    def __init__(self, cache: KaomojiCache, tagTable: TagTable):
+        self.cache = cache
+        self.tags = tagTable.tags
+
+    def __len__(self) -> int:
+        return self.cache.count
+
+    def __getitem__(self, index: int) -> list[str]:
+        if not 0 <= index < self.cache.count:
+            raise IndexError(index)
+        tagStarts = self.cache.tagStarts
+        return [self.tags[tagId] for tagId in self.cache.tagIds[tagStarts[index]:tagStarts[index + 1]]]
+
+    def __iter__(self):
+        tags = self.tags
+        tagIds, tagStarts = self.cache.tagIds.tolist(), self.cache.tagStarts.tolist()
+        for index in range(self.cache.count):
+            yield [tags[tagId] for tagId in tagIds[tagStarts[index]:tagStarts[index + 1]]]
+
+class KaomojiIds():
+    def __init__(self, cache: KaomojiCache):
+        self.cache = cache
+
+    def get(self, kaomoji: str, default: int | None = None) -> int | None:
+        cache = self.cache
+        key = kaomoji.encode('utf-8')
+        order = cache.kaomojiOrder
+        position = bisect_left(order, key, key=cache.kaomojiBytes)
+        if position < len(order) and cache.kaomojiBytes(order[position]) == key:
+            return order[position]
+        return default
+
+class StoreItems(ItemsView):
+    def __iter__(self):
+        return zip(self._mapping.kaomojis, self._mapping.tagLists)
+
+class StoreValues(ValuesView):
+    def __iter__(self):
+        return iter(self._mapping.tagLists)
+
+# (kaomoji, tags) by id, decoded only for the rows asked for
+class StoreSequence(Sequence):
+    def __init__(self, store: 'KaomojiStore'):
+        self.kaomojis = store.kaomojis
+        self.tagLists = store.tagLists
+
+    def __len__(self) -> int:
+        return len(self.kaomojis)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[id] for id in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        return self.kaomojis[index], self.tagLists[index]
+
+class KaomojiStore(Mapping):
+    def __init__(self, cache: KaomojiCache):
+        self.cache = cache
+        self.tagTable = cache.tagTable(copy=False)
+        self.kaomojis = StringColumn(cache, cache.kaomojiOffsets)
+        self.haystacks = StringColumn(cache, cache.haystackOffsets)
+        self.tagLists = TagColumn(cache, self.tagTable)
+        self.ids = KaomojiIds(cache)
+        self.sequence = StoreSequence(self)
+
+    def __getitem__(self, kaomoji: str) -> list[str]:
+        id = self.ids.get(kaomoji)
+        if id is None:
+            raise KeyError(kaomoji)
+        return self.tagLists[id]
+
+    def __contains__(self, kaomoji) -> bool:
+        return isinstance(kaomoji, str) and self.ids.get(kaomoji) is not None
+
+    def __len__(self) -> int:
+        return self.cache.count
+
+    def __iter__(self):
+        return iter(self.kaomojis)
+
+    def items(self) -> StoreItems:
+        return StoreItems(self)
+
+    def values(self) -> StoreValues:
+        return StoreValues(self)
@@ -0,0 +1,88 @@
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QPersistentModelIndex, Qt
+
+class KaomojiTableModel(QAbstractTableModel):
+    headers = ["Kaomoji", "Tags"]
+    fetchSize: int = 100 # rows loaded at once when scrolling instead of paginating
+
+    def __init__(self, data, parent=None):
+        super().__init__(parent)
+        self.tabData = data # TabData whose results are displayed
+        self.start: int = 0
+        self.rows: int = 0
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return self.rows
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self.headers)
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        results = self.tabData.results
+        row = self.start + index.row()
+        if row >= len(results):
+            return None
+        kaomoji, tags = results[row]
+        if index.column() == 0:
+            return kaomoji
+        return ', '.join(tags)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index: QModelIndex | QPersistentModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    # Moves the displayed window to the current page, only signaling the rows that changed
+    def refresh(self):
+        data = self.tabData
+        if data.pagination:
+            start = (data.currentPage - 1) * data.resultsPerPage
+            rows = max(0, min(data.resultsPerPage, len(data.results) - start))
+        else:
+            start = 0
+            rows = min(self.fetchSize, len(data.results))
+
+        self.start = start
+        if rows < self.rows:
+            self.beginRemoveRows(QModelIndex(), rows, self.rows - 1)
+            self.rows = rows
+            self.endRemoveRows()
+        elif rows > self.rows:
+            self.beginInsertRows(QModelIndex(), self.rows, rows - 1)
+            previousRows = self.rows
+            self.rows = rows
+            self.endInsertRows()
+            rows = previousRows
+        if rows:
+            self.dataChanged.emit(self.index(0, 0), self.index(rows - 1, self.columnCount() - 1), [Qt.ItemDataRole.DisplayRole])
+
+    def canFetchMore(self, parent: QModelIndex | QPersistentModelIndex) -> bool:
+        if parent.isValid() or self.tabData.pagination:
+            return False
+        return self.rows < len(self.tabData.results)
+
+    def fetchMore(self, parent: QModelIndex | QPersistentModelIndex):
+        if not self.canFetchMore(parent):
+            return
+        self.fetchRows(min(self.rows + self.fetchSize, len(self.tabData.results)))
+
+    def fetchAll(self):
+        if not self.tabData.pagination:
+            self.fetchRows(len(self.tabData.results))
+
+    def fetchRows(self, rows: int):
+        if rows <= self.rows:
+            return
+        self.beginInsertRows(QModelIndex(), self.rows, rows - 1)
+        self.rows = rows
+        self.endInsertRows()
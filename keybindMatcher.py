@@ -0,0 +1,111 @@
+import sys
+from pynput import keyboard
+from keybinds import Keybinds, GLOBAL_KEYBINDS
+
+CTRL = 1
+ALT = 2
+SHIFT = 4
+META = 8
+
+Key = keyboard.Key
+MODIFIER_KEYS = {
+    Key.ctrl: CTRL, Key.ctrl_l: CTRL, Key.ctrl_r: CTRL,
+    Key.alt: ALT, Key.alt_l: ALT, Key.alt_r: ALT,
+    Key.shift: SHIFT, Key.shift_l: SHIFT, Key.shift_r: SHIFT,
+    Key.cmd: META, Key.cmd_l: META, Key.cmd_r: META,
+}
+
+# Modifier names of Qt portable key sequences. Qt calls Command "Ctrl" and Control "Meta" on macOS
+MODIFIER_NAMES = {'ctrl': META, 'meta': CTRL} if sys.platform == 'darwin' else {'ctrl': CTRL, 'meta': META}
+MODIFIER_NAMES.update({'alt': ALT, 'shift': SHIFT})
+
+KEY_NAMES = {
+    'esc': Key.esc, 'left': Key.left, 'right': Key.right, 'up': Key.up, 'down': Key.down,
+    'space': Key.space, 'return': Key.enter, 'enter': Key.enter, 'tab': Key.tab, 'backspace': Key.backspace,
+    'del': Key.delete, 'home': Key.home, 'end': Key.end, 'pgup': Key.page_up, 'pgdown': Key.page_down,
+    **{f'f{number}': getattr(Key, f'f{number}') for number in range(1, 13)},
+}
+
+# Matches global key presses against the keybinds in the listener thread,
+# so only full chords cross into Qt
+class KeybindMatcher():
+    def __init__(self, keySequences: dict[Keybinds, str]):
+        self.modifiers: int = 0 # modifiers held down right now
+        self.held: dict = {} # modifier key -> its modifier, for keys held down
+        self.chords: dict = {} # key (Key, char or vk) -> modifiers -> keybind, the table in use
+        self.globalChords: dict = {} # only the global keybinds
+        self.allChords: dict = {}
+        self.windowActive: bool = False
+        self.compile(keySequences)
+
+    # Key sequences use the Qt portable text format, e.g. 'Ctrl+Alt+K'
+    # Can be called again from any thread to rebind, the listener keeps running
+    def compile(self, keySequences: dict[Keybinds, str]):
+        globalChords, allChords = {}, {}
+        for keybind, keySequence in keySequences.items():
+            chord = self.parse(keySequence)
+            if chord is None:
+                continue
+            modifiers, keys = chord
+            for key in keys:
+                allChords.setdefault(key, {})[modifiers] = keybind
+                if keybind in GLOBAL_KEYBINDS:
+                    globalChords.setdefault(key, {})[modifiers] = keybind
+        # Tables are swapped whole, the listener thread never sees a partial one
+        self.globalChords, self.allChords = globalChords, allChords
+        self.setWindowActive(self.windowActive)
+
+    def setWindowActive(self, active: bool):
+        self.windowActive = active
+        self.chords = self.allChords if active else self.globalChords
+
+    def parse(self, keySequence: str) -> tuple[int, list] | None:
+        # Only the first chord of a multi-chord sequence is used
+        names = keySequence.split(',')[0].strip().split('+')
+        if not names[-1] and len(names) == 1:
+            return None # unbound
+        if len(names) > 1 and not names[-1]: # the '+' key itself
+            names = names[:-2] + ['+']
+        modifiers = 0
+        for name in names[:-1]:
+            modifier = MODIFIER_NAMES.get(name.strip().lower())
+            if modifier is None:
+                return None
+            modifiers |= modifier
+
+        name = names[-1].strip()
+        key = KEY_NAMES.get(name.lower())
+        if key is not None:
+            return modifiers, [key]
+        if len(name) != 1:
+            return None
+        # Characters come in either case, or as a control character while Ctrl is held on Windows
+        keys = {name.lower(), name.upper()}
+        if name.isalpha() and name.isascii():
+            keys.add(chr(ord(name.upper()) & 0x1f))
+        return modifiers, list(keys)
+
+    # Returns the keybind of a completed chord, None for every other key
+    def press(self, key) -> Keybinds | None:
+        if isinstance(key, keyboard.KeyCode):
+            key = key.char if key.char is not None else key.vk
+        else:
+            modifier = MODIFIER_KEYS.get(key)
+            if modifier is not None:
+                self.held[key] = modifier
+                self.updateModifiers()
+                return None
+        bound = self.chords.get(key)
+        if bound is None:
+            return None
+        return bound.get(self.modifiers)
+
+    def release(self, key):
+        if not isinstance(key, keyboard.KeyCode) and self.held.pop(key, None) is not None:
+            self.updateModifiers()
+
+    def updateModifiers(self):
+        modifiers = 0
+        for modifier in self.held.values():
+            modifiers |= modifier
+        self.modifiers = modifiers
@@ -4,4 +4,15 @@ class Keybinds(Enum):
     Show = 0
     Hide = 1
     Prev = 2
-    Next = 3
\ No newline at end of file
+    Next = 3
+
+# Qt portable key sequences bound by default
+DEFAULT_KEY_SEQUENCES = {
+    Keybinds.Show: 'Ctrl+Alt+K',
+    Keybinds.Hide: 'Esc',
+    Keybinds.Prev: 'Left',
+    Keybinds.Next: 'Right',
+}
+
+# Keybinds listened to while the window is in the background, the others only while it is active
+GLOBAL_KEYBINDS = {Keybinds.Show}
\ No newline at end of file
@@ -0,0 +1,15 @@
+import importlib
+
+# Stands in for a module that isn't needed for the first paint, the import happens on first attribute access
+class LazyModule():
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attribute: str):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attribute)
+
+def lazyImport(name: str) -> LazyModule:
+    return LazyModule(name)
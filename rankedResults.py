@@ -0,0 +1,35 @@
+from collections.abc import Sequence
+from heapq import heapify, heappop
+from typing import Callable
+
+# Results ordered by descending score, sorted lazily: a heap is built over every
+# match and only popped as far as the rows being displayed
+class RankedResults(Sequence):
+    def __init__(self, items, score: Callable[[tuple[str, list[str]]], float], tail: list | None = None):
+        self.heap = [(-score(item), order, item) for order, item in enumerate(items)] # insertion order breaks ties
+        heapify(self.heap)
+        self.ranked: list[tuple[str, list[str]]] = []
+        self.tail = tail if tail is not None else [] # appended after the ranked items, e.g. fuzzy matches
+
+    def __len__(self) -> int:
+        return len(self.ranked) + len(self.heap) + len(self.tail)
+
+    def rank(self, count: int):
+        ranked, heap = self.ranked, self.heap
+        while len(ranked) < count and heap:
+            ranked.append(heappop(heap)[2])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            ids = range(*index.indices(len(self)))
+            if ids:
+                self.rank(max(ids[0], ids[-1]) + 1) # ranked as far as the last row the slice touches
+            return [self[id] for id in ids]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        self.rank(index + 1)
+        if index < len(self.ranked):
+            return self.ranked[index]
+        return self.tail[index - len(self.ranked)]
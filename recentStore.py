@@ -0,0 +1,62 @@
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+
+class RecentEntry():
+    __slots__ = ('tags', 'score', 'lastUsed')
+
+    def __init__(self, tags: list[str], lastUsed: float):
+        self.tags = tags
+        self.score: float = 0.0 # decayed use count as of lastUsed
+        self.lastUsed = lastUsed
+
+# Recently used kaomojis ranked by frecency: every use adds 1 to a score that halves
+# every halfLife seconds. Uses are O(1), the least recently used kaomoji is evicted past the limit
+class RecentStore(Mapping):
+    def __init__(self, limit: int = 100, halfLife: float = 3 * 24 * 3600):
+        self.entries: OrderedDict[str, RecentEntry] = OrderedDict() # least recently used first
+        self.limit = limit
+        self.halfLife = halfLife
+
+    def use(self, kaomoji: str, tags: list[str], now: float | None = None):
+        now = time.time() if now is None else now
+        entry = self.touch(kaomoji, tags, now)
+        entry.score = self.decayed(entry, now) + 1
+        entry.lastUsed = now
+
+    # Puts back an entry as saved, as the most recently used one
+    def restore(self, kaomoji: str, tags: list[str], score: float, lastUsed: float):
+        entry = self.touch(kaomoji, tags, lastUsed)
+        entry.score = score
+        entry.lastUsed = lastUsed
+
+    def touch(self, kaomoji: str, tags: list[str], now: float) -> RecentEntry:
+        entry = self.entries.get(kaomoji)
+        if entry is None:
+            entry = self.entries[kaomoji] = RecentEntry(tags, now)
+            if len(self.entries) > self.limit:
+                self.entries.popitem(last=False)
+        else:
+            self.entries.move_to_end(kaomoji)
+        return entry
+
+    def decayed(self, entry: RecentEntry, now: float) -> float:
+        return entry.score * 0.5 ** (max(now - entry.lastUsed, 0) / self.halfLife)
+
+    def frecencies(self, now: float | None = None) -> dict[str, float]:
+        now = time.time() if now is None else now
+        return {kaomoji: self.decayed(entry, now) for kaomoji, entry in self.entries.items()}
+
+    def __getitem__(self, kaomoji: str) -> list[str]:
+        return self.entries[kaomoji].tags
+
+    def __contains__(self, kaomoji) -> bool:
+        return kaomoji in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    # Highest frecency first, the most recent use breaks ties
+    def __iter__(self):
+        frecencies = self.frecencies()
+        return iter(sorted(reversed(self.entries), key=frecencies.__getitem__, reverse=True))
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'recentlyUsedTab.ui'
+##
+## Created by: Qt User Interface Compiler version 6.7.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QHBoxLayout, QHeaderView, QLabel,
+    QPushButton, QSizePolicy, QTableView, QVBoxLayout,
+    QWidget)
+
+class Ui_RecentlyUsedTab(object):
+    def setupUi(self, RecentlyUsedTab):
+        if not RecentlyUsedTab.objectName():
+            RecentlyUsedTab.setObjectName(u"RecentlyUsedTab")
+        self.verticalLayout_6 = QVBoxLayout(RecentlyUsedTab)
+        self.verticalLayout_6.setObjectName(u"verticalLayout_6")
+        self.RecentlyUsedVerticalLayout = QVBoxLayout()
+        self.RecentlyUsedVerticalLayout.setObjectName(u"RecentlyUsedVerticalLayout")
+        self.RecentlyUsedTableView = QTableView(RecentlyUsedTab)
+        self.RecentlyUsedTableView.setObjectName(u"RecentlyUsedTableView")
+
+        self.RecentlyUsedVerticalLayout.addWidget(self.RecentlyUsedTableView)
+
+
+        self.verticalLayout_6.addLayout(self.RecentlyUsedVerticalLayout)
+
+        self.RecentlyUsedHorizontalLayout = QHBoxLayout()
+        self.RecentlyUsedHorizontalLayout.setSpacing(8)
+        self.RecentlyUsedHorizontalLayout.setObjectName(u"RecentlyUsedHorizontalLayout")
+        self.RecentlyUsedFirstButton = QPushButton(RecentlyUsedTab)
+        self.RecentlyUsedFirstButton.setObjectName(u"RecentlyUsedFirstButton")
+        icon = QIcon()
+        icon.addFile(u":/first/first.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        self.RecentlyUsedFirstButton.setIcon(icon)
+
+        self.RecentlyUsedHorizontalLayout.addWidget(self.RecentlyUsedFirstButton)
+
+        self.RecentlyUsedPreviousButton = QPushButton(RecentlyUsedTab)
+        self.RecentlyUsedPreviousButton.setObjectName(u"RecentlyUsedPreviousButton")
+        icon1 = QIcon()
+        icon1.addFile(u":/previous/previous.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        self.RecentlyUsedPreviousButton.setIcon(icon1)
+
+        self.RecentlyUsedHorizontalLayout.addWidget(self.RecentlyUsedPreviousButton)
+
+        self.RecentlyUsedStatusLabel = QLabel(RecentlyUsedTab)
+        self.RecentlyUsedStatusLabel.setObjectName(u"RecentlyUsedStatusLabel")
+        self.RecentlyUsedStatusLabel.setMinimumSize(QSize(180, 24))
+        self.RecentlyUsedStatusLabel.setAlignment(Qt.AlignCenter)
+
+        self.RecentlyUsedHorizontalLayout.addWidget(self.RecentlyUsedStatusLabel)
+
+        self.RecentlyUsedNextButton = QPushButton(RecentlyUsedTab)
+        self.RecentlyUsedNextButton.setObjectName(u"RecentlyUsedNextButton")
+        icon2 = QIcon()
+        icon2.addFile(u":/next/next.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        self.RecentlyUsedNextButton.setIcon(icon2)
+
+        self.RecentlyUsedHorizontalLayout.addWidget(self.RecentlyUsedNextButton)
+
+        self.RecentlyUsedLastButton = QPushButton(RecentlyUsedTab)
+        self.RecentlyUsedLastButton.setObjectName(u"RecentlyUsedLastButton")
+        icon3 = QIcon()
+        icon3.addFile(u":/last/last.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        self.RecentlyUsedLastButton.setIcon(icon3)
+
+        self.RecentlyUsedHorizontalLayout.addWidget(self.RecentlyUsedLastButton)
+
+
+        self.verticalLayout_6.addLayout(self.RecentlyUsedHorizontalLayout)
+
+
+        self.retranslateUi(RecentlyUsedTab)
+
+        QMetaObject.connectSlotsByName(RecentlyUsedTab)
+    # setupUi
+
+    def retranslateUi(self, RecentlyUsedTab):
+        self.RecentlyUsedFirstButton.setText("")
+        self.RecentlyUsedPreviousButton.setText("")
+        self.RecentlyUsedStatusLabel.setText(QCoreApplication.translate("RecentlyUsedTab", u"0-0 results | 0 (total)", None))
+        self.RecentlyUsedNextButton.setText("")
+        self.RecentlyUsedLastButton.setText("")
+        pass
+    # retranslateUi
+
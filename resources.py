@@ -1,5334 +0,0 @@
-# Resource object code (Python 3)
-# Created by: object code
-# Created by: The Resource Compiler for Qt version 6.7.0
-# WARNING! All changes made in this file will be lost!
-
-from PySide6 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\x12\xcc\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4x\xd4\xfa\
-\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95+\x0e\x1b\x00\x00\x04\xeeiTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 7.1-c000 79\
-.9ccc4de, 2022/0\
-3/14-11:26:19   \
-     \x22> <rdf:RDF\
- xmlns:rdf=\x22http\
-://www.w3.org/19\
-99/02/22-rdf-syn\
-tax-ns#\x22> <rdf:D\
-escription rdf:a\
-bout=\x22\x22 xmlns:xm\
-p=\x22http://ns.ado\
-be.com/xap/1.0/\x22\
- xmlns:dc=\x22http:\
-//purl.org/dc/el\
-ements/1.1/\x22 xml\
-ns:photoshop=\x22ht\
-tp://ns.adobe.co\
-m/photoshop/1.0/\
-\x22 xmlns:xmpMM=\x22h\
-ttp://ns.adobe.c\
-om/xap/1.0/mm/\x22 \
-xmlns:stEvt=\x22htt\
-p://ns.adobe.com\
-/xap/1.0/sType/R\
-esourceEvent#\x22 x\
-mp:CreatorTool=\x22\
-Adobe Photoshop \
-23.3 (Windows)\x22 \
-xmp:CreateDate=\x22\
-2024-04-22T15:07\
-:56+02:00\x22 xmp:M\
-odifyDate=\x222024-\
-04-22T15:34:16+0\
-2:00\x22 xmp:Metada\
-taDate=\x222024-04-\
-22T15:34:16+02:0\
-0\x22 dc:format=\x22im\
-age/png\x22 photosh\
-op:ColorMode=\x223\x22\
- xmpMM:InstanceI\
-D=\x22xmp.iid:5b17f\
-1e2-a287-6149-aa\
-38-16d478420061\x22\
- xmpMM:DocumentI\
-D=\x22xmp.did:5b17f\
-1e2-a287-6149-aa\
-38-16d478420061\x22\
- xmpMM:OriginalD\
-ocumentID=\x22xmp.d\
-id:5b17f1e2-a287\
--6149-aa38-16d47\
-8420061\x22> <xmpMM\
-:History> <rdf:S\
-eq> <rdf:li stEv\
-t:action=\x22create\
-d\x22 stEvt:instanc\
-eID=\x22xmp.iid:5b1\
-7f1e2-a287-6149-\
-aa38-16d47842006\
-1\x22 stEvt:when=\x222\
-024-04-22T15:07:\
-56+02:00\x22 stEvt:\
-softwareAgent=\x22A\
-dobe Photoshop 2\
-3.3 (Windows)\x22/>\
- </rdf:Seq> </xm\
-pMM:History> </r\
-df:Description> \
-</rdf:RDF> </x:x\
-mpmeta> <?xpacke\
-t end=\x22r\x22?>\xb4\x8a*Q\x00\
-\x00\x0d\x84IDATx\xda\xed\xddAn$\xb9\x15\
-E\xd1\x17@\x8dT[\x92V/mI5eOz\
-P\x10J\xd5!\xb62\x93\x8cw\xce\xd4F\xdb\x90?\
->o0\x90\xe1\x1fc\x8c\x00\x00]~\xf8\x13\x00\x80\
-\x00\x00\x00\x04\x00\x00 \x00\x00\x00\x01\x00\x00\x08\x00\x00\
-@\x00\x00\x00\x02\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\
-\x00 \x00\x00\x00\x01\x00\x00\x08\x00\x00@\x00\x00\x00\x02\
-\x00\x00\x10\x00\x00\x80\x00\x00\x00\x01\x00\x00\x08\x00\x00@\
-\x00\x00\x00\x02\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00\
- \x00\x00\x00\x01\x00\x00\x08\x00\x00@\x00\x00\x00\x02\x00\
-\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00 \x00\x00\x00\x01\
-\x00\x00\x02\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00 \
-\x00\x00\x00\x01\x00\x00\x08\x80i\xc7q\x8c\xcf\xfe\xb51\
-\xc6\xe1\x7f>Vg\x86\x01\x01\xf0?\x97\xe5\x7f\xfd{\
--S\xcc0\xc0f\x01\xf0\x95\xa5y\xe6\x9fa\x91b\
-\x86\x01\x16\x0e\x80\xefX\x9a\x9f\xfds-Pv\x9f\xe1\
-$oc\x8c\x17\x7fe\xe02\x01p\x1c\xc7{\x92\xa7\
-{,f!\xc0\x8d\xe6\xeb5\xc9\xf3\x8d\xffc\x9e\xc5\
-,p\x99\x00\xb8\xd5\x13\x93\xdb\x00\xcc0\xc0\xa2\x01p\
-\xef\xc5\xf9\xe1?\xf7\xd7\x18\xe3\xa7\xff\xc9\xd9x\x86\xdd\
-h\x01\xfb\x05\xc0\xa3\x16\xe7o\x9e<I\xb1\xf9\x0c\xbb\
-\x0d\x00\xf6\x0a\x80\x15\x16\xa7\x05\x8a\x19\x06x\xc0\x0d\xc0\
-j\xcb\xdc\x02\xe5\x02A\xe2\xb5\x16\xb0n\x00\xac\xf4\xe4\
-\xf4\xa7\xff^B\x80]g8^k\x01\xab\x06\xc0\xc2\
-\x8b\xd3m\x00g\xe7\xe3\xd5\x0c\x03\x02\xe0\xc2Ox\x16\
-(\x9fx6\xc3\x80\x00\xf8\xdaBz\xdf-\x02\x12\xaf\
-\x04\xd8;d\xcd0\xb0\xc2\x0d\xc0\xd3\x8e\x7f\x10OR\
-|<P\xcd0 \x00\x8a\x16\xbf\x05\x8a\x19\x06\x04\xc0\
-\xd7\x97\xcf\xeb\xee\x7f\x18?\xb3\xe2\x223\xec\x95\x00p\
-\xd7\x1b\x80\xe7\x8b\xfc}\xfc\xcc\xaa\xfc\xf0t\x1b\x00\x08\
-\x80\xf2\xc3\xc0\x02\xc5\x0c\x03\x02\xc0\x02\x85-g8^\
-k\x01\x02`z\x81z\xa7\xca\xce\xbc\xd6\x02\x04\x80\xdb\
-\x00\xcc0 \x00\xb0@1\xc3\x80\x00\xe0\xdc\x02M\xbc\
-\x12\xc0\x0c\x03\x02\xc0\x93\x14\x98a@\x00X\xa0`\x86\
-\x01\x01P\xb0@\x13\xd7\xa9\x98a@\x00x\x92\x023\
-\x0c\x08\x00\x0b\x14\xcc0 \x00,PX~\x86\xe3\xeb\
-\x81 \x00\x98^\xa0\xde\xa9\xb23_\x0f\x04\x01\x80\xdb\
-\x00\xcc0 \x00\xb0@1\xc3\x80\x00\xe0\xdc\x02M\xbc\
-\x12\xc0\x0c\x03\x02\xc0\x93\x14\x98a@\x00X\xa0`\x86\
-\x01\x01P\xb0@\x13\xd7\xa9\x98a@\x00x\x92\x023\
-\x0c\x08\x00\x0b\x14\xcc0 \x00,PX~\x86\xe3\xeb\
-\x81 \x00\x98^\xa0\xde\xa9\xb23_\x0f\x04\x01\x80\xdb\
-\x00\xcc0 \x00\xb0@1\xc3\x80\x00\xe0\xdc\x02M\xbc\
-\x12\xc0\x0c\x03\x02\xc0\x93\x14\x98a@\x00X\xa0`\x86\
-\x01\x01P\xb0@\x13\xd7\xa9\x98a@\x00x\x92\x023\
-\x0c\x08\x00\x0b\x14\xcc0 \x00,PX~\x86\xe3\xeb\
-\x81 \x00\x98^\xa0\xde\xa9\xb23_\x0f\x04\x01\x80\xdb\
-\x00\xcc0 \x00\xb0@1\xc3\x80\x00\xe0\xdc\x02M\xbc\
-\x12\xc0\x0c\x03\x02\xc0\x93\x14\x98a@\x00X\xa0`\x86\
-A\x00P\xb0@\x13\xd7\xa9\x98a@\x00x\x92\x023\
-\x0c\x02\x00\x0b\x14\xcc0\x08\x00,PX~\x86\xe3\xeb\
-\x81 \x00\x98^\xa0\xde\xa9\xb23_\x0f\x04\x01\x80\xdb\
-\x00\xcc0 \x00\xb0@1\xc3\x80\x00\xe0\xdc\x02M\xbc\
-\x12\xc0\x0c\x83\x00\xc0\x93\x14\x98a\x10\x00X\xa0`\x86\
-A\x00P\xb0@\x13\xd7\xa9\x98a\x10\x00x\x92\x023\
-\x0c\x02\x00\x0b\x14\xcc0\x08\x00,PX~\x86\xe3\xeb\
-\x81 \x00\x98^\xa0\xde\xa9\xb23_\x0f\x04\x01\x80\xdb\
-\x00\xcc0\x08\x00\xb0@1\xc3 \x00\xe0\xdc\x02M\xbc\
-\x12\xc0\x0c\x83\x00\xc0\x93\x14\x98a\x10\x00X\xa0`\x86\
-A\x00P\xb0@\xe3gV\xec?\xc3^\x09 \x00`\
-\x82\x9fY\xe16\x00\x04\x00\x16(\x98a\x10\x00X\xa0\
-\xb0\xd9\x0c\xc7k-\x04\x00L/P\xefT\xd9\x99\xd7\
-Z\x08\x00p\x1b\x80\x19\x06\x01\x00\x16(f\x18\x04\x00\
-\x9c[\xa0\x89W\x02\x98a\x10\x00x\x92\x023\x0c\x02\
-\x00\x0b\x14\xcc0\x08\x00\x0a\x16h\xfc\xcc\x8a\xfdg\xd8\
-+\x01\x04\x00L\xf03+\xdc\x06\x80\x00\xc0\x02\x053\
-\x0c\x02\x00\x0b\x146\x9b\xe1x\xad\x85\x00\x80\xe9\x05\xea\
-\x9d*;\xf3Z\x0b\x01\x00n\x030\xc3 \x00\xc0\x02\
-\xc5\x0c\x83\x00\x80s\x0b4\xf1J\x003\x0c\x02\x00O\
-R`\x86A\x00`\x81\x82\x19\x06\x01@\xc1\x02\x8d\x9f\
-Y\xb1\xff\x0c{%\x80\x00\x80\x09~f\x85\xdb\x00\x10\
-\x00X\xa0`\x86A\x00`\x81\xc2f3\x1c\xaf\xb5\x10\
-\x000\xbd@\xbdSeg^k!\x00\xc0m\x00f\
-\x18\x04\x00X\xa0\x98a\x10\x00pn\x81&^\x09`\
-\x86A\x00\xe0I\x0a\xcc0\x08\x00,P0\xc3\x08\x00\
-(X\xa0\xf13+\xf6\x9fa\xaf\x04\x10\x000\xc1\xcf\
-\xacp\x1b\x00\x02\x00\x0b\x14\xcc0\x02\x00,P\xd8l\
-\x86\xe3\xb5\x16\x02\x00\xa6\x17\xa8w\xaa\xec\xcck-\x04\
-\x00\xb8\x0d\xc0\x0c\x83\x00\x00\x0b\x143\x0c\x02\x00\xce-\
-P\x7f\x05\xae0\xc3B\x00\x01\x00\xe06\x00\x04\x00\x80\
-\x08\x00\x01\x00p\xf9\x08H\xbc\x12@\x00\x00\xb8\x0d\x00\
-\x01\x00 \x02\x10\x00\x00\x14D@|=\x10\x01\x00P\
-\xc9\xd7\x03\x11\x00\x00\xcd\xb7\x01\x22@\x00\x00 \x02\x10\
-\x00\x004E@\xe2\xa7\x82\x02\x00\x00\xb7\x01\x08\x00\x00\
-D\x00\x02\x00\x80\x82\x08H\xbc\x12\x10\x00\x00\xb8\x0d@\
-\x00\x00 \x02\x10\x00\x00\x14D@|=P\x00\x00P\
-\xc9\xd7\x03\x05\x00\x00\xcd\xb7\x01\x22@\x00\x00 \x02\x10\
-\x00\x004E@\xe2\xa7\x82\x02\x00\x00\xb7\x01\x08\x00\x00\
-D\x00\x02\x00\x80\x82\x08H\xbc\x12\x10\x00\x00\xb8\x0d@\
-\x00\x00 \x02\x10\x00\x00\x14D@|=P\x00\x00P\
-\xc9\xd7\x03\x05\x00\x00\xcd\xb7\x01\x22@\x00\x00 \x02\x10\
-\x00\x004E@\xe2\xa7\x82\x02\x00\x00\xb7\x01\x08\x00\x00\
-D\x00\x02\x00\x80\x82\x08H\xbc\x12\x10\x00\x00\xb8\x0d@\
-\x00\x00 \x02\x10\x00\x00\x14D@|=P\x00\x00P\
-\xc9\xd7\x03\x05\x00\x00\xcd\xb7\x01\x22@\x00\x00 \x02\x10\
-\x00\x004E@\xe2\xa7\x82\x02\x00\x00\xb7\x01\x08\x00\x00\
-D\x00\x02\x00\x80\x82\x08H\xbc\x12\x10\x00\x00\xb8\x0d@\
-\x00\x00 \x02\x10\x00\x00\x14D@|=P\x00\x00P\
-\xc9\xd7\x03\x05\x00\x00\xcd\xb7\x01\x22@\x00\x00 \x02\x10\
-\x00\x004E@\xe2\xa7\x82\x02\x00\x00\xb7\x01\x08\x00\x00\
-D\x00\x02\x00\x80\x82\x08H\xbc\x12\x10\x00\x00\xb8\x0d@\
-\x00\x00 \x02\x04\x00\x00\x14D@|=P\x00\x00P\
-\xa9\xfe\xeb\x81\x02\x00\x80\xea\xdb\x80\xd6\x08\x10\x00\x00\x88\
-\x80\xc2\x08\x10\x00\x00\x88\x80\xc2\x9f\x0a\x0a\x00\x00(\xbc\
-\x0d\x10\x00\x00P\x18\x01\x02\x00\x00\xfe\x10\x01\xc9\xb5_\
-\x09\x08\x00\x00(\xbc\x0d\x10\x00\x00P\x18\x01\x02\x00\x00\
-ND@.\xf6\xf5@\x01\x00\x00\xe7\x5c\xea\xeb\x81\x02\
-\x00\x00\xbex\x1bp\x85\x08\x10\x00\x00P\x18\x01\x02\x00\
-\x00&# \xd9\xf7\xa7\x82\x02\x00\x00\x0ao\x03\x04\x00\
-\x00\x14F\x80\x00\x00\x80o\x8a\x80d\x9fW\x02\x02\x00\
-\x00\x0ao\x03\x04\x00\x00\x14F\x80\x00\x00\x80\x1bE@\
-\x16\xfez\xa0\x00\x00\x80\xdbY\xf6\xeb\x81\x02\x00\x00\xee\
-p\x1b\xb0Z\x04\x08\x00\x00(\x8c\x00\x01\x00\x00w\x8c\
-\x80d\x8d\x9f\x0a\x0a\x00\x00(\xbc\x0d\x10\x00\x00P\x18\
-\x01\x02\x00\x00\x1e\x18\x01\xc9c^\x09\x08\x00\x00(\xbc\
-\x0d\x10\x00\x00P\x18\x01\x02\x00\x00\x0a#@\x00\x00@\
-a\x04\x08\x00\x00($\x00\x00\xa0\xf0\x16@\x00\x00@\
-a\x04\x08\x00\x00($\x00\x00`\xdd[\x80\xf71\xc6\
-O\x01\x00\x00]\x9e\xdc\x00\x00\x00\x02\x00\x00\x1a\x1c\xc7\
-\xf1:\xc6x\x11\x00\x00\xd0\xe5\xd9\x0d\x00\x00 \x00\x00\
-\x00\x01\x00\x00\x08\x00\x00@\x00\x00\x00\x02\x00\x00\x04\x00\
-\x00 \x00\x00\x00\x01\x00\x00\x08\x00\x00\xe0\x8e\xde\x04\x00\
-\x00\x94\xb9\xc5\xff\x0f\x80\x00\x00\x80R\x02\x00\x00\xd6\xf5\
-v\xab\x7f\xb0\x00\x00\x80E\xdd\xea\xfa_\x00\x00@)\
-\x01\x00\x00k>\xfd\x1f\x02\x00\x00\x1c\xfe\x02\x00\x00\x10\
-\x00\x00\xe0\xe9_\x00\x00\x80\xc3_\x00\x00\x80\xc3_\x00\
-\x00@\xfb\xe1/\x00\x00\xa0\xec\xe0\x17\x00\x00Pz\xf8\
-\x0b\x00\x00(<\xfc\x05\x00\x00\x94\x1d\xfc\x02\x00\x00J\
-\x0f\x7f\x01\x00\x00\x85\x87\xbf\x00\x00\x80\xdb\xfa5\xc6\xf8\
-\xb9\xe2\x7f1\x01\x00\x00%O\xfd\x02\x00\x00\x8a\x0f\x7f\
-\x01\x00\x00\x85\x87\xbf\x00\x00\x80\xb2\x83_\x00\x00@\xe9\
-\xe1/\x00\x00\xa0\xf0\xf0\x17\x00\x00Pv\xf0\x0b\x00\x00\
-(=\xfc\x05\x00\x00\x14\x1e\xfe\x02\x00\x00\xce[\xf6\xab\
-~\x02\x00\x00<\xf5\x0b\x00\x00p\xf8\x0b\x00\x00p\xf8\
-\x0b\x00\x00\xe8;\xf8\x05\x00\x00\x94\x1e\xfe\x02\x00\x00\x0a\
-\x0f\x7f\x01\x00\x00e\x07\xbf\x00\x00\x80\xd2\xc3_\x00\x00\
-\xe0\xf0/%\x00\x00ht\xa9\xaf\xfa\x09\x00\x00\xf0\xd4\
-/\x00\x00\xc0\xe1/\x00\x00p\xf8#\x00\x00p\xf0\x0b\
-\x00\x00p\xf8\x0b\x00\x00p\xf8\x0b\x00\x00p\xf0\x0b\x00\
-\x00p\xf8\x0b\x00\x00p\xf8\x0b\x00\x00\xb8\xab\xfa\xaf\xfa\
-\x09\x00\x00<\xf5#\x00\x00p\xf8#\x00\x00p\xf8#\
-\x00\x00p\xf0\x0b\x00\x00p\xf8\x0b\x00\x00p\xf8\x0b\x00\
-\x00p\xf0\x0b\x00\x00p\xf8\x0b\x00\x00p\xf8\x0b\x00\x00\
-\x98\xe6\xab~\x02\x00\x00O\xfd\x08\x00\x00\x1c\xfe\x08\x00\
-\x00\x1c\xfe\x08\x00\x00\x1c\xfc\x08\x00\x00\x1c\xfe\x08\x00\x00\
-\x1c\xfe\x08\x00\x00\x1c\xfc\x02\x00\x00\x1c\xfe\x02\x00\x00\x1c\
-\xfe\x02\x00\x00f\xf9\xaa\x9f\x00\x00\xc0S?\x02\x00\x00\
-\x87?\x02\x00\x00\x87?\x02\x00\x00\x07?\x02\x00\x00\x87\
-?\x02\x00\x00\x87?\x02\x00\x00\x07?\x02\x00\x00\x87?\
-\x02\x00\x00\x87?\x02\x00\x80Y\xbe\xea'\x00\x00\xf0\xd4\
-\x8f\x00\x00\xc0\xe1\x8f\x00\x00\xc0\xe1\x8f\x00\x00\xc0\xc1\x8f\
-\x00\x00\xc0\xe1\x8f\x00\x00\xc0\xe1\x8f\x00\x00\xc0\xc1\x8f\x00\
-\x00\xc0\xe1\x8f\x00\x00\xc0\xe1\x8f\x00\x00`\x96\xaf\xfa!\
-\x00\x00<\xf5#\x00\x00p\xf8#\x00\x00p\xf8#\x00\
-\x00p\xf0#\x00\x00p\xf8#\x00\x00p\xf8#\x00`\
-\xe7\xa5y\x1c\xc7\xf0\xd7\xc0\xc1\x8f\x00\x00\x8b\x13\xcc0\
-\x02\x00,N0\xc3\x08\x00\xb04\xe1q|\xd5\x0f\x01\
-\x00\x0e\x7f\xcc0\x08\x00\xb081\xc3 \x00\xc0\xe2\xc4\
-\x0c\x83\x00\xc0\xd2\x043\x8c\x00\x00\x8b\x13\xcc0\x02\x00\
-,N0\xc3\x08\x00\xb04\xc1\x0c#\x00\xc0\xe2\x043\
-\x8c\x00\x00\x8b\x13\xcc0\x02\x00,M\x98\xe5\xab~\x08\
-\x00p\xf8c\x86A\x00\x80\xc5\x89\x19\x06\x01\x00\x16'\
-f\x18\x04\x00\x96&\x98a\x10\x00X\x9c`\x86A\x00\
-`q\x82\x19\x06\x01\x80\xa5\x09f\x18\x04\x00\x16'\x98\
-a\x04\x00X\x9c`\x86\x11\x00`i\xc2,_\xf5C\
-\x00\x80\xc3\x1f3\x0c\x02\x00,N\xcc0\x08\x00\xb08\
-1\xc3 \x00\xb04\xc1\x0c\x83\x00\xc0\xe2\x043\x0c\x02\
-\x00\x8b\x13\xcc0\x08\x00,M0\xc3 \x00\xb08\xc1\
-\x0c\x83\x00\xc0\xe2\x043\x0c\x02\x00K\x13f\xf9\xaa\x1f\
-\x02\x00\x1c\xfe\x98a\x10\x00`qb\x86A\x00\x80\xc5\
-\x89\x19\x06\x01\x80\xa5\x09f\x18\x04\x00\x16'\x98a\x10\
-\x00X\x9c`\x86A\x00`i\x82\x19\x06\x01\x80\xc5\x09\
-f\x18\x04\x00\x16'\x98a\x10\x00X\x9a0\xcbW\xfd\
-@\x00\xe0\xf0\xc7\x0c\x83\x00\x00\x8b\x133\x0c\x02\x00,\
-N\xcc0\x08\x00,M0\xc3 \x00\xb08\xc1\x0c\x83\
-\x00\xc0\xe2\x043\x0c\x02\x00K\x13\xcc0\x08\x00,N\
-0\xc3 \x00\xb08\xc1\x0c\x83\x00\xc0\xd2\x84Y\xbe\xea\
-\x07\x02\x00\x87?f\x18\x10\x00X\x9c\x98a@\x00`\
-qb\x86\x01\x01`i\x82\x19\x06\x01\x80\xc5\x09f\x18\
-\x04\x00\x16'\x98a\x10\x00X\x9a`\x86A\x00`q\
-\x82\x19\x06\x01\x80\xc5\x09f\x18\x04\x00\x96&\x98c\x10\
-\x00X\x9a`\x86A\x00`q\x82\x19\x06\x01\x80\xc5\x89\
-\x19\xf6W\x00\x01\x80\xa5\x89\x19\x06\x04\x00\x16'f\x18\
-\x10\x00X\x9c\x98a@\x00X\x9a`\x86\x01\x01`q\
-\x82\x19\x06\x04\x80\xc5\x09f\x18\x10\x00\x96&\x98c@\
-\x00X\x9a`\x86A\x00`q\x82\x19\x06\x01\x80\xc5\x09\
-f\x18\x04\x00\x96&\x98a\x10\x00X\x9c`\x86A\x00\
-`qb\x86\x01\x01\x80\xa5\x89\x19\x06\x04\x00\x16'f\
-\x18\x10\x00\x16\xa7\xbf\x02f\x18\x10\x00\x96&\x98c@\
-\x00X\x9a`\x86\x01\x01`q\x82\x19\x06\x04\x80\xc5\x09\
-f\x18\x10\x00\x96&\x98a@\x00X\x9c`\x86\x01\x01\
-`q\x82\x19\x06\x04\x80\xa5\x09f\x18\x10\x00\x16'\x98\
-a@\x00X\x9c\x98a@\x00`ib\x8e\x01\x01\x80\
-\xa5\x89\x19\x06\x04\x80\xc5\x09f\x18\x10\x00\x7f\xf5\x96\xe4\
-\xf9\x02\x7f\x9f\xb71\xc6\x8b1\xe9<0\x8f\xe3\x18\x0e\
-\x7f@\x00|m\xe1\xbc\xec\xbe<-M\x1c\xfc\x80\x00\
-\xb08\xc1\x0c\x03\x02\xe0\xa4-_\x03X\x9c\xfc>\x0b\
-;\xded\x99a\xe0\xa1\x01\xb0\xdbk\x00K\x13O\xfd\
-\x80\x00\xb08a\xab[\x003\x0c,\x15\x00;,O\
-\x8b\x13\x01\x0b\x08\x80\xa2\x08\xb04\xb9B\xc8\x9ac`\
-\xd9\x00\xb04\xc1\x0c\x03\xa5\x01\xb0\xd2\x13\x94\xc5\x89\x19\
-\x06\xb8\xe3\x0d\xc0\x02\x0b\xd4W\xfd\xd8>\x02\x1c\xfe\xc0\
-v\x01\xf0\xc8\x05jib\x86\x01\x1e\x18\x00\xbf-\xd0\
-\xd7\xdc\xe9#A\x16'f\x18`\x81\x00\xf8w\xa1\xbd\
-$\xc9-\x9f\xa4,M\xcc0\xc0b\x01\xf0q\xc1}\
-\xf7\x12\xb581\xc3\x00\x0b\x07\xc0w.Q\x0b\x133\
-\x0c\xb0Y\x00|\xb6\x00\xff\xb6L-KV\x0e\x013\
-\x0c\x08\x80o\x5c\xa6\xb0{\x10\x00\x08\x00\x00@\x00\x00\
-\x00\x02\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00 \x00\
-\x00\x00\x01\x00\x00\x08\x00\x00@\x00\x00\x80\x00\x00\x00\x04\
-\x00\x00 \x00\x00\x00\x01\x00\x00\x08\x00\x00@\x00\x00\x00\
-\x02\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00 \x00\x00\
-\x00\x01\x00\x00\x08\x00\x00@\x00\x00\x00\x02\x00\x00\x10\x00\
-\x00\x80\x00\x00\x00\x01\x00\x00\x08\x00\x00@\x00\x00\x00\x02\
-\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00 \x00\x00\x00\
-\x01\x00\x00\x08\x00\x00@\x00\x00\x00\x02\x00\x00\x10\x00\x00\
-\x80\x00\x00\x00N\xf9\x07\x96\x89h\xa7\xb5j\x0c)\x00\
-\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00#h\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4x\xd4\xfa\
-\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95+\x0e\x1b\x00\x00\x04\xeeiTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 7.1-c000 79\
-.9ccc4de, 2022/0\
-3/14-11:26:19   \
-     \x22> <rdf:RDF\
- xmlns:rdf=\x22http\
-://www.w3.org/19\
-99/02/22-rdf-syn\
-tax-ns#\x22> <rdf:D\
-escription rdf:a\
-bout=\x22\x22 xmlns:xm\
-p=\x22http://ns.ado\
-be.com/xap/1.0/\x22\
- xmlns:dc=\x22http:\
-//purl.org/dc/el\
-ements/1.1/\x22 xml\
-ns:photoshop=\x22ht\
-tp://ns.adobe.co\
-m/photoshop/1.0/\
-\x22 xmlns:xmpMM=\x22h\
-ttp://ns.adobe.c\
-om/xap/1.0/mm/\x22 \
-xmlns:stEvt=\x22htt\
-p://ns.adobe.com\
-/xap/1.0/sType/R\
-esourceEvent#\x22 x\
-mp:CreatorTool=\x22\
-Adobe Photoshop \
-23.3 (Windows)\x22 \
-xmp:CreateDate=\x22\
-2024-04-22T15:01\
-:49+02:00\x22 xmp:M\
-odifyDate=\x222024-\
-04-22T15:34:33+0\
-2:00\x22 xmp:Metada\
-taDate=\x222024-04-\
-22T15:34:33+02:0\
-0\x22 dc:format=\x22im\
-age/png\x22 photosh\
-op:ColorMode=\x223\x22\
- xmpMM:InstanceI\
-D=\x22xmp.iid:2a349\
-336-fe08-b54d-84\
-f8-09ab8dac710f\x22\
- xmpMM:DocumentI\
-D=\x22xmp.did:2a349\
-336-fe08-b54d-84\
-f8-09ab8dac710f\x22\
- xmpMM:OriginalD\
-ocumentID=\x22xmp.d\
-id:2a349336-fe08\
--b54d-84f8-09ab8\
-dac710f\x22> <xmpMM\
-:History> <rdf:S\
-eq> <rdf:li stEv\
-t:action=\x22create\
-d\x22 stEvt:instanc\
-eID=\x22xmp.iid:2a3\
-49336-fe08-b54d-\
-84f8-09ab8dac710\
-f\x22 stEvt:when=\x222\
-024-04-22T15:01:\
-49+02:00\x22 stEvt:\
-softwareAgent=\x22A\
-dobe Photoshop 2\
-3.3 (Windows)\x22/>\
- </rdf:Seq> </xm\
-pMM:History> </r\
-df:Description> \
-</rdf:RDF> </x:x\
-mpmeta> <?xpacke\
-t end=\x22r\x22?>g+]\x98\x00\
-\x00\x1e IDATx\xda\xed\xdd}\xa8Ve\xa3\
-&\xf0\x0b\x91\x8d\xb3\x91\xcdFDD\x1cG<\x22\x22\
-\x22\x22\x9d\x08\x11\x89FBBB$\x22Db\x13\x12\
-\x12\xe1D\x1c$\xe2E\xd8\xbc\xc4&\xa2\x119D\x84\
-D\xd3\x89x\x09\x89\x90\xce{\x9c&$$\x86\x978\
-D#!!\x12\x12!\x22\x12\x22!\x22\x22\xcd\x1f\xeb\
-\xb14\xbf\xf6\xc7\xb3\x9eg\xadu\xff~p\xfds8\
-\x90\xef\xbe\xd7\xba\xefk\xdd\xcf\xfaH\xa09\x16&\xf9\
-\xadaYbX\x00`n\x16$Y\x95d[\x92\x17\
-\x93\xbc\x99\xe4h\x92o\x93\x5ch\xe0\xe2\x7f+\xd7\x93\
-\xfc\x98\xe4\xcb$\x1f\xf5\xfe\xdd/\xf6\xfew\xacJ2\
-\xcf\xd0\x02@u%\xbf)\xc9\xf3\xbd\xc5\xf2\xf3\x86/\
-\xf0\xfd(\x08\xa7{ef2\xc9\x8e^1\x00\x80\xce\
-Z\x92dg\x92\xa9\xdeB\x7f\xae\xc3\x0b\xfdL\xf3K\
-\x92\x93I\xdeM2\x91d\xad\xc3\x05\x806\x9a\x97d\
-]\xef\xca\xfe\xbd\xdeU\xaf\x85~f\xf95\xd5O\x09\
-\xb7v\x0a\xc6\x1dV\x004\xcd\xfc$[\x92\xfc5\xc9\
-WI\xaeZ\xc0\xfb\x9e\x9bIN\xf5v\x09v)\x04\
-\x00\x0c\xcb\xaaT7\xb8\x1dMr\xd9\x02=\x94B\xf0\
-m\xaa{'\xb6\xf5J\x18\x00\xf4\xddh\x92\xa7\x93\xbc\
-\x93\xe4\xac\x05\xb8\x91\xf7\x11|\x92\xe4\x85$\xcb\x1c\xae\
-\x00\xcc\xc5\x82T\xbf?\x7f\x94\xea7i\x0bm\xbbv\
-\x07&\xe3)\x03\x00,\xfa\xc5\xe6t\xaf\x0c\xacvx\
-\x03\xf0\xe7E\xff\xb9$\xc7\x92\x5c\xb3`v:\xdf$\
-y5\xc9R\x87=@\xb9\xd6\xa5\xba\x89\xec\x92\x85\xb1\
-\xc8\x9f\x09\xbeL\xf2L\xdc@\x08P\x84\xb1Tw\xef\
-\xff_\x8b\xa0\xf4r!\xc9\xe1$\xeb\x9d\x1e\x00\xdd\xf3\
-x\x92\x8fc\x8b_\x1e\x9c\xafS\xbd\x8dp\x81S\x06\
-\xa0\xbdFR\xbd\x8d\xef\x94\x85Mf\x98+\xbd]\x81\
-\xe5N#\x80\xf6X\x92\xe4`\x92\x8b\x162\x99c\xae\
-'\xf90\xc9\x06\xa7\x15@s\xadKr$\xb6\xf9\xa5\
-\x9e\x9cH\xf5\x88\xa8\xcf\x1a\x034\xc4\x96$_X\xa0\
-d@9\x93\xea>\x01O\x0f\x00\x0c\xc9\xe6T\x8fr\
-Y\x94d\x18\xf91\xd5=&\x8a\x00\xc0\x80<\x96\xe4\
-s\x0b\x904$\xe7R=Z\xaa\x08\x00\xd4\xe4\xd1$\
-\xc7-8\x92\xe6\xfe4\xb0'\xee\x11\x00\xe8\x9buI\
-\xfen\x81\x91\x96\xe4\x87$;\x9d\xb6\x00\xb3\xb78\xd5\
-\xe7woXT\xa4\x85\xf9*\xc9F\xa71\xc0\xf4\xcd\
-O\xb2?\xc9e\x8b\x88\xb4<7S}Y\xd2\xc7\x87\
-\x00\x1ebG\x92\xb3\x16\x0e\xe9X\xae\xa6\xfa$\xb1W\
-\x0c\x03\xfc\xc9\xc6$'-\x14\xd2\xf1\xfc\x94\xe4Y\xa7\
-;@uE4\x99\xea\x95\xab\x16\x08)\xe9\xfe\x805\
-N\x7f\xa0T[S=:eA\x90\x12s\xadW~\
-\xbd?\x00(\xc6\xe2T7FY\x04D\x92o\x93l\
-2-\x00]\xf7L\x92K&}\x91;r#\xd5\xe7\
-\x87\x17\x9a\x22\x80\xaeY\x11\xef\xed\x17\x99\xcek\x85\x9f\
-0]\x00]\xb1;\xc9\x15\x93\xbb\xc8\xb4\xdf\x1d\xf0v\
-\x92\x11S\x07\xd0Vc\xf1[\xbf\xc8ls:\xde$\
-\x08\xb4\xd0\xe6T\x9fK5\x91\x8b\xcc\xedI\x81\x03\xf1\
-\x81!\xa0\x05\xe6\xa7z\xb4\xe9\xa6\xc9[\xa4o\xf92\
-\xc92\xd3\x0b\xd0Tk\x93\x9c2Y\x8b\xd4\x92_\xe2\
-+\x83@\x03=\x1d7\xfa\x89\x0c\x22\x87\xe3\xe5A@\
-\x03\xccO\xf2\xa6IYd\xa09\x19_\x18\x04\x86h\
-q\x92\x13&c\x91\xa1\xe4|\x92\xc7LC\xc0\xa0=\
-\x92\xea\xcbf&b\x91\xe1\xbeA\xf0\x80\xe9\x08\x18\x94\
-\x17\xe3\xeb}\x22M\xca\xc7IFMM@]F\x92\
-|`\xb2\x15i\xecG\x85<*\x08\xf4\xddx\xaao\
-\x98\x9bhE\x9a}_\xc0F\xd3\x15\xd0/+\x93\xfc\
-`r\x15iE\xae$y\xd2\xb4\x05\xcc\xd5\xa3I.\
-\x9aTEZ\xf7A\xa1\x97L_\xc0l\xedLr\xd5\
-d*\xd2\xea\x97\x06\xf9\x8e\x000#\xfb\xe3}\xfe\x22\
-]\xc8\xa7I\x16\x98\xd2\x80\xe98d\xd2\x14\xe9\xdc\x9b\
-\x03\xc7Lm\xc0\xfd\xccKr\xc4d)\xd2\xc9|\x93\
-d\x91i\x0e\xb8\xd7\xe2\xff\xa1IR\xa4\xd39\x1d\xef\
-\x0a\x00n3\x92\xeawB\x13\xa4H\xf7s&\xc9r\
-\xd3\x1e0\x9a\xe4\x0b\x93\xa2HQ\xf9)\xc9j\xd3\x1f\
-\x94ka|\xcdO\xa4\xd4\x5cH\xb2\xde4\x08\xe5\x19\
-KuS\x90\x89P\xa4\xdc\x5cR\x02\xa0\xbcm\xff\x93\
-&\xbf\xce\xe7P\x1f\xe3\xef\xd9\xdd\x5cL\xb2\xd6\xb4\x08\
-\xdd7\x92\xe4\xb8I\xaf\xb3\x0b\xfb_S\xbd\xc1qm\
-\xfa\xf7\x06\xb8\xe5I\xb6\xa5z9\x94\xa2\xd0\xcd\xfc\x9c\
-\xea\x9b\x1f@G\xcdKr\xd4d\xd7\xea\x85\xfe`\x9a\
-\xfb\x18\xd7\x1e\xa5\xa0\xd5\xf91\x1e\x11\x84\xce.\xfe\x1f\
-\x9b\xe4Z\xb5\xe0o\xea\xc0q7\x9a\xe4u\xa5\xa0U\
-\x8f\x08.1]B\xb7\xbcork\xf4b\xbf/\xe5\
-|\xb4eM\x92\xb7\x14\x82\xc6\xe6\xbb$\xe3\xa6L\xe8\
-\x86\xc3&\xb5\xc6-\xfa\xaf:,\x7f\xb7\xdd\x0eA\xe3\
-\xf2\x8f\xf8\x80\x10\xb4\xde_Lf\x8dY\xf4\xd78\x1c\
-\xa7eR\x19hD>\x8bO\x09Ck=c\x12\xb3\
-\xe8\xb7\xdc\xcb\xca\xc0P\xf3\xaeC\x10\xdags\x92k\
-&\xb0\xa1,\xfan\xa2\xaao7K\x11\x18|\xf6;\
-\xf4\xa0=V\xa6z\xb9\x87\xc9kp\x8b\xfe\x84\xc3n\
-`F\xed\x0a\x0c47\x93\xecr\xd8A\xf3-J\xf5\
-(\x8f\x89\xab\xfe\x85\x7f\xca\xe16t\x13\x8a\xc0@r\
--\xc9c\x0e7h\xae\x91x\xc5\xef \x16\xfe}\x0e\
-\xb5\xc6YaW` \xdf\x0dX\xe5P\x83f\xfa\xd0\
-$U\xeb\xc2\xbf\xc9!\xd6\x0aS\x8a@m\xf9>\xd5\
-O0@\x83\x1c09\xd5\xb6\xf0/rx\xb5\xd2\xa4\
-\x22PK\xfe\xe6\xd0\x82\xe6x<\xc9\x0d\x13\x93\x85\x9f\
-{\xf2\xf4@\xff\xf3/\x0e+\x18\xbe\xa5I.\x98\x90\
-\xfa\xba\xf0\x8f8\xac\xec\x08\xc8C\x9f\x0c\xd8\xee\x90\x82\
-\xe1\x99\x9f\xe4k\x93Q\xdf\x16\xfeG\x1dREx[\
-\x09\xe8\xdbM\x81+\x1cN0\x1c&\xb1\xfe,\xfc\xbb\
-\x1dJ\xc5\x19\xb5\x1b\xd0\x97\x9c\x8a\x9b\x02a\xe0\xbc\xe6\
-w\xee\x0b\xff\xeb\x0e\xa3\xe2mU\x04\xe6\x9c#\x0e#\
-\x18\x9c5I\xae\x98x\xe6\xb4\xf8\xc3\xed\xdc\x1f0\xb7\
-<\xe7\x10\x82\xfa-Hr\xda\x843\xeb\x85\xdfD\xc5\
-\x83(\x01\xb3\xcb\xe5\xb8\x1f\x00jw\xd8d\xe3\xaa\x9f\
-ZM(\x02\xb3\xca\xd7\xf1\xf9`\xa8\xcd6\x93\xcc\xac\
-\x16\xfe\xc7\x1d:\xd8\x0d\x18H&\x1d6\xd0\x7f\xe3I\
-~2\xc1\xb8\xeag\xa0\xf6+\x013~?\x80\xc2\x0d\
-}\xf67\x93\xcb\x8c\x16\xfe\x17\x1c2\xf4\xc9\x88\xdd\x80\
-\x19\xe5\xe7\xde\x05\x0b\xd0\x07\xbbM*\xae\xfa\x19\xbaI\
-%`\xda\xf9\xc0\xe1\x02s\xb7,\xc9/&\x94i-\
-\xfeo9\x5c\xa8\xd9\x0e\xbb\x01\xd3\x8eW\x05\xc3\x1c}\
-i\x22\x99\xd6\xe2\xefm~\x0c\x92\x12\xf0\xf0\xfc\x94d\
-\xcc\xa1\x02\xb3\xb3\xd7$2\xad-\x7f\x93\x0c\xc3\xe0\x9b\
-\x02\x0f\xcf\xbb\x0e\x13\x98\xb9%\xb1\xf5\xef\xf7~\x9a\xee\
-e%\xe0\xa1y\xdca\x023\xf3\xb1\x89\xe3\x81\x8b\xff\
-\x94C\x84\x86\xd8\xa6\x04<0\xe7\x92,t\x98\xc0\xf4\
-'\x14\x13\xc7\xfd\x17\xff\xfd\x0e\x11\x1afq\xdc\x17\xf0\
-\xa0\xbc\xed\x10\x81\x87\x1bIr\xc6\x84q\xdf\xc5\xdf\x9d\
-\xc54\x99\x12p\xef\xdcH\xb2\xc1\xe1\x01\x0f\xf6\x86\xc9\
-\xe2\xbe\xbf\xf7/sx\xa0\x04\xb4\xfa[\x01\xc0}\xac\
-Ir\xddD\xe1f?\x94\x80\x8e\xc6\xd78\xe1>N\
-\x9a ,\xfet\xc6[J\xc0]9\x1f7\x04\xc2]\
-v\x99\x1c,\xfet\xce\x94\x12pW\xdetX\xc0\x1f\
-F\x92\x9c51X\xfcQ\x02\x0a\xc8\xf5$k\x1d\x16\
-Py\xc5\xa4`\xf1G\x09((\xc7\x1d\x12P}6\
-\xd3\x1b\xff,\xfe(\x01\xa5\xe5\x09\x87\x04\xa5{\xdbD\
-`\xf1\xa7\x18n\x0c\xfc#\xff\xe9p\xa0d+\xe3\xb1\
-\xbf\xdb\x0b\x00\x94\xc0#\x82\x7f\xe4\x19\x87\x03\xa5:j\
-\x02\xf8}\xf1_\xe0p@\x09(.g\x92\xccw8\
-P\x9aG\x9d\xfc\xbf/\xfe\xcb\x1d\x0e(\x01\xc5\xe6E\
-\x87\x02\xa5\xf9\xbb\x13?\x87\x92\xecp(Px\x09(\
-}\x1e\xb8\x90d\xd4\xa1@)69\xe9s(\xc9\x01\
-\x87\x02\x85[\xa0\x04\xe47s\x01%9f\xf1\xcf\x94\
-\xc3\x00\x92$[\x95\x80\x5c\xb2\x0b@\x096Z\xfc\xdd\
-\xf1\x0f\x7f\xb2W\x09\xc8~\x87\x01]\xf7\xa9\x02\x00\xdc\
-C\xe9/\x0a\xfa9\xd5k\xd1\xa1\x93\xd6%\xb9Y\xf8\
-\xe2\xbf\xcca\x00\xf7U\xfa\x93\x01{\x1d\x02t\xd5'\
-\x85/\xfe\x13\x0e\x01\x98V\x09(u\x9e\xf81\xde\x0b\
-@\x07\xad)\xf8\xea\xdfM\x7f0}[\x0a/\x01{\
-\x1c\x02t\xcd;q\xd3\x1f0=\xaf\x17\x5c\x02N\x1b\
-~\xbad<\xc9\xafq\xd3\x1f0}%\xdf\x0f\xb0\xcd\
-\xf0\xd3\x15\xaf\x16\xbc\xf8{\xcd'\xcc\xad\x04\x948w\
-|n\xe8\xe9\x82y\xa9nl\xb1\xf5\x0f\xcc\xd4\xee\x82\
-K\xc0\x1a\xc3O\xdb\xed\x8c\xad\x7f`n\xbb\x00%\x96\
-\x80\xb7\x0d=m\xf7U\xa1\x8b\xffvC\x0f}-\x01\
-\xa5\xcd#\x97\x93,4\xf4\xb4\xd5\xfa\xd8\xfa\x07\xe6n\
-{\xa1%`\x9f\xa1\xa7\xad\x8e\xc4\xd6?\xd0\xbf]\x80\
-\xd2J\x80G\x02i\xa5\xd1\x94\xf7\xe8\xdf!\x8d\x1dj\
-/\x01\xa5]Tl6\xec\xb4\xcd\xf3\xae\xfe\x81>\xdb\
-_`\x098b\xd8i\x9b\xd2n\xfe;\x94d\xcc\xb0\
-\x83]\x80>\xe7J\xaa\x1dUh\x85\x95)\xeb\xbd\xff\
-\xde\xf5\x0f\x83\xb3\xa4\xc0\x12\xe0\xfb\x00\xb4\xc6dl\xfd\
-\x03\xf5\xee\x02\x94T\x02N\x18r\xda\xe2\x5c\xdc\xf8\x07\
-\xd4_\x02J\x99gn\xa6\xdaY\x85F{\xdc\xd5?\
-0\x00\x07\x0b+\x01\x07\x0d9M\xf7aa\x8b\xbf\xaf\
-v\x81]\x80A\xe4\xac\xe1\xa6\xc9FR\xdd\xb1\xea\xea\
-\x1f\x18\x84\x89\xc2J\xc0FCNS\xed(l\xf1_\
-n\xc8\xc1.\xc0\x00\xf3W\xc3MS}\xe0\xea\x1f\x18\
-\xb0=\x05\x95\x803\x86\x9b&\x9a\x97\xe4RA\x8b\xbf\
-ou\x83]\x80ad\x9d\xe1\xa6i\x9ep\xf5\x0f\x0c\
-\xc9DA%\xc0\xd3\x004\xce;\x05-\xfek\x0d7\
-\xd8\x05\x18R\xbe7\xd44\xcdyW\xff\xc0\x10\xbdX\
-P\x09\xf0\x13$\x8d\xb1\xb9\xa0\xc5\xffI\xc3\x0dv\x01\
-\x86\x9cW\x0c5M1\xe5\xea\x1fh\xc8\x5cTB\x09\
-\xf8\xc2P\xd3\x14\xdf\x16\xb2\xf8\x1f0\xd4`\x17\xa0\x01\
-\xb9\x16\x9f\x08\xa6\x01\x16\xa5\x8cO\xff\xba\xfa\x07\x05\xa0\
-Iy\xcaP3l\xcf\x16\xb2\xf8+\x00\xd0\x0e\xe3\x85\
-\x94\x80\xc3\x86\x9aa;\xe2\xea\x1f\xb0\x0b\xe0\xe3@\x94\
-\xe7\x9c\x02\x004\xcc\xfeBJ\xc0*C\xcd\xb0\xac)\
-d\xf1\xdfg\xa8\xc1.@\x03\xf3\xa2afX^r\
-\xf5\x0f(\x00C\xcbG\x86\x99a\xf9L\x01\x00\x1a\xea\
-\xd1\x02J\xc09\xc3\xcc\xb0\x5c,`\xf1\xdf`\x98\xc1\
-.@\x83\xb3\xdc03h\xab\x5c\xfd\x03\x0a\xc0\xd0\xf3\
-\xacaf\xd0v+\x00@\xc3-)\xa0\x04\xfc\xaba\
-f\xd0\x0e\xc7\xf6?`\x17`\xd8\xf9\xce\x103h\xdf\
-\xb8\xfa\x07\x14\x80\xa1\xe7f\x921\xc3\xcc\xa0\x8c$\xb9\
-\xae\x00\x00-\xb0\xb6\x80\x12\xf0\xb8afP6\x17\xb0\
-\xf8o1\xcc`\x17\xa0%y\xc5\x103(\xaf\xba\xfa\
-\x07\x14\x00/\x04\xa2<\x1f+\x00@\x8bLt\xbc\x04\
-|o\x88\x19\x94S\x1d/\x00o\x18b\xb0\x0b\xd0\xa2\
-\xdcH\xb2\xc0\x10S\xb7\xf9\xe9\xf6\x0d\x80\x87\x92\xcc3\
-\xcc\xa0\x00\xb4,\x8f\x18b\xea\xb66\xb6\xff\x01\x05\xa0\
-i\xd9k\x88\xa9\xdb.\x05\x00h\xa1-\x1d/\x01\xef\
-\x18b\xeav\xb0\xe3\x8b\xff\x01C\x0cv\x01Z\x98\x13\
-\x86\x97\xba\x1du\xf5\x0f(\x00\x8d\xcbO\x86\x97\xba\x9d\
-V\x00\x00\x05\xa0\x91\xaf\x04\xf6$\x00\xb5)\xe1\x09\x00\
-\xa0\xbb\xf6w\xbc\x04\xac7\xc4\xd4eu\xdc\x00\x08\xd8\
-\x05hjv\x1a^\xea\xb2\xad\xe3\x8b\xffvC\x0c\x0a\
-@\x8b\xe3&fj\xf3\x82\xab\x7f@\x01hl\xde7\
-\xbc\xd4eR\x01\x00\x14\x80\xc6\xe6+\xc3K]>P\
-\x00\x00\x172\x8d\xcdY\xc3K]N(\x00@\xcb\xad\
-\xed\xf0.\xc0U\xc3K]\xcev\xb8\x00L\x19^(\
-F\x97\x7f\x06\x187\xbc\xd4\xe1Z\x87\xaf\xfe7\x18^\
-P\x00:\x90u\x86\x97~[\x1a\xdb\xff\x80\x02\xd0\xf4\
-l3\xbc\xf4\x9b\x17\x00\x01\x0a@\xf33axQ\x00\
-\x14\x00\xa0\xbc\x02\xf0\xba\xe1E\x01P\x00\x80{\xf3N\
-\x13P\x00\x9c0P\xa0-\x1d\xde\x05\xf8\xc0\xf0\xa2\x00\
-(\x00\xc0\xfdu\xb5\x00|fhQ\x00\x14\x00\xa0\xbc\
-\x02p\xc2\xd0\xa2\x00L?/\x1b^P\x00:\x92o\
-\x0d-\x0a\xc0\xf4\xb3\xc5\xf0\x82\x02\xd0\x91\xfchhQ\
-\x00\xa6\xbf\xfd\xbf\xd8\xf0\x82\x02\xd0\x91\x5c2\xb4(\x00\
-~\xff\x07\xca+\x00\xd7\x0d-\x0a\x80\x02\x00\x94W\x00\
-~K2\xcf\xf0\xa2\x00(\x00@y\x05`\xc4\xf0\xa2\
-\x00(\x00@y\x05`\xd4\xf0\xa2\x00(\x00@y\x05\
-`\xdc\xf0\xa2\x00(\x00@y\x05\xc0\x93M(\x00\x0a\
-\x00P`\x01XjxQ\x00\x14\x00\xa0\xbc\x02\xb0\xc2\
-\xf0\xa2\x00(\x00@y\x05`\x95\xe1E\x01P\x00\x00\
-;\x00\xa0\x00(\x00@\x01\x05`\x89\xe1E\x01P\x00\
-\x80\xf2\x0a\xc0\xb8\xe1E\x01P\x00\x80\xf2\x0a\x80\x17\x01\
-\xa1\x00(\x00@\x81\x05`\xbe\xe1E\x01P\x00\x80\xb2\
-\x0a\xc0MC\x8b\x02\xa0\x00\x00\xe5\x15\x80k\x86\x16\x05\
-`\xfa\x05`\x81\xe1\x05\x05\xa0#\xb9lhQ\x00\xa6\
-\x9f\x0d\x86\x17\x14\x80\x8e\xe4\x9c\xa1E\x01\x98~v\x1b\
-^P\x00:\x92o\x0d-\x0a\xc0\xf43exA\x01\
-\xe8H\xbe4\xb4(\x00n\x04\x04\xca+\x00G\x0d-\
-\x0a\x80\x02\x00\xdc\xdb\xaa\x0e\x17\x80\xf7\x0c/\x0a\x80\x02\
-\x00\xdc\xdb\xbe\x0e\xcfgo\x1a^\x14\x00\x05\x00\xb8\xb7\
-.\xbf\x05\xf0\x80\xe1E\x01P\x00\x80\xf2\x0a\xc0\x0b\x86\
-\x17\x05@\x01\x00\xca+\x00O\x1a^\xfam$\xd5;\
-\xa6\xbbZ\x00\xc6\x0d1(\x00\x1d\xc8:\xc3K\x1d\xce\
-w\xf8\xa4y\xd5\xf0\x82\x02\xd0\x81\x8c\x19^\xea\xf0\x8f\
-\xf8\x19\x00h\xb7\x91\x0e\x17\x80+\x86\x97\xba|\xa2\x00\
-\x00-\xb7\xb7\xc3\xf3\xd8i\xc3K]\xdeT\x00\x80\x96\
-\xeb\xf2\xf6\xffq\xc3K]^R\x00\x00\x05\xa0\xb19\
-bx\xa9\xcb\x8e\x8e\x17\x80\xe5\x86\x18\x14\x80\x16\xe7u\
-\xc3K]6\xa4\xdb\xef\x03\xf0U@P\x00\xda\x9c]\
-\x86\x97\xba\x8c\xc5\x0b\x81\x80\xf6\xda\xd6\xf1\x02\xb0\xde\x10\
-S\xa7\x9f\x15\x00\xc0\xd5\x7f\xe3r3\xc9\x02CL\x9d\
-\x8e+\x00\x80\x02\xd0\xb8\xfchx\xa9\xdb\xdb\x1d/\x00\
-;\x0c1(\x00\xf1\x08 \xdce\x22\xee\x03\x00\xdag\
-^\xc7\x0b\x80\xb9\x8b\xda=\xa2\x00\x00-4\xd9\xf1\xb9\
-k\x9f!\xa6n\xa3\x0a\x00\xd0B]\xbe\xfa\xff-\xc9\
-c\x86\x98A8\xd7\xf1\x02\xb0\xc7\x10\x83\x02\x90v=\
-\x010j\x88\x19\x84\xcf\xed\x02\x00-\xb2\xa1\xe3\x05\xe0\
-{C\xcc\xa0t\xfd\xb74\x05\x00\x5c\xfd\xb7)\x1f\x18\
-b\x06\xe5)\x05\x00P\x00\x1a\x93\x97\x0d1\x83\xb2\xa8\
-\x80\x02\xe0\xbb\x00\xa0\x00\xb4%\x9b\x0d1\x83t\xd6.\
-\x00\xd0\x02\x07\xe3\x06@\xe8\xab\x8f\x14\x00\xc0\xd5\xbf\x1b\
-\x00)\xcfK\x05\x14\x80I\xc3\x0c\x0a@\xc3\xf3\x8e!\
-f\xd06u\xfc\xa4\xb2\x0b\x00\xedw\xa0\x80\x02\xf0\x9c\
-af\xd0\xe6'\xb9\xaa\x00\x00\xae\xfe\x87\x9a\xe5\x86\x99\
-a\xf8:\x9e\x06\x00\x14\x00\x9f\x00\xa68\x07\xe3g\x00\
-\xa0\x99\xa6\xe2\x05@P\x9b\xcd\x85\x14\x80\xf5\x86\x1a\x5c\
-\xfd70\x13\x86\x99a\x99\x9f\xe4\x8a]\x00\xa0a\xd6\
-\x17R\x00V\x19j\x86\xe9\x98\x02\x00\xb8\xfa\x1fx\xce\
-\x19f\x86\xed\xa5\x94Q\x00\xbck\x1b\x14\x00\xcf\xff\xc3\
-m\xd6\x14p\xa2\xd9\x05\x80\xf6\xe8\xfa\xab\x7fo\xe5)\
-CM\x13\x9c+\xa4\x00l1\xd4\xe0\xea\xbf\x01\xb9\x16\
-\xef\xff\xa7!\xde\xb7\x0b\x004\xc0\xceB\x0a\xc0qC\
-M\x93N:\x05\x00p\xf5?\x98\xb8'\x89\xc6X\x90\
-\xee\xbf\x16\xf8V\x01x\xcbpC#-/\xa8\x00\xac\
-6\xdc4\xc9\xa7v\x01\x00W\xff\xb5\xe7\x07CM\xd3\
-\xec.\xa8\x00\xf8>\x004\xcbxA\x05\xe0\x0d\xc3M\
-\xd3,Lug\xaa]\x00\xc0\xd5\x7f}\xf1jr\x1a\
-\xe9\xefv\x01\x80\x01\x1b+\xa8\x00\x9c1\xdc4\xd5\xde\
-\x82Z\xb8]\x00p\xf5?\xe8L\x1an\x9ajq\x92\
-\x1bv\x01\x80\x01\x19/\xac\x00\xac3\xe44\xd9\x09\xbb\
-\x00\x80\xab\xff\xbe\xe7\xb4\xe1\xa6\xe9\x9e/\xac\x00(\x01\
-0\x1cO\x14V\x00\x0e\x1ar\x9an4\xc9\xaf\x85\x95\
-\x80e\x86\x1d\x5c\xfd\xd7\x1c/\xff\xa1\x15\xde/\xec\xc4\
-\xb4\x0b\x00\x83\xb5\xaf\xb0\x02p\xd2\x90\xd3\x16[\x0a,\
-\x00\xdb\x0c;\xb8\xfa\xaf)\xcf\x1br\xda\xe4\x8c]\x00\
-\xa0\x06S\x85\x15\x80+\xf1\xe9_Z\xe6/\x05\x16\x00\
-\x8f\x05B\xbd\x96\x14x\xf5\xff\x9ea\xa7m\x96'\xb9\
-Y`\x09\x183\xf4P\x9b\xd2\x16\xff\xdf\x92<b\xd8\
-i\xa3/\x0b<Y\xfd\x14\x00\xf5\xd8_`\x01\xf8\xde\
-\xb0\xd3V;\x0b-\x00/\x1azp\xf5\xdf\x87\xec7\
-\xec\xb4\xd5\xbc$\xe7\xec\x02\x00}X\xfcK+\x00\xbf\
-\xc6O\x8a\xb4\xdc\xab\x85\x16\x00%\x00\xfa\xa3\xb4g\xfe\
-o\xe5\xb0\xa1\xa7\xed\xc6R=\xc6Rb\x09\xb0}\x07\
-\xfd\xb9\xfa/m\xfe\xb8\x99d\x95\xa1\xa7\x0b\xde)\xf0\
-\x04\xbeU\x02\xc6\x0d?\xcci\xf1/\xb1\x00\x1c3\xf4\
-t\xc5\xea\x94\xf7H\xa0\xfb\x01`n\x0e\x16\xba\xf8\xff\
-\x96\xeaCG\xd0\x19\xc7\x0b.\x00\x93\x86\x1ffdm\
-\xc1\x8b\xbfG\xff\xe8\x9c\xed\x85\x9e\xcc\xb7J\xc0\xd3\x0e\
-\x01\x98\xb6C\x05\xcf\x17/\x18~\xba\xe8\xbb\xc2K\x00\
-0\xbd\xc5\xbf\xd4\x02\xf0s\x92\x11\x87\x00]\xb4\xab\xf0\
-\x02\xa0\x04\xc0\x83\x95\xfc\xbb\xffoI^v\x08\xd0e\
-\xa7\x0a/\x01o9\x04\xe0\x9e\xb6\x17\xbe\xf8_H\xb2\
-\xc0a@\x97=[\xf0\x09\xeeU\xc1p\x7f\x87\x0a\x9f\
-\x1b^q\x08\xd0u\xf3R\xdd\xe5Zz\x09\xd8\xe2P\
-\x80;\x16\xff\x92\x0b\xc0\xc5$\xa3\x0e\x03J\xb0\xbb\xf0\
-\x02\xe0%A`\xf1\xbf=\xff\xe20\xa0\xa4]\x80\x1f\
-\x94\x007\x05R\xbc\xb7,\xfe\xb9\x94d\xa1C\x81\x92\
-\xecQ\x00<\x19@\xd1J\xbf\xe3\xdfo\xff\x14\xbd\x0b\
-\xf0\x9d\x93_\x09\xa0H\x13\x16\xff\xfc\x96\xeas\xe9\x9e\
-\xfb\xa7HO\x98\x00<\x1eHq\x9e\xb6\xf8\xff\x9e\xdd\
-\x0e\x07J\xf6\x85I\xe0\xf7\x120\xe5p\xa0\xe3\xb6Z\
-\xfc\x7f\xcf\xa9T;\xa1P\xac\xb5In\x98\x0c\x94\x00\
-:o\xbd\xc5\xff\x8elsH@r\xc4dpG\x09\
-8\xe0\x90\xa0c\xd6X\xfc\xef\xc8q\x87\x04T\x96&\
-\xf9\xd5\xa4pG\x09x\xddaAG\xac\xb4\xf8\xdf\x91\
-\x9bI68,\xe0\x0f\x07M\x0cw\x95\x80\x83\x0e\x0b\
-Z\xeeQ\x8b\xff]y\xcfa\x01w\x1aMr\xde\xe4\
-\xe0\x9e\x00:\xe3\x09\x8b\xff=_\xfa\xb3\xc8\xa1\x01w\
-{\xd6\x04\xe1\x11A:a\x87\xc5\xff\x9e\x99ph\xc0\
-\xfd}n\x92\xf0\xb2 Zm\xc2\xe2\x7f\xcf|\x13\x8f\
-\xfd\xc1\x03\xad\x88\x1b\x02\x95\x00\xda\xea5\x8b\xff}o\
-\xfc\xdb\xe8\xf0\x80\x87;`\xc2x`\x09p\x15A\x13\
-\xf9\xb0\xcf\xfds\xd8\xe1\x01\xd33?\xd5[\xb2L\x1c\
-\xf7/\x02\x9b\x1c&4\x88O\xfa\xde?\x17\x92\x8c9\
-D`\xfa\x1e\xebm\x9b\x99@\xee_\x02\xbcG\x1c\x8b\
-\x7f\xf3\xb3\xd3!\x023\xf7\xae\xc9\xc3c\x824\xd6V\
-\x8b\xffC\xf3\xb1\xc3\x04fg,\xc9\xcf&\x117\x07\
-\xd28\x93\x16\xfe\x87\xe6b<\xf3\x0fs\xe2\x93\xc1\xd3\
-/\x01^/\xca \xb8\xea\x9f^v9T`\xee\x0e\
-\x9bL\xa6]\x04\xf6;\x5c\xa8\xc9Z\x8b\xbf\xad\x7f\x18\
-\xb4\x91$\xdf\x9bT\xfc$\xc0\xd0\xbcn\xe1\x9f\xd1\xeb\
-~\x978d\xa0\x7f6&\xb9nr\x99Q\x09\xd8\xe9\
-\xb0\xa1\x0f\x5c\xf5\xcf,\xbe\xe4\x095x\xcd\xe4\xe2;\
-\x02\x0c\xcc\x0b\x16\xffY\xe5j\xaa{\x97\x80>\x9a\x97\
-\xe4\xa4\x09fV\xbb\x01^\x1c\x84\xab\xfe\xc1\xe5Z\x92\
-m\x0e#\xe8\xafU\xf1\xad\x00\xf7\x06P\x97\x97-\xfe\
-v\x02\xa0\xc9|6xn%`\xc2!\xc4\x9f,\xb1\
-\xf0\xdb\x09\x80\xb6\xf0h\xa0\x8f\x0a\xd1\x1fS\x16~%\
-\x00\xdad~\x92\xafM.n\x12d\xd6\xf6\xb9\xeaW\
-\x02\xa0\xad\x96\xa5z\xdd\xa6\x09f\xee\xbb\x01\x1e]*\
-\xc7f\x0b\xbf{\x02\xa0\x0b\x1eOr\xc3\xe4\xd2\xb7\x22\
-\xe0\xf5\xa5\xdd5n\xe1\xb7\x13\x00]\xe3\xfd\x00\x8a\x00\
-\xf7\xb7\xc0\xc2\xaf\x04@\x97}jb\xa9\xa5\x08<\xeb\
-\xd0r\xc5/\xb5\x94\x00?\x07@\x1f'\xbb\xd3&\x96\
-\xda\x8a\xc0n\x87Xk,\xb7\xf0\xbb'\xe0!s\xa5\
-'\x80\xe8\x9c\x95qS`\xddE\xe0\xa0\xc3\xac\xb1\xb6\
-[\xf8\x95\x80\x9e\x05\xa9\xee\x8f:\x98\xe4X\x92\x1fz\
-\xff\xad\xdb\xff\xdb\xd7\x93\x9cK\xf2e\xfe\xf8\xd9o\xb1\
-\xd3\x886{\xb4\xb7\xbdfr\xa9\xb7\x08x\x8f@s\
-\x1c\xb4\xf0+\x01=O&\xf9(\xb3\x7f[\xea\xcd^\
-!\x98\xe8\x95\x08h\x9dgz\x07\xb2\xc9e0e`\
-\xafCn(\xbb]\x87,\xfcJ@\xaf\x88\xefI\xff\
-?\x99~1\xc9_\x92,t\xba\xd16\x07L*C\
-\xd9\x15X\xe5\xd0\xab\xd5\x94E_\x09\xb8\xcd#I\xbe\
-\xa9\xf9\xdfu\xbeW0\xa0U\xde5\xa9\x0c\xad\x0cL\
-\xa5\xba\xd9\x88\xb9{\xd9\xd5\xbe\x12p\x8f\xab\xfe\x03\x19\
-\xec;P\x8e%Y\xe4t\xa4-\xe6\xa7\xfa=\xcb\xc4\
-2\xfc\x9d\x017\x17\xcd\xcc\xeb\x16}%\xe0>\xc6\x93\
-\x9c\x18\xd2\xbf\xed\xe7$\x1b\x9d\x9e\xb4\xc5X\x92oM\
-*\x8d*\x03\xde-p\xb7\xc5\xa9\xbe\xcb`\xd1\x97\x07\
-\x95\x80e\xe9\xffo\xfd3\xcd\x95x\x87\x01-\x9b\x5c\
-\xbd#\xa0\x99e\xe0P\x92\xb5\x85\x1e\x97\x93\x16|\x99\
-A\x09X\x99\xea\xb1\xbd&\xfc\xdb\xae\xa7z\xec\x14Z\
-aI\x923&\x95V\x14\x82\x89\x0e\x1e\x7f[\xee\xf1\
-\xbf\xd3\xa2/\xd3-\x01kz\xdb\xefM\xfa\xb7]O\
-\xb2\xc3\xd2B[\xacl\xe0I$\x0f/\x04\x87R\xdd\
-\xf0\xd4\x96\xfb\x08v[\xec\xa5\x90\xd8\x09\xa0UV'\
-\xb9\xe0\xc4\xedL1\xb8U\x0e\x06\xf93\xc2\x92T\x8f\
-E\x1dz@\x8c\x97\x94T\x02\xec\x04\xd0\x1a\xeb\x93\xfc\
-\xe2\xc4-\xa2\x1c\xd4\x15\x7fs\x11%\x80\x96z4\xd5\
-\xdd\xacN^\x11\x11?\x07P\x98\xc7\x92\x5cv\xe2\x8a\
-\x88(\x01\x94g]\xdc\x13 \x22\xe2\xe7\x00\x8a\xb46\
-\xd5\xfb\xae\x9d\xbc\x22\x22v\x02(\xcc\xaa4\xe7%\x1b\
-\x22\x22J\x00\x0c\xd0\xf2$?8qED\x94\x00\xca\
-\xb3$\xc9)'\xae\x88\x88\x12@y\xc6\x93\x9ct\xe2\
-\x8a\x88(\x01\x94g$\xc9GN\x5c\x11\x11%\x802\
-M:qED<\x22H\x99\x9e\xef\x1d\xb8N`\x11\
-\x11;\x01\x14\xe6\xf1xk\xa0\x88\x88\x12@\x91V'\
-9\xeb\xe4\x15\x11\xf1s\x00\xe5Y\x92\xe4+'\xaf\x88\
-\x88\x9d\x00\xca3/\xd5\xcd\x817\x9d\xc0\x22\x22v\x02\
-(\xcf\xae\xf8\xa4\xb0\x88\x88\x9d\x00\x8a\xb4:\xc9\xf7N\
-`\x11\x11;\x01\x94ga\x92O\x9c\xc0\x22\x22J\x00\
-ez%\xde\x17 \x22\xe2\xe7\x00\x8a\xb4)\xbe((\
-\x22\xa2\x04P\xa4\x05I\x0e;\x89ED\xfc\x1c@\x99\
-\x9eJr\xd1\x89,2\xab\xdcL\xf2q\x92\x1b\xfe\x16\
-v\x02\xa0\x8d\x16'9\xe6D\x16\x99Q~L\xb2\xf5\
-\xb6\x22\xed\xde\x1a;\x01\xd0Z/&\xb9\xead\x16y\
-\xe8U\xff\xdb\xbd\x9f\xd1n\xb7\xcbN\x80\x9d\x00\xcb\x08\
-m\xb6,\xc9gNf\x91{\xe6\x5c\xaa\x8fn=\xe8\
-'5;\x01v\x02\xa0\xd5\x9e\x8b{\x03Dn\xe5F\
-\xef\xaa\x7ft\x1a\xe7\x8e\x9d\x00%\xc0N\x00\xad\xb7(\
-\xc9\xfbNh)<\xdf$\xd98\xc3sG\x09P\x02\
-\x94\x00:aK\xbc7@\xca\xcb\x95$\xfbS}X\
-k6\xfc\x1c\xa0\x04\xf89\x80NX\x90\xe4\xafI\xae\
-9\xb1\xa5\x80\xfc-\xc9\xd2>\x9c7v\x02\x94\x00;\
-\x01t\xc6\x8a\xf8\xa6\x80t7\xdf\xe5\xc17\xf9)\x01\
-\xa2\x04P\xbc\xcd\xa9~\x1bu\x82K\x17r!\xc9\x0b\
-s\xd8\xeeW\x02D\x09\xa08\xbb\x93\xfc\xec\x04\x97\x96\
-\xe6Z\x927R}-\xb3nJ\x80\x12\xa0\x04\xd09\
-\xa3I\xfe\x12/\x11\x92v\xbd\xcc\xe7\xc3\xdeOZ\x83\
-\xa4\x04(\x01J\x00\x9d\xb4$\xd5\xb3\xd2\x8a\x8049\
-G\x93\xac\x1b\xe2y\xa2\x04(\x01J\x00\x9d\xb58\xc9\
-\x9b\x8a\x804,_&y\xa4!\xe7\x88G\x04\x95\x00\
-\x8f\x08\xd2iKS}r\xd8\xa3\x832\xec\x85\x7fs\
-\x03\xcf\x0f;\x01J\x80\x9d\x00\x8a\xf8i\xe0ME@\
-\x06\x98\x9bI>O\xf2X\xc3\xcf\x0d;\x01J\x80\x9d\
-\x00\x8a)\x02\x93\xf1\x8d\x01\xa9wB}?\xc9\x9a\x16\
-\x9d\x17v\x02\x1c\xb3v\x02(\xc6\x82${\x93\x9cv\
-\xf2K\x9fr9\xc9[I\x96\xb7\xf4\x9cP\x02\x94\x00\
-%\x80\xe2l\xe9m\xd5\x9a\x04d69\x93\xea}\xfd\
-\xa3\x1d8\x17\xfc\x1c\xa0\x04\xf89\x80\x22\xadK\xf2^\
-\xaa\x0f\xb0\x98\x0c\xe4a\xbf\xef\x7f\x9a\xfe\xbf\xb2\xd7N\
-\x80\xd8\x09\x80!\x1aM\xf2|\x92\x93&\x03\xf9S\xce\
-%9\x98\xc1\xbf\xbcg\x18%\xc0x+\x01P\xb4\xd5\
-I\xa6\x92\x9c7)\x14\x9b\xabI>J\xf2D\xea{\
-O\x7f\xd3\xac4\xeeJ\x80\x12\x00\x95y\xa9~\x1b\xfb\
-4\x1e%,e\x8b\xff\xebT7\x8a\x8e\x15Xz\x7f\
-r\x0c\x88\x12\x00w[\x98\xe49e\xa0\x93\xf9G\x92\
-W\xd2\xde;\xf9\xe7j\x8d\xdd.Q\x02`\xfae\xe0\
-\xd9T\xefv\xf7\xda\xe1v\xe6\x9b$\xaf\xa6\xfb\xbf\xeb\
-?\xcc\xd2T\xf788&D\x09\x80\x19\x1aM\xf2L\
-\xaa\xdf\x8b\xbdh\xa8\xb9\xf95\xc9g\xbd\xed\xfde\x0e\
-\xdb$\xc9H\x92o\x1d\x1b\xa2\x04@\x7flLr \
-\xc9\x89x\xb6z\xd89\x9b\xea\x9b\x10O\xf6\x16;\xee\
-\xf4\xaf\x8e\x11Q\x02\xa0\xbe\xdd\x81\xa7z\x8b\xd0\x0f&\
-\x92\x81<\xae\xf7A\x92=)\xf7\xf7\xfc\xe9\xda\xe6x\
-\x11%\x00\x06gQ\xaa\xa7\x0a\xdeH\xf2Uo[\xda\
-\xe42\xfb;\xf6O\xf7\x16\xfc\x89T\x8f\xb01\xfd\xad\
-\xff3\x8e!Q\x02`x\xe6\xf5~2x)\xd5=\
-\x04gz\x0b\x9b\xc9\xe6\xee\x9cO\xf5\x1b\xfek\xa9\xde\
-\xc4\xb7\xd0\xe13k\xfb\x1dO\xa2\x04@3\xaf\xce\xd6\
-\xa5\xba\xb1p2\xd5\x93\x06\xa7\x0b\x9b`N\xf7\x0a\xd1\
-\x81\xde\x8e\xc9R\x87E\xdf\xcc\x8f\xe7\xfd\xc5\xb7\x03\xa0\
-U\xc6\x92lN\xb5\xdd=\x99\xe4\xc3T\xaf->\x97\
-\xf6\xbd\xc3\xfdJ\x92\xefR\xbdS\xe1\xad$\xfbR\xdd\
-\xa8\xb7\xca0\xd7n\xb7\x05L\xec\x04@\xb7\xae\xeaV\
-$\xd9\x9a\xea{\x06\xaf\xf5\x16\xd6\xf7\x93\x1cK\xf5v\
-\xbb\xd3\xa9\x1eS\xac\xab,\x5c\xee\x95\x91S\xbd\xff\xde\
-'\xa9n~|\xad\xf7o\xda\x9ed}\x92\xc5\x86k\
-\xa8\xbe\xb0x\x89\x12\x00e\xef&\xac\xe8]q\xafN\
-\xb2\xa9\x97\xcd\xa9\xee\x0e\xdf\x96\xe4\xe9T?C<y\
-\xdb\xffm\xcbm\xff\xbf\xebR\xddi?\xe6\xcf\xd9\x1a\
-K\xe2\x1e\x13Q\x02\x00\x8a\xf3\x9c\x05K\x94\x00\x80\xf2\
-\xbcg\xb1\x12%\x00\xa0<\xffi\xa1\x92x:\x00\xa0\
-8\x97-Rb'\x00\xa0,c\x16'Q\x02\x00\xca\
-\xb3\xdc\xc2$\xf1s\x00@q\xd6X\x94\xc4N\x00@\
-yVX\x90\xc4N\x00@y\x16Y\x8c\xc4N\x00@\
-y\xe6%\xb9j1\x12%\x00\xa0<\xa7,D\x12?\
-\x07\x00\x14\xe7c\x8b\x90\xd8\x09\x00(\xcf^\x0b\x90(\
-\x01\x00\xe5Ye\xf1\x11%\x00\xa0L\xbe\x07 \xee\x09\
-\x00(\xd0~\x0b\x8f\xd8\x09\x00(\xcfX|\x14H\xec\
-\x04\x00\x14i\xca\xa2#v\x02\x00\xca3\x9e\xe4\x92E\
-G\xec\x04\x00\x94\xe7\x05\x0b\x8e\xd8\x09\x00(\xd31\x0b\
-\x8e\xd8\x09\x00(\xcf\xe2$\xe7-8b'\x00\xa0<\
-\xeb\xe3\xa9\x00\xb1\x13\x00P\xa4m\xbd\xc9\xd6\xa2#v\
-\x02\x00\x0a\xf3d\x92k\x16\x1c\xb1\x13\x00\xa0\x04\x88(\
-\x01\x00\x85x*~\x0e\x10?\x07\x00\xd8\x09\x10\xb1\x13\
-\x00\xa0\x04\x88(\x01\x00J\x80\x88\x12\x00\xa0\x04\x88(\
-\x01\x00J\x80\x88\x12\x00\xa0\x04\x88(\x01\x00J\x80\x88\
-\x12\x00\xa0\x04\x88(\x01\x00J\x80\x88\x12\x00\xa0\x04\x88\
-(\x01\x00\x0d\xe1\xb5\xc1\xe2\xb5\xc1\x00v\x02D\xec\x04\
-\x00(\x01\x22J\x00\x80\x12 \xa2\x04\x00(\x01\x22J\
-\x00@\x87\xb81P\xdc\x18\x08`'@\xc4N\x00\x80\
-\x12 \xa2\x04\x00(\x01\x22J\x00\x80\x12 \xa2\x04\x00\
-(\x01\x22J\x00\x80\x12 \xa2\x04\x00(\x01\x22J\x00\
-\x80\x12 \xa2\x04\x00(\x01\x22J\x00@\x13yc\xa0\
-xc \x80\x9d\x00\x11;\x01\x00J\x80\x88\x12\x00\xa0\
-\x04\x88(\x01\x00\xdd\xe4\x9e\x00ij\xae%\xd9\xea\x14\
-\x05P\x02\xa4\xbc\x5cN\xb2\xce)\x0aP\x1f?\x07H\
-S\xf3c\x921\xa7(\x80\x9d\x00)/\x1f9=\x01\
-\xec\x04H\x99\xf1\x8e\x00\x00;\x01R`\xce$\x19q\
-z\x02\xd8\x09\x90\xf2\xb2\xd7\xa9\x09\xa0\x04H\x997\x04\
-\xcesj\x02\xd4\xcf\xcf\x01\xd2\xb4<\xe9\xb4\x04\xb0\x13\
- \xe5\xe5C\xa7$\x80\x9d\x00)/W\x92\xccwJ\
-\x02\xd8\x09\x902\x03\x80\x9d\x00Q\x00\x00P\x02D\x01\
-\x00@\x09\x10\x05\x00\x00%@\x14\x00\x00\xe6\xc8\x8d\x81\
-\xa2\x00\x00\xd8\x09\x10Q\x00\x00\x94\x00\x11\x05\x00@\x09\
-\x10Q\x00\x00\x94\x00\x11\x05\x00@\x09\x10Q\x00\x00\xda\
-\xce\xd3\x01\xa2\x00\x00\xd8\x09\x10\xe9k\xc6\x9d^\x00v\
-\x02\xa4\xac\xfc?\xa7\x15\x80\x12 \xe5\xe5\x7f8\xa5\x00\
-\xda\xc3\xcf\x01\xd2\xaf,r:\x01\xd8\x09\x90\xb2r\xc4\
-i\x04`'@\xca\xcb\x7fu\x0a\x01\xd8\x09\x90\xb2\xf2\
-\xa6S\x07\xc0N\x80\x94\x95_\x92\xfc\x17\xa7\x0d\x80\x9d\
-\x00)+\xff\xect\x01\xb0\x13 \x1e\xfb\x03\xc0N\x80\
-t8\xff\xd3\xe9\x01\xd0m\xdb\xed\x04\xc8\x9f\xf2oN\
-\x0b\x00;\x01RV>q:\x00(\x01b\xf1\x07@\
-\x09\x90\x0e\xe7\xa8\xc3\x1f@\x09P\x02,\xfe\x00(\x01\
-b\xf1\x07@\x09\x10\x8b?\x00J\x80X\xfc\x01P\x02\
-\xc4\xe2\x0f\x80\x12 \x0d\x5c\xfc\xe79\xa4\x01P\x02,\
-\xfe\x00\xa0\x04X\xfc\x01@\x09\xb0\xf8\x03@\x8f\x0f\x08\
-y\xbd/\x00v\x02\xc4\x95?\x00J\x804!\x9fZ\
-\xfc\x01P\x02,\xfe\x00\xa0\x04X\xfc\x01@\x09\xb0\xf8\
-\x03\x80\x12`\xf1\x07\x00%\xc0\xe2\x0f\x00J\x80\xc5\x1f\
-\x00\x94\x00\x8b?\x00(\x01\x16\x7f\x00H\xbc6\xd8\xe2\
-\x0f\x80\x9d\x00\xb1\xf8\x03\xa0\x04\x88\xc5\x1f\x00%@\x1e\
-\x90\xcf,\xfe\x00(\x01\x16\x7f\x00P\x02,\xfe\x00\xa0\
-\x04X\xfc\x01@\x09\xb0\xf8\x03\x80\x12`\xf1\x07\x00%\
-\xc0\xe2\x0f\x00J\x80\xc5\x1f\x00\x94\x80\x81\xe5\x7f[\xfc\
-\x01P\x02,\xfe\x00\xa0\x04X\xfc\x01\xa0\x0c%|E\
-\xf0\x98\xc5\x1f\x00\xca\xda\x09p\xe5\x0f\x00\x85\xed\x04\xfc\
-\xbb\xc5\x1f\x00\xca*\x01\x16\x7f\x00\x98\x81.\xfc\x1c\xf0\
-\x7f\x92\xcc7\x94\x00PN\x09\xb0\xf8\x03@a%\xc0\
-\xe2\x0f\x00\x85\x95\x00\x8b?\x00\x14V\x02,\xfe\x00P\
-X\x09\xb0\xf8\x03@a%\xc0\xe2\x0f\x00\x03\xb0\xbdA\
-%\xe0?\xe29\x7f\x00\x18\x98\xadI\xae\x0cy\xf1?\
-\xea\xca\x1f\x00\x06oC\x92\x9f\x86\xb4\xf8O\xfa\xf3\x03\
-\xc0\xf0\x8c\xf5\xae\xc4\x07\xb5\xf0\xdfH\xf2\xdf\xfd\xd9\x01\
-\xa0\x19v\x0c`7\xe0\x7f%\x19\xf7\xa7\x06\x80fY\
-\x98\xe4\xb5$\x17\xfb\xbc\xf0\x1fK\xb2\xde\x9f\x17\x00\x9a\
-mA\x92=I\x8e\xa7\xda\xb2\x9f\xcd\xa2\x7f)\xc9T\
-\x92\xff\xe6\xcf\x09\x00\xed36\x8b\xc5\xff\x9f\xfc\xd9\xfe\
-\xf0\xff\x01~\xcep\xd0Nc\xd3i\x00\x00\x00\x00I\
-END\xaeB`\x82\
-\x00\x00\x1a\x81\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4x\xd4\xfa\
-\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95+\x0e\x1b\x00\x00\x04\xeeiTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 7.1-c000 79\
-.9ccc4de, 2022/0\
-3/14-11:26:19   \
-     \x22> <rdf:RDF\
- xmlns:rdf=\x22http\
-://www.w3.org/19\
-99/02/22-rdf-syn\
-tax-ns#\x22> <rdf:D\
-escription rdf:a\
-bout=\x22\x22 xmlns:xm\
-p=\x22http://ns.ado\
-be.com/xap/1.0/\x22\
- xmlns:dc=\x22http:\
-//purl.org/dc/el\
-ements/1.1/\x22 xml\
-ns:photoshop=\x22ht\
-tp://ns.adobe.co\
-m/photoshop/1.0/\
-\x22 xmlns:xmpMM=\x22h\
-ttp://ns.adobe.c\
-om/xap/1.0/mm/\x22 \
-xmlns:stEvt=\x22htt\
-p://ns.adobe.com\
-/xap/1.0/sType/R\
-esourceEvent#\x22 x\
-mp:CreatorTool=\x22\
-Adobe Photoshop \
-23.3 (Windows)\x22 \
-xmp:CreateDate=\x22\
-2024-04-22T15:07\
-:29+02:00\x22 xmp:M\
-odifyDate=\x222024-\
-04-22T15:34:01+0\
-2:00\x22 xmp:Metada\
-taDate=\x222024-04-\
-22T15:34:01+02:0\
-0\x22 dc:format=\x22im\
-age/png\x22 photosh\
-op:ColorMode=\x223\x22\
- xmpMM:InstanceI\
-D=\x22xmp.iid:da9df\
-449-5e7c-2b45-a1\
-a4-fdc8c4c4398a\x22\
- xmpMM:DocumentI\
-D=\x22xmp.did:da9df\
-449-5e7c-2b45-a1\
-a4-fdc8c4c4398a\x22\
- xmpMM:OriginalD\
-ocumentID=\x22xmp.d\
-id:da9df449-5e7c\
--2b45-a1a4-fdc8c\
-4c4398a\x22> <xmpMM\
-:History> <rdf:S\
-eq> <rdf:li stEv\
-t:action=\x22create\
-d\x22 stEvt:instanc\
-eID=\x22xmp.iid:da9\
-df449-5e7c-2b45-\
-a1a4-fdc8c4c4398\
-a\x22 stEvt:when=\x222\
-024-04-22T15:07:\
-29+02:00\x22 stEvt:\
-softwareAgent=\x22A\
-dobe Photoshop 2\
-3.3 (Windows)\x22/>\
- </rdf:Seq> </xm\
-pMM:History> </r\
-df:Description> \
-</rdf:RDF> </x:x\
-mpmeta> <?xpacke\
-t end=\x22r\x22?>\x85\xdf\xa4p\x00\
-\x00\x159IDATx\xda\xed\xddm\xccde}\
-\x06\xf0k7\xe4\x09!\x9b\x0d\xdd\xd2\x8d\xa1\xa4!\xc6\
-\xacHIc\xb6\x94n+\xea\xb0Bi\x8d%\x80\x86\
-\xbe\xd1\xa5\xf5\x03M\xd3\xd6\xbe\x98,j\xe3\x87\x86\x1a\
-K_>XkS\xdb\x10E\x83\x22\xd62\x95\xb4B\
-)\xdb\x91\x8a\x81\xb5/)\x11\x82\x94\x22]7\xb4%\
-\x08\xba]\x116\xcbN?\x9cy\xca\x0a\xec\xf2\xec3\
-o\xe7\x9c\xff\xef\x97L\x94\x0f\xe8<\xf7\x99s\xeek\
-\xee\xfb\xccu6\x8c\xc7\xe3\x00\x00\xb5l4\x04\x00 \
-\x00\x00\x00\x02\x00\x00 \x00\x00\x00\x02\x00\x00 \x00\x00\
-\x00\x02\x00\x00 \x00\x00\x00\x02\x00\x00 \x00\x00\x00\x02\
-\x00\x00 \x00\x00\x00\x02\x00\x00 \x00\x00\x00\x02\x00\x00\
- \x00\x00\x00\x02\x00\x00 \x00\x00\x80\x00\x00\x00\x08\x00\
-\x00@O\x9d\xd4\x957\xbaa\xc3\x86\xb6\xbd\xa5-I\
-\xb6%9+\xc9\xd6$\xdf\x9ddS\x92S&\xff\xf9\
-d\x92\xa7\x93\x1cL\xf2\xcd$\x8f$yh\xf2:\xe4\
-\xa3\x07\xb00\xa7&\xd9\x91\xe4\xec$\xafIr\xda\xe4\
-:\x9d\xc95z_\x92\xffL\xb2w\xf2\x9a\xea\x1a=\
-\x1e\x8f\x05\x80\x9e\x05\xa5\x1dI\x06I.H\xf2\x03\x93\
-\x0f\xd0z\x1c\x99|\xd8\xf6&\xb93\xc9\x9e$\x0f\x1b\
-b\x80\x99\xda\x9c\xe4\xca$\x97M\xae\xddk\x9d\xef\x9e\
-NrW\x92\xeb\x93\x0c\x93\x1c\xee\xed\x08\x8d\xc7\xe3N\
-\xbc\x96\xe0\xe4$W$\xb95\xc9\xb7\x92\x8c\xe7\xf8\xfa\
-Z\x92\x0f&9\xcf9\x0b0\x95\xadI\xde\x9ff\xe5\
-u\xdak\xf3\x7f%y\xcfd>\xe8\xdf\xbc*\x00\xbc\
-\xc8\xb9I\xfebF\x1f\x9e\xf5\xbc\xbe2\xf9\xc0mu\
-\x1e\x03\x9c\x90]I\x9e\x9a\xd3\x97\xb4]\x02@\x7f\x03\
-\xc0\xf9\x93o\xfb\xe3\x96\xbc\x9eM\xf2\xe1$g8\xa7\
-\x01\x8e\xeb\x8c$w,\xe0\xba|c\x9a\xfb\xbc\x04\x80\
-\x9e\x04\x80\xf3\x93\xdc\xdd\xa2\x89\xffXA\xc0\x8a\x00\xc0\
-\x8b\xedL\xf2?\x0b\xbc&\xff[\x923\x05\x80n\x07\
-\x80-I>\x90\xe4\xb9\x16O\xfeG\xbf\x9eJ\xf2\x8e\
-\xf8\xe9&\xc0\xaa\xddK\xba\x86\x7f\xedx!@\x00h\
-w\x00x{\x92\xafwd\xe2\x7f\xe1\xebKi~\x85\
-\x00P\xd5\xe6$\xb7,\xf9Z\xfc\x1fIN\x17\x00\xba\
-\x13\x006%\xf9dG'\xfe\xa3_\xdf\x9e\xac\x06\x00\
-T\xb3}2\xf9\xb6\xe1Z|o^\xe2\xe7\x85\x02@\
-\xfb\x02\xc0\xf6$\xff\xde\x83\xc9\xff\xe8\xd7g\xd2\x14\x5c\
-\x00T\xb0k\xf2\x05\xa8M\xd7\xe1\xdf\xe9j\x00\xd8\xd0\
-\x95\xc6\xa2)\x9b\x00/Os\xf7\xe6\xc9=<!\x1e\
-Hrq\x92\xfd\xae\x0d@O\x9d\x92\xe6f\xe8+[\
-\xf8\xde\x8e$\xf9\xe1$\xfftt\x00\xe8\x82\x0a7\x94\
-\xedJ\xf2\xa9\x9eN\xfeISmyo\x92s\x5c#\
-\x80\x1e\xda6\xb9\xc6]\xd9\xd2\xf7\xb71M\xf1P\xe7\
-\xf4=\x00\xbc'\xc9\x0d\xe9\x7f\xe5\xf1\xe9I>\x1fM\
-\x82@\xbf\xbc-\xc9?w\xe0\x0b\xce\x85i~\x8e(\
-\x00\xb4\xc4\xaf&y_\xa1\x13eK\x9a\x22\x8c\xd7\xba\
-f\x00\x1dwR\x92\xeb\x92|:\xcf?\xb4\xa7\xed~\
-\xb3k\x83\xdc\xd7{\x00~6\xcd\x9e\x7fE\x8f%y\
-]\x92G]C\x80\x0e:}2\xf1\xffh\xc7\xde\xf7\
-\xe1$\xdf\x9b\xe4q\xf7\x00,\xcf\x9b\xd3,\xfbW>\
-yn\xcf\xfa\x9fV\x08\xb0,;\x93\xfck\x07'\xff\
-\xa4Y\xb5x[\x97\xdep\xdf\x02\xc0+\xd3\xfc\xce\xbf\
-\xfac\x8e\xb7M\x12\xb4\xd6@\xa0+v\xa7\xd9\xc6\xec\
-r\xed\xf9\x05\x02\xc0r\xacL&\xbd\xcd\xce\xa3$\xcd\
-\xf3\xaf\xdfe\x18\x80\x96[m\xf5\xbb\xae\x07sR\xa7\
-n\xc4\xee\xd3=\x00\x1fLs\xe3\x1f\xcf;\x92\xe4\xa2\
-${\x0c\x05\xd0B\xe7N\xbe\xb8\x9d\xd9\xa3\xbf\xe9{\
-\xc6\xe3\xf1\x13V\x00\x16\xe7B\x93\xff1\x8f\xefG\xb2\
-\x86\xc7W\x02,\xd8\xae$\xff\xd8\xb3\xc9?9\xc6\xf3\
-\x01\x04\x80\xf9X\x99|\xfb\xe7\xa5}_\x92\xf7\x1a\x06\
-\xa0%NNr}\x9a\x9b\xb5\xfbX\xd0\xb6E\x00X\
-\x9c\xddI\xcerN\x1d\xd7o\x19#\xa0\x05\xb6\xa5y\
-\xa2\xe9\xdb{\xfc7\x9e*\x00,\xc6\x99I~\xdb9\
-\xf5\xb2V\x92|\xc80\x00KtIj\xd4\x96w\xe6\
-Wh]\x0f\x00\xefN\x7f;\xfegmg\x927\x18\
-\x06`\x09\x13\xe2uI\xfe:\x9e^*\x00\xcc\xc8+\
-\xd2\xdcD\xc2\xda\xb9\x17\x00X\xa4\xd5\xe7\x94\xec6\x14\
-\x02\xc0,]\xe3\xdb\xff\x09\xbb0\xddl\xd8\x02\xbag\
-\x90\xe6A>\xae9\x02\xc0LmNr\xb5\xc3\xb7.\
-\xef4\x04\xc0\x9c\xedNrg\x9a\x95ZZ\xaa\xab\x95\
-\xb9W\xc4o\xdb\xd7\xeb-i\x9e\x13\xf0\x84\xa1\x00\xe6\
-\xf0\xe5\xec\x86$\x97\x1a\x0a+\x00\xf3r\x95C\xb7n\
-+\xe9\xd8\x03+\x80N\xd8\x9e\xe6A>&\x7f\x01`\
-n\xceLr\xbeC'@\x01\xad\xb1+\xc9\xddi\x1e\
-\xc8\x86\x0007W8lS\xdb\x91\xa6!\x10`\x1a\
-}o\xf5\x13\x00Z\xe6\x22\x87m&v\x1a\x02`\x0a\
-\x15Z\xfd\x04\x80\x16Y\x89\x9f\x94\xcc\xca\x9b\x0c\x01\xb0\
-NUZ\xfd\x04\x80\x169/\xee\xfe\xb7\x02\x00,\x8b\
-V\xbf\x9e\x1d\xcc.q\xf3\xdf\xec\x9c\x9e\xe6\x86\x9dG\
-\x0c\x05\xb0\xc6k\xc6\xa7c\x15\xd6\x0a\xc0\x92|\xbfC\
-6S\x9e\x10\x08\xac\xc5 Z\xfd\x04\x00\x13\x96\x00\x00\
-\x94\xa2\xd5\xaf\xa7\xba\xb6\x05\xf0*\x87l\xa6^m\x08\
-\x80c\xd0\xea'\x00\xb4\xc6\xd6\xb8\xe9d\xd6\xb6\x19\x02\
-\xe0%lO\xb3\xdf\xaf\xd8\xa7\xc7\xba\xb4\x05\xb0\xc5\xe1\
-2\xa6\xc0\xdci\xf5\x13\x00Zg\x93\xc35s\x9b\x0d\
-\x010\xa1\xd5\xaf\x98.m\x01\x98\xac\x84*`>\xb6\
-%\xf9L\x14\xfbX\x010YY\x01\x00\xca\xd0\xea'\
-\x00\xb4\xde\x8a\xc3eL\x81\x99\xd1\xea\xe7\x03\x00@1\
-Z\xfd\xe8\xe4\xd3\x00\x01X\xbfA\xb4\xfa!\x00\x00\x94\
-\xa2\xd5\x8f\xffg\x0b\x00\xa0\xff\xb4\xfa!\x00\x00\x14\xa3\
-\xd5\x8f\x97d\x0b\x00\xa0\xbf\xb4\xfa!\x00\x00\x14\xa2\xd5\
-\x8f\x97e\x0b\x00\xa0_\xb4\xfaa\x05\x00\xa0\x18\xad~\
-\x08\x00\x00\x85h\xf5c]\x1f\x1a\x00\xbaK\xab\x1fV\
-\x00\x00\x8a\x19D\xab\x1f\x02\x00@)Z\xfd\x98\x8a-\
-\x00\x80n\xd1\xea\x87\x00\x00P\x8cV?f\xc6\x16\x00\
-@7h\xf5C\x00\x00(D\xab\x1fsa\x0b\x00\xa0\
-\xbd\xb4\xfaa\x05\x00\xa0\x18\xad~\x08\x00\x00\x85h\xf5\
-ca\x1f4\x00\xdaA\xab\x1fV\x00\x00\x8a\x19D\xab\
-\x1f\x02\x00@)Z\xfdX8[\x00\x00\xcb\xa3\xd5\x0f\
-\x01\x00\xa0\x18\xad~,\x95-\x00\x80\xc5\xd3\xea\x87\x00\
-\x00P\x88V?Z\xc3\x16\x00\xc0bh\xf5\xc3\x0a\x00\
-@1Z\xfd\x10\x00\x00\x0a\xd1\xeaG\xab?\x9c\x00\xcc\
-\x9eV?\xac\x00\x00\x143\x88V?\x04\x00\x80R\xb4\
-\xfa\xd1\x09\xb6\x00\x00fC\xab\x1f\x02\x00@1Z\xfd\
-\xe8\x1c[\x00\x00\xd3\xd1\xea\x87\x00\x00P\x88V?:\
-\xcd\x16\x00\xc0\x89\xd3\xea\x87\x15\x00\x80b\xb4\xfa!\x00\
-\x00\x14\xa2\xd5\x8f\xde}\xa0\x018>\xad~X\x01\x00\
-(f\x10\xad~\x08\x00\x00\xa5h\xf5\xa3\xb7l\x01\x00\
-\xbc\x98V?\x04\x00\x80b\xb4\xfaQ\x82-\x00\x80\xe7\
-i\xf5C\x00\x00(D\xab\x1f\xe5\xd8\x02\x00\xaa\xd3\xea\
-\x87\x15\x00\x80b\xb4\xfa!\x00\x00\x14\xa2\xd5\x0f'\x81\
-!\x00\x8a\xd1\xea\x07V\x00\x80b\x06\xd1\xea\x07\x02\x00\
-P\x8aV?8\x8a-\x00\xa0\xef\xb4\xfa\x81\x00\x00\x14\
-\xa3\xd5\x0f\x8e\xc1\x16\x00\xd0WZ\xfd@\x00\x00\x0a\xd1\
-\xea\x07k`\x0b\x00\xe8\x13\xad~`\x05\x00(F\xab\
-\x1f\x08\x00@!Z\xfd`\x9d'\x0e@Wi\xf5\x03\
-+\x00@1\x83h\xf5\x03\x01\x00(E\xab\x1fL\xc9\
-\x16\x00\xd0%Z\xfd@\x00\x00\x8a\xd1\xea\x073d\x0b\
-\x00\xe8\x02\xad~ \x00\x00\x85h\xf5\x839\xb1\x05\x00\
-\xb4\x95V?\xb0\x02\x00\x14\xa3\xd5\x0f\x04\x00\xa0\x10\xad\
-~\xb0\xc0\x93\x0d\xa0\x0d\xb4\xfa\x81\x15\x00\xa0\x98A\xb4\
-\xfa\x81\x00\x00\x94\xa2\xd5\x0f\x96\xc0\x16\x00\xb0,Z\xfd\
-@\x00\x00\x8a\xd1\xea\x07Kf\x0b\x00X4\xad~ \
-\x00\x00\x85h\xf5\x83\x16\xb1\x05\x00,\x82V?\xb0\x02\
-\x00\x14\xa3\xd5\x0f\x04\x00\xa0\x10\xad~\xd0\xf2\x13\x14`\
-\xd6\xb4\xfa\x81\x15\x00\xa0\x98A\xb4\xfa\x81\x00\x00\x94\xa2\
-\xd5\x0f:\xc2\x16\x000\x0bZ\xfd@\x00\x00\x8a\xd1\xea\
-\x07\x1dd\x0b\x00\x98\x86V?\x10\x00\x80B\xb4\xfaA\
-\xc7\xd9\x02\x00N\x94V?\xb0\x02\x00\x14\xa3\xd5\x0f\x04\
-\x00\xa0\x10\xad~\xd0\xc3\x93\x1a\xe0x\xb4\xfa\x81\x15\x00\
-\xa0\x98A\xb4\xfa\x81\x00\x00\x94\xa2\xd5\x0fz\xcc\x16\x00\
-\xf0BZ\xfd@\x00\x00\x8a\xd1\xea\x07E\xd8\x02\x00V\
-i\xf5\x03\x01\x00(D\xab\x1f\x14d\x0b\x00j\xd3\xea\
-\x07V\x00\x80b\xb4\xfa\x81\x00\x00\x14\xa2\xd5\x0f\xb0\x05\
-\x00\xc5h\xf5\x03\xac\x00@1\x83h\xf5\x03\x04\x00(\
-E\xab\x1f\xf0\x1dl\x01@\xbfi\xf5\x03\x04\x00(F\
-\xab\x1fpL\xb6\x00\xa0\x9f\xb4\xfa\x01\x02\x00\x14\xa2\xd5\
-\x0fX\x13[\x00\xd0\x1fZ\xfd\x00+\x00P\x8cV?\
-@\x00\x80B\xb4\xfa\x01\xeb\xbex\x00\xdd\xa4\xd5\x0f\xb0\
-\x02\x00\xc5\x0c\xa2\xd5\x0f\x10\x00\xa0\x14\xad~\xc0\xd4l\
-\x01@wh\xf5\x03\x04\x00(F\xab\x1f0S\xb6\x00\
-\xa0\xfd\xb4\xfa\x01\x02\x00\x14\xa2\xd5\x0f\x98\x1b[\x00\xd0\
-NZ\xfd\x00+\x00P\xcc%I\xbed\xf2\x07\x04\x00\
-\xa8\xe1\xe8V\xbf\xcd\x86\x03\x98\xf7\x05\x07X>\xad~\
-\x80\x15\x00(f\x10\xad~\x80\x00\x00\xa5h\xf5\x03\x96\
-\xc2\x16\x00,\x87V?@\x00\x80b\xb4\xfa\x01Kg\
-\x0b\x00\x16K\xab\x1f \x00@!Z\xfd\x80V\xb1\x05\
-\x00\xf3\xa7\xd5\x0f\xb0\x02\x00\xc5h\xf5\x03\x04\x00(D\
-\xab\x1f\xd0\xfa\x8b\x140[Z\xfd\x00+\x00P\xcc \
-Z\xfd\x00\x01\x00J\xd1\xea\x07t\x86-\x00\x98\x9eV\
-?@\x00\x80b\xb4\xfa\x01\x9dd\x0b\x00\xd6O\xab\x1f\
- \x00@!Z\xfd\x80\xce\xb3\x05\x00'F\xab\x1f`\
-\x05\x00\x8a\xd1\xea\x07\x08\x00P\x88V?\xa0\x97\x176\
-\xe0\xd8\xb4\xfa\x01V\x00\xa0\x98A\xb4\xfa\x01\x02\x00\x94\
-\xa2\xd5\x0f\xe85[\x00\xf0\x9d\xb6$\xb91\xc9\x8f\x1b\
-\x0a@\x00\x80\x1a\xb4\xfa\x01e\xd8\x02\x80\x86V?@\
-\x00\x80B\xb4\xfa\x01%\xd9\x02\xa02\xad~\x80\x15\x00\
-(F\xab\x1f \x00@!Z\xfd\x00b\x0b\x80Z\xb4\
-\xfa\x01X\x01\xa0\x98A\xb4\xfa\x01\x08\x00\x94\xa2\xd5\x0f\
-\xe0\x05l\x01\xd0gZ\xfd\x00\x04\x00\x8a\xd1\xea\x07p\
-\x1c\xb6\x00\xe8#\xad~\x00\x02\x00\x85h\xf5\x03X#\
-[\x00\xf4\x85V?\x00+\x00\x14si\xb4\xfa\x01\x08\
-\x00\x94\xb1\xda\xeawK\xb4\xfa\x01\x9c\xf0\x05\x14\xbaH\
-\xab\x1f\x80\x15\x00\x8a\x19D\xab\x1f\x80\x00@)Z\xfd\
-\x00f\xc0\x16\x00]\xa1\xd5\x0f@\x00\xa0\x98\xedi~\
-\xe2w\xa6\xa1\x00\x98\x0d[\x00\xb4\xddj\xab\x9f\xc9\x1f\
-@\x00\xa0\x00\xad~\x00sd\x0b\x806\xd2\xea\x07`\
-\x05\x80b.\x8dV?\x00\x01\x802\xb4\xfa\x01,\xf8\
-\xa2\x0b\xcb\xa6\xd5\x0f\xc0\x0a\x00\xc5\x0c\xa2\xd5\x0f@\x00\
-\xa0\x14\xad~\x00Kb\x0b\x80e\xd8\x92\xe4\xe3I\xde\
-l(\x00\x04\x00jxe\x92\xcf\xa5\xf9\xa9\x1f\x00K\
-b\x0b\x80E\xda\x91\xe6'~&\x7f\x00\x01\x80\x22\xce\
-N\xf27i\x96\xff\x01\x10\x00(\xe0\xb4$\xb7\x9b\xfc\
-\x01\x04\x00j\xf9H\x923\x0c\x03\x80\x00@\x1dW'\
-y\x8ba\x00\x10\x00\xa8cS\x92k\x0d\x03\x80\x00@\
--\xd7$\xd9j\x18\x00\x04\x00\xeaXI\xb3\xfc\x0f\x80\
-\x00@!?\xed\xdb?\x80\x00@=o5\x04\x00\x02\
-\x00\xb5\xac$\xd9i\x18\x00\x04\x00j\xd9\x9e\xe6\x17\x00\
-\x00\x08\x00\x14r\x8e!\x00\x10\x00\xa8\xe7\xd5\x86\x00@\
-\x00\xa0\x9eS\x0d\x01\x80\x00@=\x9b\x0d\x01\x80\x00@\
-=\x87\x0d\x01\x80\x00@=\x07\x0c\x01\x80\x00@=\x8f\
-\x1b\x02\x00\x01\x80z\xee7\x04\x00\x02\x00\xf5\xdcg\x08\
-\x00\x04\x00\xeay0\xc9~\xc3\x00 \x00P\xcf\xdf\x1a\
-\x02\x00\x01\x80zn4\x04\x00\x02\x00\xf5\xdc\x15\xf7\x02\
-\x00\x08\x00\x94t\x9d!\x00\x10\x00\xa8\xe7\x13I\xf6\x1a\
-\x06\x00\x01\x80z~=\xaa\x81\x01\x04\x00\xca\xb9'\xc9\
-\xb5\x86\x01@\x00\xa0\x9e\xdfMr\x9ba\x00\x10\x00\xa8\
-\xe5H\x92\xcb\x92|\xc1P\x00\x08\x00\xd4\xf2L\x92\x9f\
-L22\x14\x00\x02\x00\xb5|#\xc9\xc5I>f(\
-\x00\x04\x00j9\x94\xe4\xaa$\xbf4\xf9\xef\x00\x08\x00\
-\x14\xf2\xe7I~$\xc9\xa3\x86\x02@\x00\xa0\x96\x7fI\
-\xf2\x83\xf1\x0b\x01\x00\x01\x80r\x9eL\xf2\x13I\xaeI\
-\xf3k\x01\x00\x04\x00\x0a\xf9\xfd$oJ\xf2\xb8\xa1\x00\
-\x10\x00\xa8e\x94fK\xe0\x1eC\x01 \x00P\xcb\xfe\
-$\xaf\x9f\xac\x08\x00 \x00P\xc8\xe14\xf7\x04\x5c\x96\
-\xe4\x80\xe1\x00\x10\x00\xa8e\x98\xe4\x87\x92|\xd9P\x00\
-\x08\x00\xd4\xf2P\x9a\xbe\x80\x9b\x0c\x05\x80\x00@-\x07\
-\x93\xfcL\xb4\x07\x02\x08\x00\x94\xa4=\x10@\x00\xa0(\
-\xed\x81\x00\x02\x00Ei\x0f\x04\x10\x00(L{ \x80\
-\x00@Q\xa3h\x0f\x04\x10\x00(I{ \x80\x00@\
-Q\xda\x03\x01\x04\x00\x0a\x1bF{ \x80\x00@I\xda\
-\x03\x01\x04\x00\x8a\xd2\x1e\x08 \x00P\x98\xf6@\x00\x01\
-\x80\xa2\xb4\x07\x02\x08\x00\x14\xa5=\x10@\x00\xa00\xed\
-\x81\x00\x02\x00E\x8d\xa2=\x10\x10\x00\xa0$\xed\x81\x80\
-\x00\x00Ei\x0f\x04\x04\x00(l\x18\xed\x81\x80\x00\x00\
-%i\x0f\x04\x04\x00(J{  \x00@a\xda\x03\
-\x01\x01\x00\x8a\xd2\x1e\x08\x08\x00P\x94\xf6@@\x00\x80\
-\xc2\xb4\x07\x02\x02\x00\x145\x8a\xf6@@\x00\x80\x92\xb4\
-\x07\x02\x02\x00\x14\xa5=\x10\x10\x00\xa0\xb0a\xb4\x07\x02\
-\x02\x00\x94\xa4=\x10\x10\x00\xa0(\xed\x81\x80\x00\x00\x85\
-i\x0f\x04\x04\x00(J{  \x00@Q\xda\x03\x01\
-\x01\x00\x0a\xd3\x1e\x08\x08\x00P\xd4(\xda\x03\x01\x01\x00\
-J\xd2\x1e\x08\x08\x00P\x94\xf6@@\x00\x80\xc2\x86\xd1\
-\x1e\x08\x08\x00P\x92\xf6@@\x00\x80\xa2\xb4\x07\x02\x02\
-\x00\x14\xa6=\x10\x10\x00\xa0(\xed\x81\x80\x00\x00Ei\
-\x0f\x04\x04\x00(L{  \x00@Q\xa3h\x0f\x04\
-\x04\x00(I{  \x00@Q\xda\x03\x01\x01\x00\x0a\
-\x1bF{  \x00@I\xda\x03\x01\x01\x00\x8a\xd2\x1e\
-\x08\x08\x00P\x98\xf6@@\x00\x80\xa2\xb4\x07\x02\x02\x00\
-\x14\xa5=\x10\x10\x00\xa00\xed\x81\x80\x00\x00E\x8d\xa2\
-=\x10\x10\x00\xa0$\xed\x81\x80\x00\x00Ei\x0f\x04\x04\
-\x00(l\x18\xed\x81\x80\x00\x00%=4\x09\x01\x1f5\
-\x14\x80\x00\x00\xb5<\x93\xe4\x17\xa3=\x10\x10\x00\xa0$\
-\xed\x81\x80\x00\x00Ei\x0f\x04\x04\x00(J{  \
-\x00@a\xda\x03\x01\x01\x00\x8a\x1aE{ \x08\x00@\
-I\xda\x03A\x00\x00\x8a\xd2\x1e\x08\x02\x00P\xd80\xda\
-\x03A\x00\x00J\xd2\x1e\x08\x02\x00P\x94\xf6@\x10\x00\
-\x80\xc2\xb4\x07\x82\x00\x00\x14\xa5=\x10\x04\x00\xa0(\xed\
-\x81 \x00\x00\x85i\x0f\x04\x01\x00(j\x14\xed\x81 \
-\x00\x00%i\x0f\x04\x01\x00(J{ \x08\x00@a\
-\xc3h\x0f\x04\x01\x00(I{ \x08\x00@Q\xda\x03\
-A\x00\x00\x0a\xd3\x1e\x08\x02\x00P\x94\xf6@\x10\x00\x80\
-\xa2\xb4\x07\x82\x00\x00\x14\xa6=\x10\x04\x00\xa0\xa8Q\xb4\
-\x07\x82\x00\x00\x94\xa4=\x10\x04\x00\xa0(\xed\x81 \x00\
-\x00\x85\x0d\xa3=\x10\x04\x00\xa0$\xed\x81 \x00\x00E\
-i\x0f\x04\x01\x00(L{ \x08\x00@Q\xda\x03A\
-\x00\x00\x8a\xd2\x1e\x08\x02\x00P\x98\xf6@\x10\x00\x80\xa2\
-Fi\xb6\x04\xbeh(@\x00\x00j\xd9\x9f\xe4\x8d\xd1\
-\x1e\x08\x02\x00P\x8e\xf6@\x10\x00\x80\xc2\x86\xd1\x1e\x08\
-\x02\x00P\x92\xf6@\x10\x00\x80\xa2\xb4\x07\x82\x00\x00\x14\
-\xa6=\x10\x04\x00\xa0(\xed\x81 \x00\x00Ei\x0f\x04\
-\x01\x00(L{ \x08\x00@Q\xa3h\x0f\x04\x01\x00\
-(I{ \x08\x00@Q\xda\x03A\x00\x00\x0a\x1bF\
-{ \x08\x00@I\xda\x03A\x00\x00\x8a\xd2\x1e\x08\x02\
-\x00P\x98\xf6@\x10\x00\x80\xa2\xb4\x07\x82\x00\x00\x14\xa5\
-=\x10\x04\x00\xa00\xed\x81\x08\x00\x86\x00(j\x14\xed\
-\x81\x08\x00\x00%i\x0fD\x00\x00(J{ \x02\x00\
-@a\xc3h\x0fD\x00\x00(I{ \x02\x00@Q\
-\xda\x03\x11\x00\x00\x0a\xd3\x1e\x88\x00\x00P\x94\xf6@\x04\
-\x00\x80\xa2\xb4\x07\x22\x00\x00\x14\xa6=\x10\x01\x00\xa0\xa8\
-Q\xb4\x07\x22\x00\x00\x94\xa4=\x10\x01\x00\xa0(\xed\x81\
-\x08\x00\x00\x85\x0d\xa3=\x10\x01\x00\xa0$\xed\x81\x08\x00\
-\x00Ei\x0fD\x00\x00(L{ \x02\x00@Q\xda\
-\x03\x11\x00\x00\x8a\xd2\x1e\x88\x00\x00P\x98\xf6@\x04\x00\
-\x80\xa2F\xd1\x1e\x88\x00\x00P\x92\xf6@\x04\x00\x80\xa2\
-\xb4\x07\x22\x00\x00\x146\x8c\xf6@\x04\x00\x80\x92\xb4\x07\
-\x22\x00\x00\x14\xa5=\x10\x01\x00\xa00\xed\x81\x08\x00\x00\
-Ei\x0fD\x00\x00(J{ \x02\x00@a\xda\x03\
-\x11\x00\x00\x8a\x1aE{ \x02\x00@I\xda\x03\x11\x00\
-\x00\x8a\xd2\x1e\x88\x00\x00P\xd80\xda\x03\x11\x00\x00J\
-\xd2\x1e\x88\x00\x00P\x94\xf6@\x04\x00\x80\xc2\xb4\x07\x22\
-\x00\x00\x14\xa5=\x10\x01\x00\xa0(\xed\x81\x08\x00\x00\x85\
-i\x0fD\x00\x00(j\x14\xed\x81\x08\x00\x00%i\x0f\
-D\x00\x00(J{ \x02\x00@a\xc3h\x0fD\x00\
-\x00(I{ \x02\x00@Q\xda\x03\x11\x00\x00\x0a\xd3\
-\x1e\x88\x00\x00P\x94\xf6@\x04\x00\x80\xa2\xb4\x07\x22\x00\
-\x00\x14\xa6=P\x00\xe8\x0c7\xaf\x18S`\xb6F\xd1\
-\x1e(\x00t\xc0A\x87k\xe6\x94\x84\x00\xda\x03\x05\x00\
-\x93UAB\x15\x90h\x0f\x14\x00LVV\x00\x80\xd2\
-\x86\xd1\x1e(\x00\xb4\xd0\x93\x0e\x971\x05\xe6N{\xa0\
-\x00\xd0:\x8f'\xf9\x86C6\xf3\x13\x1d\xe0\x85\xb4\x07\
-\x0a\x00\xad\xf3\xb0C6S_1\x04\xc0qh\x0f\x14\
-\x00Z\xe3A\x87\xccx\x02\x0b\xa5=P\x00h\x85\xfb\
-\x1d2\x01\x00X8\xed\x81\x02\xc0\xd2}\xc1!\x9b\x99\
-\xc7\x92<b\x18\x80\x13\xa0=P\x00X\x9a\xbdI\x9e\
-v\xd8fb\x8f!\x00\xd6a\x14\xed\x81\x02\xc0\x12\x1c\
-\xb2\x0a03w\x1a\x02`\x9d\xb4\x07\x0a\x00&.+\
-\x00@Q\xda\x03\x05\x80\x85\xbb\xc9a\x9b\xda\x17\x93\xec\
-3\x0c\xc0\x0c\x0c\xa3=P\x00X\x90}I\xeer\xe8\
-\xa6\xf2qC\x00\xcc\x90\xf6@\x01\xc0\x04\xd6\x01\x87\x92\
-\xdcl\x18\x80\x19\xd3\x1e(\x00,\xc4\xcd\xf1k\x80\xf5\
-\xfal<\x03\x00\x98\x1f\xed\x81\x02\xc0\x5c\x1dH\xf2g\
-\x0e\xdf\xba\xfc\x91!\x00\xe6L{\xa0\x000W\x7f\x90\
-f\xc9\x89\xb5\xfb\xbb$\xf7\x18\x06`\x01\xb4\x07\x0a\x00\
-s\xf3\xdfq\xc3\xc9\x89\xba\xd6\x10\x00\x0b\xa6=P\x00\
-\x98\x8b\xf7\xc7\xbd\x00k\xf5\xf7Q\xa2\x04,\xc7(\xda\
-\x03\x05\x80\x19\xdb\x97\xe4}\x0e\xe3\xcb:\x94\xe4\xd7\x0c\
-\x03\xb0D\xfb\x93\x5c\x90\xe4Oz\xfew\x1e\x16\x00\x16\
-\xe7\x0f\xe3\xa9v\xc6\x08\xe8\xd2\x97\x91>\xb7\x07>!\
-\x00,\xf6\x03\xf5+\xce\xabcz4VI\x80v\x19\
-\xa6\xbf\xed\x81\x02\xc0\x82\xedI\xf2\xc7\xce\xa9\x179\x9c\
-\xe4\xe7\xe3>\x09\xa0}\x1eJ\xd3\x17\xf0\x89\x1e\xfdM\
-G\xd2<j]\x00X\xb0w\xc6O\xdc^\xe8\xbdq\
-\xe3\x1f\xd0^\x07\x93\xfc\x5c\xfa\xd3\x1e\xf8`:\xb4\xb5\
-\xd1\xa7\x00p8\xc9OE\xcb\xdd\xaa\xdb\xe2Q\x9d@\
-7\xf4\xa5=\xb0S_B7\xf6\xecC\xb4o\x92&\
-\x0f\x17?\x99\x1e\x9c\x8c\x83\xf2\x0d\xa0+\xfa\xd0\x1e\xd8\
-\xa9\xc7\xd5o\xec\xe1\x87\xe8\xb64\xfb\xdeU'\xbf\xc7\
-\x92\x5c\x1c+!@\xf7t\xb9=\xf0@\x9a\x9b\x1b\x05\
-\x80%\xbb)5\x7f\xf7~`r\xf2\xecs\x1d\x01:\
-\xac\x8b\xed\x81\x7f\x99\x8e\xddp\xbd\xb1\xc7\x1f\xa0?M\
-\xf2\xeeB'\xcc\x13I.Jr\x9fk\x07\xd0\x03\xa3\
-t\xa7=\xf0H:\xf8\xa0\xb5\x8d=\xff\x00\xfd^\x92\
-\xab\xd2\xff{\x02\xf6%y}\x92\xbd\xae\x19@\x8f\xec\
-O\xf2\xc6\xb4\xff\x86\xe6\x8f&y\xa0k\x83\xbba<\
-\x1ew\xe3\x8dn\xd80\xcd\xbf~I\x92O%9\xb9\
-\x87'\xc8\x97\xd3\xec\xf9?\x16\x80\xfe\xba\x22\xc9\xf5I\
-6\xb5\xec}\x1dL\xf2\x9aIXI\x92te^\xdd\
-X\xe4\x83\xf3\xd94KI\x0f\xf4\xec\xef\xfa\xab$\xaf\
-3\xf9\x03\x05\xdc<\xb9\x8e\xb7\xad=\xf0\x97\x8f\x9e\xfc\
-;e<\x1ew\xe25#\x9b\x92\xdc\x98d\xdc\xf1\xd7\
-\xb7\x93\xbc\xc3\xf5\x00(\xa8M\xd7\xf1\x1b:=\xaf\x16\
-\x0b\x00\xab~!\xc9\xd7;:\xf9\xdf\x9b\xe4\x1c\xd7\x00\
-\xa0\xb8\xab\x93<\xbb\xc4k\xf1\x1d9\xc6\xb6\xb2\x00\xd0\
-\xee\x00\x90$\xa7&\xf9@\x92\xe7:2\xf1?5\xf9\
-\xd6\xbf\xd1y\x0f\x90$\xd9\x9e\xe4\xabK\xb8\x1e\xdf\x9d\
-\xe3\xdc\x8b \x00\xb4?\x00\xac\xda\x91\xe4\xf3-\x9e\xf8\
-\x9fM\xf2\xa1$\xa79\xd7\x01^dK\x92\xcf-\xf0\
-\x9a\xfc\xc9$\xa7\x1c\xef\x0d\x09\x00\xdd\x09\x00\xab\xceO\
-rk\x8b&\xfeoMV(\xcep~\x03\x1c\xd7\xc6\
-$\xbf1\xb9n\xce\xf3\xcb\xd8\x9a\xee\xbd\x12\x00\xba\x17\
-\x00\x8e^R\xfap\x9a%\xf7eL\xfc\xf7'y\x97\
-o\xfc\x00'\xecUi\xfa\xf8g}]\xbeu\xf2\xbf\
-\xbd&\x02@w\x03\xc0\xaa\x95$\x97'\xb9%\xc9\xff\
-\xcey\xd2\xff\xea\xe4\xdb\xfev\xe7/\xc0\xd4\xde\x90\xe4\
-\xf6)\xaf\xcb\xcf\xa5\xd9Z\xf8\xb1\x13\xfd?\xef\xca\xbc\
-Z\xa5\x08hZ'%97\xc9\xce$\x17$y\xed\
-\x14\xdf\xd0\x8f\xa4y\xe4\xe5=I\xfe!\xc9\x9e$\x8f\
-8_\x01\xe6\xb2\x22py\x92\xcb\x92\x9c\x97\x97\xbf\x89\
-\xfa\x994\x8d\xaaw$\xf9X\xd6\xf9\x5c\x95\xce\xcc\xab\
-\x02\xc0\xba\x9d\x9ad[\x92\xb3\x92\xbc\x22\xc9w\xa5\xb9\
-+t\xf5\xf5d\x9a\x86\xa8\x83I\xbe9\x99\xf4\x1fL\
-\xf2p\x92C\xceK\x80\x85ZIr\xf6\xe4\xb5u\xf2\
-\xcf+i\x1e\xa2\xb6\x7f\xf2\xbao\x12\x02\xa6\x22\x00\x00\
-\x00\xad\xe57\xe5\x00 \x00\x00\x00\x02\x00\x00 \x00\x00\
-\x00\x02\x00\x00 \x00\x00\x00\x02\x00\x00 \x00\x00\x00\x02\
-\x00\x00 \x00\x00\x00\x02\x00\x00 \x00\x00\x00\x02\x00\x00\
- \x00\x00\x00\x02\x00\x00 \x00\x00\x00\x02\x00\x00 \x00\
-\x00\x80\x00\x00\x00\x08\x00\x00@_\xfd\x1f\x06\x81cy\
-\xe0+Zg\x00\x00\x00\x00IEND\xaeB`\x82\
-\
-\x00\x00$B\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4x\xd4\xfa\
-\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95+\x0e\x1b\x00\x00\x04\xeeiTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 7.1-c000 79\
-.9ccc4de, 2022/0\
-3/14-11:26:19   \
-     \x22> <rdf:RDF\
- xmlns:rdf=\x22http\
-://www.w3.org/19\
-99/02/22-rdf-syn\
-tax-ns#\x22> <rdf:D\
-escription rdf:a\
-bout=\x22\x22 xmlns:xm\
-p=\x22http://ns.ado\
-be.com/xap/1.0/\x22\
- xmlns:dc=\x22http:\
-//purl.org/dc/el\
-ements/1.1/\x22 xml\
-ns:photoshop=\x22ht\
-tp://ns.adobe.co\
-m/photoshop/1.0/\
-\x22 xmlns:xmpMM=\x22h\
-ttp://ns.adobe.c\
-om/xap/1.0/mm/\x22 \
-xmlns:stEvt=\x22htt\
-p://ns.adobe.com\
-/xap/1.0/sType/R\
-esourceEvent#\x22 x\
-mp:CreatorTool=\x22\
-Adobe Photoshop \
-23.3 (Windows)\x22 \
-xmp:CreateDate=\x22\
-2024-04-22T15:08\
-:01+02:00\x22 xmp:M\
-odifyDate=\x222024-\
-04-22T15:34:07+0\
-2:00\x22 xmp:Metada\
-taDate=\x222024-04-\
-22T15:34:07+02:0\
-0\x22 dc:format=\x22im\
-age/png\x22 photosh\
-op:ColorMode=\x223\x22\
- xmpMM:InstanceI\
-D=\x22xmp.iid:c2b6f\
-605-03bc-f64a-a3\
-da-db01db12bcb4\x22\
- xmpMM:DocumentI\
-D=\x22xmp.did:c2b6f\
-605-03bc-f64a-a3\
-da-db01db12bcb4\x22\
- xmpMM:OriginalD\
-ocumentID=\x22xmp.d\
-id:c2b6f605-03bc\
--f64a-a3da-db01d\
-b12bcb4\x22> <xmpMM\
-:History> <rdf:S\
-eq> <rdf:li stEv\
-t:action=\x22create\
-d\x22 stEvt:instanc\
-eID=\x22xmp.iid:c2b\
-6f605-03bc-f64a-\
-a3da-db01db12bcb\
-4\x22 stEvt:when=\x222\
-024-04-22T15:08:\
-01+02:00\x22 stEvt:\
-softwareAgent=\x22A\
-dobe Photoshop 2\
-3.3 (Windows)\x22/>\
- </rdf:Seq> </xm\
-pMM:History> </r\
-df:Description> \
-</rdf:RDF> </x:x\
-mpmeta> <?xpacke\
-t end=\x22r\x22?>\xbc\xbdqC\x00\
-\x00\x1e\xfaIDATx\xda\xed\xdd{h\x9d\xf7a\
-\xc7\xe1\xc8\xbaX\xb2.\xd6\xfdH\xb2\xae\x96d\xd9\xb2\
--\xcb7\xd9\xb2-[\xb2\xae\x96%Y\x17\x1f[\xb6\
-\xe3t6!\x1d\x1d+i:VV\x0a\xa1#\x832\
-V\x1a\xca`d\x84A\xd8\xe8\x1f-a\xac\xebL)\
-\xa1\xb0u\x8c0Zh\xc9e-M\xe7t\xa1-\x0d\
-\xab\x93\xa5\xee\x1a;\xb64\x9f\x94ti\x93\xb8\xb6u\
-$\x9d\xf7\xfd=\x7f<P(\x04E\xe7\xcd\xfb\xfb\xe8\
-\xe8=_\xdd\xb7\xb8\xb8x\x1f\x00\x10\x16\xdf\x04\x00\x10\
-\x00\x00\x80\x00\x00\x00\x04\x00\x00 \x00\x00\x00\x01\x00\x00\
-\x08\x00\x00@\x00\x00\x00\x02\x00\x00\x10\x00\x00\x80\x00\x00\
-\x00\x04\x00\x00 \x00\x00\x00\x01\x00\x00\x08\x00\x00@\x00\
-\x00\x00\x02\x00\x00\x10\x00\x00 \x00\x00\x00\x01\x00\x00\x08\
-\x80\x18h\x9c\x9b\x9e\xac\x1b\x19\xfa\xebD\xdf\xc1\xafW\
-\xee\xd9\xf5b\xd9\xf6\xad\xaf\x94\xef\xecz\xa9\xe2\xd6\xff\
-\xae>\xd4\xfb\x8d\x0d\xe3#\x8f7\xcdN\xcf\xec~\xe8\
-\xa1\x5c\x17\x07\xc0\xca\xe9\xb88U\xdc1?2\xd3:\
-\xd1\xf7\x17M\x83=\xff\xd8pd\xf77\xeaz\xbb\xbe\
-U\xbbo\xdb\x8bU;6\xbdR\xb3\xa7\xf3\xfb\xb5\xfb\
-\xb7?\xb7\xe1P\xf7\xb3\xb7\xfe\xffK-\xe3\x07\x9el\
-?9\xf8\xe0\x963\x13\xad\xbe\x7f\x02\xe0=\xfa\xfb\xfb\
-s\x1a&\x8e\xfdI\xf9\x8e\xed?\xcc-)\xb9y\xdf\
-\xad\x7f\xdd;\x91[\x5ct\xb3bW\xf7\xf7\xea\x8f\x8f\
-=*\x06\x00\xd2o\xf3\xa9\xd1\x91\x96\xb1\x03\x7fW\xdd\
-\xbd\xe9\xbf\xd6U\x95\xbd\x95\xb5&k\xf1N\xef\xd1\xbf\
--\xaf\xb8\xf0fyG\xd3\x95\xc6\xa3{\x9e\xd9tr\
-\xf0\xf7{\x1fI\x16\xf8\x1e\x07\x1a\x00\xf5\xb7^\xfc\xda\
-\xa3\x03_*HT_\xbf\xd7\x0b\xea\x1d\xa9\x7fF\xdd\
-\xf0\xd1\xa7:\x93\xc9\x22\x17\x0c\xc0\xbd\xdbtr\xe8\xc1\
-\xba[?\xc5\xe7\x97\x95\xdcX\xea\xbd\xf9v\xb2\xd7\xe6\
--Vno\xfb\xc9\xc6\x89\xc3\x9f\xeb\xfe\xd0\x89R\xdf\
-\xfb@\x02\xa0a\xf2\xf8'\x0bjk\xae\xa5\xfb\x82\xca\
-\xaf\xaa\xbc\xde4u\xfcc.\x1a\x80;\xb7\xed\xfe\x89\
-\xad\x0d\x03{\x9e)\xac\xad\xbc\xb6\x9c\x87\xfe\x07\xbe\xa3\
-[X\xb0P\xbb\xb7\xf3?:N\x0d?\xe0\xf5\x88i\
-\x00t\x5c\xbcX\x9c\xfa]\xfer_L\x95{v=\
-\xdf~!Y\xe5\xe2\x01\xb8\xcd=\xf9\xf4\xe8\xfe\xba\x03\
-]\xdf\xce\xce\xcf[\x5c\x8d\x83\xff\xfd\x94\xb6\xd6\xbf\xd1\
-6}\xe4O\xbd>1\x0a\x80\xe6S\xa7v\x1555\
-\xfe|\xa5.\xa2u\xb55o6\xcf\x9e\x18w\x01\x01\
-\xbc\xf7'\xfe\xda\x9e\xad\xdf]\x93\x9b\x931\x07\xffo\
-+ko\xf8\x9f\xd4\x03\x84\x02 \xe2\xff\x02-\xa7O\
-o-H$V\xfc\xad\xa5\xec\xfc\xb5\x0b\xf5\xe3#\x8f\
-\xfb\x0f\x1e\xe0W\x0f]\xb7\x1c;\xf0D^\xf1\xba\x85\
-L=\xf8\x7f[b\xd7\xe6\x1fly`\xb2C\x00D\
-P\xeb\x99\xb9\x8e\x82\xba\xda7W\xf3\x02J\xfd\xda\xc1\
-\x03\x82@\xd0\x0f\xf7%\x87O\x974\xd5\xfe\x22*\x07\
-\xffo~\x82`\xddB\xea#\x85\x02 b\xb5Y\xdc\
-\xd6\xfaZ&\x5c@EM\x0dW7&g\x0f\xb9\x11\
-\x00\xa1I\xfd\xd4\x9fI\xbf\xe7\xbfWU;\xda\x7f\xd4\
-q\xffd\x93\x00\x88\x80\xc4\xe1C\xcfd\xd2\xc5\x93\xda\
-\x0eh\x98\x1a\xff\xa4\x1b\x02\x10\xc4\xef\xfa\xe7G6$\
-vn\xfea\xd4\x0f\xfew+\xac\xa9\xb8\x9ez7C\
-\x00d\xb0\xc6\xd9\xe9dVvv\xc6]<YYY\
-\x8b5\x87\x0f>\x93zw\xc2\x0d\x02\x88\xf3\x13\xfeE\
-uU\xd7\xe2t\xf8\xff\xfa\xf9\xae\xbc\xdc\xc5\xb6\xa9#\
-\x7f&\x002TIG\xc7\xab\x99|\x01\x95\xb4\xb7^\
-i\x99\x9f\xebt\xa3\x00\xe2f\xcb\xd9\xb1\xe3\x05\x15\xeb\
-o\xc4\xf1\xf0\x7f\xf7\x0fs-\xa3\xbd\x7f+\x002m\
-\xe8\xe7\xc4\xe4\x1fD\xe1\x02Z[^v\xa3qz\xe2\
-A7\x0c 6\x0f\xfb\x9d\x1cz0JO\xf9/U\
-\xe3\xe0\xde\xaf\x0a\x80\x0cR\xda\xb9\xe5'Q\xb9x\xd6\
-\xe4\xe4,\xd6\x1e=\xf2\xb4\x1b\x07\x10\xf9\xb7\xfd\xe7G\
-fR\xabz\xa1\x1c\xfe\xefh\x1a\xde\xf7e\x01\x90\x19\
-\x1f\xfbkM\x1d\xaaQ\xbb\x80\xcawl\xbfl=\x10\
-\x88\xaa\xcd\xf7\x8f\xf7\xad--\xbe\x19\xda\xe1\xff\x8e\x8d\
-\xc7\x0e>)\x00VY\xed\xe0\xd1/D\xf5\x02ZW\
-W\xf3fs\xd2z \x10\xb1\xb7\xfd\xe7\xc7:SO\
-\xc7\x87z\xf8\xbf\xfdL@\xf6\x9a\xc5\xf6\xe9\xfeO\x09\
-\x80\xd5|\xfb\x7f\xdb\xd6W\x22\xfdt\xa9\xf5@ b\
-{+\xe5\x9b[~\x16\xf2\xe1\xff\xee?*\x94z'\
-D\x00\xac\x92\xbc\xf2\xb2X<yj=\x10\x88\xc4C\
-\xd7\xfd{\xbe\xee\xf0\xff\x7f\xeb\x9b\xeb\xae\xc6\xe9\xde\x1d\
-\x9d\xb5\xa9\xf9\xb9\xce8]HE\xcdMol<5\
-\xb3\xd7M\x06\xc8D\xeds\x83\x1fM}\x1c\xce\xc1\xff\
-\x9b\xeaz\xbb\xbe%\x00V\xbaDg\xa6N\xc7\xee-\
-%\xeb\x81@&~\xd6\xff\xdch\x22?\xe6\x9f\xf5_\
-\x8aM3G?.\x00V2\x00\xa6&?\x16\xd7\x8b\
-\xa9\xba\xb7\xe7Y\xeb\x81@\xa6\xd8p\xa8\xfb\xdf\x1d\xf4\
-\xb7\x99\x0c\xae\xad\xbc\xd6qq\xaaX\x00\xac\xd4\x059\
->\xf6\x99X\xffni\xf3\xa6W[\x1e8\xdd\xe6\xe6\
-\x03\xac\xeaO\xff\xf3\xa3S\xa9\xa7\xde\x1d\xf4\xf1\x1f\x09\
-\x8aN\x00\x1c\x1b\xfdl\xdc/(\xeb\x81\xc0j+k\
-o|\xdd\x01\x7f'\x9f\xea\xca[\xec<?\xd6#\x00\
-\x04\x80\xf5@ \xf2\xdaf\x06\xfe\xd8\xe1~\xe7j\xf7\
-o\x7fN\x00\x08\x00\xeb\x81@\xf4\x7f\xfa\xdf\xd4\xf4\x9a\
-\x83\xfd\xee\xfer\xe0\x96\xf9\xf1\x9d\x02@\x00\xa4]A\
-m\xcd\xb5\x96\xe4\xf4\x94\x1b\x13\xb0\xdc:N\x0e]p\
-\xa8\xdf\xbd\xd4\x03\x93\x02@\x00X\x0f\x04\x22\xab\xb2\xab\
-\xfd\xc7\x0e\xf4\xbb\x97s\xeb\x1e\xbdm~d\x83\x00\x10\
-\x00\xd6\x03\x81\xc8\xd9\xfc\xc0t[\x14\xff\xd0Z\xa6h\
-\x19?\xf0\xa4\x00\x10\x00\xcb\xbb\x1e\xd8\xd4pucr\
-\xf6\x90\x1b\x16\x90NM\xc3\xbdO;\xc8\xef]\xea\xd9\
-\x09\x01 \x00\xac\x07\x02\x91S\xd2\x5cw\xd5\xfdui\
-\xb6\x9c\x199$\x00\x04\x80\xf5@ 26\x9d\x1a;\
-\xe2\x9e\xbatM\xc3\xfb\xbe,\x00\x04\xc0\x8a)io\
-\xbd\x92\xfa#Inb\xc0\xbdj\x19;\xf8\x94\xfb\xe9\
-\xd2Unk}U\x00\x08\x00\xeb\x81@dTuo\
-~\xd9\xbd4=\x9f\x06\xe8}$Y \x00\x04\x80\xf5\
-@ \x0a\x07@\xd6\xda\xd2\xe2\x9b\xee\xa3i\xfa+\x81\
-\xb3\x83\x1f\x16\x00\x02\xc0z \x90\xf9\xe3?\xe7\xc6\x86\
-\xdc;\xd3\xf8\x1c\xc0`\xcf%\x01 \x00\xac\x07\x02\x19\
-\xafu\xf2\xc8c\xee\x9b\xe9\x93\xd8\xbd\xe5%\x01 \x00\
-\xac\x07\x02\x19\xafqh\xdfW\xdc3\xd3\xa7t\xe3\x86\
-\x9f\x0b\x00\x01\x90!\xeb\x81;\xad\x07\x02\x1f\xa8f\xef\
-\xd6\xef\xb9W\xa6q\xa7\xa5\xb0`A\x00\x08\x00\xeb\x81\
-@\xc6+ko|\xdd}2\xbd:\xcf\x1d\xdb$\x00\
-\x04\x80\xf5@ \xa3\x15\xd5'~\xe9\x1e\x99^\x9bO\
-\x8d\x8e\x08\x00\x01`=\x10\xc8h\x05\x15\xa5o\xb97\
-\xa6\xf9\xa3\x80\xa7F\xce\x09\x00\x01`=\x10\xc8hy\
-\xc5\xeb\x16\xdc\x17\xd3\xbd\x050\xf0\xb0\x00\x10\x00\xd6\x03\
-\x81\x8c\xe6O\x00\xa7_\xdb\xe4\x91\xc7\x04@\x9a\xd5\x0a\
-\x00\xeb\x81@z\x0f\x00\xf7\xc2\xb4k\x9d:\xfcY\x01\
- \x00\xac\x07\x02\x02@\x00\x08\x00\x01`=\x10\x10\x00\
-\x02@\x00\x08\x80L\x5c\x0f\x1c\x1b\xfa\xbc\x9b\x22\x08\x00\
-\x04\x80\x00\x08\xf1oZ[\x0f\x04\x01\x80\x00\x10\x00\xd6\
-\x03\x01\x01\x80\x00\x10\x00\xd6\x03\x01\x01\x80\x00\x10\x00\xd6\
-\x03\x01\x01\x80\x00\x10\x00\xd6\x03\x01\x01 \x00\x04\x80\x00\
-\xb0\x1e\x08\x08\x00\x01 \x00\x04\x80\xf5@@\x00\x08\x00\
-\x01 \x00\xac\x07\x02\x02@\x00\x08\x00\x01\x109\xeb\xac\
-\x07\x82\x00@\x00\xacL\x00\x1c\x13\x00\xd6\x03\x01\x01 \
-\x00\x04\x00\xd6\x03\x01\x01 \x00\x04\x00\xd6\x03\x01\x01 \
-\x00\x04\x00\xd6\x03\x01\x01 \x00\x04\x00\xd6\x03\x01\x01 \
-\x00\x04\x00\xd6\x03\x01\xf7*\x01 \x00\xb0\x1e\x08\x02\x00\
-\x01 \x00\xb0\x1e\x08\x02\x00\x01 \x00\xb0\x1e\x08\x02\x00\
-\x01 \x00\xb0\x1e\x08\x02\x00\x01 \x00\xb0\x1e\x08\x02\x00\
-\x01 \x00\xb0\x1e\x08\x02@\x00\x08\x00\x01\x80\xf5@\x10\
-\x00\x02@\x00\x08\x00\xac\x07\x82\x00\x10\x00\x02@\x00`\
-=\x10\x04\x80\x00\x10\x00\x02\xc0z\xa0\xf5@\x10\x00\x02\
-@\x00\x08\x00\xeb\x81\x80\x00\x10\x00\x02@\x00X\x0f\x04\
-\x04\x80\x00\x10\x00X\x0f\x04\x04\x80\x00\x10\x00X\x0f\x04\
-\x04\x80\x00\x88g\x00\x8c\x0a\x00\xeb\x81n\xd8 \x00\x04\
-\x80\x00\xc0z  \x00\x04\x80\x00 \xa4\xf5\xc0)\xeb\
-\x81 \x00\x04\x80\x00\xc0z  \x00\x04\x80\x00\xc0z\
-  \x00\x04\x80\x00\xc0z  \x00\x04\x80\x00\xc0z\
-  \x00\x04\x80\x00 ^\xeb\x81\x87\xad\x07\x82\x00\x10\
-\x00\x02\x00\xeb\x81\x80\x00\x10\x00\x02\x80\x80\xd6\x03\x13\xd6\
-\x03A\x00\x08\x00\x01\x80\xf5@@\x00\x08\x00\x01\x80\xf5\
-@@\x00\x08\x00\x01\x80\xf5@\x10\x00\x08\x00\x01@\x8c\
-\xd7\x03\x9b\xac\x07\x82\x00\x10\x00\x02\x00\xeb\x81 \x00\xdc\
-\x13\x04\x80\x00  \xeb\xad\x07\x82\x00\x10\x00\x02\x80p\
-\xd7\x03\x9b\xad\x07\x22\x00\xdc\x0f\x04\x80\x00 \xcc\xf5\xc0\
-\xbaA\xeb\x81\x08\x00\x04\x80\x00\xc0z \x08\x00\x04\x80\
-\x00\xc0z \x08\x00\x04\x80\x00 \x80\xf5\xc0\x06\xeb\x81\
-\x08\x00\x04\x80\x00 LU\xd6\x03\x11\x00\x08\x00\x01\x80\
-\xf5@\x10\x00\x08\x00\x01\x80\xf5@\x10\x00\x08\x00\x01@\
-\x10\xeb\x81\x07\xac\x07\x22\x00\x10\x00\xab\xa6F\x00`=\
-\x10\x04\x80\x00\x10\x00`=\x10\x04\x80\x00\x10\x00`=\
-\x10\x04\x80\x00\x10\x00`=\x10\x04\x80\x00\x10\x00`=\
-\x10\x04\x80\x00\x10\x00`=\x10\x04\x80\x00\x10\x00`=\
-\x10\x01@z\x02`B\x00,C\x00\x8c\x0b\x00\xac\x07\
-\x82\x00\x10\x00\x02\x00\xac\x07\x82\x00\x10\x00\x02\x00\xac\x07\
-\x82\x00\x10\x00\x02\x00\xac\x07\x82\x00\x10\x00\x02\x00\xac\x07\
-\x82\x00\x10\x00\x02\x00\xac\x07\x82\xff>\x05\x80\x00\x00\xeb\
-\x81\x08\x00\xd2\x12\x00G\x04\x80\x00\x00\xeb\x81\x08\x00\x01\
- \x00\x04\x00X\x0fD\x00\x08\x00\x01 \x00\xc0z \
-\x02 ~6\x0a\x00\x01\x00\xd6\x03\x11\x00\x02@\x00\x08\
-\x00\xf8\x1d\xeb\x81c\xd6\x03\x11\x00\x02@\x00\x08\x00\xac\
-\x07\x82\x00\x10\x00\x02@\x00`=\x10\x04\x80\x00\x10\x00\
-\x10\xc2z\xe0\xb8\xf5@\x04\x80\x00\x10\x00\x02\x00\xeb\x81\
- \x00\x04\x80\x00\x80\x80\xd6\x03\xb7Y\x0fD\x00\x08\x00\
-\x01\xe0\xe2\xc2z \x08\x00\x01 \x00\xc0z \x08\x00\
-\x01 \x00\xc0z \x08\x00\x01 \x00\xc0z \x08\x00\
-\x01 \x00\xc0z \x08\x00\x01 \x00\xc0z \x02\xc0\
-\x7fC\x02@\x00\x80\xf5@\x04\x00\x02@\x00\x80\xf5@\
-\x04\x00\x02@\x00\x80\xf5@\x04\x00\x02@\x00@F\xab\
-\xb0\x1e\x88\x00\x10\x00\x02\x00\xac\x07\x82\x00\x10\x00\x02\x00\
-\xac\x07\x82\x00\x10\x00\x02\x00\xac\x07\x22\x00\x10\x00\x02\x00\
-\xac\x07\x22\x00\x10\x00\x02\x00\xac\x07\x22\x00\x10\x00\x02\x00\
-\xac\x07\x22\x00\x10\x00\x02\x00\xac\x07\x22\x00\x10\x00\x02\x00\
-\xac\x07\x22\x00\x10\x00\x02\x00\xac\x07\x22\x00\x04\x80\x00\x10\
-\x00`=\x10\x01 \x00\x04\x80\x00\x00\xeb\x81\x08\x00\x01\
- \x00\x04\x00X\x0fD\x00\x08\x00\x01 \x00\xc0z \
-\x02@\x00\x08\x00\x01\x00\xd6\x03\x11\x00\x02@\x00\xb8\xb8\
-\xc0z \x02@\x00\x08\x00\xc0z \x02@\x00\x08\x00\
-\xc0z \x02@\x00\x08\x00\xc0z \x02@\x00\x08\x00\
-\xc0z \x02@\x00\x08\x00\xc0z\xa0\x00p-\x0b\x00\
-\x01\x00\xdc\xebz\xe0\xa4\xf5@\x01\x80\x00\x10\x00\x10\xe6\
-z\xe0\xa0\xf5@\x01\x80\x00\x10\x00\x10\xe6z`\xb7\xf5\
-@\x01 \x00\x04@\xfa%\x04\x00X\x0fD\x00\x08\x00\
-\x01\x00X\x0fD\x00\x08\x80 \x02\xe0\xb8\x00\x80H\xad\
-\x07\xee\xb5\x1e(\x00\x04\x80\x00\x10\x00\x10\xe6z\xe0F\
-\xeb\x81\x02@\x00\x08\x00\x01\x00\xd6\x03\x11\x00\x02@\x00\
-\x08\x00\xb0\x1e\x88\x00\x10\x00\x02@\x00@\x08\xeb\x81[\
-/7\x9d\x9bI8|\x05\x80\x00\x10\x00\x02\x00\x02S\
-PSm=P\x00\x08\x00\x01 \x00\xc0z \x02 \
-N\x01\xd0/\x00\x04\x00`=P\x00\x08\x00\x01 \x00\
-\x00\xeb\x81\x02@\x00\x08\x00\x01\x00X\x0f\x14\x00\x02@\
-\x00\x08\x00\xc0z\xa0\x00\x10\x00\x02@\x00\x80\xf5@\x07\
-\xb4\x00\x10\x00\x02@\x00\x80\xf5@\x04\x80\x00\x10\x00@\
-\x08\xb2\xb2\xb3\x17\xeb\xfa\x0f]rP\x0b\x00\x01 \x00\
-\x04\x00X\x0fD\x00d\xb4\x16\x01 \x00\x00\xeb\x81\x02\
-@\x00\x08\x00\x01\x00X\x0f\x14\x00\x02@\x00\x08\x00\xc0\
-z\xa0\x00\x10\x00\x02@\x00\x00\xd6\x03\x05\x80\x00\x10\x00\
-\x02\x00\xb0\x1e(\x00\x04\x80\x00\x10\x00\xc0m$\xac\x07\
-\x0a\x00\x01 \x00\x00\xeb\x81\x08\x00\x01 \x00\x00\xeb\x81\
-\x08\x00\x01 \x00\x80 \xd6\x03\x07\xac\x07\x0a\x00\x01 \
-\x00\x800\xd7\x03\xbb\xad\x07\x0a\x00\x01 \x00\x00\xeb\x81\
-\x08\x00\x01\x10\xe1\x00\x18\x11\x00\x80\xf5@\x01 \x00\x04\
-\x00\x80\xf5@\x01 \x00\x04\x00\x80\xf5@\x01 \x00\x04\
-\x00\x80\xf5@\x01 \x00\x04\x00\x80\xf5@\x01 \x00\x04\
-\x00`=\xf0\xed\xf5\xc0\xc9N\x01\x80\x00\x10\x00\x80\xf5\
-@\x01\x80\x00\x10\x00@8\xeb\x81\x07/\x09\x00\x04\x80\
-\x00\x00\xac\x07\x0a\x00\x04\x80\x00\x00\xac\x07\x0a\x00\x04\x80\
-\x00\x00\xac\x07\x0a\x00\x04\x80\x00\x00\xac\x07\x0a\x00\x04\x80\
-\x00\x00b\xb5\x1eX\x1f\xeb\xf5@\xaf\xb1\x00\x10\x00\x00\
-\x01\xae\x07z}\x05\x80\x00\x00\x08p=\xd0\xeb*\x00\
-\x04\x00@\x80\xeb\x81^S\x01 \x00\x00\xeex=\xb0\
-46\xeb\x81^O\x01 \x00\x00\x02\x5c\x0f\xf4Z\x0a\
-\x00\x01\x00\x10\xe0z\xa0\xd7P\x00\x08\x00\x80%\xac\x07\
-n\x9c\x9b\x98\x16\x00\x08\x00\x01\x00X\x0f\x14\x00\x02@\
-\x00\x08\x00\xc0z\xa0\x00\x10\x00\x02@\x00\x00\xd6\x03\x05\
-\x80\x00\x10\x00\x02\x00\xb0\x1e(\x00\x04\x80\x00\x10\x00\x80\
-\xf5@\x01 \x00\x04\x80\x00\x00\xac\x07\x0a\x00\x01\x10|\
-\x00L\x08\x00\xc0z\xa0\x00\x10\x00\x02\x00\xc0z\xa0\x00\
-\x10\x00\x02\x00\xc0z\xa0\x00\x10\x00\xf1\x0b\x80j\x01\x00\
-X\x0f\x14\x00\x02@\x00\x00X\x0f\x14\x00\x02@\x00\x00\
-X\x0f\x14\x00\xab\x1f\x00\xc7\x05\x80\x00\x00\xb8C%m\
--\xaf\xb7\x9e\x99k\x15\x00q\x08\x80\x01\x01 \x00\x00\
-\xee\xee\xb9\x80\xf6\xf9\x99>\x01 \x00\x04\x80\x00\x00B\
-\x8b\x80\xea\xca\xeb\xad\xa7g\xba\x04\x80\x00\x10\x00\x02\x00\
-\x08LaC\xdd\xffn?{\xb6L\x00\x08\x00\x01 \
-\x00\x80\xd0\x1e\x0c\xdc\xdb\xfd\xbc\x00\x10\x00\x02@\x00\x00\
-\x01j\x9c\x18~T\x00\x08\x00\x01 \x00\x80\x00\x9f\x07\
-\xe8\xb8x\xb1X\x00\x08\x00\x01 \x00\x80\xc0\xd4\x0d\xf6\
-=-\x00\x04\x80\x00\x10\x00@`\xd6V\x94\xbd\xb5\xfb\
-\xa1\x87r\x05\x80\x00\x10\x00.. \xbcg\x01>-\
-\x00\x04\x80\x00pq\x01\x81\xa9\xe8\xde\xf6\x03\x01 \x00\
-\x04\x80\x8b\x0b\x08LnQ\xe1\xc2r\xfd\x1a\xc0\xf7W\
-\x00\x08\x00\x80\x0c\xd6<w\xfc\xa4\x00\x10\x00\x02\x00 \
-0\x0dc\x03\x7f)\x00\x22\x12k\x02@\x00\x00\xa4K\
-\xe2`\xcf\xbf\x0a\x00\x01 \x00\x00\x02S\xb5\xb7\xfb\x05\
-\x01 \x00\x04\x00@p\x9f\x04\xd8\xfaC\x01 \x00\x04\
-\x00@h\x01\xb0c\xeb\xcb\x02@\x00\x08\x00\x80\xf0~\
-\x05\xf0\xbc\x00\x10\x00\x02\x00\xc0C\x80\x02@\x00\x08\x00\
-\x80\xf8\x7f\x0cp\xd0\xc7\x00\x05\x80\x00\x000\x04$\x00\
-\x04\x80\x00\x00\x88\xb5\xdc\xe2\xa2\x9b\xa6\x80\x05\x80\x00p\
-q\x01\xa1}\x02`\xe7\xf6\x97\xfc1 \x01 \x00\x5c\
-\x5c@`\x1a'F\x1f\x15\x00\x02@\x00\xb8\xb8\x80\x80\
-\x14TW^\xef\xef\xef\xcf\x11\x00\x02@\x00\xb8\xb8\x80\
-\x80\xd4\x0d\x1e\xfe\xe2\xb2\x1e\x00\xbe\xc7\x02@\x00\x00d\
-\xd8O\xff\x89\xaa\xeb\x9d\xc9d\x91\x00\x10\x00\x02@\x00\
-\x00\x01i\x9a\x18\xf9\xd4\xb2\x1f\x00\xbe\xcf\x02@\x00\x00\
-d\x8e\xaa\x9e]\xcf\xad\xc8\x01\xe0{-\x00\x04\x00@\
-f(j\xac\xff\xc5\xf6\xb3g\xcb\x04\x80\x00\x10\x00\x02\
-\x00\x08D~u\xe5\xf5\xd6\xd33]+v\x00\xf8\x9e\
-\x0b\x00\x01\x00\xb0\xca\x0f\xfd\xd5T_\xdb\x98\x9c:\xb4\
-\xa2\x07\x80\xef\xbb\x00\x10\x00\x00\xab\xa7\xa4\xad\xe5\xf5\xd6\
-3s\xad+~\x00\xf8\xde\x0b\x00\x01\x00\xb0J\x0f\xfc\
-\xed\xd9\xf9\xe2r\x7f\xdcO\x00\x08\x00\x01\x00\x90!\xb2\
-\xf3\xd7.4\x8c\x0d}~U\x0f\x00\xaf\x83\x00\x10\x00\
-\x00+\xfb\xfb\xfe\xe6\xb9\x89\xe9U?\x00\xbc\x16\x02@\
-\x00\x00\xac\x8c\xf2\x1d\xdb.7\x9d\x9bId\xc4\x01\xe0\
-\xf5\x10\x00\x02\x00`yeeg/\xd6\xf6\x1f\xba\x94\
-Q\x07\x80\xd7E\x00\x08\x00\x80\xe5\xb3\xb6\xbc\xecF\xf3\
-\xf4\xc4\x83\x19w\x00xm\x04\x80\x00\x00X\x1e\xeb\xdb\
-[\xaf\xb4\xcc\xcfuf\xe4\x01\xe0\xf5\x11\x00\x02\x00 \
-\xfd\xaa\x0f\xf4<\xdb\xdf\xdf\x9f\x93\xb1\x07\x80\xd7H\x00\
-\x08\x00\x80\xf4\xc9-.\xba\xd945\xfe\xc9\x8c?\x00\
-\xbcV\x02@\x00\x00\xa4GQS\xc3\xd5\x95\x9e\xf4\x15\
-\x00\x02@\x00\x00\xac\xa2\xcaU\x5c\xf5\x13\x00\x02@\x00\
-\x00\xac\xc2\xaa_\xfd*\xaf\xfa\x09\x00\x01 \x00\x00V\
-z\xd5ofj:j\x87\xbf\x00\x10\x00\x11\x0a\x80)\
-\x01\x00d\xd8\xaa\xdf\xf6\x8cY\xf5\x13\x00\x02@\x00\x00\
-\x04\xb8\xea'\x00\x04\x80\x00\x00X\xe6U\xbf\xc6\x0c\x5c\
-\xf5\x13\x00\x02@\x00\x00,\x93\x92\x0c^\xf5\x13\x00\x02\
-@\x00\x00,\xc7\xaa_of\xaf\xfa\x09\x00\x01 \x00\
-\x00\xd2\xbc\xea\xd7\x10\x81U?\x01\x90)\x010(\x00\
-\x04\x00\x10\x8fU\xbf\xd9Cq<\xfc\x05\x80\x00\x88\xcc\
-\x85Z%\x00\x80\x15T\xb1gW\xa4V\xfd\x04\x80\x00\
-\x10\x00\x00K^\xf5\x1b\xfe|\x9c\x0f~\x01 \x00\x04\
-\x00\xc0o\xac\xfa%\xae\xb5$\xa7\xa7B8\xfc\x05\x80\
-\x00\x10\x00\x001X\xf5\x13\x00\x02@\x00\x00\xdc\xe5\xaa\
-_M\x7f\xdf\xa5\x90\x0e~\x01 \x00\x04\x00`\xd5/\
-&\xab~\x02@\x00\x08\x00\x80\x00W\xfd\x04\x80\x00\x10\
-\x00\x00\xbfCU\xef\xbe\xd8\xad\xfa\x09\x00\x01 \x00\x00\
-n\xb7\xea7\x19\xcfU?\x01 \x00\x04\x00\xc0\xfb(\
-lj\x8c\xf5\xaa\x9f\x00\x10\x00\x02\x00 \xc0U?\x01\
- \x00\x04\x00\xc0\xafW\xfd\xf2\x176\x8c\x86\xb1\xea'\
-\x00\x04\x80\x00\x00H\xad\xfa%\x12\xd7\x1a\x03Z\xf5\x13\
-\x00\x02@\x00\x00\xc1+\x0bp\xd5O\x00\x08\x00\x01\x00\
-\x04\xbd\xea\x97\xe8?|\xc9\xe1.\x00\x04\x80\x00\x00\xac\
-\xfa!\x00\x04\x80\x00\x00\xe2\xb9\xea\xd7\x16\xfc\xaa\x9f\x00\
-\xc8\x0c\x8d\x02@\x00\x00V\xfd\x04\x80\x00\x10\x00\x02\x00\
-X\x96U\xbf\xe3V\xfd\x04\x80\x00\x10\x00@0\xab~\
-\x8d\x8dW\x1b\xad\xfa\x09\x00\x01 \x00\x80\x90V\xfdv\
-[\xf5\x13\x00\x02@\x00\x00a\xad\xfa\x8dX\xf5\x13\x00\
-\x02@\x00\x00A\xad\xfa\xcd\xceZ\xf5\x13\x00\x02@\x00\
-\x00\xc1\xac\xfauu]n\x9a\xb1\xea'\x00\x04\x80\x00\
-\x00\xac\xfa!\x00\x04@@\x010,\x00 \x14y\xe5\
-e7\xea\xa7\xa7\xac\xfa\x09\x00\x01 \x00\x04\x00\x84\xa2\
-\xd8\xaa\x9f\x00\x10\x00\x02@\x00@`\xab~\xfb\xad\xfa\
-\x09\x00\x01 \x00\x04\x00\x04\xb5\xeaWo\xd5O\x00\x08\
-\x00\x01 \x00\xc0\xaa\x1f\x02@\x00\x08\x00\x01\x00V\xfd\
-\x10\x00\x02@\x00\x00qX\xf5\xab\xb5\xea'\x00\x04\x80\
-\x00\x10\x00\x10\x8e|\xab~\x02@\x00\x08\x00\x01\x00V\
-\xfd\x10\x00\x02@\x00\x08\x00\x88\xa9599\x8b\x89\x81\
-\x81\xa7\x1d\xba\x02@\x00\x08\x00\x01\x00!\xad\xfaMY\
-\xf5\x13\x00\x02@\x00\x08\x00\x08k\xd5o\xce\xaa\x9f\x00\
-\x10\x00\x02@\x00@0*\xf7\xef\xb7\xea'\x00\x04\x80\
-\x00\x10\x00\x10\xce\xaa_\xf1\xcd\xfa\xc9I\xab~\x02@\
-\x00\x08\x00\x01\x00A\xad\xfa\xcdZ\xf5\x13\x00\x02@\x00\
-\x08\x00\x08F\xf9n\xab~\x02\x00\x01 \x00\xc0\xaa\x1f\
-\x02@\x00\x08\x00\x01\x00\xf1TP[k\xd5O\x00 \
-\x00\x04\x00\x84\xa4\xb4\xab\xebr\xfb\x85\x0bU\x0eR\x01\
-\x80\x00\x10\x00\x10\x80,\xab~\x02\x00\x01\xb0\xb2\x01p\
-B\x00\xc0\xaa\xaf\xfa\x95[\xf5\x13\x00\x08\x00\x01\x00a\
-\xad\xfa\xb5_\xa9\xb7\xea'\x00\x10\x00\x02\x00\xc2Z\xf5\
-\xbb\xcf\xaa\x9f\x00@\x00\x08\x00\x08C\x8eU?\x01\x80\
-\x00\x10\x00\x10\xe2\xaa_\xd2\xaa\x9f\x00@\x00\x08\x00\x08\
-g\xd5o\xcf\x8bUV\xfd\x04\x00\xf7\x10\x00C\x02@\
-\x00@DW\xfdFF\xad\xfa\x09\x00\x04\x80\x00\x80`\
-V\xfdjj\xafm\xb0\xea'\x00\x10\x00\x02\x00\xac\xfa\
-!\x00\x10\x00\x02\x00\xac\xfa!\x00\x10\x00\x02\x00\x22\xbf\
-\xeaW\x96Z\xf5\x9b\xb6\xea'\x00\x10\x00\x02\x00\x82Y\
-\xf5kK\xad\xfa\xcd[\xf5\x13\x00\xfe{Hw\x00\x8c\
-\x0b\x00\x01\x00\x19\xaab\x7f\xafU?\x04\x80\x00\x88N\
-\x00T\x08\x00X\xf2\xaa_\x9dU?\x04\x80\x00\x10\x00\
-\x10\x8eu\x8dMV\xfd\x10\x00\x02@\x00\x80U?\x10\
-\x00\x02@\x00@lW\xfdj\xac\xfa!\x00\x04\x80\x00\
-\x80p\xe4\xbf\xbd\xea\x97\xb4\xea\x87\x00\x10\x00\x02\x00\xc2\
-Y\xf5\xdba\xd5\x0f\x01 \x00\x04\x00\x84\xb5\xeaw\xd4\
-\xaa\x1f\x02@\x00\x08\x00\x08i\xd5\xaf\xce\xaa\x1f\x02@\
-\x00\x08\x00\x08G\x91U?\x04\x80\x00\x10\x00\x10\xd8\xaa\
-\xdf>\xab~\x08\x00\x01 \x00 \x9cU\xbf\xa2\xe2\x9b\
-u\xc7\xa7\xac\xfa!\x00\x04\x80\x00\x00\xab~ \x00\x04\
-\x80\x00\x80X*\xb3\xea\x87\x00\x10\x00\x02\x00B[\xf5\
-\x1b\xb3\xea\x87\x00\x10\x00\x02\x00\xac\xfa\x81\x00\x10\x00\x02\
-\x00\xac\xfa\x81\x00\x10\x00\x02\x00\xa2\xbf\xeaW=0h\
-\xd5\x0f\x01\x101\x0d\x02@\x00\x80U?\x04\x80\x00\x10\
-\x00\x02\x00\xac\xfa!\x00\x04\x80\x00\x10\x00\xf0^\xe5\xfb\
-\x0eX\xf5C\x00\x08\x00\x01 \x00\x08i\xd5\xaf\xc6\xaa\
-\x1f\x02@\x00\x08\x00\x01@X\xab~uV\xfd\x10\x00\
-\x02@\x00\x08\x00\xac\xfa\x81\x00\x10\x00\x02@\x00\x10\xd3\
-U\xbf\x84U?\x04\x80\x00\x10\x00\x02\x00\xab~ \x00\
-\x04\x80\x00\x10\x00\xc4\xd4\xfa\xaen\xab~\x08\x00\x01 \
-\x00\x04\x00!\xad\xfaU\x0d\x0cY\xf5C\x00\x08\x00\x01\
- \x00\x08k\xd5o\xd6\xaa\x1f\x02@\x00\x08\x00\x01@\
-8\xab~\x9b\xac\xfa!\x00\x04\x80\x00\x10\x00X\xf5\x03\
-\x01 \x00\x04\x80\x00 \xc6\xab~\xd3V\xfd\x10\x00\x02\
-@\x00\x08\x00\xac\xfa\x81\x00\x10\x00\x02@\x00\x10\xd3U\
-\xbf\xbdV\xfd\x10\x00\x08\x00\x01@(\xd6\xbc\xbd\xeaw\
-\xcc\xaa\x1f\x02\x00\x01 \x00\x08g\xd5\xaf\xce\xaa\x1f\x02\
-\x00\x01 \x00\x08m\xd5\xaf\xc6\xaa\x1f\x02\x00\x01 \x00\
-\xb0\xea\x07\x02\x00\x01 \x00\x88\xeb\xaa\xdf\x84U?\x04\
-\x00\x02@\x00`\xd5\x0f\x04\x00\x02`\xb9\x03`Z\x00\
-`\xd5\x0f\x04\x80\x00\x10\x00`\xd5\x0f\x04\x80\x00\x10\x00\
-\x90\xd6U\xbff\xab~\x08\x00\x04\x80\x00 $\xa5\xbb\
-z\xac\xfa!\x00\x10\x00\x02\x80\x90V\xfd\xaa\x87\xc7\xad\
-\xfa!\x00\x10\x00\x02\x80\x90V\xfdjg\xe7\xad\xfa!\
-\x00Xb\x00\x0c\x0b\x00\x01@T\x94l\xb7\xea\x87\x00\
-@\x00\x08\x00\x82Z\xf5\xab\xec\xb7\xea\x87\x00@\x00\x08\
-\x00\x82\x91[V~\xa3\xc6\xaa\x1f\x02\xc0\xfd@\x00\x08\
-\x00\xc2Qh\xd5\x0f\x04\x80\x00\x10\x00\x84\xa5l\xdfA\
-\xab~ \x00\x04\x80\x00 \xa4U\xbf\x84U?\x10\x00\
-\x02@\x00\x10\x8e\x82\xb7W\xfd\xceX\xf5\x03\x01 \x00\
-\x04\x00V\xfd\x00\xf7\x08\x01 \x00\xb0\xea\x07\x02\x00\x01\
- \x00\x88\xc1\xaa\xdf\xb4U?\x10\x00\x02@\x00\x10\xd0\
-\xaa\xdfN\xab~ \x00\x04\x80\x00 \xacU\xbfa\xab\
-~ \x00\x04@\xdc\x02\xa0\x5c\x00\xf0\x81\xab~\x157\
-j&NZ\xf5\x03\x01 \x00\x04\x00\xc1\xac\xfa\xb5v\
-X\xf5\x03\x01 \x00\x04\x00V\xfd\x00\x01 \x00\x04\x00\
-\xf1]\xf5\x1b\x9f\xb1\xea\x07\x02@\x00\x08\x00\xac\xfa\x01\
-\x02@\x00\x08\x00bi\xbdU?\x10\x00\x02@\x00\x10\
-\xda\xaa\xdf\x84U?\x10\x00\x02@\x00\x10\x8a\xb5V\xfd\
-@\x00\x08\x00\x01\xe0\xe2\xb2\xea\x07\x08\x00\x01 \x00\x88\
-\xf1\xaa_E\xff\x88U?\x10\x00\x02@\x00\x08\x00\xab\
-~\x80\x00\x10\x00\x02\x00\xab~\x80\x00\x10\x00\x02\x80\x18\
-\xac\xfa\xf5\x1c\xb2\xea\x07\x02@\x00\x08\x00\x01`\xd5\x0f\
-\x10\x00\x02@\x00\x08\x80x\xae\xfa5X\xf5\x03\x01 \
-\x00\x04\x80\x00\x08l\xd5o\x9fU?\x10\x00\x02@\x00\
-\x08\x80`V\xfd\xd6\xe6/TY\xf5\x03\x01\x10S\xf5\
-\x02@\x00`\xd5\x0f\x04\x80\x00\x10\x00\x02\xc0\xaa\xdf\xf6\
-]\x97k\x92V\xfd@\x00\x08\x00\x01 \x00\x02Y\xf5\
-\xcb]\xac8b\xd5\x0f\x04\x80\x00\x10\x00\x02 \xa8U\
-\xbfj\xab~ \x00\x04\x80\x00XR\x00\x0c\x09\x80\xa8\
-\xad\xfaU\xcf\x9d\xb7\xea\x07\x02@\x00\x08\x00\x01\x10\xd6\
-\xaa\xdf\xa3V\xfd@\x00\x08\x00\x01 \x00\xc2X\xf5+\
-\xb9Ye\xd5\x0f\x04\x80\x00\x10\x00\x02 \xacU\xbfj\
-\xab~ \x00\x04\x80\x00\x10\x00\x01\xad\xfa\xedL\xad\xfa\
-}\xc4\xaa\x1f\x08\x00\x01 \x00\x04@0\xab~C\x93\
-V\xfd@\x00 \x00\x04@X\xab~\xe7\xac\xfa\x81\x00\
-@\x00\x08\x80P\x14[\xf5\x03\x01\x80\x00\x10\x00V\xfd\
-\x00\x01\x80\x00\x10\x00V\xfd\x00\x01 \x00\x04\x80\x00\x88\
-\x83uV\xfd@\x00 \x00\x04@XJ{\xfa\xac\xfa\
-\x81\x00@\x00\x08\x80\xb0V\xfd\xe6\xac\xfa\x81\x00@\x00\
-\xacv\x00\xcc\x08\x80\x15\x92\xdf\xd0b\xd5\x0f\x04\x00\x02\
-@\x00\x84\xa4\xc4\xaa\x1f\x08\x00\x04\x80\x00\x08k\xd5\xaf\
-\xc2\xaa\x1f\x08\x00\x04\x80\x00\x08i\xd5o\xc3\xb5j\xab\
-~ \x00\x10\x00\x02\xc0\xaa\x1f \x00\x10\x00\x02 \xa6\
-\xab~\xe5V\xfd@\x00\x90\xe6\x00\x18\x11\x00\x02 \xd3\
-W\xfdNY\xf5\x83\xc0e\xe5\xe4\xb8'\xa6;\x00\x8e\
-\x8f>&\x00\x04@\x86\xae\xfam\xb6\xea\x07\xbc-\xa7\
-\xa8h\xc1}1\xbd\x1a\xa6\x8e=,\x00\x04@\xc6Y\
-o\xd5\x0fx\x97\xb5\xe5\xe5o\xb97\xa6W\xf3\xcc\x89\
-s\x02@\x00d\x8cl\xab~\xc0\xfb(\xa8\xab\xfb\xa5\
-{dz5\xcdM\x8f\x08\x00\x01\x909\xab~SV\
-\xfd\x80\xf7*nm}\xdd}2\xbd\x1a\x93\xc9M\x02\
-@\x00d\xc0\xaa\xdf~\xab~\xc0\x07\xdfWw\xed\xfa\
-\x9e{e\x1a\xff\x86J\xe1\xba\x85H}\x0aD\x00\xc4\
-t\xd5o\xf8\xc4\xe3np\xc0\xedT\xf7\xf7\x7f\xc5=\
-3}\x8aZ\x9a~.\x00\x04\xc0\xaa\xc9KX\xf5\x03\
-\xee\xcc\x86cc\x8f\xb9o\xa6O\xf9\xce\xae\x97\x04\x80\
-\x00X\x9d\xfa\xdc\xbe\xdb\xaa\x1fp\xc7\x1agg\x07\xdd\
-;\xd3\xa7\xa6\xbf\xef\x92\x00\x10\x00+\xbf\xeawx\xd4\
-\xaa\x1fp\xd7\xf2JKo\xb8\x8f\xa6\xe9\x01\xc0\xa9\xf1\
-\x0f\x0b\x00\x01`\xd5\x0f\x88\x84\xb2\xae\xae\x97\xddK\xd3\
-\xf0q\xeb\xfc\xb5\x0b\xf5\x8f$\x0b\x04\x80\x00\xb0\xea\x07\
-DB\xcd\xd0\xd0S\xee\xa7i\x18Z\xdb\xdc\xf1\xd3\xa8\
-\xbd\xf6\x02 \xb2\xab~\x87\xad\xfa\x01K\xd6p\xf2d\
-\x9f{j\x1a~\xff?\xd0\xf7\x0f\x02@\x00,\xfb\xaa\
-_\xe5x\xd2\xaa\x1f\x906\x85\x8d\x8dW\xdd_\x97\xf0\
-\x1cVV\xd6\xe2\xc63\xc9\x1e\x01 \x00\x96y\xd5\xef\
-\xbcU? \xad\x12G\x8f~\xc9A\xbe\x84\xd1\xb5\xf6\
-\xd6+Q|\xdd\x05@D\x14[\xf5\x03\x96I\xcb\xe9\
-\xd3m\xfe4\xf0\xbd\xdb02\xf8\xa4\x00\x10\x00V\xfd\
-\x80HZ\xbfu\xeb\x8f\x1d\xe6\xf7\xf2\xf4\x7f\xfeB\xc3\
-\xfc|\x8d\x00X\xce\x8f\xaa\x04\x18\x00V\xfd\x80\x15{\
-\x18pz\xfa\x82\x03\xfd\xeeU\xf7\xf6<\x1b\xd5\xd7\x5c\
-\x00d\xea\xaa\xdf6\xab~\xc0\xca*no\xbf\xe2P\
-\xbf\x8bwh\xf3r\x17[\xcf&w\x08\x00\x01\x90\xb6\
-U\xbf\xb2\xc3cV\xfd\x80\x15\xb7ab\xe2\xe3\x0e\xf6\
-;W\xd9\xb3\xe7;Q~\xbd\x05@\x86\xad\xfaU\x8e\
-[\xf5\x03V\xf1]\x80\xb6\xb6\xd7\x1c\xeew\xf0\xbb\xff\
-\xb5k\x17\x9bO\xcd\xec\x12\x00+\xf1\x10\xe0\xf0\xdcg\
-\xe2|1\x15\xb6o}u\xc3\xe9\x07\xdb\xdc\x80\x80\xd5\
-T?==\x99\x95\x9d\xed\x90\xff\x1d\x12\xfd}\xff\x14\
-\xf5\xd7:2_h\xc5h\xf2a\xab~\x00\xcb\xafr\
-\xff\xfeg\x1d\xf2\xb7\x99a\xaf\xab}3j\xbb\xff\x91\
-\x0e\x80\xca\xc9\xfb\x93\xb1\x5c\xf5\x1b\xb3\xea\x07d\x96\xf6\
-\x0b\x17\xaa\xf2\xca\xcb\xdfr\xd8\xbf\xbf\x86\xc9\xe3\x0f\xc7\
-\xe1u\x8e\xcc\x17Z=y\xbe3V\xab~\x8d\xado\
-T\xcf<\xb0\xd7\xcd\x06\xc8\xc8\x07\x02\xa7\xa6\xfe\xd0\xaf\
-\x02\xde\xabj\x7f\xcf7\xe3\xf2\x1aG\xea\x8b\xcd)\xab\
-\x8cE\x91\x16\xef\xec\xb5\xea\x07d\xfe\x0f^}}\xcf\
-8\xf4\xdf\xf5\xf1\xec\xe6\xa6\xab\x9d\xc9d\x91\x00X\x05\
-\x85\x9d\xbb^\x89\xf6\xaa_\xc1B\xc5\xf0\xb4U? \
-\x1a\x07D\x7f\x7fNIG\xc7\x7f;\xfc\xef[\xcc)\
-\x5c\xb7\xd0r\xf2d_\xac^\xdf(}\xb1\xa5G\x8e\
-\x7f!\xb2\xab~5\xf5oV\x9d87\xee\xa6\x02D\
-I\xe3\x993\x1d\xf9\x89\xc4\xb5\xa0\x07\x7frr\x16\x1b\
-&\xc7?\x11\xbb\xc0\x8b\xd2\x17[5\xf7{\xad\xa9\xa1\
-\x9c\xe8\xad\xfa\xed\xb9\x5c\x93\xfc\xa8U? \x9a\x11p\
-\xea\xd4\xde\xbc\xf2\xf2\x1b\xa1\x06@\xdd\xc8\xd0\x13\xb1|\
-\x87'j_p\xe1\xe6\xee\xc8\xfc\xc1\x8a_\xad\xfa\x1d\
-\xb3\xea\x07D^\xc3\xcc\xcctNa\xe1Bh\x87\x7f\
-\xed\xc0\x91\xbf\x8f\xed\xafx\xa2\xf6\x05W\x8c\x9f\xf9H\
-$~_TVy\xa3r|\xde\xaa\x1f\x10\x9f\x08\x98\
-\x9e\xbe\x90ST\xb4\x10\xce\xd8\xcf\xe1K\xb1~\xc6#\
-\x8a_\xf4\xbaM\xdb\x7f\x9a\xc9\x17M\xc1\xc6\xcdW\xaa\
-\xe7\xcew\xbaa\x00\xb1\x8b\x80\xd9\xd9\xf1\xb8o\x04d\
-ee-\xd6\x0d\x1f}*\xf6\x0fyFr\xa5\xea\xf8\
-\xd9\x93\x19\xf9\xf9\xd4\xac5\x8b\xeb\x0f\x0c=c\xd5\x0f\
-\x88\xfb3\x01\x05\xb5\xb5o\xc6u\xe3\xbf\xfe\xf8\xd8\xa7\
-\x83\xf8\x94GT\xbf\xf0\xf5\x07F\xbef\xd5\x0f`\x95\
-\xde\x09\x98\x9f\xaf)\xed\xea\xba\x1c\xa7\xc3\xbf \x91\xb8\
-\xd68;\x9d\x0c\xe6c\x9e\xd1\xfd|\xea\xa39\x05\x1b\
-\xb7d\xc4\xdf\xae\xceoh\xb9Z=u\xfe\x90\x9b\x02\
-\x10\x9a\x9a\xe1\xe1'\xd6\xdc\xfa\xa99\xea\x87\x7fy\xf7\
-\x8e\xffl\x9a\x99I\x04\xb5\xf3\x10\xe5/\xbe\xfc\xc4\x85\
-My5\x0d\xab\xfa6Tq\xb7U? l\xf5\xb3\
-\xb33\x85\xcd\xcdW#\xf9g\xd8\x8b\x8bn\xd6\x0e\xc7\
-\xf3c~\xb1\x0e\x80\x94\xd4\xdf\x08\xc8K\xd4_[\x8d\
-U\xbfr\xab~\x00\xef\x1c&Y\xb5\xc3\xc3O\xe4\x16\
-\x17\xdf\x8c\xca\xe1_\xb6\xa3\xeb\x07\x8dg\xe6:\x02~\
-\xcd\xa2\xff/Q~\xe2\xc2\xce\xfc\x86\xb67\xac\xfa\x01\
-\xac\xf2\x03\x82g\xcetT\xec\xd9\xf3Bj=/c\
-\xff\x1eK[\xebk\x0d'\xa6.\x88\xb6\x98\xfc\x8b\xa4\
-\xde\x86/\xea>\xf8\xc2\xf2\xbf\xe5\x7f\xe0y\xab~\x00\
-\xb7\xd7r\xfa\xf4\xd6\xca\xfd\xfb\x9f\xcd\xa4\xe7\x03\x8aZ\
-\x9a\xdf\xa8\x9f<\xfeG^\x9f\x98\x05\xc0\xaf\x87\x82F\
-O\x7fb9~%\x90[Ys\xbdb4\xf9\xb0\x8b\
-\x06\xe0.B`n\xae\xb3\xfa\xf0\xe1\xaf\x16\xd4\xd6\xae\
-\xca\xdf\x13H\xfd\x11\x9f\x8a\xbd\xbb_h\x989q\xce\
-\xeb\x11\xf3\x00x\xfb\x81\x94\xe4#\x05\xa5}\xc7\xbe\x98\
-[U{}\xc9o\xf7\xdf\xfag\x94\xf5O\xfc\x8d\x07\
-\xfd\x00\x96xo>q\xe2|EO\xcf\xb7\xd7.\xf3\
-\x90Pv~\xfeB\xe9\xb6\xad?\xaa;6\xfa\xe7\x1d\
-\x17/\x16\xfb\xde\x07\x14\x00\xef~(\xe5\xd6O\xed\x9f\
-(\xdc\xba\xe7rNI\xd9\x1d?\x98\x92]\x5cz\xb3\
-\xa8\xbb\xf7\xbb\x15#s\x8f\xee~\xe8\xa1\x5c\x17\x0a@\
-z5\x9d\x9a\xed\xaf\x19\x1az\xaa\xack\xfb\xcb\xf9U\
-U\xd7S\xeb{\xf7\xfc\x0emI\xc9\xcd\x92M\xed?\
-\xab>\xdc\xf7\xb5\xfa\xe9\xa9\x07\x9b?\xf4\xa1|\xdf\xe3\
-\xc0\x03\xe0=\xcf\x09L<0^60\xf5W\xeb\x0f\
-\x0c\x7f\xadx\xd7\xc1\xe7\x0a;w\xbdR\xd4}\xe0\xc5\
-\x94\x92}\x03\xffR>4\xf3\xb9\x8a\xc9\xf3S\x0e}\
-\x80\x95\x95\xfaI\xbdqvv*\xf5S{b\xa0\xff\
-\xcbU\x87\x0e\xfes\xe5\xbe}\xdf,\xdf\xbd\xfb\xc5\xd2\
-m\xdb^)\xdf\xb9\xf3\xfb\x15{\xf7~\xa7\xaa\xb7\xf7\
-\xdf\x12\xfdG.\xa5>\xba\xd70=u\xa1\xf1\xec\xd9\
-f\xdf?\x01\x00\x00\x08\x00\x00@\x00\x00\x00\x02\x00\x00\
-\x04\x00\x00 \x00\x00\x00\x01\x00\x00\x08\x00\x00@\x00\x00\
-\x00\x02\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00 \x00\
-\x00\x00\x01\x00\x00\x08\x00\x00@\x00\x00\x00\x02\x00\x00\x10\
-\x00\x00\x80\x00\x00\x00\x04\x00\x00\x04\xee\xff\x00|j:\
-Vu\x08\xfc\xd2\x00\x00\x00\x00IEND\xaeB`\
-\x82\
-\x00\x00H\xea\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4x\xd4\xfa\
-\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95+\x0e\x1b\x00\x00\x04\xeeiTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 7.1-c000 79\
-.9ccc4de, 2022/0\
-3/14-11:26:19   \
-     \x22> <rdf:RDF\
- xmlns:rdf=\x22http\
-://www.w3.org/19\
-99/02/22-rdf-syn\
-tax-ns#\x22> <rdf:D\
-escription rdf:a\
-bout=\x22\x22 xmlns:xm\
-p=\x22http://ns.ado\
-be.com/xap/1.0/\x22\
- xmlns:dc=\x22http:\
-//purl.org/dc/el\
-ements/1.1/\x22 xml\
-ns:photoshop=\x22ht\
-tp://ns.adobe.co\
-m/photoshop/1.0/\
-\x22 xmlns:xmpMM=\x22h\
-ttp://ns.adobe.c\
-om/xap/1.0/mm/\x22 \
-xmlns:stEvt=\x22htt\
-p://ns.adobe.com\
-/xap/1.0/sType/R\
-esourceEvent#\x22 x\
-mp:CreatorTool=\x22\
-Adobe Photoshop \
-23.3 (Windows)\x22 \
-xmp:CreateDate=\x22\
-2024-04-22T15:00\
-:04+02:00\x22 xmp:M\
-odifyDate=\x222024-\
-04-22T15:34:27+0\
-2:00\x22 xmp:Metada\
-taDate=\x222024-04-\
-22T15:34:27+02:0\
-0\x22 dc:format=\x22im\
-age/png\x22 photosh\
-op:ColorMode=\x223\x22\
- xmpMM:InstanceI\
-D=\x22xmp.iid:bb7ac\
-259-b737-e842-b5\
-f3-ad8247f66447\x22\
- xmpMM:DocumentI\
-D=\x22xmp.did:bb7ac\
-259-b737-e842-b5\
-f3-ad8247f66447\x22\
- xmpMM:OriginalD\
-ocumentID=\x22xmp.d\
-id:bb7ac259-b737\
--e842-b5f3-ad824\
-7f66447\x22> <xmpMM\
-:History> <rdf:S\
-eq> <rdf:li stEv\
-t:action=\x22create\
-d\x22 stEvt:instanc\
-eID=\x22xmp.iid:bb7\
-ac259-b737-e842-\
-b5f3-ad8247f6644\
-7\x22 stEvt:when=\x222\
-024-04-22T15:00:\
-04+02:00\x22 stEvt:\
-softwareAgent=\x22A\
-dobe Photoshop 2\
-3.3 (Windows)\x22/>\
- </rdf:Seq> </xm\
-pMM:History> </r\
-df:Description> \
-</rdf:RDF> </x:x\
-mpmeta> <?xpacke\
-t end=\x22r\x22?>\xaf\xc8?0\x00\
-\x00C\xa2IDATx\xda\xed\xddyl]\xd5\xb9\
-\xf7\xf1'\x89\xed\xd8\xf1\xecx\x9e\x1d\xcf\xf3<O\xc7\
-\xf1<\xcf\xf6\xf1<\xc4\x9c$\x06\x5c\x08}\x03EH\
-\x16U\xabV\xa8\x88\x0a\x15\xa1 \xd4\x0aQ!\xda*\
-B\xb4\xb7\x08E\x11\x82B!Bi!\xa2M\x81\x02\
-\x01BC\xe0\x12 !\x10\x9c\xc4\xf6{\x8e)\x5c\x08\
-\x19<\x9c\xe3s\xf6\xda\xdf?>z\xa5\xde\xfb\xde:\
-{?\xcfZ\xbf\xb3\xf7\xdak\xc9\xe2\xe2\xa2\x00\x00\x00\
-}\xe1\x22\x00\x00@\x00\x00\x00\x00\x04\x00\x00\x00@\x00\
-\x00\x00\x00\x04\x00\x00\x00@\x00\x00\x00\x00\x04\x00\x00\x00\
-@\x00\x00\x00\x00\x04\x00\x00\x00@\x00\x00\x00\x00\x04\x00\
-\x00\x00@\x00\x00\x00\x00\x04\x00\x00\x00@\x00\x00\x00\x00\
-\x04\x00\x00\x00@\x00\x00\x00\x00\x04\x00\x00\x00@\x00\x00\
-\x00\x80\x00\x00\x00\x00\x08\x00\x00\x00\x80\x00\x00\x00\x00\x08\
-\x00\x00\x00\x80\x00\x00\x00\x00\x08\x00\x00\x00\x80\x00\x00\x00\
-\x00\x08\x00\x00l\xd4\xd0\xfbL\xce\xb2{\x22Zv\xf4\
-\x17\x89\xa9\xbfY&\xfa\x86d\xa8c\xaf\x0c\x7f\xcb@\
-\xeb\x9d\xd2\xdfr\xb7\xf47\x7f\xdf\xa0\xf9\x7ff\xf9\xdf\
-\x19\xef\x9a\x92\x1d\xddC\xb2\xcbX#S}\x95r\xd3\
-`\xb4\xcc\x8c\x84s\x8d\x01\x02\x00\x00[7\xe7\xdeI\
-O\x99\x1c\xcc\x97\xb1\x9eQ\x19h\x9f\x95\xae\xc6\x07\xa5\
-\xa9\xea\x80T\x16\xbd$\x85\xd9\xc7$5\xe1\x13\x89\x0a\
-;'!\x81\xe7\xc5\xcbsA\x9c\x9d\xcc\xff\x9f\xc4\xf6\
-\xdc6/J\xe0\xd6\x0b\x12\x17\xf5\xb9d%\xff\xaf\x14\
-g\x1d\x93\xed\xe6\xbf\xa9\xd9pP\xba\xea\x1e\x91\x81\x96\
-\xbbd\xb4\xe3\xc6\xa5\xe00\xdd\xeb\xc1\xbd\x04\x08\x00\x00\
-\xbe\xdd|cc\xae\xb2\xc3X.C\x9d\xb7Hg\xc3\
-CR]\xf6\xbc\xe4g\xbd+q\xd1g\x97&\xf4\xf5\
-\x98\xccmm\xe3\x86E\xf1\xf7\xbd(\xc9\xdb\xce\x98\x83\
-\xc2;R[rH:k\x1e\x95\xa1\x96;eGw\
-\x87\xdc2\xe0O-\x00\x04\x00@\xcd&3\x0d\x05\xc9\
-H\xcf\x84t\x98'\xf9\xca\xe2\x97%-\xe9\xd4\xd2\xaf\
-\xf6M\x9b\x16\x95\x98\xe4\xd7*\xd8\xff\x82\xe4\xa6|(\
-u%/Jo\xfdod\xb2kJn\x18\x8e\xa2v\
-\x00\x02\x00\xa0\x9d_\xf4\xe3\xc6&\xe9i\xb9[j+\
-\x9f\x95\x9c\xf4\x13K\x13=\x93\xfc\xeaX\x9e\x1cd&\
-\x9e\x92\xed\x85/I\x7f\xe3\xfdb\xeam\x92Y\x83\x13\
-\xb5\x06\x10\x00\x00\xfb6\xcf\xd4X\xa6\xf4\xb7\xffXj\
-*\x9e^\xfaU\xbf\xd9\x85I\xdb\xd6\xb6\xb8.,\xbd\
-N\xa8.zYz\x1b\xf6\xc9\xae\xde6\xf3\xcd\xd8@\
-=\x02\x04\x00\xc06\x8d2\xdd\xeb!\x83=S\xd2\x5c\
-\xb7_\x0a\xb2\xdf\x91\x80\xad\x17\x98\x90\x1d\x84\xb7\xc7\x82\
-d'\xff\xaf\xb4\x1a\x0e\xc8d\xe7N\xd9\xb3\xc7\x8d\x9a\
-\x05\x08\x00\xc0\xea\x1f\xe7\x0f\xf6\xec\x92:\xc3S\x92\x14\
-\x7fZ\x5c\xf8u\xaf\x19\x96\xaf\x14,\xaf\x0e\xbe\x0a\x04\
-\xd3|\x89\x00\x10\x00\x80\xab7\xc3\x88\xb1M\x9a\xcc\xbf\
-\xf03SO\x8a\x9b\xeb\x02\x93\xa9B\x81 #\xe1c\
-i\xa9<(;\xbaFXG\x00\x10\x00\xa0\xfbw\xf8\
-\xa3\x89\xd2\xde\xf4\x80\x14\xe4\xbe%~>\xf3L\x96:\
-\xe1\xe7=/\xe59\xaf\xcb`\xd3/\xd8\xdc\x08\x04\x00\
-@7\xbf\xf2\x07\xca\x96~\xe5\xa7&\x9d\xe23<,\
-\xedS`YT\xd8^\xf5\x84\x5c\xd7=D\x8f\x80\x00\
-\x00\xa8S\xe0\x1bd\xb0oH\xaa+\x9f\x95\x88\xf0s\
-Lz\xb8\xaa\xb0\xc0\xf3R_\xf2\xa2\xe5U\x01\xfd\x03\
-\x02\x00\xa0\xb5\xa2\x9e\x9du\x92\xfe\xee\x1b\xa5\xac\xe4\x88\
-\xf8o\xbd\xc8\xc4\x86U\x87\x81\xc6\xd2\x17\xc4\xd4k\xa4\
-\xaf@\x00\x00\x1c\xfa\xf1\xfe`\xb3l\xaf|Z\x82\x83\
-\xd8|\x07\xd6\x15\xe2\x7fAj\x8b^\xb6|U@\xaf\
-\x81\x00\x008B\x01\x0f\x0fgK}\xed\xe3\x12\x15\xf9\
-\x05\x13\x15\xd6ET\xc8\x9c\xb4W\xfdYf\x063\xe9\
-A\x10\x00\x80\xf5,\xda\xc9\xc9`im~@R\x92\
-O\xc9\xc6\x8dLH\xb0\x0f\xa7M\x8b\x92\x9brR\x86\
-\x9b\x7f\xc6\xe6C \x00\x00\xb6~\xc4_QvH<\
-\xdc\xf9F\x1f\x8e\xc5\xd3\x5c\x93U\xf9GewO/\
-\xbd\x0a\x02\x00`\x9d\x1d\xf9|\xa4\xa5i\x9f\xc4n;\
-\xc3D\x03MH\x8a9#\xfdu\xbf\x91\xdb\x06}\xe9\
-a\x10\x00\x80\x15\xbf\xdb7VKE\xf9!\xf1\xf2b\
-\x83\x1eh\x93\x87\xdb\xc2\xd2\xc2\xc1\x1b\xfb\x8a\xe9i\x10\
-\x00\x80k}\xbe\xd7\xd9\xfe3IJ\xfc\x98\x09\x04J\
-\xad\x15(\xca8.S\x1d|A\x00\x02\x00\xf0\x9d\x22\
-\x9c\x9e\xf6\x90\xe6\xa6}\x12\x16:\xc7\x84\x01\xa5\xc5E\
-|!\xbd\xb5\x0f\xf3z\x00\x04\x00\xe8\xbb\xf8\xc6\xc7c\
-\xa5\xba\xfa\x80x{\xf3\x98\x1f:;\x8f\xc0k^\xda\
-*\x0e\xca\x0d\xc3Q\x8c\x05 \x00@?E70P\
-&\xe5\xe5\x87d\xcb\x16V\xf3C\xdf\xb6\xb8~\xb5N\
-\x80=\x05@\x00\x80\xd2\xc5f4vJN\xce;\x1c\
-\xc2\x03\x5c\xe6\xc8\xe2\x9a\xc2\x97\xe4\xfa\xbe|\xc6\x0a\x10\
-\x00\xa0N\x91\x0d\x0e6Kn\xee\x9bl\xda\x03\x5c\x83\
-\xb3\xd3\xa2\x94e\xbd)\xd7\xf7\xd63v\x80\x00\x00\xed\
-\x16\xd7\xd0P\x8d\xe4\xe6\xbd\xc5\xc4\x0f\xac\xe2\x98\xe2\xf2\
-\xec\xb7dg_%c\x09\x08\x00\xd0\xd2\xc4_$\x85\
-\x85Gy\xd4\x0fX\xe1\x13\xc2\xaa\xbc\xa3\xac\x11\x00\x01\
-\x00\x0e\xbeU\xefH\x81\x14\x16\x1d\x15gg\x06n\xc0\
-\xdak\x04\x1aK\x9f\x93\x99\x91p\xc6\x1a\x10\x00\xe08\
-E41\x11 \x95\x86\xa7\xc5\xc5\x85\x81\x1a\xb0%o\
-\x8f\x05\xe9\xacz\x82}\x04@\x00\x80}\x8b\xc7dr\
-\x96\xc6\xa6\x87\xf8\x8e\x1fXg\x81~\x17\xc5X\xf7\x1b\
-\xd9grf,\x02\x01\x00\xeb[8]=?\x94\x88\
-\xc8s\x0c\xc6\x80\x9dw\x16\xbc\xae\xf3z\xc6$\x10\x00\
-`\xfb\x82\xe9\x1b\xa8\x93\xcc\xac\xe3\x0c\xbe\x80\x03\xc9K\
-9\xc9\xa1C \x00\xc0V\xef\xf9\xa3\xa5\xa8\xe4\x08+\
-\xfb\x01\x07^(\xd8^y@~0\xe6\xc3\x98\x05\x02\
-\x00\xacS$-\xedw\xf3\x9e\x1f\xd0\xd2\xfa\x80\xfa}\
-\x8c] \x00`\x0d[\xf7\x0e\xd5HR\xf2)\x06U\
-@\x83\xb2\x13?\x92\xdd\xbd\xd5\x8ce \x00`\xf9E\
-\xb1g\x8f\x9bT\xd7>\xc1g}\x80\xc6m6\xf7p\
-s\xd9\xd32\xdd\xeb\xc1\xd8\x06\x02\x00\xae^\x10\x1d\xbd\
-7Jh\xf8\x97\x0c\x9e\x80Bb\xc3\xcf\xc9\xce\xaeQ\
-\xc68\x10\x00\xf0\xfdB\x18\x9d\x8a\x93\x9c\xbc7\x18,\
-\x01\x85\xb7\x15n(9\xc4&B \x00\xe0\xff\x8a\xa0\
-\xbd\xeb\x0e\xf1\xf5\xbb\xc8 \x09\xe8@X\xe0y\x99h\
-\xdb\xcb\xd8\x07.\x82\xae\xf7\xee7\x85KN\xfe\xeb\x0c\
-\x8a\x80\x0e\x19\xf2^\x93=\xc60\xc6B\x02\x00\xf4v\
-\xe3\xdb\xba\xf7\xcaV\xff\x0b\x0c\x84\x80\x8e\x05m\xbd \
-\xd7\xb5\xcf0&\x12\x00\xa0\x87\x1b\xbe{\xb7\xaf\x94T\
-\x1c\x92\x0d\x1b\x19\xfc\x00|\xa5\xb6\xe8e\xbe\x14 \x00\
-@\xe9\x15\xfe\xfdS\x12\x1c2\xc7\x80\x07\xe0{b\xc2\
-\xce\x89\xa9\xbb\x87\xb1\x92\x00\x00\x95n\xb2a\xd6I\xaa\
-\xea\x9e\xe0W?\x80k\xee\x1b`9nx\xd6\xe0\xc4\
-\xd8I\x00\x80\xe6w\xf3\x1bI\x91\xc4\x94\x8f\x18\xdc\x00\
-,[V\xe2)\xb9\xb1/\x871\x94\x00\x00\xcd~\xde\
-\xd7\xfbC\xf1\xf1e\x0f\x7f\x00+\xe7\xe39/\x13\xad\
-w0\x96\x12\x00\xa0\xa5\x9b:6\xe6*eUO\xf3\
-\xc8\x1f\xc0\x9aY6\x0f\xdagrfl%\x00\xc0\xd1\
-o\xe8\xc0H\x81\xc4&\x9cf\xe0\x02`5\x19\xf1\x9f\
-\xc8\x9e\xe1T\xc6X\x02\x00\x1c\xf6\xd8\xde\xce\x1f\x8b\x87\
-\xe7\x02\x03\x16\x00\x9b\x1c3<\xd5\xb9\x93\xb1\x96\x00\x00\
-\xc7\xba\x89\x1b\xc4\xc0*\x7f\x00\xebp\x9e\x80\xe5+\x01\
-\xf3\x98\xc3\xd8K\x00\x80\xbdo`\xe7P\x90\xa4e\xfd\
-\x87\xc1\x09\xc0\xba)L\x7fO\xfe\x9f1\x981\x98\x00\
-\x00{\xdd\xbc\xbe\x11\x83\x84F\x9cc@\x02`\x97\x8d\
-\x83f\x8c\xe5\x8c\xc5\x04\x00\xac\xf7\x8dk\xee\xfe\x91\xb8\
-{\xf0\xbe\x1f\x80\xfdx\x9b\xc7\xa0\x89\xb6\x9b\x18\x93\x09\
-\x00X\xaf\x9bVY\xf7'\xde\xf7c\xc5\x9c\x9d\x17\xc5\
-\xc3}aIp\xd0\xf9%~>\xf3\xdf\xfcg_s\
-q\xe1Za\x05u\xe5\xb4(\xfdu\xbffl&\x00\
-\xc0\x967kr\xd2S2r\x8f1\xe8\xe8\xd8Fs\
-\xf0\xf3\xf3\xbd(\xb11\x9fIv\xe6\x7f\xa4\xac\xe4\x88\
-T\x1b\x9e\x91\xa6\xba\xfd\xd2\xd1|\xbf\xf4\xb4\xcf\x8a\xb1\
-gJ\xc6\x06\xeaej4QvOD[\xf6\x85X\
-U\xbdM\x0dG\xc9\xc4H\x81\x8c\xf6\xb5\xca\xa0\xf9\xff\
-\xa6\xb1\xebV\xe9i\xb9[\xda\x1b\x1e\x92Z\xc3SR\
-V\xf4\x8a\xe4\xa4\x9f\x90\x84\xd83\x12\x14p\x81\xe0\xa0\
-s\xf5\xc5\x87\xd9/\x80\x00\x00[\xdc\xa8A\xf3@\x1e\
-\x9b\xf8)\x03\x8d\x0eX~\x85o3O\xf0\xf9\xb9o\
-H]\xf5\x93\xd2\xder\xafyR\xdf%\xa3CE\xb2\
-g\x8f\x9bC\xd7\xe9\xae\x81X\x19\xe9\x19\x95.\xf3\xdf\
-\xdc\xb0\xfd\x80\x94\xe4\xbf&\xc9\xf1\x9f\x8a\xff\xd6\x8b\xdc\
-[\x1d\xc8M\xfe@\xf6\x18\xc3\x18\xb3\x09\x00\xb0\xdeb\
-\xbfb\x09\x09\xff\x92\x01F1n\xae\x0b\x92\x10\x7fZ\
-JK^\x92\xa6\x86\x87\xa5\xb7\xeb&\x99Tw\xb3\x15\
-\x99\x99\x08X\x0a\x07\x1d\x8d\x0fIe\xf1\xcb\x92\x92\xf0\
-\x89x\xb1o\x85r\xa2C\xbfdq \x01\x00V\xd9\
-\xcf\xdf8(\xde\xec\xe7\xafy[\xb6,Hb\xe2'\
-R^vX\xdaZ~%CC\xf52;\xcb\x89k\
-\x96\x1a\x9f0fK\x7f\xfb\xac\xd4U>#\xe9\xc9\x1f\
-\x89\xfb\x16B\x81\xd6\xf9\xfb\xcc\x8b\xa9\xbb\x9f\xfa&\x00\
-`\xb57\xa7\xa9\xfb\x0equc0\xd4\x22_sh\
-\xcb\xce:.\xf5\xf5\xbf\x97\xfe\xfe\x1e&\xfb\x15\xd4\xfd\
-\xac\xc1I\xc6\x8dm\xd2\xd9\xf0\x1b)\xc9{M\x22B\
-\xe7\xa8)-\xbe\xca2\x8f]\x13\xed\xb7P\xd3\x04\x00\
-\xac\xf4\xc6\xd4\xb4\xfcF6mb\x10\xd1\xd2\x84\x9f\x9b\
-\xfb\xa645=d\xf9uO\x0d\xdb\xe0)Aw\xd3\
-\xfdR\x94\xfb\x86\x04\xb0\x9e@S_\x08\x0c7\xddM\
-\x0d\x13\x00\xb0\xdc\x9bRZ\xfd\x0c\x83\x87\x83\xb3\x84\xb3\
-\xf8\xf8\xd3RS\xf3\xa4\x18\x8dF\xb6F]\xe7\x1e\x19\
-76I[\xdd\xef$;\xed}q\xddL=:\xf4\
-\x97+\x1b\x16\xa5\xa7\xfa\xf7\xd4-\x01\x00\xd7\xda\xd3?\
-\xaf\xf4\x08\x83\x86\xa3nz\xe2=/\x05\x05\xafI{\
-\xfb\xdd2<\x1cE\xcd:H\xdf\xec\xde\xed+\xfd\xad\
-?\x91\xd2\xfc\xd7\xc4\xd7\x9b\xf52\x8e\xaa\xb1\xf49\x82\
-2\x01\x00\x97\xbb\x11&\x93\xb3d\x16\xbc\xce@\xe1\x80\
-\x93~Q\xd1?\xa4\xab\xeb\x16\xcb=\xa2V5\xb0~\
-`\xb4g\x97l/;$!\x81\xe7\xa9a\x07S\x99\
-\xf7\x9a\xcc\xaen_\x0a\x10\x00\xd4\xbc\x09\xbd{\xdc$\
--\xe7]\x06\x08\x07z\x9f_T\xfc\x8a\xf4\xf4\xdc\xcc\
-\xa4\xaf\xf1\xde\x1a\xed\x99\x10C\xf1\xcbK;\x1eR\xdb\
-\x8er\x90\xd0\x7fd\xba\xd7\x83\xfa$\x00p\x03\xda\xc7\
-|$)\xfd$\x03\x83\x9dYv\xb1\xcb\xc99&]\
-=\xb72\xe9+\xfa\x84m\xa0\xfdGR\x92\xf7o>\
-3t\x00\x05\xa9\xef\x13\x02\x08\x00:_\xd9<\x13 \
-\xf1)\xa7\x18\x10\xech\xdb\xb6\xb3R\xdf\xf8\x08\xef\xf4\
-u\xd4w?0\x87n\xcb\x17\x05\xc9q\xa7\xe9\x01;\
-\xef\x1a\xb8w\xd2\x93\x9a$\x00\xe8\xf0\xb1\xbf)\x5c\xa2\
-\xe3\xcf0\x10\xd8\x81\xa7\xd7\xbc\x94\x95\xbf(\xc6\xa16\
-j\x91\xaf\x09d{\xe9av$\xb4\x93\x9c\xa4\xff\x95\
-\xdb\x06}\xa9E\x02\x80\xbe&\xff\x08\xf3/O\x06\x80\
-\xf5\x15\x19\xf5\x8546?(cc>\xd4!\xbe\xd3\
-\x93\xe6_\xa2\xd2\xd3|\xef\xd2\xb9\x05\xf4\xca\xfa\xcaJ\
-<%\xb7\x0c\xf8S\x87\x04\x00\xf5/\xf8\x80\xc9_\xb6\
-q\xa8\xcf\xba\xb1\x1c\x9b\x9c\x9avR:\xba\xf7R\x7f\
-XV\x8f\x8e\xf5\xf6Ky\xc1Q\xd9\xcc\xe9\x86\xeb&\
--\xf6\xb4\xdc4\x14D\xfd\x11\x00\x14>\xd1o\xb7\xaf\
-\xc4&}B\xc3\xaf\x03w\x8f\x05)\xaf|A\x06\x07\
-\xf3\xa9=\xac\xaa_\xa7\x06s\xa4\xa6\xfc\x05\xf1t\xe7\
-\xf5\xc0zH\x8f\xfb\x94\x10@\x00P\xf3BONz\
-J|\xeaG4\xfa:|\xb7_e\xd9\x9do\x9c#\
-Ia\x9d\xde\xb5\x9cb\xd8^\xf7;\x09\x0a\xb8@\x8f\
-\xd9XF\xc2\xc7,\x0c$\x00\xa8\xf7\x9d\x7fR\xe6\xfb\
-4\xb8\x0dm\xf5\xbf 5\xf5\xfb-\xafX\xa89\xd8\
-\xa4\x8f\xf7\x98\xfb\xb8\xabq\x9f\x84\x05\xb3\xc1\x90\xad?\
-\x11d\xb3 \x02\x802\xdf\x1f\xa7d\x1f\xa7\xb1m$\
-(\xe4\xbc4\xb4<h\x19\x9c\xa97\xac\xcf\x1a\x811\
-Ws\x10xP\xc2\x82\x08\x02\xb6R\x9e\xfd\x06\xdb\x06\
-\x13\x00\xb4}q\x0d\xb3N\x92\x91\xff\x16\x0dm\x8b\xdd\
-\xfa\xfc.J]\xd3o\x99\xf8a\xb7\xfe\xdeg\x0e\xf7\
-=M\xf7\xf3D\xc0Fj\x0a\x8fPg\x04\x00\xed^\
-\xdc\xdc\xb2\x97hd\x1b,\xee\xab\xaa}\xc2r\x00\x0c\
-5\x06\x87y\x22\xd0^\xf70\xdb\x0d\xdb@K\xf93\
-\xd4\x18\x01@{\x17\xb6\xb4\xeeI\x1a\xd8\x8a6\xbb.\
-JI\xc5!\x19\x9c\x88\xa6\xbe\xe0\xb0\x8b\x05\x9b\xab\x9f\
-`\xaba+\xeb\xaa\xfa\x1f\xea\x8b\x00\xa0\x9d\x8b\xba\xbd\
-\xfd~\x1a\xd7\x8a\xb2\xf3\xde\x90\xc1\xb1Lj\x0b\x9a\xe8\
-\xff\xdd\x83\x99K\xfb\x08l\xdaD\xefZK_\xdd\xaf\
-\xa9-\x02\x80\xe3_\xd0\xc6\xde[\xc5\xc9\x99\x86\xb5\x86\
-\xa8\x98\xb3\xd2\xd17E]A\x9bg}\xf4\xb5Jj\
-\xc2\xc7\xf4\xb2\x158\x99\xc3\xd4D\xdb\xed\xd4\x15\x01\xc0\
-q/f\xeb`\xa7l\xf1\xe0\xf1\xdfZyx.H\
-u\xc3~N\xe5\x83\x12\xe3\x82\xb1\xfd\xc7\x12\xb8\x95=\
-\x04\xd6j\x8b\xeb\x82\xec\xee\xe9\xa5\xa6\x08\x00\x8ew!\
-\xdbF\xca\xc4\xdb\x97E@kaydZ\x5c~X\
-FL\xe1\xd4\x14\xd4\xfa\x1cx(H\xaaK_\xe4\xb5\
-\xc0Z?\xfb5\x07\xa9\x99A^\x07\x12\x00\x1c\xe8\x22\
-\xf6O\xc5I`\xe8\x1c\x0d\xba\x96\x83zb>\x97N\
-c?\xf5\x04\xb5w\x04\xedo\xe6\xb5\xc0\x1a%D~\
-.\xb7O\x04PO\x04\x00\xc7\xd8\xe5o\x1b\xfb\xfb\xaf\
-\x9a\x8b\xcb\xa2\x94U=\xcd\xf7\xfc\xd0\xd5\xb8\xd1\xd7r\
-7G\x10\xafAn\xca\x07\x96}\x18\xa8%\x02\x80}\
-/`V\xc9?i\xc8U\x8aM\xfcTz\x87\xea\xa9\
-#\xe8\xf4\xb5@\x86\xe4\xa6\x9f`,X\xedFAE\
-\x7f\xa3\x8e\x08\x00\xf6\xbbx\x95\xcd\x8f\xd0\x88\xab\xdc\xcc\
-\xa7\xb6\xe5A\xb6\xfa\x04\xcc-\xd1\xd3t\x9fx{\xb2\
-~h5zj\x7fG\x0d\x11\x00\xd6\xff\xc25\x18g\
-X\xd0\xb3\x0aqI\x9fH\xf7P\x115\x04|k<\
-\xd9aL\x91\xfc\x0c\xce\x0cY\xa9\x8d\x1b\x16e\xb2\xe3\
-\x87\xd4\x10\x01`\x1dW\xfcO\x16\x8b\x87\x17\x89}\xa5\
-+\xfcK\xab\x9e\xb6\x9c\x8f@\x0d\x01WY\x1b\xe0\xe9\
-\xce\xda\x80\x15\x1d\x01\xee\xb1 \xd3\xc6r\xea\x87\x00`\
-\xfb\x0b\xd6i\x0a\x92\x90\xa8s4\xde\x0a\x84\x84\x7f)\
-\x9d\x83F\xea\x07X\xc6\x1835P&\x89\xb1g\x18\
-;V\xb2\x9e(\xe2\x0b\xb9\x8d\xf3A\x08\x00\xb6\xbdX\
-\x1b$9\xfb?4\xdc\x0a\x14V\x1c\x96\xc9IO\xea\
-\x07X\xc1X\xb3g\x8f\x9b\xd4\x96\xffu\xe9\x117\xe3\
-\xc82\x8f\x10\xcey\x9d\xda!\x00\xd8\xeeb\x15\xd7\x1e\
-\xa0\xd1V\xb0\x9b_c\xd7\x9d\xd4\x0d\xb0\x861g\xb4\
-sF\x02\xfc.2\xa6,{Q\xe0#\xd4\x0d\x01\xc0\
-6\x8b\xfe6l\xa4\xc1\x96#\x22\xe6s\xe9\x1e\xa8\xa4\
-n\x00+\x8c=\xd7\x8f\xc6IF\xf2G\x8c-\xcb<\
-3`G\xe7\xf5\xd4\x0d\x01\xc0z\x17\xa9u$E\xbc\
-I\xe1\xcb\xdb\xa0\xa3\xf8(\x8f\xfc\x01\x1b\xbc~\xb4\x1c\
-5\xcc+\x81k\xdb\xea3/\xd3\xc6l\xea\x86\x00`\
-\x85\xcd:L\xce\xb2-\x99\xad;\xaf\xc5\xd5mA\xea\
-\xda\xef\xa5f\x00[n;\xdez'_\x09,CZ\
-\xdc\xa72;\xe6J\xcd\x10\x00\xd6v\x81\x0a\xab\x9f\xa1\
-\xa1\xae!0\xe4\xbct\x0c\xb5R/\xc0z\xec\x190\
-`\x90\x98\x88/\x18{\xae\xa1\xb9\xe2\x19\xea\x85\x00\xb0\
-\xfa\x8bS\xd3\xb7\x97\xf7\xfe\xd7\xfa\xfc&\xe9\x13\xcba\
-H\xd4\x0b\xb0\x8ec\xd3m\xbb}\xa50\xfb\x1d\xc6\xa0\
-kl\x124\xd1q#\xf5B\x00X\xc5\xf7\xfe\x93\xa9\
-\xe2\xc5\xf1\xbeW\x95S|\xd4r\x18\x12\xf5\x02\xd8q\
-]\x00c\xd1U\x9eN\xfa]\x94=\xa3\xfc@!\x00\
-\xac\xf0\xbd\x7ft\xd2\xa74\xd0Uv\xf5\xabjf\x0f\
-n\xc0\x11\xc6\xab\x9e\xc6_\xc9f\x17\xc6\xa5+\xeeE\
-\x92\xfe\x1euB\x00X\xfeE)\xaa\xe3{\xff+\xd9\
-\xe2\xb1 \x8d={\xa9\x13\xc0\x81\xc6\xac\xe1\xae\x9d\xe2\
-\xeb\xcd\x13\xcb+\xef\x0f\xf00uB\x00\xb8\xf6\x05i\
-\x1c6\x8a\x933\x0ds9>~\x17\xa5m\xa0\x83:\
-\x01\x1c\xf1\xc9\xa5\xb1\x5c\x22\xc3\xbed\xac\xba\x0c\xb7\xcd\
-\x8b\xb2\xbb\xbf\x99:!\x00\x5c\xf9b\xb4\xed\xf5\x94\xe0\
-\x08\xf6\xf9\xbf\x9c\xe0\xb09i\xe7\x14?\xc0\xa1\xc7\xb0\
-\xa9\xe1(I\x8e;\xcd\x98u\x191a\xe78/\x80\
-\x00p\xe5\x8b\x91Sy\x98F\xb9\x8c\xa8\xd83\xac\xf4\
-\x07\xb4\xf2$`\xc0_\xb2R>`\xec\xba\x8c\xda\xe2\
-\xbfS#\x04\x80\xef_\x88\xfa\x81i>\xf9\xbb\x8c\xc4\
-\xf4\x932`\xf2\xa7F\x00\x0d\x8dg\xfbL\xceR\x9a\
-\xf7\x1ac\xd8e>\x0dd\xab`\x02\xc0w.B\xfb\
-x\x98\xf8\x04\x5c\xa0A.\x91\x91\xff\x86\x8c\xb1\x9b\x16\
-\xa0\xd9\xcf\x04\xab\x8a\xff\xceXv\xe9Y%\xc1s\xbc\
-\x0a \x00\xfc\xdfEH+\xfa7\x8dq\x89\xec\xe2\xa3\
-b\x98u\xa2>\x14\xa8\xef\xa1\xa1 i\xef\xfc\x91\xd4\
-\xd5\xfdQ\x0a\x0b\x8fJJ\xcaG\x12\x13\xf3\x99\x84\x87\
-\x9f[\x12\x1b\xfb\xd9\xd2\x7ff\xf9\x9f\xd5\xd6=.]\
-]\xb7\xca\xc4D\x00\xd7N\x91\xfb\xdfT\xc5WM\x97\
-\xaa/y\x91\xda \x00\x88l\xef\xf9)\x0dq\xe9\x81\
->\xa5G,\xbf\x1eh\x10\x0d\xd7\xf5\xd8X\xa6y2\
-\xff\xa3\xc4\xc6\x9dY\xda\xb7a5{=\xc4\xc7\x9f6\
-\x87\x86\xc7\xcc\x01\x22\x83k\xaa\xf1zh\xad\xf9#c\
-\xdb%\xaf\x02\xae\xeb\x9a \x00\xe8\xfd\xd1\xbf\x17\xa7\xfc\
-}G~\xc5a&\x7f\x0d\xd7tw\xff\x94\xa4g\xbc\
-o\xd5\xf5,\x1b\xcd\xff\xb722NH_\xdf\x04\xd7\
-\x98\x10\xa0\x8c\xe8\xd0/e\xaf\xbeO.\xd5wCd\
-\x96\xbdB#|KA\xe5!\x06J\x8d\xd6ro\x7f\
-\x8f$&\xd9\xfe\xd4\xca\xe4\xe4S\xe6 \xc0^\x10\x84\
-\x00E^\x05\x94>O\x00\xd0\xe5\xaa\xff\xc1)V\xfd\
-\x7f{\xbb\xcc\xaa\xe7\x18 5X\xc7\xbbw\xfbJq\
-\xe9\xdfV\xf5\x98\x7f-[A\x97\x95\x1d\xb6\xfcws\
-\x0f4X3-\xd5\x8f3\xe6\xfd\x97\x93\xb9\x96\xaf\xeb\
-\x1e\x22\x00\xe8\xea\xd7\xd2\xb4\x87\x04E\xb2\xe1\xcf7\xef\
-\xfc\xcb^b`\xd4`\x1d\xf7\x19[%,\xdc~u\
-lY@h46q/\x08\x01\xda~\x15\x10vN\
-\xf6\xe8\xf3P3}\x16\x7f!{\xfd\xff\xdf\xa7~\x85\
-\xaf\xf3\xce_\x8b\x8fr;\xee\x94\xcd\xae\xf6\xaf\x1fW\
-\xd7\x05\xe9\xe8\x98\xe5\x9eh\xb0\x86\x1a*\x9fb\x0c\xfc\
-\xaf\xce\xed\x7f$\x00\xe8\xe2\x93\x98\xe1:q\xe6\xe4\xac\
-%)9\xc7-'\x1f2\x18j\xac\x86\x1b[\x1e\x5c\
-\xd7G\xfe\xcby%\xd0\xdc\xfc\x00\xf7F\x83\xb5TY\
-t\x84\xb1\xd0r\xc8\x999\xc8N\x1b\xb3\x09\x00\xaao\
-\x8c\x11\x9d\xfc1\x05o\x16\x97zJ&\xf7z2\x08\
-jm\xf2o\xfd\x95\xc3\xae]!\x04hsL,\xce\
-}\x9d1\xd1\xac8\xf3m\x02\x80\xca\xff\xd8\xf2\xf6\x07\
-(t\xcb;\xaf\xc4\xd32\xc8\x02.\xed}\xb6\xdau\
-\x87C\xfd\xf2\xbf\xdc\x93\x80\xee\xee\xdb\xb9W\x1a\xab\xab\
-={\xdc8;\xe0\xbf\xc6\xdbo!\x00\xa8\xf8\x0fm\
-\x9b\x0c\x16/?\xce\xcb\x0e\x0a\x9b\x93\xee\xf1X\x06>\
-\x8d\xd5\xef\xe0H\xb1xx.8|}\xb9\xbb/\xc8\
-\xf0p9\xf7L\x83_\x93p\x8a\xe0\xa2D\x85~\xa9\
-\xa7\x05\x81\xfa)\xf0l\xc3!\xdd\x17\xb7\xa7\xcf\xbct\
-\x8e18k\xf1\xab\x95\xa8\x98\xb3\x9a\xa9\xb3m\xdb\xce\
-\xeauU\xb5\xb6C\xc0D\xb4D\x84\xce\xe9~\x9cl\
-\xdf\xfe?\x04\x00\xa5V\xbb\x8eT\x8a\x93\xb3\xbe\x8b\xda\
-\xb2\xf0\xb1\xc98\xc5@\xa7\xc1\xfa\xad\xaa\xd1\xdeW+\
-5\xb5Op\xef4Xk;\x8c\xe5\xe2\xeb=\xaf\xfb\
-\x05\x817\x0e\xe6\x10\x00T\xf9G\xc6g\x9f\xd0uA\
-[\x16\x8d\xd5v\xff\x9c\x01N\x8b\xdf\xfa\x8f\x14;\xc4\
-\xe7~+\xff<p\x91W\x01\x1a\xad\xb9\xd1\x9e]\xe2\
-\xec\xa4\xef\x1fL%Y\xef\x10\x00T\xf8\x07n7\xde\
-\xa2\xfbGZ\xe5M\xfb\x19\xd84Z\xbfY\xb9\xc7\xb4\
-\xbb\xc1T\xde\x1b\xdcC\x8d\xd6]O\xcb=,\x08\xec\
-\x9c&\x00h\xf9\x1fg29Kp\x94\xbew\xfc\xcb\
-*\xf9\x07\x03\x9af\x7f\xfd\x1b\x1cz\xd5\xffr\x0e\x11\
-\x1a\x1a\xaa\xe1^ju\xbb\xf4\xcagt=v&D\
-\x7f\xa6\xfa&ij\x17pI\xcb#\xfa^\xd1\x1a\x7f\
-\xc6\xb2\x80\x8c\xc1L\xa3\xf5\x9b_\xf4\x0f\xed\x7f[]\
-\xfc\x0a\xf7R\xc3{\x04\x14f\xbf\xa3\xeb1t\xb0\xe5\
-.\x02\x80&\xb7J\x9d\x8a\x12w/\xfd.f\xf1\xf6\
-\xbb(\x9d\x13\x9c\xe3\xae\xd5\xfa\x1d\x1b\xf3\x11w\x8f\x05\
-\xcd\xd7\xa1\xa7\xe7\x82LN\xb2\xe1\x94f\x9f\xa2\x0e\xf8\
-Kt\x84~\x9f\xa2F\x04\xcf\xa9\xfcE\x8b\xba\x85\x9b\
-[\xfd\xac~O\xb8r^\x94\xa6A\xcen\xd7\xf4\x96\
-\xd5m\xea\xbc\x83mm\xbb\x8b{\xaa\xe9/\x03\xaa\xc5\
-\xc3}A\xb7\xe3iW\xdd#\x04\x00m\xfd\xfaO\x94\
-\xcdn\xfa-\xd8\x8a\x96\x87\x18\xb8\xb4\xbeoE\xde\x1b\
-\xca\xd4c~\xc1k\xdcS\x8d\xd7c\x7f\xeb\x9d\xb2q\
-\x83>\xc7S\xcbg\x91\xd3\xc60\x02\x80V\xfeQ\xe9\
-\xe5/\xe9w\xd1_\xe9?\x19\xb0\x14\xa8a\xbf\xad\x17\
-\x95\xa9I\x7f\xff\x0b\xdcS\x05j\xb2\xa6\xfc9\xdd\x8e\
-\xab\x8d\xe5O\x13\x004\xb1ru\xb4H\xb7\x9b\xfe\x84\
-D\x9d\x93\xf61\x1f\x06+\xad\xef\xfc7R\xa6\x5cm\
-\x0e\x0d\x15qo\x15\xf8\xaa*=\xe9\x94n7\x07\xba\
-~(\x83\x00\xe0\xe8\xff\xa0\xd4\xe2\xd7tY\xa0\x96W\
-\x1e-c\xf5\x0cT\x0a\xd4pK\xd7\x1d\xea\x9d\xb7\xce\
-!AJ\xd4\xe6\xce\xa1\x04\x09P\xe8\xe9\xd4J\x18\xf2\
-\xffA\x00p\xe8_\xffcu\xb2q\x93>\x7f\xfd\x1b\
-:\xeeg\x80Re\xf3\xaa\xfa\xc7\x94\xab\xcf\xbaz6\
-\xa3R\xa5>\x07;n\xd2\xe5z\x00\xcb\xee\x88\xd3\x03\
-\x05\x04\x00G\xfd\xc7$\xe4\xbd\xab\xcb\xc9?\xbd\xe8\xdf\
-\x0cL\x0a\xd5qq\xf9\x8b\xca\xd5hY\xf9\x8b\xdc[\
-\xa5\xd6\x03\xbc\xa0\xcb\xb1\xb6\xaa\xf0\x15\x02\x80#\xfeC\
-jG\xfa\x97\xf6\xbc\xd7[A\x06\x86\xcfI\xefL\x00\
-\x83\x92BM\x99WtT\xb9:-,:\xca\xbdU\
-\xa8F\xf7\xecq\x93\xb8\xe8\xb3\xfa{\xd5\xea\xb2(\xd3\
-\xc6l\x02\x80\xa3\xfdC\xe2r\xfe\xa3\xcb\xef\xfd\x9b\x87\
-{\x19\x90\x14\x1b\x5c3s\xd5\xdb}-;\xe7\x1d\xee\
-\xadbuz\x9d\xb1F\xdc\x5c\xf5\xf7\xb9uM\xf1\xdf\
-\x09\x00\x8e\xf4\x8f\xa8\x9b\xac\xd7\xe5\xaf\xff\xa2\xba\x03\x0c\
-D*~\xc6\x9a}\x5c\xb9Z\xcd\xcc:\xce\xbdU\xb0\
-V;\x1a~\xad\xcb\xa7\x003\x83\x99\x04\x00G\xf9G\
-$\x17\xbd\xae\xbb\x22\x0c\x8f;+cc\xae\x0cB\x04\
-\x00\x02\x00\xec\xbb\xebj\xc6{\xba\x1b\x7f\xebJ_$\
-\x008\xc4\xbb\xff\xc9|\xdd}\xf7\xbf\xb4\xd5\xefH\x1b\
-\x83\x0f\x01\x80\x00\x00\xbb\xd7\xeb\xc4P\x82x{\xea\xeb\
-\xdc\x15\xb7\xcd\x96/\x02\x12\x09\x00\xec\xfag\x87\x13\xd6\
-\x1a\x1fg\xe0!\x00\x10\x00\xe005\xdb\xddt\xbf\xee\
-\xc6\xe1\xfa\xd2\xe7\x08\x00\xf6\xfc\xe3\x1b'\x12\xc4\xc5U\
-gG\xfc&\x9e\x16\xc3\xac\x13\x83\x0e\x01\x80\x00\x00\x87\
-\xaa\xdb\xac\xd4\x0fu5\x16\xbb\xbb-\xc8\x0d\xc3Q\x04\
-\x00{\xfd\xf19\xb5\xcf\xe8k#\x0a\x97Ei\x1e\xad\
-a\xb0Q| M#\x00@\x8b[\x05\x0f\x14\x88\xfb\
-\x16}}\x15\xd0^\xfdG\x02\x80]~\xfd\xcf\x04\x88\
-\xbb\xb7\xbe\xde;\x15\xd4\x1dd\xa0!\x00\x10\x00\xe0\xb0\
-\xb5\xdb^\xff[}\xed\xc3\xb2\xf5\x82\x96\x17ck\xb7\
-\xd0\x0a\x9a\x1e\xd3U\xa1\x05\x84\xceI\xdb^O\x06\x19\
-\x02\x00\x01\x00\x0e<\xa1l\x90\x94\x84Ot56\x1b\
-\x9b\x7fA\x00X\xef\x22\xdb\x1a6\xa7\xaf\xcd'\x8c\xb7\
-0\xc0\x10\x00\x08\x00p\xf8\xfa\x9d\xeco\x96M::\
-\x93%%\xee4\x01`=\xff\xe8\xf2\xbe;u5\xf9\
-\xa7\x14\xbc\xc1\xc0B\x00\xd0\xb4\x0c\x02\x80\xaej\xb8\xaa\
-\xf4\xb0\xae\xc6\xe8\xc9\x9e\x09\x02\xc0z\xfd\xd11\x19\xff\
-\xab\x9f\x95\xa6^\x0b\xd2\xba#\x85A\x85\x00@\x00\x80\
-fj\xf8\x86\xc9`\xd9\xea\xab\x9fc\x83Kr\xde\x22\
-\x00\xac\xcb\xc6?c\xd5\xba\xda\xf6\xb7\xa4\xe5\x11\x06\x14\
-\x02\x00\x01\x00\xda\xdb\x1b\xa0\xe5>]\x1d\x15l\xd2\xde\
-!A\x1a\xfcF\xba\xf2\xef\xfaYa\x1a\xf1\xa5\x18\xd8\
-\xee\x97\x00\xa0B\x00\xc8&\x00\xb0 P\xf1\xed\x81\xcb\
-\x9e#\x00\xd8\xfa\xd3?7\x0f\xfd|g\xba\xbd\xefG\
-\x0c$\x04\x00\x02\x004[\xcbc\xbd=\xbaY\x10h\
-\xd9\x0ey\xef\xa4'\x01\xc0V\x7fla\x9b~\xbe1\
-\x8d\xcd\xf8\x90\x01\x84\x00@\x00\x80\xe6\xeb\xb9\xbc\xf0\x9f\
-\xba\x19\xb7\xfb\x9b\xee%\x00\xd8\xea\x8f\x0d\x8c>\xa7\x8b\
-\x22\xdahN\xcc\xf5\x1c\xf6C\x00 \x00@\x81z\xde\
-aL\x117W}<\xb9\xcdH<E\x00\xb0\xc9g\
-%\xc3\xbbt\x93\x223\xca\x8f0p\x10\x00\x08\x00P\
-\xa6\xa6k+\x9f\xd5\xc7\x8f\xb7\x0d\x96\xc5\x80\xe5\x04\x00\
-k\xff\xa1\xc9%\xaf\xea\xa2\x80\x5c\xb7,X\x0e9b\
-\xd0 \x00\x10\x00\xa0LM\x8f\x1b\xc3tsdp}\
-\xf9_\x08\x00\xd6\xfc#\x9bw\xfb\xeaf\xf1_n\xcd\
-\xd3\x0c\x18\x04\x00\x02\x00\x94\xab\xeb\x96\xba\xfd\xfa\xd8\xb6\
-\xdd\xef\xa2\xec39\x13\x00\xac\xf5G\x96t\xe9\xe3{\
-RK\xc8i\xde\x1d\xcd`A\x00 \x00@\xb9\xba\x9e\
-\xee\xf5\x90\xe0\xc0\xf3\xba\x18\xcb\x87\xdb\xef \x00X\xeb\
-\x8f\x8cJ\xffH\x1f\xa7\xfd\xd5?\xc9@\x01\x02\x00\x94\
-\xad\xed\xae\xe6\xfbu1\x96\xe7\xa7\xbfG\x00\xb0\xc6\x1f\
-X3\x95\xa3\x8b\x9d\xff\xdc\xbd\xe6\xa5m2\x98A\x02\
-\x04\x00([\xdb&\x93\xb3\x84\x85\xa8\x7f\x90\x9beg\
-\xc0]\xc6\x14\x02\xc0Z\xff\xc0\x9c\xc6'u\x91\x18\x0b\
-\x9b\x1ec\x80\xc0R\xcd\xa7\x12\x00\xa0p}w4=\
-\xa0\x8b1\xbd\xb5\xfaq\x02\xc0Z\xff@=\x1c\xfb\xeb\
-\xe5w\xd1\xb2\xd0\x91\xc1\x01\x04\x00\xa8\xbf;\xe0\x98\xab\
-\x04\x05\x5cP~\x5c\x8f\x8f>K\x00X\xcb\x1fW9\
-8\xa5\x93_\xff\x7fd`\x00\x01\x00\xba\xa9\xf1\xb6\x06\
-}\xec\xeaz\x9d\xb1\x86\x00\xb0\xda?.\xa5\xe2\x88.\
-V\xfe\xd7\x8d\x871(\x80\x00\x00\xdd\xd4\xf8\xdeIO\
-\xf1\xdf\xaa\xfeq\xc1\xcd\x86\x03\x04\x80\xd5\xfca\x86Y\
-'\xf1\xd4A\x81dU=\xcf\x80\x00\x02\x00tW\xe7\
-\xcd:\xd8\x17 &\xe2\x1c\x01`U\x8f\xffu\xb0\xf5\
-\xaf\x93\xb39!Ne2\x18\x80\x00\x00\xdd\xd5\xf9\xee\
-\xdd\xbe\xba\xd8\x1d\xd0\xd4\xdfL\x00X\xf1 X\xf1\x92\
-\xf2\x85\x91Vz\x94\x81\x00\x04\x00\xe8\xb6\xd6ktp\
-F@}\xc5\xd3\x04\x80\x95\xfdQ\x1b\xc4K\xf1U\xa2\
-\x96\xbd\x0d\xea\xc6\x9b\x19\x04@\x00\x80nk}j,\
-s\xe9\x9by\x95\xc7\xfa\xf0\xe09\x02\xc0J\xfe\xa8\x8a\
-a\xf5W\xff\xc7e\xbd\xcf\x00\x00\xdd\x04\x80t\x02\x00\
-\xaeP\xef\xf9\xd9\xc7\x94\x1f\xef'z{\x08\x00\xcb\xde\
-\x09\xcdpX\xf9\x82\xa82\xdeN\xf3\x83\x00\x00\xdd\xd7\
-\xfbH\xcf\xa8\x0eN\x08\xfc+\x01`\xb9\x7f\x94o\xb0\
-\xda\x07F\xf8\x99\xff}\x86Y'\x9a\x1f\x04\x00\xc0\x5c\
-\x22\x09\xb1g\x94\x1e\xf3\xa3\xc2\xce\x11\x00\x96\xb5\xfa\x7f\
-D\xfd4X\xc0\xb6\xbf \x00\x00\xdf\xd4|W\xcb=\
-\xca\x8f\xfbS\x03e\x04\x80k\xfdA\x19\xb5j\xaf\x0a\
-uvY\x94\x96]\xb14=\x08\x00\xc0\xb7\xb6\x07\xf6\
-\xf3Q\xfb\x93\xc0\xf6\xdaG\x09\x00\xd7\xfa\x83\x82c\xcf\
-*]\x04)\xc5\xaf\xd1\xf0 \x00\x00\x97n\xfeVv\
-H\xe9\xb1?;\xf5C\x02\xc0\xd5\xfe\x98\xed;R\x94\
-?\xfa\xb7fx\x88f\x07\x01\x00\xb8\xf4)@_\x9d\
-\xd2c\xfff\x97E1\x0d\xf8\x13\x00\xae\xf4\xc7\x14v\
-\xdd\xaft\x01\x04F\x9e\xa3\xd1A\x00\x00\xaeP\xfb\x89\
-\xf1\xa7\x95\x9e\x03\x06\xdaf\x09\x00W\xfac\xe2\x0a\x8e\
-)\xbe\xf8\x8fS\xff@\x00\x00\xaeT\xfb\xedM\x0f(\
-=\x07\x94\x17\xfc\x83\x00p\xd9\xf7?\xb3N\xe2\xae\xf0\
-\x22\x10\xcb\xab\x0d\xf6\xfd\x07\x01\x00\xb8\xfa\xf9\x00\x1e\xee\
-\x0b\xca\xce\x03\x01~\x17-;\xdd\x12\x00\xf4\xf6\xf9_\
-L\xfa\x8748\x08\x00\xc05\xea\xbf\xb4\xf0\xa8\xd2s\
-\xc1do'\x01\xe0\xd2?$\xb3\xfe\xa0\xd27\xbd\xb4\
-\xeb^\x9a\x1b\x04\x00\xe0\x1a\xf5?\xd0=\xad\xf4\x5c\xd0\
-Z\xfd8\x01\xe0\xd2?$4A\xdd\x9d\xa0\x5c\xdd\x17\
-\xa4\xc5\xe4Os\x83\x00\x00\x5csR\xda \x01\xfe\xea\
-\x1e\x06\x97\x9b\xf6>\x01\xe0\xdb\x7fD\xddx\x98l\xdc\
-\xa4n\xe2K*z\x9d\xc6\xc6\xb2\xfb!E\xc1\x00\x90\
-F\x00\xc0\x0az\xa0\xa2\xf8o\xca\xce\x07\x9e\xe6\x1f\x84\
-\xfbL\xce\x04\x80\xaf\xff\x88\x12\xe3\x1dJ?\xf2\xa9\xe8\
-\xbb\x83\xa6\x06\x01\x80{\x8be\xf6\xc0`\xcf\x84\xe2\xa7\
-\x03\x1a\x09\x00_\xff\x11i5\xcf\xa9\xbb\xf9\x839\xed\
-\x19\xa6=hj\x10\x00\xb8\xb7X\xc1k\x80\xc0\x00u\
-_\x03\xb4T?F\x00\xf8\xfa\x8f\x08K\xfeT\xd9\x1b\
-\x9dX\xf8\x16\x0d\x0d\x02\x00\x01\x00+\xde\x1a\xf8Ee\
-\xe7\x85\x1c\xc7X\x07`\xff?\xa0m\xaf\xa78mV\
-x\xe3\x87\xbe\x9f\xd3\xcc \x00\x10\x00\xb0\xc2>\x18\xee\
-\x1bRz\x1d\xc0\xac\xc1\x89\x00P>\xbaK\xd9\x9b\xec\
-\xe2\xba\xc8\xea\x7f\x10\x00\x08\x00Xe/\x04lU\xf7\
-5\xc0Xo?\x01 \xb3\xf1Ieop\x5c.\x83\
-\x1eV\x11\x00r\x08\x00\xc0\xd2\x02q\x857\x05j\xa9\
-y\x8c\x00\x10\x99\xf9\x81\xb27\xb8\xa4\xeb>\x9a\x18\x04\
-\x00\x02\x00V\xd9\x0b=\x1d?Vv~\xc8\xcb\xf8\x8f\
-\xae\x03\xc0\xd2\xfe\xffn^j\xee\xfbl\xd9\xfb\xbfa\
-G\x0aM\x0c\x02\x00\x01\x00k8\x1b\xc0\xc5E\xd1\xd3\
-a\xb7^\xd0w\x00\xa8\x18\xefT6\xdd\x05o\xfb\x9c\
-\x06\x06\x01\x80\x00\x80\xb5~&\x9e\xf2\xa1\xb2\xf3\xc4\xce\
-\xe1T\xfd\x06\x80\xdc\xce\x07\x95\xbd\xb1Y\xd5\x7f\xa5y\
-A\x00 \x00`\x8d\xfd\xd0T\xf7{e\xe7\x09c\xfb\
-\xac~\x03@r\xe5\xcb\xca\xdeX\xc3\xe0\x0c\xcd\x0b\x02\
-\x00\x01\x00k\xec\x87\xb1\xe1re\xe7\x89z\xc3S\xfa\
-\x0d\x00!\x89j\x1e\x00\xe4\xe2\xb6 \xbd{\xdch^\
-\x10\x00\x08\x00\xb0BO\x04\x07\x9dW\xf3Iq\xeaI\
-]\x06\x80\xa5\x05\x80\x96\x89R\xc5\x9b\xba-\xfb}\x9a\
-\x16\x04\x00\x02\x00\xac\xd4\x13E\xf9\xaf)9W\xf8z\
-\xcf\xeb3\x00\x94\x8f\xd5)\xfbX'\xbf\xe5\xf74-\
-\x08\x00\x04\x00Xk\xc7\xd8\xe6\xfb\x95\x9d/L\x03\x05\
-\xfa\x0b\x00\xf9=\xf7*{C\xab\xc6ziZ\x10\x00\
-\x08\x00\xb0ROL\x8c\x14(;_\xf4\xb7\xfd\x5c\x7f\
-\x01 \xa5\xfa\x90\xb2\xa7\xff\x99\x1c\xe3\xacg\x10\x00\x08\
-\x00`\x1d\x80\x83\xab)\x7fN\x7f\x01 <\xfd\x94\x92\
-73*\xfdC\x9a\x15k\xfb:F\xc1\x00\x90J\x00\
-\xc0\x1a\xfb\xa20\xefu5O\x06L?\xa1\xbf\x00\xe0\
-\xe6=\xaf\xe4\xcd\xcc\xae?H\xb3\x82\x00@\x00\x80\x95\
-\xfb\xa2\xb5i\x9f\x92sFX\xf0\x9c\xae\x02\x80l7\
-e\xa8{\xfc\xaf\xf1&\x9a\x15\x04\x00\x02\x00\xac\xdc\x17\
-\xc3\x03j.\x1c\xdf\xb4iQ\xf6Nz\xea'\x00\x94\
-\x0c\xcd(y#7n\xe2\xf8_\x10\x00\x08\x00\xb0\xcd\
-d\xb5A<\xdc\xd5\xfct|\xb4\xafC?\x01 \xa7\
-\xf3!5\xf7\xff\x8f=K\xa3\x82\x00@\x00\x80\xad\x16\
-\xc8&\xab\xb9v\xac\xbb\xe5\x1e\xfd\x04\x80\xe4\xaa\xc3J\
-\xde\xc4\xa4\xb2\xa34)\x08\x00\x04\x00\xd8j\x03\xb9\x8a\
-\x17\x94\x9c;\xea\xec\xb3%\xb0}nbd\xd6I5\
-7\x00j}\x84&\x05\x01\x80\x00\x00\x1b\xf5FG\xdb\
-]J\xce\x1dyY\xef\xea'\x00\xf8\x86\xcd)y\x13\
-+F&hR\x10\x00\x08\x00`C\xa0\x15\x89\x0c;\
-\xa7\x8b\x00`9$gi\xb1\x9cj7p\xc3\xc6E\
-i\x9c\x09\xa0IA\x00 \x00\xc0\x86\xfd\xe1\xa3\xe0'\
-\xe4\xceN\x8b26\xe6\xaa~\x00P\xf5\x0c\x80\xad\x11\
-s4'\x08\x00\x04\x00\xb0\x10pUv\x0c\x97\xab\x1f\
-\x00\x0a\x8d?V\xf2\xe6\xc5\x15\x1c\xa39A\x00 \x00\
-\xc0\xc6\xfdQZ\xfc\x92\x92s\xc8`\xf7\x8c\xfa\x01 \
-\xb3\xe5q5w\x00lz\x82\xe6\x04\x01\x80\x00\x00\x1b\
-\xf7Gs\xc3\xc3J\xce!\x1d\x8d\xfb\xd4\x0f\x00\x89\x86\
-\x97\x95\xbcy\xc5}?\xa39A\x00 \x00\xc0\xc6\xfd\
-\xd1\xd7s\xbd\x92sH\xbd\xe1\xa0\xfa\x01 :\xef=\
-%o\x9ea\xb4\x95\xe6\x04\x01\x80\x00\x00\x1b\xf7\xc7\xd4\
-h\x9c\x92sHI\xfe\xbf\xd4\x0f\x00A\x09g\x94\xfc\
-\x02\xa0m\xaf'\xcd\x09\x02\xc0\x15\xf8\xfa_\xb4\x84\x00\
-\xabJ\xb3\xb1t+\xc9\xb0\xa2\x82\xa2\xa3RT\xfa7\
-\xd9^\xfbgi\xed\xfc\xa9\x18\x87j,[\xe4\xf2%\
-\x80\x02\xd2\x93?R?\x00x\x06^P\xee\xc6\xf9\x84\
-\x9cg\xe2\x02\x01\x00v\xe1m\x9e\x0c3\xb3\xdf\x95\x86\
-\xe6}24\x14\xa4\x8b\x1eIJ\xfcD\xb9\xfb\x18\x11\
-:\xa7t\x00\x10\xc3\xac\x93\x92{\x00D\xa6\x7f\xc4\xc4\
-\x05\x02\x00\xecn\xb3\xeb\xa2\xe4\xe4\xbd!\xbd\xc6N\xa5\
-{\xa4\xb0\xe0_\xca\xdd;\xd7\xcd\x8b\xeb\xfd4g\x9d\
-\xf7\x00P\xf4\x18\xe0\xe4\xca#L\x5c \x00\xc0\xa1\xa4\
-e\xbc/\xc6\xa16%{\xa4\xa6\xfa\x80\x92\xf7lj\
-4Q\xdd\x00P42\xa2\xe4M\xcbi\xfd=\x13\x17\
-\x08\x00p\xc8\xb3\xe6K\xcb_\x94\x89\x09\xa5v)\x95\
-\xd6\x96\xfb\xd5\xdc\x0b\xa0gP\xdd\x00\x90\xd7\xff35\
-Wo\xf6\xff\x98\x89\x0b\x04\x008\xeeQ\xe5!s\xd2\
-?\xd0\xcb\xa7\x80\x0e\xce\xd8y\xbb\xba\x01 \xb3\xedQ\
-%oZ\xf9\xd8\x10\x13\x17\x08\x00ph..\x8b\xd2\
-\xd8\xfa+%zdh\xa8H\xc9{\xd4\xd9\xfc+u\
-\x03@J\xdd\xb3J\xde\xb4\xaa\xdd\x99L\x5c\xb0\xde\x0a\
-g\x02\x00l\xa8\xba\xee1\xcd\xf7\x88\xc9\xe4\xbc\xf4z\
-C\xb5{\xd3\x5c\xbb_\xdd\x00\x90PyD\xb9\x1bf\
-\xf9\xaa\xc10\xeb\xc4\xc4\x05\x02\x00\xb4\x13\x02j5\xbf\
-u\xb9\x04\x06\xa8\xf7Iyu\xc5_\xd4\x0d\x001\x85\
-\xc7\x94\xbba\x9e\x01\x17\x99\xb4@\x00\x80\xe646?\
-\xa8\xe9>\x89\x8bSoS\xb9\xd2\x82\x7f\xa8\x1b\x00\x22\
-\xb2>T\xee\x86\x85$|\xc6\xa4\x05\x02\x004\xf9\x85\
-@W\xdf.\xcd\xf6If\xc6\x09\xe5\xeeIn\xd6\xbb\
-\xea\x06\x80\xa0D\xf5\x12[L\xee{LZ \x00@\
-\x93\xfc\xb6^\x94\xa1\xa1\x04\x8dn\x06\xf4\xaar\xf7#\
-%\xf1cu\x03\x80_\xe4\x97\xca\xdd\xb0\xa4\xf2\x7f2\
-i\x81\x00\x00\xed\x1ee\x9e{L\x93}RQ\xfe\xbc\
-r\xf7\x22*\xe2\x9c\xba\x01\xc0\xdd\x9c6\x95;\xe5l\
-\xfb\xf3LZ \x00@\xd3\xda{n\xd1\x5c\x9f\xd4\xd5\
->\xae\xde\x13\x19\xdf\x8b\xea\x06\x00gW\xf5\x1a'\xb3\
-\xf1\xcfLZ \x00@\xd3\xc2\xc2\xcfi\xedk&i\
-Qp7@7\xd7\x05%\x03\x80\x94\xee\xf5Ts\x1b\
-\xe0\xb6\x87\x99\xb4@\x00\x80\xe6\xb5\xb6\xffLS}\xd2\
-\xd5u\x87\x8a\x0b3\xd5\x0c\x00e;S\x95l\x9a\x82\
-\x9e{\x98\xb4@\x00\x80\xe6E\xc7\x9c\xd5\xd6v\xc0}\
-\x13J\xde\x87={\xdc\xd4\x0b\x00%;\x0cJ\xde\xac\
-\xe2\x81\x1f1i\x81\x00\x00%\xf4\x0evj(\x00t\
-(y\x0f\xc6\x8da\x0a\xbe\x02\x18oR\xf2f\x95\x8d\
-\x8d2i\x81\x00\x0056\xa2)\x7fQ3}20\
-P\xa9\xe4=\x98\x1cNU/\x00\x14Ov\xaay\x10\
-\xd0x\x13\x93\x16\xac\xda+\x89\x04\x00\xd8I`\xd0y\
-\xcd\xf4\xc9\xf0\xb0\x9a\xaf\x95\xc7\x86\xcb\xd5\x0b\x00E\x13\
-CJ\xde\xac\xca\x892&-\x10\x00\xa0\x8c\xc1\x91b\
-M\xf4\xc9\xe4d\xb0\x9a\xaf\x00\x06\x9b\xd5\x0b\x00\x05\xa3\
-SJ\xde,\xc3d>\x93\x16\x08\x00PFC\xcb\x03\
-\x9a9\x11P\xc9\x00\xd67\xa4^\x00(\x1c\xbd^\xc9\
-\x9b\xb5}G\x0a\x93\x16\x08\x00`\x1d\x80\x1dz\xc5\xd9\
-Y\xbd\xeb?\xd0=\xad^\x00\xc8\x1f\xbaE\xc9f\xa9\
-\xd8\x15\xcb\xa4\x05\x02\x00\x94\x91\x96\xf1\xbefz\xc5\xdd\
-}A\xb9\xeb\xdf\xdf\xf5C\xf5\x02@\xde\xc0\x1dJ6\
-K\xcd\x0d\xc1LZ \x00@\x19\xe1\x91\xe7\x08\x00v\
-\xd4\xd7u\x8bz\x01 \xd7\xf8c%\x9b\xa5m\xaf'\
-\x93\x16\x08\x00P\x86\x7f\xe0\x05\x02\x80=\x9f\x00\xf4\xdc\
-\xac^\x00\xc8\xe9\xbfK\xcdE\x80\xda\xda?\x1b\x04\x00\
-\xe0\xaa<<\x174\xd3+[\xb6\xa8\x17\x00\x8c\xdd3\
-\x0a>\x01\xe8\xff\x89r7\xcai\xf3\x22\x13\x16\xac\xde\
-+\xc9\xf9\xc7\x98\x88@\x00\xd0i\x00\xe8\xef\xbeQ\xc1\
-E\x80\xc37)w\xa3\xb6\xf8\xce3a\xc1\xea\xbd\x92\
-^z\x94\x89\x08\xbc\x02\xd0\xeb\x13\x80\x9e\xeb\x15\xdc\x09\
-p\xc2\xa8\xdc\x8d\xf2\x0d\x9bc\xc2\x82\xd5{%\xdb\xf0\
-\x22\x13\x11X\x04\xa8\xdb'\x00\x0a~\x06X:\x13\xae\
-\xdc\x8d\x8a\xc8\xfc\x90\x09\x0b\xd6?8\xab\xf9Q&\x22\
-\xd8M\xaa\x86>\x03T\xf3\x09\xc0.\xe5\x02\xc0W+\
-6\xfd\xe6\x95\xbaQI\x95\x7fc\xc2\x82\xd5\xfb\xa4z\
-\xe0\x87LD\xb0\x9b\x92\x0a\xedl\x04\xb4i\x93z\xd7\
-\xbf\xafg\xa7\x9a\x01 4\xe3#\xa5nTN\xe7\x83\
-LX\xb0z\x9f\xb4L\xa62\x11\xc1n\xeaZ\xf6i\
-\xa2Oz\xa7=\x94\xbc\xfe\xc6\x9e)5\x03@J\xf3\
-\x93j\x1d\x05\xccA@\xb0Q\xaf\x04\x86\xcf1\x19\xc1\
->\xbf@5r\x18\xd0\xf0p\x94\x92\xd7\x7f\xb8\xbfW\
-\xcd\x00P06\xa2\xccM\xf2\x09;\xcfD\x05\x9b\xf5\
-JF\xd9+LFXwA!\xda9\x0e\xd88\x9c\
-\xadf\x000V\xab\x19\x00dq\x83x\x85\x9cW\xe2\
-&%W?\xcfD\x05\xdb\xad\x03\xe8\xdb\xcb\x84\x84u\
-W\x5cqH3=24T\xa3\xe4=\x98\x1cNU\
-2\x00,\xfd\x17&\xd5?\xa3\xc4M*\x9flf\xa2\
-\x82\xcd\xfa\xc40\xeb$\xde\xfe\x17\x99\x94\xb0\xae\xba\x06\
-;5\xd3#\xfd\x03\xbdJ\xde\x83\xa1\xa1 u\x03@\
-\xd1T\x99l\xd4\xf8\xca\xcd\x90\xe4\xd3LR\xb0\xfd\x01\
-Z\xb5\xcf0)a\xddD\xc7\x9e\xd5T\x7ft\xf7O\
-)y\x1ff\xd7o{y\xfb\xdc\xb8\xe8\xe274}\
-\x83\x0a\x87ng\x82\x82\xcd\xfb\xa4c*N6\xbb-\
-09a]4w\xfeTS\xfd\xd1\xde\xa9\xde\x01s\
-n\xae\xeb\xba\x0d\xb3\x9d6:\xb9\xae^\xb3O\x01\x82\
-\x12>cr\xc2\xba\xf5J\x16\xbb\x02b}v\xff3\
-\x17\xdc\x06M\xf5Fc\xf3\x83\xea\xed.\xbb\xbe\xdb\xcb\
-\xdb\xef\xe6\xc5o?\xac\xb9\x9b\xb3a\xe3\xa2\x94\x8cN\
-01a\xfd~\xe5\x8c\x87\x89\x97\x1fk\x01`\xe3c\
-\xcd{o\xd6\x5col\xaf\xf9\xb3r\xf7!$\xf8\xbc\
->\x02@\xb9)H<\x02\xb45\xb0%T\xbc\xc2\xa4\
-\x84\xf5\xef\x95\xce\xfb\x98\xa4`3Y\xf9oi\xb2/\
-J\xcb\xd5{:\x16\x19qN\x17\x01\xe0\xab#\x82\x87\
-o\xd4\xcc\xab\x00\xbf\xc8/\xa5q&\x80\x09\x09v\xe9\
-\x95\x84\xdc\xe3LV\xb0\xfe\xb8\xe6\x7fA\x06\xc6c\xb5\
-\xb9H\xb6\xe0\xdf\xca\xdd\x8f\xc4\x84Ou\x13\x004\xb3\
-;\xa0\xb3\xeb\xa2\x94\xedhc\x22\x82\xfd\xb6\x076\x85\
-\x8b_\xf0y&-X\x8de\x1f\xfd\x8e\xbe)\xcd\xf6\
-Dj\xdaI\xe5\xeeIv\xd6q}\x05\x00\xcb\xe6@\
-1e\xaf9\xec\x0d\xb1<\xa1\xc8\x1f\x98e\x12\x82\xdd\
-{\xa5n\xb4I\xdc\xbd\xe6\x99\xbc`\x15\xb5\xda\xd8\xf3\
-\xff\x8a\xfd\x10\xb3\xed\xacz\x071\x15\xbf\xa2\xab\x00\xf0\
-\xd5\xa6'c\xae\x12\x9e{\xc2!\x17\xfdew\xedc\
-\xf2\x81\xc3\x0cz5\x83\x13|\x1a\x885\xab\xac\xfb\x93\
-\xe6{\xc1W\xc1\xc5\xb1\xdb\xab\x9e\xd2]\x00\xf8j=\
-\xc0>g\xd9V\xf6\xaa\xe3<\x1es^\x94\xdc\xbe_\
-2\xe9\xc0\xe1\x06\xbe\xda\x91Q\x9e\x04@\xd7\x93\xbf\xe5\
-$@\xcb\x0f4\xd5\xeeMS\xe3ou\x19\x00\xbey\
-\x1d\x90X\xf7\x17\xbb\xdf\xd8-\xbe\xf3R0:\xc3d\
-\x03\x87~\x1d\xe0\x1f\xca\x9a\x00,\xdff\xd7Ei\xe8\
-P\xe2G\x8d\xf4\x0eW+y\x8f:\xda\x7f\xae\xdb\x00\
-\xf0\x7fO\x03\x86n\x91-~\xf6\xf9\x85\x13\x92\xfa\x89\
-\x94\x99\xb2\x99d\xe0\xf0\x83`\xdbd\xb0$\xe6\xbd\xcd\
-\xe4\x86k\x0a\x0e\x9b\x93\x0e\xed\xec\xf3\x7f\xed]2{\
-~\xa8\xe6Q\xcc=;u\x1f\x00\x96\xfe\xb0\xc2\x9d\x09\
-K\x8b\x03\xd7\xebi\x80\xab\xd7\x82d\xb6?l9\x84\
-\x85\xc9\x05\xda\xda'\xa0\xeb^\xf1\xf4\xe3\x95\x00\xbe\xcf\
-\xc9yQ\x8a*\x9f\x97\x01\x93\xbfR5\xdf\xd0\xf2\xa0\
-\x92\xf7kh\xa8\x86\x00\xf0\x9do=G'$4\xf3\
-C\xdb}\xe2\xe7\xb6 \x09\xdb\x0fK\xd9\xf5qL&\
-\xd0\xee+\x81\xf10\xc92\x1cb\x81 \xbeY\xc0\x9c\
-\x9a\xf5\x1f\xe9\x1ajR3\xf4\x1a\x9eV\xf2\xbe\x8d\x8c\
-\x84\x13\x00.\xf7\x87\x16\x8c\x0dJt\xc9\xeb\xe2\xe2n\
-\x9d\x01\xce'\xec\xbc\xa44\x1ed\xe2\x87Z\xfb\x05\x8c\
-\xc7J~\xedS\xe2\x13p\x81\x89P\x87\x5c\xcd\x010\
-\xab\xe0u\xe9\x1aQz\xdf\x12\xc9Up\x13 \x17\x97\
-\xc5u\xbf\x8e\x9a\xbb\xf1e\xb7\xf9JV\xdf\xdd\x12[\
-qT|\xc2\xe7V\xb4\xaa?8\xf9\xb4$\xd7?#\
-\x05\xa3SL\x16Pz\x80\x5c\x5c\xdc \xd5\x833\x92\
-Q\xfe\x92\x04F\x9ecrT\x98\xb7\xef\xbcd\xe4\x1d\
-\x93\xda\xb6_\xa9\xf6\xa8\xff\xca{\x00\xc4\x9eQ\xee>\
-\x86\x85\xcd\x11\x00V\xfa\x0f\xa8\x98\x0e\x93\x82\xb1\x11\xc9\
-\xea\xb9O\xd2\xda\x1f\x95\x94\x96'\x96&\xf9\x94\xe6?\
-KF\xc7\xc3\x92\xdd\xff\x13)\xdaQ'\xc5{\xdc\x98\
-\x18\xa0\xdb@\xd08\x91 \xdb\xfbo\x92\x92\x16sO\
-T=/\xe9\xa5\xff\x90\x94\x82\xb7$1\xe7\xb8\xd5%\
-YI\xb2\x1d\xa4\xacE\xf6\xb5\xa5\xaeAZ\xce\xbb\x92\
-S|T\x0a+^\x94\xca\x86?JC\xd7\x9d\xd25\
-\x5c\xad\xcbzv\xdb\xa2\xde\xab\xae\x94\x94\x0f\x09\x00\x00\
-\x00\x5ci\xd2\x1a\x1c\xcbQ\xf2INq\xf1+\x04\x00\
-\x00\x00\xae4i\xb5\xf7\xdc\xaad\x00\xa8\xa9\xf9\x13\x01\
-\x00\x00\x80+n\x87]\xbf_\xc9\x00\xd0\xd6v\x17\x01\
-\x00\x00\x80+MZ\xf9EG\xd5\xdc\x04\xa8o\x90\x00\
-\x00\x00\xc0\x95&\xad\xd8\x84\xd3J\x06\x80\xf1\xf1X\x02\
-\x00\x00\x00\x97\x9b\xb0\x0c\xb3N\xe2\xea\xaa\xde\x17\x00[\
-\xb6,\xd8\xe9sa\x8a\x0a\x00\xa0\x81\x00\xd03\xd2\xac\
-\xe4\xaf\xff\x88\xc8s\x04\x00\x00\x00\xae4a\xd5\xb5\xec\
-S2\x00\xe4\xe4\xbcC\x00\x00\x00\xe0J\x13Va\xe9\
-\x11%\x03@\xd5\xf6\x83\x04\x00\x00\x00\xae4aE+\
-\xb8\x05\xb0E{\xc7\xcf\x09\x00\x00\x00\x5cn\xb22\x99\
-\x9ce\xb3\xab\x9a\xe79\xac\xf31\xc0\x04\x00\x00\x80\x86\
-\x16\x00\x0e\xf4*9\xf9\xbb\xb8,Z\xc2\x0d\x01\x00\x00\
-\x80\xcbMV\xdb\xeb\x7f\xafd\x00\x88\x8c\xfa\xc2n\xd7\
-\x94\xc2\x02\x008|\x00H\xcf>\xaed\x00\xc8\xcd{\
-\x8b\x00\x00\x00\xc0\xe5'\xaa\x0d\xe2\xe5=\xafd\x00\xa8\
-\xaey\x92\x00\x00\x00\xc0\xe5&\xaanc\xab\x92\x93\xff\
-W_\x00\xdcI\x00\x00\x00\xe0r\x13Uu\xe3#\xca\
-\x06\x80\x91\x91\x02\x02\x00\x00\x00\x97\x7f\xff\xff\xae\x92\x93\
-\xbf\x8f\xef\xbc\x9d_\xadP\x5c\x00\x00\x07~\xffo\x9e\
-(\x95\x0c\x00\xe9\x99'\x08\x00\x00\x00\x5c\xf6\xfd\xff\xa0\
-Q\xd9\xc7\xff\xdb\xed\xb7\x00\x90\x00\x00\x00p\xec\x00P\
-Q{@\xd9\x00\xd0\xd5{3\x01\x00\x00\x80\xcbMR\
-1qj\xee\xff\xbfa\xe3\xa2\x18\xc7\xc3\x08\x00\x00\x00\
-\x5c:A\x0dND\xcb\xa6Mj\xfe\xfa\x0f\x0b?\xe7\
-\x00\xeb+(2\x00\x80\x03\x06\x80\xfa\xb6{\x95}\xfc\
-\x9fW\xf0\x1a\x01\x00\x00\x80\xcbMP\x99yo*\x1b\
-\x00\xea\x9b~K\x00\x00\x00\xe0\xd2\xc9il\xccU<\
-\xbd\xe6\x95\x0d\x00\xbd\xfd=\x04\x00\x00\x00.\x9d\x9c\x9a\
-{\xf6*;\xf9{x.\x88a\xd6\x89\x00\x00\x00\xc0\
-\xa5\x93Sn\xf1Qe\x03@F\xf6q\x87\xb8\xc6\x14\
-\x1a\x00\xc0\xe1\x1e\xff{\xf9\xa8\xfb\xf8\xbf\xae\xf1\x11\x02\
-\x00\x00\x00\x97NL-\xbd\xb7*;\xf9/\xbd\xff\x1f\
-j\x22\x00\x00\x00p\xe9\xc4\x94]\xf8/e'\x7f\xcb\
-\xb9\x06\x8b\x8b\x1b\x08\x00\x00\x00\x5c\xfa\xf8\xdfC\xe1\xd5\
-\xffY\xb9\xc7\x1c\xe6ZSp\x00\x00\x87\x99\x94\x1a{\
-\xeeP\xfa\xf1\x7f}\xf3C\x04\x00\x00\x00.\x9d\x94R\
-\xb3\x8f+\x1d\x00\xfa\x06*\x09\x00\x00\x00|{B\xea\
-\x9f\x8a\x13'gu'\x7f\xff\xc0\x0b\x0eu\xbd):\
-\x00\x80CLHU\x8d\x7fP\xfa\xd7\x7fQ\xe9\xcb\x04\
-\x00\x00\x00.\x9d\x90\xc2\xa2\xbeP:\x00\xb4\xf7\xdcJ\
-\x00\x00\x00\xe0\xdb\x93Q\xc7`\xa7\xd2\x93\xbf\xab\xeb\x82\
-LNz\x12\x00\x00\x00\xf8\xf6d\x94W\xfa\x92\xd2\x01\
- =\xeb=\x87\xbb\xe6\x14\x1e\x00\xc0\xae\x13\xd1\x80\xc9\
-\x7f\xe9\x80\x1c\x95\x03@C\xcb\x03\x04\x00\x00\x00\xbe\xb3\
-\xf8\xaf\xe9\x11\xa5'\xff\x0d\x1b\x17ex2\x95\x00\x00\
-\x00\xc0\xb7'\xa2\x90\x88sJ\x07\x80mqg\x1c\xf2\
-\xbaS|\x00\x00\xbbMBM\xfd?Tz\xf2\xb70\
-\xd4<I\x00\x00\x00\xe0\xdb\x93Pr\xd6\x09\xe5\x03@\
-\xefP\x1b\x01\x00\x00\x80\xaf'\xa0\xae\x91\xe2\xa5\xf7\xe3\
-*O\xfe\xa1\x11\xe7\x1c\xf6\xfaS\x84\x00\x00\xbbL@\
-\x05\x95/*\xff\xeb\xbf\xb2\xe6\x00\x01\x00\x00\x80\xaf'\
-\x9f\xee\xf1X\xd9\xec\xb6\xa0\xfe\xe3\xff\xe1j\x02\x00\x00\
-\x00_O>%\xd5O)?\xf9G\xc7\x9eu\xe8{\
-@!\x02\x00\xd6u\xe2\xe9\x9d\x09\x10\x0f\xafy\xe5\x03\
-@U\xfdc\x04\x00\x00\x00\xbe\x9ex\xca\xeb\x1fW~\
-\xf2\xb7,n\xec\x1b\xcb!\x00\x00\x00\xb0\xf4\xeb\x7f\x8f\
-\x9b\xf8\xfa_P>\x00\xc4&~\xea\xf0\xf7\x82\x82\x04\
-\x00\xac\xdb\xa4S\xd5\xf2\x90\xf2\x93\xbfEu\xd3#\x04\
-\x00\x00\x00\x96~\xfdO{\xc8\xd6@\xf5\x7f\xfd;9\
-/J\xefD\x02\x01\x00\x00\x00\xcb\x84S\xd1\xb4_\x17\
-\xbf\xfe\xd3\xb3\xdf\xd5\xc4\xfd\xa0(\x01\x00\xeb\xb2\xf2\xdf\
-\xd3g^\x17\x01\xa0\xa5\xf7V\x02\x00\x00\x00K\xdf\xfd\
-\xd7\x1e\xd4\xc5\xe4\xef\x1fxA\x0c\xb3N\x04\x00\x00\x00\
-\x93\x7f\xd7D\xb4l\xf1X\xd0E\x00(\xaf>\xa8\x99\
-\xfbBq\x02\x00l:\xd1\xe4\xeb`\xcf\xff\xaf\xbf\xfd\
-\xef\x9d( \x00\x00\x00\x98\xfc\xdbG\x8b\xc4\xd9eQ\
-\x17\x01 )\xfd\xa4\xa6\xee\x0d\x05\x0a\x00\xb0\xd9$\x93\
-\x92s\x5c\x17\x93\xbfEc\xe7O\x09\x00\x00\x00&\xff\
-\xe6\xc1]\xba\x99\xfc\xbd}\xe7-\xbb\x1c\x12\x00\x00\x00\
-\xfa\x9e\xfc\x0d\xb3N\x12\x1e\xf3\xb9n\x02@\xc9\xf6\xa7\
-5w\x8f(T\x00\x80\xf57\xfdi~D7\x93\xbf\
-e\xe7\xbf\xfe\x89\x0c\x02\x00\x00\x80\xcf\xfe\xf4p\xdc\xef\
-\xd7\xb2\x0a^\xd7\xe4}\xa2X\x01\x00V\x9dX\xb2\xcb\
-\x8f\xe8f\xf2\xb7h3\xf6\x13\x00\x00\x00z_\xf87\
-\xba\xf4=\xbc^&\xff\xd8\xa4O4{\xaf(X\x00\
-\x80U&\x94\xb11W\x09\x8d\xfeBW\xbf\xfe\x1b:\
-\x7fB\x00\x00\x00\xe8;\x00\x14\xd7\x1e\xd0\xd5\xe4\x1f\x18\
-r^+\xfb\xfe\x13\x00\x00\x00\xb6\x99LZ\x87\xebt\
-\xb3\xe3\xdf\xd7\xaa\x1a\xff\xa0\xe9{F\xe1\x02\x00\xd68\
-\x91l\x90\xe8\xa4Ou5\xf9[\x0e72N\x06\x13\
-\x00\x00\x00\xfa\x0d\x00\xe5-\x0f\xebj\xf2\xb7(6\xfc\
-E\x81\xe0F\xf1\x02\x00V\xfb\xe8\x7f\xac\x5c6\xbb-\
-\xe8j\xf2w5\xff{{'\x12\x08\x00\xc0\x95\x8a\xcb\
-0\xed!e\xbb\xa3\xbf\xeb6_\xae\x0d\xa0H\x8f\x9b\
-L\xce\x12\x19\x7fFw\xbf\xfe\x8b\x0c/(\xf2\xea\x86\
-\x22\xd6\xe4\x8d3O\xa4\xdfL\xaa\x85\xa6b\xc9\x9b\xaa\
-\x94\xc2\x9d\x06\xc9\x9b\x18Z\x923:%\xd9\xc3{\x97\
-d\x18\x7f\x22\x99\xfdw/I\xef\xfe\x8d\xa4v<,\
-i\x9d\xbf\x95\x94\x96'\x96$5\x1d\x94\xb8\x9aCK\
-b\x0dGd[\xc5\xd1%QE\xefHD\xfe\xf1%\
-!\x19\xa7\x96\x04\xa5|*\xfe\xb1\x9f/\xf1\x89\x98\x13\
-\xaf\x90\xf3K\x5c\xbd\xe7e\xb3\xe7\xc2\x92k\xa6g\xaf\
-\x05\xd9\x1as\xce\xfc\x7f\xff\x98\xa4\xb5>.\x05\xe6\xbf\
-W\x167p_\x01\x8d\x8dCEu\x07t7\xf9o\
-v]\x94\xee\xd1D\x02\x00\x96\x7f\xa1\xf3\xa7\x13%c\
-\xf8\x16I\xee\xf8\x83\xc4\xd5\xbd Q\xe5\xafJX\xc1\
-q\x09\xcb;!A\x96\x89\xd5, \xe9\x8cl\x8d\xfb\
-|\x89W\xd8y\xf1\x0c=/\x1e\xc1\x17\xbe\x99X\x9d\
-\x15~\xcc\xe6\xee7/q\x95\xafH\xc1\xd8\x08\xf5\x02\
-h`Lk\x18\x1c\x94M\x9b\x16u\x17\x00\x0a*\x0e\
-+\xb4x\x93B\xb6\xcd\xe3\xefY'\xf3\x84\xbfWb\
-\xaa^\x12\xef\xc89\xdd5\xc9Z\x04\xc4\x9d\x95\xdc\xfe\
-\x9f\xf1T\x00p\xd0\xf1mp\xb7\xaf\x04E|\xa9\xbb\
-\xb1\xc9\xf2\x99c\xa7\xf6\x0e\xfd!\x00\xac\xd7\x05-\xdc\
-\x99 \xf1MO\x89{\xe0\x05&s+\x04\x81\x82\xd1\
-)\xea\x0ap\xb0q.Kg{\xfd\x7f-\xaf\xece\
-\xc5>\xdf\xa4\x98\xadr!\xf3n\x8a\x96mu\xcf+\
-\xfd\x98\xde^,\xaf\x06X<\x088\xc6XW\xd5u\
-\x97.\xc7!\xcb\x91\xbf\x9dc9\x04\x00|\xf7\x22\xa6\
-\x19\x7f)n[\xe7\x99\xacm\xc87\xf2K)\x99l\
-\xa6\xde\x00;\x8eu\xcdc\xd5\xe2\xbae\x81_\xff\x04\
-\x00\x9a!\x7f:LB\x0b\x8e3A\xaf\xd7\xea[\xcf\
-\x05\xc9\x1f\xdaK\xed\x01vz\xef\x1f\x12uN\x97c\
-\x8f\x9b9\xf4(\xb2\xf2\x9f\x00`\x8d\x0b\x97mj\x16\
-\xafp\x16\xf7\xad\xb7M\xce\x8b\x92\xdb\xff\x13j\x10X\
-\xe71/\xbd\xf8U\xdd\x8e;%5\x07\x95\xbc\xa7\x14\
-\xf6*.Z\xe6\x8e!\xd9\xec\xcd\xbb~{\x86\x80\xbc\
-\x81Yj\x11X\xa71\xaf\xb2\xfd\x01\xdd\x8e7\xde\xbe\
-\xf3\xd2;\x13@\x00\x80y\xf2\x9f\x98\x10gw&\x7f\
-\xbb\x7f\x8e\xe3\xb6 \xc5\x13\xbd\xd4$`\xeb\xef\xfd\x87\
-{\xc5\xc5U\xbfc\x8d\xa1\xe5\xb7\xca\xde[\x0a|%\
-\x9f\xbe\xec4\x98\x7f\xf9\xb3\xd8\xcfQx\x04^\x90\x8a\
-\xa9(j\x13\xb0\xd1\x98\xd7\xba#E|\x02\xf4\xfbI\
-s`\xe8\x9c\x8c\x8d\xb9\x12\x00\xf4\xde\x08\xb93\xe1\xbc\
-\xf3w@Q\x85oS\x9f\x80\x0d\xc6\xbc\xb6\xbd\x9e\x12\
-\x91pF\xd7\xe3Km\xd7]J\xdfc\x0a}\x99\x17\
-*\xbc\xe4-&\x5c\x07\x95\xdd\xff3j\x14\xb0\xf6\xe7\
-\xcdE\xff\xd6\xf5\xb8\x12\x19{\xc6|!6\x10\x00\xf4\
-\xde\x08)\xc6{\x98h\x1d\x98\xe50\x22\xc3\x0f|\xa8\
-U\xc0Jc^Q\xc3\x9ft?\xae4\xf5O+\x7f\
-\x9f)\xf6k}\xee7\x13 n\xfe\x17\x99h\x1d\x5c\
-Z\xebc\xd4+`\x8d\x9d\xfezge\xc3F}\x8f\
-'\xe9\xf9o\xe9\xe2^S\xf0\xd7\xb8@\xdb\x1a\xfe\xc2\
-\x04\xab\x85\x05\x81\x01\x17\xc50\xedA\xcd\x02k\x18\xef\
-\xea\x06\x07e\xb3\xce\xb73\xb7l\xfa\xd31\x95I\x00\
-\xd0{3d\xdc\x10%N\xec\xed\xaf\x19Y=\xbf\xa2\
-n\x81\xd5n\xf3;n\x10\x0f\x1f\xber*k\xd4\xcd\
-\xd3D\x0a\xffj\x17'\xae\xed\x7f\x98X5$4\xe3\
-#\xea\x16X\xcd\xe7~S\x89\xe2\x1f\xcaWN\xc1\xe1\
-_J\xef\x1e7\x02\x80\xde\x1bB\x167\x88{0G\
-\xfaj\x89\xe5\xbde\xe1\x8e\x14\xea\x17X\xc9\xe7~\x93\
-\xc1\x12\xba\xeds\xc6\x10\xb3\x06\xe3\x8c\xae\xee=\x0dp\
-\xa5O`\xc6\xa7h\x08M\xbe\x06\xb8\x8f\xfa\x05\x969\
-\xce\x99\x7f\xed\xca\xb6\xb4\x8f\x18;\xccR\xf3\x8e\xe9\xee\
-\xfe\xd3\x04W\xb80\xd15/\xd2\x14\x1a\x14]\xfc\x06\
-\xf5\x0b,c\x8c3\x99\x9c%)\xff\x1d\xc6\x0d\xcbI\
-\xa3n\x0b\xd2>\x9cM\x00\xc0W\x17\xc6'\xf6\x0b\x1a\
-C\x83|#\xbf\xa4~\x81k\x8co\x86Y'I\xd5\
-\xf9F?\xdfV\xda\xf0\xb8.\xeb\x80f\xb8\xdc\xb7\xff\
-7\x04\xeb\xfe;X\xad\xda\xb8\xc9\xdc\xcc{=\xa9c\
-\xe0\x8a\x83\xfe\x06I/\xfd'\xe3\xc5\x7fE\xc4\x9d\xb5\
-<\x0d!\x00\xe0\xbf\xef\xffGo\xa414\xac\xf0\xba\
-\x1a\xea\x18\xb8\xc2\xe4\x9fV\xfa\x0f\xc6\x89\xffrr^\
-\x94\x96\xe1\x0e\x1d\xd7\x03M\xf1\xbd\x8b\x92\xd8\xfb \xcd\
-\xa1ay#\xd3\xd41p\x99\xb1-\xcb\xc0\xda\xa6o\
-+\xaa=\xa8\xf3@HS|\x7f\xf7\xbf\xe6\xa7h\x0e\
--\x1f\x0ed\xfc\x09u\x0c\x5c:\xf9W\x1ef|\xf8\
-\x96\x90\xa8sz\xfa\xe6\x9f\x00\xb0\xdc\x8b\x12\xb9\xfd\x08\
-\x0d\xc2\xe9\x80\x802\x8f\xfd3*\xfe\xc6\xd8\xf0-\x9b\
-6-J\xa3q\x84\xda\xa0A\xbe\x7fQ\x22*\x8f\xd2\
-$Z\xde\x0b\x80'\x00\xc0W\xab\xfd\xc7\x5c%\xa9\xe0\
-M\xc6\x85K\xe4W\xbd@}\x10\x00.\x7fQ\xc2\xcb\
-_\xa3I4,w\xf8F\xea\x18\xba\x1f\xc7\xda\xc7|\
-$.\xeb}\xc6\x84K\x04\x85\xcfY\xae\x0d5B\x00\
-\xe0\x09\x80\x92_\x01\x98\x9a\xa9c\xe8{{\xdf\x1b\x82\
-%2\xf9\x13\xc6\x83\xcbl\x17^o\xdcI\x8d\x10\x00\
-X\x03\xa0j\x83\x97\xdd\xe6K\x1dC\xb7\xe3W\xf3\xee\
-h\x09\x8b;\xc3xp\x19\x05\xd5\xcfP#\x04\x80\xab\
-_\x94\xa8\x1aV\xcbj\x95w\xd8yj\x18\xba\x1d\xbb\
-jG*% \x9cS\xfd.\xbf\xe1\xcf\x19\x19\x1bs\
-\xa5N\x08\x00\xd78\x07\xa0\xee\x05\x1aF\xa3\x22\x0b\xdf\
-\xa6\x86\xa1\xcbq\xabjp\xa7\xb8{\xcf3\x0e\x5c\x86\
-\xeb\x96\x05i\x1d+\xa7N\x08\x00\xd7\xbe(1\x8d\xcf\
-\xd04\x1a\x95\xde\xf9\x105\x0c\xdd\x8dYe]\xbf\x10\
-g\x17\xfa\xffJ\xaa:8%\x94\x00\xb0\xdc\x8d\x80Z\
-\x0e\xd04Z]\x00\xb8\xa3\x88\x1a\x86\xae\xc6\xab\xbc\x86\
-'\xe9\xfd\xab\x1d\xf3[\xf0\x16uB\x00X\xfeE\x89\
-m\xfb\x13\x8d\xa3A\x81\xc9\xa7\xa9_\xe8f\x9c\xea\xdd\
-\xe3&\xc9\xc5|\xb2|5[\x83\xcfK\xfbx\x18\xf5\
-B\x00XA\x00\xe8\xd8O\xf3hPZ\xc7\xc3\xd4/\
-\xf4\xb1\xd2\x7f*S\x22\x92N\xd3\xf7\xd7\xd8\xed\xaf\xde\
-8E\xbd\x10\x00VvQ\xe2\xbb\x1e\xa1\x81\xb4\xb6\xc8\
-\xc7kA\x0c&\x7f\xea\x17\xea/\xf6\x1b\xde%\x9e~\
-,\xf6\xbb\xe6A?u\x07\xa8\x17\x02\xc0\xca/JB\
-\xcf\xafi \x8dI\xa8\x7f\x9a\xda\x85\xf2cSa\xeb\
-\xefd\x933\xfd~\xcd\xf1 \xeb}\xcb\x19\x08\xd4\x0c\
-\x01`\x15\x01\xa0\xff~\x9aHC\xdc|\xe7%\x7f\x9a\
-\xf7|P{[_\xde\xf7/\x8f\x7f\xc8yi\x9d\x8a\
-\xa2n\x08\x00\xab\xbb(\x89\x83w\xd3HZ\xfa\xf4\xaf\
-\xeb\xd7\xd4-\x94\x1d\x8fj&j$(\xfa\x0bz}\
-\x19\x5c\x5c\x17\xa5q\xb8\x87\xba!\x00\xac%\x00\xfc\x8c\
-f\xd2\xca\xc1\x1ei\x1f\x9b\xff\x1f\x1e\xf5A\xcd\xb1\xa8\
-\xb4\xe7nq\xf3X\xa0\xd7\x97\xa9\xbc\xfd\x01\xea\x86\x00\
-\xb0\xb6\x8b\x92<|\x07\xcd\xa4\x85\x85\x7f\xde\xf3R8\
-]@\xcdB\xb91\xa8n<L\x12\x0a\x8e\xd1\xe7+\
-9\x06\xbc\xfc\x08\xb5C\x00X\xfbEI\x19\xddKC\
-9\xb8\x8d\x9b\x16%g\xf4f\xea\x15\xca\x8d?\x86\x91\
-Q\xf1\x0b=O\x9f\xafd\x9f\xff\xf8\xcf\xa4w\xda\x83\
-\xfa!\x00X!\x00L^OS9\xfa\xee^\xdd\x0f\
-R\xabPj\xdc1\x99\x9c%\xb7\xf1\xc9\xa5pK\x8f\
-/\x9f\x87\xcf\xbc\xb4N\xe5PC\x04\x00\xeb\x5c\x94\xd4\
-\x1d\x134\x96\x03Ki\xff\x03u\x0a\xa5\xc6\x9c\xea\xf1\
-f\x09M\xf8\x8c\xfe^!\xcb\xf9\x07\xb5\xc6\x9d\xd4\x10\
-\x01\xc0\x8a\x01`\xcaHs9\xe8c\xff\xd4n\x0e\xfb\
-\x81B\x8f\xfb\xc7\x5c\xcd\xbf\xfa\x9f\x10\xe7\xcd\xf4\xf7j\
-Ttr\xc8\x0f\x01\xc0\xca\x17%m\xaa\x95\xe6r0\
-[\xb6\xceK\xd6\xf0M\xd4'\xd4\xd9\xd1o\xb4C\x82\
-c\xcf\xd2\xdf\xabTPw\x90:\x22\x00\xd8\xe0\x09\x80\
-\xa9\x9a\x06s !\xd9\x1fH\xe1\xae\x14j\x13j\xfc\
-\xea\x9f\xf6\x90\xec\xfa\x83\xec\xe8\xb7\x96\xd7\x80\x05o\xb0\
-\xd3\x1f\x01\xc0V\x01\xa0\x88&s\x00\xee\x01\x17%\xbd\
-\xef\x17\xd4$\x94\x19[\xca\x07n\x11\xff\x889\xfa{\
-\x0d\xa2\x92>e\xc5?\x01\xc0v\x17%\xe3\xfa\x0c\x1a\
-\xcd\x01\x94\xdd\xe6K=B\x8d_\xfd\x13\xd9\x12_\xf0\
-\x0e}\xbd\xd6m~C\xcfK\xc7T\x1c5E\x00\xb0\
-\xddE\xc9\x9a\x89\xa5\xd9\x1c@\xe9\x0d\xc1\xd4#\xb4\xbf\
-\xc8\xafe\xbflvg7\xbf5\xaf\x03\xf2Z\x90\xfa\
-\xb1:\xea\x8a\x00`\xdb\x8b\x92}{\x00\x0d\xe7 \xaf\
-\x00\xd2z\xefg\xab_hs\x1b_\xcb\xe3\xfe\xc8s\
-\xf4\xb2\x95>\xf7\xab\x19\xbc\x9e\xba\x22\x00\xac\xc3F@\
-\xd3\x1e4\x9d\x03\xd9\x1a\x7fV\xb2F\xa7\xa9Mh\xe3\
-W\xffx\x93\xc4\xe6\x1d\xa7w\xadd\xc3\xc6E\xa9\xec\
-\xbe\x8b\xda\x22\x00\xac\xdf\x85\xa1\xf1\x1cp\xbb\xcf\xa2c\
-\x927UF}\xc2a\xdf\xf3'\x96\xbc\xb64a\xd1\
-\xaf\xd6\x9b\xfc\xcb;\xee\xa7\xbe\x08\x00\xeb{a6\xf2\
-\x89\x8e\xc3n\x06\x14]qT\x0av\xb1\xf5'\x1cc\
-\xach\x9c\x09\x90\xec\xa6'\xc4\xc5\x8d\xf7\xfc\xd6V\xd8\
-\xf4\x185F\x00X\xff\x0b\xe3\xb4\x85fvd\x96o\
-\xa8-A\xa0\xc8\x94A\xbd\xc2n\x13\xbfe\x81\x9f\x87\
-\xdf<=i\x03y\xb5OQg\x04\x00\xfb\x5c\x18\x17\
-o\x02\x80\x168\xb9-Jl\xcd!\xc9\xdb\x1dM\xdd\
-b}\xbe\xe57\x05I\x0e\x13\xbfM\xa5\x97\xbdB\xad\
-\x11\x00\xecwa\x5c\xb7\xd2\xdcZ\xe2\xe2\xbe\xb0\x14\x04\
-\x0awgR\xbf\xb0\xc9\x98P7\x1d&Y\x0d\x07\xc4\
-\xcd\x8b\x1f\x07\xb6\x94T\xf0\xa6\x18f\x9d\xa89\x02\x80\
-\xfd.\xcc\x96\xe0\x0b4\xa3F_\x0dD\x95\xfdK\xf2\
-v\xf0\xbd0\xac\xb4g\xff\xeeLI\xab\xfd+\x13\xff\
-:\x88\xcb>a\xd9;\x81\xba#\x00\xd8\xf7\xc2x\x84\
-\x9f\xa7!5\xbez84\xfb\xa4\xe4\x8cOQ\xcfX\
-\xd5\x18P9\xd6#\x89eG\xc5\x89\x93\xfa\xd6El\
-\xe6Ii\xdb\xebI\xed\x11\x00\xec\x7fa<\xa3\xd9\xc0\
-C\x15\x81\xa9\x9fJ\xba\xf1\x97\x96CX\xa8m\x5cc\
-@\xdc E\xfd\xb3\x12\x9e\xfa1\xbd\xb3\x8e\xe2s\x8f\
-K\xef\x1e7j\x90\x00\xe0\x18\x17\xc6;\xees\x1aS\
-\xc1#\x85\xe3\xeb\x9f\x95\xdc\x9d\xf9\xd48\xbe\xd3\xef\xdb\
-'\x12$\xbb\xe5\x8f\xe2\x1b\xc6A=\xeb-!\xef]\
-\x1e\xfb\x13\x00\x1c\xeb\xc2\xf8&}Fs*\xbc\x97@\
-X\xde\x09\xc9\x1a\xde\xcb6\xc3:\xff\xb5_2|\xb3\
-\xc4\x16\xbe\xc3\xd1\xbc\xf6\x9a\xfc\xf3\xdff\xf2'\x008\
-\xde\x85\xf1K\xfb\x94\x06\xd5\x01\x8f\xe0\x0b\x92\xd0\xf0\x8c\
-\xe4\x99\xaa\xa9{\xbd\xfc\xda7eHf\xf3\xff\x88o\
-(\xeb|\xec)1\xff\x98\x98L\xce\xd4$\x01\xc0\xf1\
-.\xcc\xd6\xccS4\xa9\xde\xce\x1c\x88\xfb\x5c\x92\xdb\xf7\
-K\xfet\x22=\xa0X?\xd7\x98\xc2%\xb7s\x9fD\
-f\x9d\x5cz\x02D\xbd\xdb{\xf2\x7f\x87_\xfe\x04\x00\
-\xc7\xbd0\xfe9\x1f\xd0\xa8:\xfe\x940,\xff=I\
-\xef\xbbGrMA\xf4\x83V\xf7\xe6\xff\x81\x8f\xe4\xf7\
-\xde%\xd1\xb9\xef\xb1\x92\xdf\x81$\x17\xff\x8b\xef\xfc\x09\
-\x00\x8e}a\x02\xf3O\xd0\xacX\x9a8Bs\xdf\x97\
-\xb4\xee\x07\xa4pW,\xbd\xe1\xe0}[1\x1df\x9e\
-\xf4\x7f)\xdb\x0a\xde\x96\xcd\xee|\xb7\xefh\xb2\xaa\x9f\
-\xb3\xac\xbd\xa0V\x09\x00\x8e}a\x82\x8a\xde\xa5a\xf1\
-\xbd\xc5\x83\xc1\x19\xa7$\xa5\xe3\x11)4\x15\xd3'\x8e\
-\xf2K\xdfT Ym\x8fJx\xc6G,\xe6s\xe0\
-}9\x0a[\xfe@\xbd\x12\x00\xb4qa\x82K\xdf\xa4\
-qqU\xde\xe1s\xb2\xad\xea\x88d\x0d\xcdJ\xf9L\
-\x00}\xb3N\xbd\xd9\xbc\xdbW\x0a\x07o\x95\xa4\xeaC\
-\x12\x18\xcb\xe7\xbaZx\xa5V\xdau/\xb5K\x00\xd0\
-\xce\x85\x09\xa9x\x8d\xe6\xc5\x8a\x06\xb9\xa0\xd4O$\xa9\
-\xe5I\xc9\x19\xdd\xc9\xa6C\xd6\xfc\x85?\xe6*E\xa3\
-S\x92\xdex@BS>\xe1W\xbe\x96\xce\xe8p[\
-\x90J\xe3\xad\xd41\x01@[\x17&\xac\xea\x15\x1a\x18\
-kZ;\x10\x98rZ\xe2k_\x90\xcc\x81;\xa5\x8c\
-\xd3\x0a\x97\xdd{\xd5\xd7\xc7I\x81qVR\xea\x9e\x95\
-\xd0\xd4\x8f\x97&\x11jJ\x83\x1boy\xcfK\xd5\xe0\
-\x085M\x00\xd0`\x00\xa8\xf9;M\x0c\xab\xf2\x89\xfa\
-R\xa2\x8a\xdf\x90\xe4\xb6\xc7$w\xf4fB\x81\xf9\xb2\
-\x94\xce\x84K\xe1\xe8.\xc9l{T\xb6\x99\xaf\x8d\x0f\
-;\xf1\xa9Q\xebA\x17\xa4f\x8c\x03\xb9\x08\x00\x1a\xbd\
-0\xe1u\x87hd\xd8\x9cg\xf0\x05\x09\xcb}_\x12\
-\xea\x9f\x96L\xe3/%o\xc2h9o^\xbd\x89~\
-\xaf\xa7\x94\xech\x93\x9c\xde{$\xb9\xf6\xaf\x12\x91u\
-R\xbc\x828qSE\xa1\x09\x9fI\xfdD\x06\xf3\x08\
-\x01@\xbb\x17&\xb2\xe9Y\x9a\x19v<\xb7\xe0\xe2\xd2\
-\x9a\x82\x98\x8a\xa3\x92\xdc\xf2'\xc9\xec\xbf[\xf2Fw\
-J\xe1\x8e\x22G\x5c_ \xb9\xfb\x9c\xa5lw\xa6\x14\
-M\x0cIN\xdf\xdd\x92\xd6\xf4\xa4\xc4\x96\xbd*!\xe6\
-\x7f\x83G\xc0E\xee\xa9^6\xf8)|K\xda\xc7|\
-\x98C\x08\x00\xda\xbe0Q-\x07ih8\xf4\xc1F\
-[c?\x97\xb0\xec\x93\x12S\xf6\x9a\xc4W\x1f\x96\xe4\
-\xe6\x03\x92\xda\xfe\xa8d\xf5\xde+9Cw\x98\x03\xc3\
-\x94\x14LvJ\xe1T\xe5\x12\xcb\x04]\xb6;zI\
-\xf1W'\xaf-\xfd2\xff\xfa?\xb3\xa8\xd8\x15\xfb\xcd\
-\xff~\xe1\x84Q\xf2\x87o\x94\x9c\x81;%\xab\xe7W\
-\x92\xd1\xfe\x88\xa4\xb6<!\x89\xd5\x87$\xa6\xf8\x0d\x09\
-\xcb\xfcP\xb6\xc6\x9c\x13w\xbf\xf9\xa5\xcf\xbc\xb8/\xfa\
-\xfe\xcc/\xb7\xe1I\xbe\xf1'\x00\xa8qa\xa2\xdb\x9f\
-\xa0\xb1\x01`\x19+\xfd\xcb\xfa~\xce\xbcA\x00P(\
-\x00t<Fs\x03\xc0Ux\xf9_\x94\xaa\xb1!\xe6\
-\x0c\x02\x80Z\x17&\xa6\xfbw48\x00\x5cAH\xfc\
-\x19\xa9\xdf\x99\xca|A\x00P\xef\xc2l\xeby\x88&\
-\x07\x80\xcb\x1d\xe8S\xf2\xaa\xb4\xed\xf5d\xae \x00\xa8\
-yab\xfb\x1f\xa0\xd1\x01\xe0[\x9c7/JA\xc7\
-C\xcc\x11\x04\x00\xc5\x9f\x00\x18\xef\xa5\xe1\x01\xe0\xbf\xb6\
-\x86\xcdI\xd5X\x0f\xf3\x03\x01@\xfd\x0b\x137r'\
-M\x0f\x00f\xdbrNH\x8d)\x9c\xb9\x81\x00\xa0\x8f\
-\x0b\x930\xb9\x93\xc6\x07\xa0k\x96#\xb0s\x1a\x9f`\
-N \x00\xe8\xeb\xc2$]W\xc7\x00\x00@\xbf\x9f\xf8\
-\x05\x5c\x10\xc3\xc8(\xf3\x01\x01@\x87\xfb\x00\xcc\xba\xca\
-F\x8e\x1d\x05\xa0\xc7G\xfe\xb9\xefI\xed\xaeX\xe6\x02\
-\x02\x80~/\x8eg\xcc9\x06\x03\x00\xba\xb1\xd9}A\
-\x0a:\xf61\xfe\x13\x00\xb88\xc1\x95\xaf2(\x00\xd0\
-\x85\xb0\xe4Oe\xfbd1c?\x01\x00\xaa}\x0a\xe8\
-\xe4\xb6\xb8t\xf0K\xf4\x98\xab\xc4\xb4=\xc1\xeb\x0d\x00\
-\xdf,\xf4\xcb\xa8}ZL&g\xc6}\x02\x00\xbeY\
-\x08\xb8'N68\xa9\xd1\xe4\x819'\xbf\xf3oK\
-\x9d\x18\x14\xafh^q\x00z\xe6\x1fyN*\xf9\xb6\
-\x9f\x00\x80\xcb_ \xff\xdc\x93J4z\xc2\xe0/\xbf\
-\xf7o\xb3<\x11\x88\xac=\xc4Q\xae\x80\xceXz>\
-\xb5\xea0\xdb\xf9\x12\x00p\xd5-\x81\x07\xef\xd2|\xb3\
-\xbbx.H\xd6\x0f|\xae\xf8oL\x1e\x9f\x12\x8f\x88\
-9\x06F@'\xbf\xfa\xcb\x87\xa7\x18\xdf\xc1E\xb8\xd6\
-\x05\xca\xdd\xe7,\xee\xe1\xe75\xdd\xf0Q\x0d\x7f\xbd\xe6\
-\xbf3\xfd6_\x89\xa8\xfe\x1bO\x03\x00E9m^\
-\x94\xcc\x86\x83b\x98\xf6`l\x07\x01`\xd9{\x02\xf4\
-<\xac\xe9\xc5\x7f);\x13\x96\xfdo\xb5\xac\x0d\xf0\x89\
-?\xcb\x80\x09(\xb6\xc2\xdf0Y\xcfx\x0e\x02\xc0j\
-\x9e\x02xht\xc1\x5cT\xf3S+\xfe\xf7\xca\xe2\x06\
-\x89\xef\xdd'.\xde\x0b\x0c\x9e\x80\xc6\xbf\xeb\xcfi\xd9\
-/\x86Y'\xc6r\x10\x00V}6\xc0\xc4\x0f5\xd7\
-\xfc\xee\xa1\xe7\xaf\xf6\xee\xff\x9a\xff\xe6\x8c\xeb3$\xb8\
-\xe8m\x06R@\x83br\xdf\x93\xaa\xdd\x99\x8c\xdf \
-\x00X\xe3b\x85T\xfdSS\xab|\x13'o\xb6\xca\
-\xbf;et\xafxh|\x1d\x04\xa0\x17\xbeasR\
-l\xbc\x831\x1b\x04\x00\xab>\x05\xb8\xc5_<\xa2\xbf\
-\xd4\xc4 \x10\xd9\xf8\xacU\xff\xedY?\xf0\x91\xe8\xc6\
-\xa7e\xd3f\x06X\xc0\x11\xb9z,Hv\xcbc\xd2\
-\xbb\xc7\x8d\xf1\x1a\x04\x00\x9bl\x0e4].\x9b\xfd\xe6\
-\x1dz \x08\xc8\xf9\xc0\xb2\xe3\x9fM\xfe\xfd\x99;\xf3\
-%\xdcp\x94\xaf\x05\x00\x07z\xda\x17[\xf8\xa6T\xed\
-Le\x8c\x06\x01\xc0\xe6O\x02\xa6v\xc9&7\xc7\x1c\
-\x0c|\x12\xcfJ\xf6\xed\x016\xbf\x06\xa9;F\xc5/\
-\xe54\x030`G\xa1\xc9\x9fJ\xe9X?\xe32\x08\
-\x00\xeby\xe1\x12w\x5c/N[\x1ck\x95\xbco\xf2\
-\x19\xc9\xb8!j}\xaf\xc3\xc0]\xac\x0f\x00\xd6\x99w\
-\xd0\x05)\xe8\xfd\x05c1\x08\x00v\x0b\x01\xd7\x8d\x8a\
-\xab\xffE\xc7\xd8\xdd+\xe7\x03I6\x05\xd9\xe5:\xa4\
-L{Hl\xc7c|6\x08\xd8\xd8\x16\xdfy\xc9j\
-\xdd\xcf\x16\xbe \x008\xc2\x05L\x9e\xce\x16\xef\xa43\
-v\x1d\x14\x22\xea\x9fs\x84\xef|%k&V\x22k\
-\x0e\xb3P\x10\xb0\xc1\x02\xbf\x8c\xc6\x03\xd28\x13\xc0\xb8\
-\x0b\x02\x80\xa3m\x14\x14\xd9\xbe\xfeG\xecn\x09\xbe \
-\x09\xe3\xb78\xdc\xf5\xc8\x9cN\x5c:d\x88 \x00\xac\
-\x8d\xb3\xeb\xa2$W\x1f\x92\xea\xdd\xd1\x8c\xb5 \x008\
-\xf4\x17\x02\xbb\xea\xc5?\xef}\xdbo\xef\xbbeA\x22\
-\x9b\x9f\xb2|\x96\xe8\xd0\xd7#c:[\x22\xb6\x1fY\
-\xf7`\x04h\xdd&s\xcf$V\x1e\x91rS\x06c\
-+\x08\x00Z\xba\xa8\xf1\x93\xd3\x12Pp\xc2\xea\x9f\xca\
-Y\xde\xb1\x87\xd7\x1d\x92\xb4\x1b5\xf5\xb9\xcfW\x9f\x0e\
-V\xbdB\x10\x00\x961\xf1'\x94\x1d\x95\xb2\x892\xc6\
-R\x10\x00\xb4\xbeg@d\xeb\x01\xf1\xdc\xb6\xfas\x04\
-,\x8f\xd1\x03\xf2\xde\x97\xd8\xfe\xfb-'\xf6i\xfaz\
-\xa4\x9a\x8a$\xac\xf2(A\x00\xb8\xcc\x9e\xfd\x96G\xfd\
-l\xdd\x0b\x02\x80\x8aa`&S\xb6\x0d\xde#a\xb5\
-\x87ek\xeeI\xf1\x88\x9a[\xfaE\xff\xf5{r'\
-\xf3\x00`\xd9`\xc8;\xe1\xac\x04\x95\xbc#\x11-\x07\
-%~\xf2\xe6\xf5\xf8\xa6\x7f\xdd\xafE\xba\xf9ZD\xd5\
-\xbf .\x9e|5\x00V\xf5\xa77\x1e\x90\x8a\xa9(\
-\xc6I\x10\x00\xa0\xa3\xc5\x93\xa6 \x89\xefzX<#\
-\xe6\x98\x0c\xa0+\x9e\x81\x17$\xb3u\xbf\x18L\xfe\x8c\
-\x05 \x00@\xdf_Q$\x0e\xdc#>\xf1g\x99\x1c\
-\xa0\xb4\xc0\xb8\xb3\x92\xdbs\x9f\x18l\xb3U7@\x00\
-\x80\x86\xd7\x09\x8c\xdf(Ay\xefs\xd6\x00\x94Z\xd8\
-\xb7\xad\xe8M)\x1e\x9d\xa0\xc7A\x00\x00\xae\xb9N`\
-W\x8elk{B\xb6\x04^d\x12\x81&\xb9\xfb\xcd\
-KR\xf5!)\x9d\xca\xa1\xa7A\x00\x00V\xf3z \
-et\xaf\x04\x17\x1e\xe7\xa9\x004! \xf6s\xc9\xea\
-\xda'\xc5\x1c\xcb\x0b\x02\x00`\xa5\xa7\x02;\x0d\x12U\
-{H\x5c}\xe7\x99h\xe0X\xbf\xf6\xb7^\x5c\xfa\xb5\
-_2\xd9L\xaf\x82\x00\x00\xd8\xf2\xf0\xa1\xc4\x81_J\
-`\xf6\x07\xb2q\x13\x93\x0f\xec\xc3i\xf3\xa2D\x17\xbe\
--\x05C\xb7[\x9eT\xd1\x9b \x00\x00\xebY\xc0y\
-7EKB\xef>\x09\xc8<\xc5\xa4\x84\xf59y3\
-\xf6sIo\xdb/e\xd7\xc7\xd1\x83 \x00\x00\x0e\xb1\
-\xe5\xf0t\xb9\xc4\xb4\x1e\x10\xaf\xa8/\x99\xa8`U~\
-Q\xe7$\xa5\xe1))\xddQM\xaf\x81\x00\x008\xf4\
-z\x81)\xa3D\xd6\xbe(\x1e\xa1\xe7\x99\xc0\xb0*[\
-\xb7}!)M\x07\xa4\xe4\xbazz\x0a\x04\x00@\x9b\
-a\xa0R\xe2:\xf7\x8b_\xf2\x19&6\x5c\x95o\xe4\
-\x97\x92T\xf74\x93>\x08\x00\x80r\xaf\x09v\xe6\x9b\
-\xc3\xc0\xa3\x12\x90\xf5\x11\x87\x12ai!_h\xe6\x87\
-\x92\xd6\xb6_JL\xc5\xf4\x08\x08\x00\x80.\xf6\x18\x98\
-\x09\x97\xc4\xfe{%\xac\xec\xdfl8\xa4#>\x11s\
-\x12W\xf57\xc9\x19\xfc\x91\x18~\xe0C/\x80\x00\x00\
-\xe8\xbd\x192\xae\xab\x93\xf8\xceG%8\xff?\x9cT\
-\xa8\x10\x17\xf7\x05\x89\xc8=!\xe9\x1d\x0f\xf3+\x1f \
-\x00\x00\xd7\xde\x810ubDb[\x9f\x5c\xfa\xc4\xd0\
-\xc9\x8d\x89T+\xdc|\xe7%\x22\xef=Im\xdf/\
-\x85\x13F\xbe\xd1\x07\x08\x00\xc0\xda\x02A\xe6umK\
-{\x0eDT\x1e\xe5SC\x07\xb2e\xaby\xc2\xcf?\
-\xbe4\xe1\x17L\x0c\x99\xff\xa3\x0d\xd4,@\x00\x00l\
-\xd7<Y;\x13$exVb\x1a\x9e\x15\xff\xf4\x8f\
-\xc5\xd9\x9d\xd7\x06\xb6\xe6\x11xA\xc2\xf3NHR\xe3\
-A\xc9\x1a\xb8S\x0awgR\x8b\x00\x01\x00p\x80\xaf\
-\x0cv\x17K\xca\xd0\x9d\x12\xd7\xfa\xa4\x84\x16\xbd-\xde\
-\xd1\xe7\xd8\xaex\x15,\xd7\xcc;|N\x22\x8b\xde\x91\
-\xe4\xe6?K\xf6\xf0^v\xde\x03\x08\x00\x80\xb6\x9a\xcc\
-rvA\xe6T\xaf$\xf5\xdf'1u/HH\xc1\
-q\xf1\x8d\xfb\x9c'\x06f\xae^\x0b\x12\x90\xf8\x99D\
-\x95\xbc.I-O\x9a\x7f\xd5\xff\x5c\xf2\xa6Z\xc50\
-\xedA\xed\x00\x04\x00@\xed\xd7\x08\x19\xe3\x13\x92\xdcw\
-\xaf\xc4\xb5\x1c\x90\xf0\xd2\xd7\xc5?\xf5S\xf1\x0c;\xaf\
-\xc4\xc2CW\xefy\xf1\xdb\xf6\x85\x84f\x9f\x94\x18\xc3\
-+\x92\xd8t@\xd2\xba\xf7I\xce\xe8\xb4\xe4O'R\
-\x03\x00\x01\x00\xc0\xe5\x1a4{&@\xb2M\xd5\x921\
-\xb1KR\x8dwIB\xc7\xef%\xb6\xe1/\x12Y\xf1\
-\xaa\x84\xe4\x9d\x90\xc0\xccS\xe2\x17\x7fV\xbc\xc2\xe7d\
-\x8b\xffE\x9b>U\xd8\xb0\xf1\xab\x09\xdd\xf2\xdf\xe5o\
-\xfe\xd5\x1e\x92\xfd\xa1D\x96\xbc%\xdb\xaa^\x96\xf8\xc6\
-\xa7$\xb9\xe3\x0f\x92\xd6w\x9fd\x0d\xdf$y\xd7\xd5\
-\xf0\x8d=@\x00\x00\xb0\xde\x8d]pC\x94\xe4\xee\xcc\
-\x97\xec\x1du\x92\xb9c\xe8{\xb2\xc6wI\xc6\xf0\xde\
-\xef\xc8\x1c\x9f\x92\x1c\xf3\xff,g\xa2G\xf2\xa6*\x97\
-\x14\xee\x8a\x95\xbc\xdd\xd1R\xba\xd7\x93\xeb\x0a\x10\x00\x00\
-\x00\x00\x01\x00\x00\x00\x10\x00\x00\x00\x00\x01\x00\x00\x00\x10\
-\x00\x00\x00\x00\x01\x00\x00\x00\x10\x00\x00\x00\x00\x01\x00\x00\
-\x00\x10\x00\x00\x00\x00\x01\x00\x00\x00\x10\x00\x00\x00\x00\x01\
-\x00\x00\x00\x10\x00\x00\x00\x00\x01\x00\x00\x00\x02\x00\x00\x00\
- \x00\x00\x00\x00\x02\x00\x00\x00 \x00\x00\x00\x00\x02\x00\
-\x00\x00 \x00\x00\x00\x00\x02\x00\x00\x00 \x00\x00\x00\x00\
-\x02\x00\x00\x00 \x00\x00\x00\x00\x02\x00\x00\x00 \x00\x00\
-\x00\x00\xeb\xf9\xff\xcb\x90j&\xea\xfa\x98\x1a\x00\x00\x00\
-\x00IEND\xaeB`\x82\
-\x00\x00!\x7f\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4x\xd4\xfa\
-\x00\x00\x00\x09pHYs\x00\x00\x0e&\x00\x00\x0e&\
-\x01\xa2\xef%\xfc\x00\x00\x04\xeeiTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 7.1-c000 79\
-.9ccc4de, 2022/0\
-3/14-11:26:19   \
-     \x22> <rdf:RDF\
- xmlns:rdf=\x22http\
-://www.w3.org/19\
-99/02/22-rdf-syn\
-tax-ns#\x22> <rdf:D\
-escription rdf:a\
-bout=\x22\x22 xmlns:xm\
-p=\x22http://ns.ado\
-be.com/xap/1.0/\x22\
- xmlns:dc=\x22http:\
-//purl.org/dc/el\
-ements/1.1/\x22 xml\
-ns:photoshop=\x22ht\
-tp://ns.adobe.co\
-m/photoshop/1.0/\
-\x22 xmlns:xmpMM=\x22h\
-ttp://ns.adobe.c\
-om/xap/1.0/mm/\x22 \
-xmlns:stEvt=\x22htt\
-p://ns.adobe.com\
-/xap/1.0/sType/R\
-esourceEvent#\x22 x\
-mp:CreatorTool=\x22\
-Adobe Photoshop \
-23.3 (Windows)\x22 \
-xmp:CreateDate=\x22\
-2024-04-22T15:00\
-:24+02:00\x22 xmp:M\
-odifyDate=\x222024-\
-04-22T15:33:52+0\
-2:00\x22 xmp:Metada\
-taDate=\x222024-04-\
-22T15:33:52+02:0\
-0\x22 dc:format=\x22im\
-age/png\x22 photosh\
-op:ColorMode=\x223\x22\
- xmpMM:InstanceI\
-D=\x22xmp.iid:37c95\
-c89-d9cf-6a47-81\
-67-1ae146729faa\x22\
- xmpMM:DocumentI\
-D=\x22xmp.did:37c95\
-c89-d9cf-6a47-81\
-67-1ae146729faa\x22\
- xmpMM:OriginalD\
-ocumentID=\x22xmp.d\
-id:37c95c89-d9cf\
--6a47-8167-1ae14\
-6729faa\x22> <xmpMM\
-:History> <rdf:S\
-eq> <rdf:li stEv\
-t:action=\x22create\
-d\x22 stEvt:instanc\
-eID=\x22xmp.iid:37c\
-95c89-d9cf-6a47-\
-8167-1ae146729fa\
-a\x22 stEvt:when=\x222\
-024-04-22T15:00:\
-24+02:00\x22 stEvt:\
-softwareAgent=\x22A\
-dobe Photoshop 2\
-3.3 (Windows)\x22/>\
- </rdf:Seq> </xm\
-pMM:History> </r\
-df:Description> \
-</rdf:RDF> </x:x\
-mpmeta> <?xpacke\
-t end=\x22r\x22?>Ii\x13D\x00\
-\x00\x1c7IDATx\xda\xed\xdd\x7f\xa8\x97\xe5\xfd\
-\xf8\xf1\xfb\x1c\x8fggj\xe6\xac\x96I\x89}\x12?\
-K\xa4\xef\xac\xcfJ$b\xcd\xda\x22Dd\xccm\x8d\
-\x90o-DZ\x0d\xd9\x8f\x90\xfc \x1b\xd2\x86d\xc4\
-\xbeC\xd6\x17\x99c\x1b\xf21b\xc4\x1c\x12\xb2\xe2k\
-\xc8\x90\x8a\x1c\x12\x12\x92Q1#\xe3\x10\x12\x079\xc8\
-A\xfa^\xc7\xae\xd34=z\xce\xfb}\xff\xb8\xee\xfb\
-~<\xe1\xf1\xcf\xd6\x0f\xbd\xef\xebz]\xef|\x9f\xf7\
-\xfd\xce>\xf9\xe4\x93\x0c\x00h\x17\x17\x01\x00\xbc\x00\x00\
-\x00\xbc\x00\x00\x00\xbc\x00\x00\x00\xbc\x00\x00\x00\xbc\x00\x00\
-\x00\xbc\x00\x00\x00\xbc\x00\x00\x00\xbc\x00\x00\x00\xbc\x00\x00\
-\x00\xbc\x00\x00\x00\x8a}\x01 \xa9\xb5\xcd\x8a$IR\
-\x8bz:\x92$I-ia0\x12-t9$I\
-jG{\x82O\xa2=.\x87$I\xcd\xef\x9e\xb3\x0e\
-\xff1\xf7\xb8,\x92$5\xb7\xbe\xe0\xcd\x0b\xbc\x00x\
-3\xfe\x7f\x92$\xa9\x81\xfd\xf8\x02\x87\xff\x98\x1f\xbb<\
-\x92$5\xaf\xd9\xc1\x89\x8b\xbc\x008\x11\xff\x1aI\x92\
-\xd4\xa0\xb6]\xe4\xf0\x1f\xb3\xcde\x92$\xa99-\x0e\
-NO\xe0\x05\xc0\xe9\xf8\xd7J\x92\xa4\x06\xf4\xd2\x04\x0e\
-\xff1/\xb9\x5c\x92$\xd5\xbf\x95\x938\xfc\xc7\xact\
-\xd9$I\xaao\xfd\xc1\xdb\x1d\xbc\x00x;\xfe\xbd\x92\
-$\xa9\x86=\xd6\xc1\xe1?\xe61\x97O\x92\xa4\xfa\xf5\
-\xe5`\xa8\x8b\x17\x00C\xf1\x9f!I\x92j\xd4\xef\xbb\
-8\xfc\xc7\xfc\xdee\x94$\xa9>\xdd\x9cM\xecc\x7f\
-\x13\xf9X\xe0\xcd.\xa7$I\xf5h\x7f\x0e\x87\xff\x98\
-\xfd.\xa7$I\xe9\xf7\xdd\x1c\x0f\xff1\xdfuY%\
-IJ\xb7\x81\xe0\xbd\x02^\x00\xbc\x17\xff\xd9\x92$)\
-\xc1\xfe\xbb\x80\xc3\x7f\xcc\x7f\xbb\xbc\x92$\xa5\xd7\xdc\xe0\
-d\x81/\x00N\xc6\x7f\x87$IJ\xa8\x9d\x05\x1e\xfe\
-cv\xba\xcc\x92$\xa5\xd3\xd2\x12\x0e\xff1K]n\
-I\x92\xd2\xe8\x95\x12_\x00\xbc\xe2rK\x92T}k\
-J<\xfc\xc7\xacq\xd9%I\xaa\xaei\xc1\xfb\x15\xbc\
-\x00x?\xfe\xbb%IR\x05=Q\xc1\xe1?\xe6\x09\
-\x97_\x92\xa4\xf2\x9b\x1f\x0cW\xf8\x02`8\xfe\x1a$\
-IR\x89=W\xe1\xe1?\xe69\xb7A\x92\xa4\xf2\xba\
-#\x81\xc3\x7f\xcc\x1dn\x87$I\xc5\xd7\x1b\xfc3\xa1\
-\x17\x00\xff\x8c\xbf&I\x92T`\x0f%t\xf8\x8fy\
-\xc8m\x91$\xa9\xb8f\x06\x1f&\xf8\x02\xe0\xc3\xf8k\
-\x93$I\x05\xf4d\x82\x87\xff\x98'\xdd\x1eI\x92\xf2\
-oAp*\xe1\x17\x00\xa7\xe2\xafQ\x92$\xe5\xd8\xdf\
-\x12>\xfc\xc7\xfc\xcdm\x92$)\xbf\xee\xaa\xc1\xe1?\
-\xe6.\xb7K\x92\xa4\xee\xeb\x0b\x0e\xd7\xe8\x05\xc0\xe1\xf8\
-k\x96$I]\xf4H\x8d\x0e\xff1\x8f\xb8m\x92$\
-u\xde\xec\xe0\xa3\x1a\xbe\x00\xf8(\xfe\xda%IR\x07\
-\xfd\xb6\x86\x87\xff\x98\xdf\xba}\x92$M\xbeE\xc1H\
-\x8d_\x00\x8c\xc4\xdf\x83$I\x9aD{k|\xf8\x8f\
-\xd9\xeb6J\x924\xf1V4\xe0\xf0\x1f\xb3\xc2\xed\x94\
-$\xe9\xd2\x8d~\x84\xee\xad\x06\xbd\x00x+\xf3\xb1@\
-I\x92.\xd9O\x1at\xf8\x8f\xf9\x89\xdb*I\xd2\xf8\
-]\x19|\xdc\xc0\x17\x00\x1f\xc7\xdf\x9b$I\xba@\xdb\
-\x1bx\xf8\x8f\xd9\xee\xf6J\x92t~_\x0dN7\xf8\
-\x05\xc0\xe9\xf8{\x94$Ig\xf5r\x83\x0f\xff1/\
-\xbb\xcd\x92$\xfd\xbbo\xb7\xe0\xf0\x1f\xf3m\xb7[\x92\
-\xa4,\x1b\x08\xdei\xd1\x0b\x80w\xe2\xefY\x92\xa4V\
-\xf7x\x8b\x0e\xff1\x8f\xbb\xed\x92\xa4677\x18j\
-\xe1\x0b\x80\xa1\xf8{\x97$\xa9\x95\xfd\xb1\x85\x87\xff\x98\
-?\xba\xfd\x92\xa46vk\x8b\x0f\xff1\xb7Z\x06\x92\
-\xa4\xb6u\xc0\x0b\x803\xd7@\x92\xa4\xd6\xf4\x03\x87\xff\
-g~`9H\x92\xda\xd0\xb4\xe0_\x0e\xfe\xcf\xfc+\
-^\x13I\x92\x1a\xdd/\x1d\xfa\xe7\xf9\xa5e!Ij\
-r\xf3\x82a\x07\xfey\x86\xe3\xb5\x91$\xa9\x91=\xeb\
-\xb0\x1f\xd7\xb3\x96\x87$\xa9\x89\xdd\xee\x90\xbf\xa4\xdb-\
-\x13IR\x93\xea\x0d^w\xc0_\xd2\xeb\xf1ZI\x92\
-\xd4\x88\x1et\xb8O\xd8\x83\x96\x8b$\xa9\x09\xcd\x08>\
-p\xb0O\xd8\x07\xf1\x9aI\x92T\xeb\xb68\xd4'm\
-\x8be#I\xaas\xff\x11\x9cr\xa0O\xda\xa9x\xed\
-$I\xaae\xcf;\xcc;\xf6\xbc\xe5#I\xaac\xdf\
-p\x88w\xed\x1b\x96\x91$\xa9N\x8d~\x94\xed\x0d\x07\
-x\xd7\xde\xc8|,P\x92T\xa3\xd69\xbcs\xb3\xce\
-r\x92$\xd5\xa1Y\xc1\xa0\x83;7\x83\xf1\x9aJ\x92\
-\x94tO;\xb4s\xf7\xb4e%IJ\xb9\xaf\x04#\
-\x0e\xec\xdc\x8d\xc4k+IR\x92\xbd\xe0\xb0.\xcc\x0b\
-\x96\x97$)\xc5\xeeqH\x17\xee\x1e\xcbL\x92\x94R\
-}\xc1\x11\x07t\xe1\x8e\xc4k-IR\x12\xadw8\
-\x97f\xbd\xe5&IJ\xa1+\x83\x13\x0e\xe6\xd2\x9c\x88\
-\xd7\x5c\x92\xa4J\xfb\x9dC\xb9t\xbf\xb3\xec$IU\
-\xb688\xed@.\xdd\xe9x\xed%I\xaa\xa4\x97\x1c\
-\xc6\x95y\xc9\xf2\x93$U\xd1*\x87p\xe5VY\x86\
-\x92\xa42\xeb\x0f\xdev\x00W\xee\xedx/$I*\
-\xa5\xc7\x1c\xbe\xc9x\xccr\x94$\x95\xd1\x9c`\xc8\xc1\
-\x9b\x8c\xa1xO$I*\xb4?8t\x93\xf3\x07\xcb\
-R\x92Td7;l\x93u\xb3\xe5)I*\xaa\x7f\
-8h\x93\xf5\x0f\xcbS\x92TD\xdfw\xc8&\xef\xfb\
-\x96\xa9$)\xcf\x06\x82\xf7\x1c\xb0\xc9{/\xde+I\
-\x92ri\x93\xc3\xb566Y\xae\x92\xa4<\xba68\
-\xe9`\xad\x8d\x93\xf1\x9eI\x92\xd4U;\x1d\xaa\xb5\xb3\
-\xd3\xb2\x95$u\xd3R\x87im-\xb5|%I\x9d\
-\xf6\x9a\x83\xb4\xb6^\xb3|%I\x9d\xb4\xc6!Z{\
-k,cI\xd2d\x9a\x11|\xe0\x00\xad\xbd\x0f\xe2\xbd\
-\x94$iB=\xe1\xf0l\x8c',gI\xd2D\x9a\
-\x1f\x9crp6\xc6\xa9xO%I\xbah\x7fqh\
-6\xce_,kI\xd2\xc5\xfa\xba\xc3\xb2\xb1\xbeny\
-K\x92.Top\xc8A\xd9X\x87\xe2=\x96$\xe9\
-\x9c\xd6:$\x1bo\xade.I:\xbb\x99\xc1\xa0\x03\
-\xb2\xf1\x06\xe3\xbd\x96$\xe9LO9\x1c[\xe3)\xcb\
-]\x924\xda\xc2`\xc4\xc1\xd8\x1a#\xf1\x9eK\x92Z\
-\xde\xdf\x1c\x8a\xad\xf37\xcb^\x92\xda\xdd7\x1d\x86\xad\
-\xf5M\xcb_\x92\xdaY_p\xd8A\xd8Z\x87\xe3\x1a\
-\x90$\xb5\xacG\x1c\x82\xad\xf7\x88m I\xedjv\
-p\xc2\x01\xd8z'\xe2Z\x90$\xb5\xa4m\x0e?\xa2\
-m\xb6\x83$\xb5\xa3E\xc1i\x07\x1f\xd1\xe9\xb8&$\
-I\x0d\xef\xef\x0e=>\xe7\xef\xb6\x85$5\xbb\x95\x0e\
-;\xc6\xb1\xd2\xf6\x90\xa4f\xd6\x1f\xbc\xe5\xa0c\x1co\
-\xc55\x22IjX?s\xc8q\x09?\xb3M$\xa9\
-Y}9\xf8\xd8\x01\xc7%|\x1c\xd7\x8a$\xa9!m\
-w\xb81A\xdbm\x17IjF_\xcd|\xec\x8f\xc9\
-},\xf0\xab\xb6\x8d$\xd5\xbf\x97\x1djL\xd2\xcb\xb6\
-\x8d$\xd5\xbb\xef8\xcc\xe8\xd0wl\x1fI\xaag\x03\
-\xc1;\x0e2:\xf4N\x5cC\x92\xa4\x9a\xf5\xb8C\x8c\
-.=n\x1bIR\xbd\x9a\x1b\x9ct\x80\xd1\xa5\x93q\
--I\x92j\xd2\x9f\x1d^\xe4\xe4\xcf\xb6\x93$\xd5\xa3\
-[\x1dZ\xe4\xecV\xdbJ\x92\xd2\xef\x80\x03\x8b\x9c\x1d\
-\xb0\xad$)\xed\xeewXQ\x90\xfbm/IJ\xb3\
-i\xc1\xfb\x0e*\x0a\xf2~\x5cc\x92\xa4\xc4\xda\xec\x90\
-\xa2`\x9bm3IJ\xaby\xc1\xb0\x03\x8a\x82\x0d\xc7\
-\xb5&IJ\xa4g\x1dN\x94\xe4Y\xdbM\x92\xd2\xe8\
-v\x87\x12%\xbb\xdd\xb6\x93\xa4j\xeb\x0d^w Q\
-\xb2\xd7\xe3\xda\x93$U\xd4\x83\x0e#*\xf2\xa0\xed'\
-I\xd543\xf8\xd0ADE>\x8ckP\x92Tr\
-O:\x84\xa8\xd8\x93\xb6\xa1$\x95\xdb\x82\xe0\x94\x03\x88\
-\x8a\x9d\x8akQ\x92TR\x7fu\xf8\x90\x88\xbf\xda\x8e\
-\x92TNw9tH\xcc]\xb6\xa5$\x15\xdb\xe8G\
-\xaf\xdep\xe0\x90\x9872\x1f\x0b\x94\xa4B{\xd8a\
-C\xa2\x1e\xb6=%\xa9\x98f\x05\x1f9hH\xd4G\
-q\x8dJ\x92r\xee7\x0e\x19\x12\xf7\x1b\xdbT\x92\xf2\
-\xed+\xc1\x88\x03\x86\xc4\x8d\xc4\xb5*I\xca\xa9\x17\x1c\
-.\xd4\xc4\x0b\xb6\xab$u\xdf\xb4\xcc\xf3\xfe\xa9\xe7\xf7\
-\x04L\xb3}%ib\x8d~\x8c\xea\xa6\xe0\xa1`{\
-p(8\xed0\xa1\xa6N\xc75\xbc=\xae\xe9\x9b2\
-\x1f\x15\x94\xa43\xcd\x0f\xbe\x1b<\x15\xec\x0fN:4\
-h\xb8\x93q\xad?\x15\xd7\xfe|c@R\xd3\x9b\x1d\
-\xdc\x13l\x0a\xf6\x04\x83\x0e\x038c0\xee\x89Mq\
-\x8f\xcc6.$\xd5\xb5\x81`Y\xb0>\xf8\x9f\xe0m\
-C\x1e&\xe5\xed\xb8w\xd6\xc7\xbd4`\xacHJ\xad\
-\xd1\xf74\x17g\x9f\xfe\xd0\xd3\xff\x0d\xfe\x99\xf9\xb8\x1e\
-\x14\xf1\xf1\xc2\x7f\xc6=\xf6`\xdcs~\x9e@R\xa9\
-\xcd\x0b\xbe\x93}\xfa=\xe8/\x07C\x863Tb(\
-\xee\xc1'\xe3\x9e\x9cg<I\xca\xabY\xd9\xa7\xdfr\
-\xf6x\xf6\xe9W\x9e~`\xe8B\xd2>\x88{\xf5\xf1\
-\xb8wg\x19c\x92.U\x7fpk\xf0H\xf0\xe7\xe0\
-\x88a\x0a\x8dp$\xee\xe9G\xe2\x1e\xef7\xee\xa4v\
-7\xfa\xb8\xd25\xc1\xb6\xe0\xb5\xcc\xfb\xf6\xd0\xa6\x9f'\
-x-\xee\xfd5\x99G\x17K\x8dnn\xb0*\xf8u\
-\xf0R\xf0\xb1!\x08\x9c\xe5\xe38\x1b~\x1dg\xc5\x5c\
-cS\xaa_3\x83o\x04\x1b\x82\xe7\x83\xf7\x0d7\xa0\
-\x03\xef\xc7\x19\xb2!\xce\x94\x99\xc6\xab\x94N\xa3\xef\xe5\
-\xfdW\xf0p\xf0\xc7\xe0MC\x0b(\xd0\x9bq\xd6<\
-\x1cg\x8f\x9f'\x90Jjap\x7f\xf0\xdb\xe0\x95\xe0\
-\x94\x81\x04T\xe8T\x9cE\xbf\x8d\xb3i\xa11-u\
-\xdf\x9c`e\xf0D\xf0\xf7\xe0\x84a\x03\xd4\xc0\x898\
-\xb3\x9e\x883l\x8eq.\x8d\xdf\x8c\xe0\xeb\xc1c\xc1\
-_\x82\x7f\x19\x22@\x83\xfc+\xce\xb6\xc7\xe2\xac\x9ba\
-\xec\xab\x8d\xf5\x057\x07\xeb\x82?\x04\x873_y\x0b\
-\xb4\xef\xab\x92\x0f\xc7\x19\xb8.\xce\xc4>\xc7\x83\x9a\xd6\
-\x82\xe0\x07\xc1o\x82\x03\xc1\xb0\xcd\x0fp\x9e\xe18#\
-\x7f\x13g\xe6\x02\xc7\x87\xea\xd4\x97\x83\x15\xc1\xe6`o\
-\xf0\x91M\x0d\xd0\xb1\x8f\xe2,\xdd\x1cg\xeb\x97\x1d3\
-J\xa1i\xc1\x1d\xc1\xcf\x82\xe7\x82\xf7lV\x80\xc2\xbd\
-\x17g\xee\xcf\xe2\x0c\x9e\xe68R\xd1\xef\xdb\x7f5X\
-\x1b\xfc>x\xc3\xfb\xf6\x00\xc9\xfc<\xc1\x1bq6\xaf\
-\x8d\xb3\xda\xcf\x13\xa8\xe3\xfe#\xf8~\xf0t\xf0\x0f\xef\
-\xdb\x03\xd4\xee\xe7\x09\xfe\x11g\xf8\xf7\xe3L\x97\xce\xeb\
-\xca\xe0\xde\xe0\x97\xc1\x0b\xc1\xa0\xcd\x03\xd08\x83q\xc6\
-\xff2\xce\xfc+\x1d\x7f\xed{\xdf\xfe\xf6\xe0'\xc1\xb3\
-\xc1;6\x05@k\xbd\x13\xcf\x82\x9f\xc4\xb3\xc1\xcf\x13\
-4\xa4\xde\xe0\xa6\xe0\xa1`{p\xc8\xfb\xf6\x00\x5c\xe2\
-\xe7\x09\x0e\xc53\xe3\xa1x\x86\xf4:N\xd3o~\xf0\
-\xdd\xe0\xa9`\x7fp\xd2b\x06\xa0K'\xe3\x99\xf2T\
-<c\xe6;n\xabmv\xf0\xcd`S\xb0'\xf8\xd0\
-\x22\x05\xa0$\x1f\xc6\xb3gS<\x8bf;\x96\x8bi\
- X\x1a\xfc8\xd8\x19\xbce\xf1\x01\x90\x98\xb7\xe2\x19\
-\xf5\xe3xf\x0d8\xbe'\xff\xbe\xfd\xa2\xe0\x7f\x07\xbf\
-\x0b^\x0fF,,\x00jf$\x9ea\xbf\x8bg\xda\
-\x22?Opn\xd7\x06\xdf\x0e\xb6\x04\xff/\x18\xb2h\
-\x00h\xa8\xa1x\xd6m\x89g\xdf\xb5m9\xecg\x05\
-w\x05\x8f\x07\x7f\x0d>\xb0\x18\x00h\xb9\x0f\xe2\x99\xf8\
-x<#g\xd5\xfd\xb0\xef\x0fn\x0d\x1e\x09\xfe\x1c\x1c\
-q\x93\x01`B\x8e\xc4\xb3\xf3\x91x\x96\xf6\xa7|\xe0\
-\x7f%X\x13l\x0b^\x0bN\xb9\x81\x00\x90\x8bS\xf1\
-l\xdd\x16\xcf\xda\xafTu\xd8\xcf\x0dV\x05\xbf\x0e^\
-\x0a>vs\x00\xa0T\x1f\xc73\xf8\xd7\xf1L\x9e\x9b\
-\xf7a?3\xf8F\xb0!x>x\xdfE\x07\x80$\
-\xbd\x1f\xcf\xea\x0d\xf1\xec\x9e9\x99\xf7\xed\xff+x8\
-\xf8c\xf0\xa6\x8b\x09\x00\xb5\xf6f<\xd3\x1f\x8eg\xfc\
-9?O0\xfaJ\xe1\x15\xef\xdb\x03@+~\x9e\xe0\
-\x95x\xf6\x9fyZ\xd11\x17\x05\x00Z\xe1Xv\xd6\
-\x93\x0aG?w\xe8!<\x00\xd0lC\xd9\x05\x9e5\
-0\xfaD\x22\x8f\xdd\x05\x80f\x1a\xc9.\xf2\xf4\xc1\xc5\
-.\x10\x004\xd2\xe2K}\x1a`\xb9\x8b\x04\x00\x8d\xb2\
-|\xa2\x1f\x09\x5c\xe3b\x01@#\xac\xc9&\xd9F\x17\
-\x0d\x00jmc\xd6a\xcf\xb8x\x00PK\xcfd]\
-\xd4\x13\xecv\x11\x01\xa0Vv\xc73\xbc\xab\xa6\x04\xaf\
-\xba\x98\x00P\x0b\xaf\xc6\xb3;\x97F\x9f\x1d|\xd4E\
-\x05\x80\xa4\x1d\xcd>\xf7\xbc\xff<\xba,8\xe1\xe2\x02\
-@\x92N\xc4\xb3\xba\x90\xae\xce<-\x10\x00R3\x12\
-\xcf\xe8B[\xe8B\x03@R\x16f%\xb5\xcc\xc5\x06\
-\x80$,\xcbJn\xb5\x8b\x0e\x00\x95Z\x9dU\xd4z\
-\x17\x1f\x00*\xb1>\xab\xb8\xadn\x02\x00\x94jk\x96\
-@\xa3O\x1a\xda\xe5f\x00@)ve9<\xe5/\
-\xafz\x83\xfdn\x0a\x00\x14j\x7f<s\x93jjp\
-\xc4\xcd\x01\x80B\x1c\x89gm\x92M\x0f\x8e\xbbI\x00\
-\x90\xab\xe3\xf1\x8cM\xba+\x82a7\x0b\x00r1\x1c\
-\xcf\xd6Z4\xdf\x0d\x03\x80\x5c\xcc\xcfj\xd6-n\x1a\
-\x00t\xe5\x96\xac\xa6\xadp\xf3\x00\xa0#+\xb2\x9a\xb7\
-\xceM\x04\x80IY\x975\xa4\xcdn&\x00L\xc8\xe6\
-\xaca\xedpS\x01\xe0\xa2vd\x0dl\xf4\xc9E{\
-\xdd\x5c\x00\xb8\xa0\xbdY\x82O\xf9\xcb\xab\xbe\xe0\x90\x9b\
-\x0c\x00\xe78\x14\xcf\xc8F7\x10\x1cs\xb3\x01\xe0\x8c\
-c\xf1llE\x97\x07Cn:\x00-7\x14\xcf\xc4\
-V57\x18q\xf3\x01h\xa9\x91x\x16\xb6\xb2\xc5\x16\
-\x00\x00-\xb58ky\xcb-\x02\x00Zfy\xa63\
-\xad\xb1\x18\x00h\x895\x8e\xfds\xdbhQ\x00\xd0p\
-\x1b\x1d\xf7\x17n\x9b\xc5\x01@Cms\xcc\x8f_O\
-\xb0\xdb\x22\x01\xa0av\xc73N\x17iJ\xf0\xaa\xc5\
-\x02@C\xbc\x1a\xcf6M\xa0\xfe\xe0\xa8E\x03@\xcd\
-\x1d\x8dg\x9a&\xd1\x8c\xe0\x84\xc5\x03@M\x9d\x88g\
-\x99:\xe8\xea\xcc\xd3\x02\x01\xa8\x9f\x91x\x86\xa9\x8b\x16\
-ZH\x00\xd4\xccB\xc7w>-\xb3\x98\x00\xa8\x89e\
-\x8e\xed|[mQ\x01\x90\xb8\xd5\x8e\xebbZoq\
-\x01\x90\xa8\xf5\x8e\xe9b\xdbj\x91\x01\x90\x98\xad\x8e\xe7\
-\xe2\x1b}\x92\xd2.\x8b\x0d\x80D\xec\xca<\xe5\xaf\xb4\
-z\x83}\x16\x1d\x00\x15\xdb\x17\xcf$\x95\xd8\xd4\xe0\x88\
-\xc5\x07@E\x8e\xc4\xb3H\x154=8n\x11\x02P\
-\xb2\xe3\xf1\x0cR\x85\xcd\x0e\x86-F\x00J2\x1c\xcf\
-\x1e%\xd0|\x0b\x12\x80\x92\xccw\xec\xa6\xd5\x12\x8b\x12\
-\x80\x82-q\xdc\xa6\xd9\x0a\x8b\x13\x80\x82\xacp\xcc\xa6\
-\xdd:\x8b\x14\x80\x9c\xads\xbc\xd6\xa3\xcd\x16+\x009\
-\xd9\xecX\xadW;,Z\x00\xba\xb4\xc3qZ\xbfF\
-\x9f\xcc\xb4\xd7\xe2\x05\xa0C{3O\xf9\xabm}\xc1\
-!\x8b\x18\x80I:\x14\xcf\x10\xd5\xb8\x81\xe0\x98\xc5\x0c\
-\xc0\x04\x1d\x8bg\x87\x1a\xd0\xe5\xc1\x90E\x0d\xc0%\x0c\
-\xc53C\x0djn0bq\x030\x8e\x91xV\xa8\
-\x81-\xb2\xc0\x01\x18\xc7\x22\xc7d\xb3[n\x91\x03\xf0\
-9\xcb\x1d\x8f\xedh\x8d\xc5\x0e@\xb4\xc6\xb1\xd8\xae6\
-Z\xf4\x00\xad\xb7\xd1q\xd8\xce\xb6Y\xfc\x00\xad\xb5\xcd\
-1\xd8\xdez\x82\xdd6\x01@\xeb\xec\x8eg\x80Z\xdc\
-\x94\xe0U\x9b\x01\xa05^\x8d\xb3_\xca\xfa\x83\xa36\
-\x05@\xe3\x1d\x8d3_\xfa\xac\x19\xc1\xa0\xcd\x01\xd0X\
-\x83q\xd6K\xe7uu0l\x93\x004\xcep\x9c\xf1\
-\xd2\xb8-\xb0Q\x00\x1ag\x81\xe3M\x13i\xa9\xcd\x02\
-\xd0\x18K\x1dk\x9aL\xabm\x1a\x80\xda[\xed8S\
-'\xad\xb7y\x00jk\xbdcL\xdd\xb4\xd5&\x02\xa8\
-\x9d\xad\x8e/u\xdb\xe8\x93\xa2v\xd9L\x00\xb5\xb1+\
-\xf3\x94?\xe5To\xb0\xcf\xa6\x02H\xde\xbe8\xb3\xa5\
-\xdc\x9a\x1a\x1c\xb6\xb9\x00\x92u8\xcej)\xf7\xa6\x05\
-\xc7m2\x80\xe4\x1c\x8f3Z*\xac\xd9\x99\xa7\x05\x02\
-\xa4\xf6\x94\xbf\xd9\x8e'\x95\xd1|\x1b\x0e \x19\xf3\x1d\
-K*\xb3%6\x1d@\xe5\x968\x8eTE+l>\
-\x80\xca\xacp\x0c\xa9\xca\xd6\xda\x84\x00\xa5[\xeb\xf8Q\
-\x0am\xb6\x19\x01J\xb3\xd9\xb1\xa3\x94\xdaaS\x02\x14\
-n\x87\xe3F\xa95\xfa\xe4\xa9\xbd6'@a\xf6f\
-\x9e\xf2\xa7D\xeb\x0b\x0e\xda\xa4\x00\xb9;\x18g\xac\x94\
-l\x03\xc11\x9b\x15 7\xc7\xe2l\x95\x92\xef\xf2`\
-\xc8\xa6\x05\xe8\xdaP\x9c\xa9Rm\x9a\x1b\x8c\xd8\xbc\x00\
-\x1d\x1b\x89\xb3T\xaa]\x8bl`\x80\x8e-r\x8c\xa8\
-\xce\xddi\x13\x03L\xda\x9d\x8e\x0f5\xa1563\xc0\
-\x84\xadql\xa8Im\xb0\xa9\x01.i\x83\xe3BM\
-l\x9b\xcd\x0d0\xaem\x8e\x095\xb5\x9e\xe0y\x9b\x1c\
-\xe0<\xcf\xc7\x19)5\xb6)\xc1\x01\x9b\x1d\xe03\x07\
-\xe2l\x94\x1a_\x7fp\xd4\xa6\x0783\x0b\xfb\x1d\x0b\
-jS3\x82A\x9b\x1fh\xb1\xc18\x0b\xa5\xd6uU\
-0l\x08\x00-4\x1cg\xa0\xd4\xda\x16\x18\x04@\x0b\
--0\xfe\xa5,[j\x18\x00-\xb2\xd4\xd8\x97\xfe\xdd\
-jC\x01h\x81\xd5\xc6\xbdt~\xeb\x0d\x07\xa0\xc1\xd6\
-\x1b\xf3\xd2\xf8m5$\x80\x06\xdaj\xbcK\x17o\xf4\
-IX\xbb\x0c\x0b\xa0Ave\x9e\xf2'M\xa8\xde`\
-\x9f\xa1\x014\xc0\xbe8\xd3$M\xb0\xa9\xc1a\xc3\x03\
-\xa8\xb1\xc3q\x96I\x9ad\xd3\x82\xe3\x86\x08PC\xc7\
-\xe3\x0c\x93\xd4a\xb33O\x0b\x04\xea\xf7\x94\xbf\xd9\xc6\
-\xb7\xd4}\xf3\x0c\x14\xa0F\xe6\x19\xdbR~-1T\
-\x80\x1aXb\x5cK\xf9w\xaf\xe1\x02$\xec^cZ\
-*\xae\xb5\x86\x0c\x90\xa0\xb5\xc6\xb3T|\x9b\x0d\x1b \
-!\x9b\x8de\xa9\xbcv\x18:@\x02v\x18\xc7R\xb9\
-\x8d>Yk\xaf\xe1\x03Tho\xe6)\x7fR%\xf5\
-\x05\x07\x0d!\xa0\x02\x07\xe3\x0c\x92TQ\x03\xc11\xc3\
-\x08(\xd1\xb18{$U\xdc\xe5\xc1\x90\xa1\x04\x94`\
-(\xce\x1cI\x8947\x181\x9c\x80\x02\x8d\xc4Y#\
-)\xb1\x16\x19P@\x81\x16\x19\xb3R\xba\xf9\xa1@\xa0\
-\xa8\x1f\xfa\x93\x94p\xbe9\x10(\xea\x1b\xfe$%Z\
-\xaf!\x05\x14\xc8g\xfe\xa5D\x9bn@\x01\x05\x9an\
-\xccJi6\xc7\x80\x02\x0a4\xc7\x98\x95\xd2l\xb1\x01\
-\x05\x14h\xb11+\xa5\xd9\xb7\x0c(\xa0@w\x1b\xb3\
-R\x9a\xad5\xa0\x80\x02\xad5f\xa54\xdbj@\x01\
-\x05\xdaj\xccJi\xb6\xc7\x80\x02\x0a\xb4\xc7\x98\x95\xd2\
-\xec\xb8\x01\x05\x14\xe8\xb81+\xa5W\x8f\xe1\x04\x94\xa0\
-\xc7\xb8\x95\xd2\xaa\xdf`\x02J\xd0o\xdcJi5\xdb\
-`\x02J0\xdb\xb8\x95\xd2j\x81\xc1\x04\x94`\x81q\
-+\xa5\xd52\x83\x09(\xc12\xe3VJ\xab\xfb\x0c&\
-\xa0\x04\xf7\x19\xb7RZm2\x98\x80\x12l2n\xa5\
-\xb4\xdai0\x01%\xd8i\xdcJiu\xd8`\x02J\
-p\xd8\xb8\x95\xd2\xca`\x02\xca\x22)\x91\xfa\x0c$\xa0\
-D}\xc6\xae\x94F\x97\x19H@\x89.3v\xa54\
-\xba\xce@\x02Jt\x9d\xb1+\xa5\xd1\x12\x03\x09(\xd1\
-\x12cWJ\xa3\x95\x06\x12P\xa2\x95\xc6\xae\x94F\x8f\
-\x1aH@\x89\x1e5v\xa54\xdaf \x01%\xdaf\
-\xecJi\xb4\xdf@\x02J\xb4\xdf\xd8\x95\xd2h\xc8@\
-\x02J4d\xecJ\xd5\xd7k\x18\x01\x15\xe85~\xa5\
-j\xfb\xa2A\x04T\xe0\x8b\xc6\xafTmW\x19D@\
-\x05\xae2~\xa5j\xbb\xd1 \x02*p\xa3\xf1+U\
-\xdbr\x83\x08\xa8\xc0r\xe3W\xaa\xb6\x07\x0c\x22\xa0\x02\
-\x0f\x18\xbfR\xb5\xfd\xca \x02*\xf0+\xe3W\xaa\xb6\
-\xdd\x06\x11P\x81\xdd\xc6\xafTm\xef\x1aD@\x05\xde\
-5~\xa5j3\x88\x80\xaaH\xaa\xa8~\x03\x08\xa8P\
-\xbf1,U\xd3,\x03\x08\xa8\xd0,cX\xaa\xa6\xeb\
-\x0d \xa0B\xd7\x1b\xc3R5\xddf\x00\x01\x15\xba\xcd\
-\x18\x96\xaai\xb5\x01\x04Th\xb51,U\xd3\x06\x03\
-\x08\xa8\xd0\x06cX\xaa\xa6\x1d\x06\x10P\xa1\x1d\xc6\xb0\
-TM\x07\x0d \xa0B\x07\x8da\xa9\x9aF\x0c \xa0\
-B#\xc6\xb0T~S\x0c\x1f \x01S\x8cc\xa9\xdc\
-\xa6\x1b<@\x02\xa6\x1b\xc7R\xb9\xcd5x\x80\x04\xcc\
-5\x8e\xa5r\xbb\xc9\xe0\x01\x12p\x93q,\x95\xdb\xbd\
-\x06\x0f\x90\x80{\x8dc\xa9\xdc~d\xf0\x00\x09\xf8\x91\
-q,\x95\xdb\xd3\x06\x0f\x90\x80\xa7\x8dc\xa9\xdc^4\
-x\x80\x04\xbch\x1cK\xe56h\xf0\x00\x09\x184\x8e\
-\xa5\xf2\xea1t\x80\x84\xf4\x18\xcbR9\x0d\x188@\
-B\x06\x8ce\xa9\x9c\xae0p\x80\x84\x5ca,K\xe5\
-\xb4\xd0\xc0\x01\x12\xb2\xd0X\x96\xca\xe9\x0e\x03\x07H\xc8\
-\x1d\xc6\xb2TN\xf7\x1b8@B\xee7\x96\xa5r\xfa\
-\x85\x81\x03$\xe4\x17\xc6\xb2TN\xcf\x198@B\x9e\
-3\x96\xa5r:b\xe0\x00\x099b,K\xe5d\xe0\
-\x00\xa9\x91TpS\x0d\x1a AS\x8dg\xa9\xd8f\
-\x1a4@\x82f\x1a\xcfR\xb1\xcd3h\x80\x04\xcd3\
-\x9e\xa5b\xfb\x9aA\x03$\xe8k\xc6\xb3Tl\xab\x0c\
-\x1a A\xab\x8cg\xa9\xd8~j\xd0\x00\x09\xfa\xa9\xf1\
-,\x15\xdbv\x83\x06H\xd0v\xe3Y*\xb6\x03\x06\x0d\
-\x90\xa0\x03\xc6\xb3Tl\xc3\x06\x0d\x90\xa0a\xe3Y*\
-\xae^C\x06HX\xaf1-\x15\xd34\x03\x06H\xd8\
-4cZ*\xa69\x06\x0c\x90\xb09\xc6\xb4TL\x8b\
-\x0c\x18 a\x8b\x8ci\xa9\x98\xee6`\x80\x84\xddm\
-LK\xc5\xb4\xd6\x80\x01\x12\xb6\xd6\x98\x96\x8ai\x8b\x01\
-\x03$l\x8b1-\x15\xd3\x1e\x03\x06H\xd8\x1ecZ\
-*\xa6\xe3\x06\x0c\x90\xb0\xe3\xc6\xb4\x94\x7f=\x86\x0bP\
-\x03=\xc6\xb5\x94o\xfd\x06\x0bP\x03\xfd\xc6\xb5\x94o\
-\xb3\x0d\x16\xa0\x06f\x1b\xd7R\xbe\xdd`\xb0\x005p\
-\x83q-\xe5\xdb2\x83\x05\xa8\x81e\xc6\xb5\x94o\xf7\
-\x19,@\x0d\xdcg\x5cK\xf9\xb6\xd1`\x01j`\xa3\
-q-\xe5\xdbN\x83\x05\xa8\x81\x9d\xc6\xb5\x94o\x87\x0c\
-\x16\xa0\x06\x0e\x19\xd7R\xbe\x8d\x18,@\x0d\x8c\x18\xd7\
-R~\xf5\x19*@\x8d\xf4\x19\xdbR>\xcd0P\x80\
-\x1a\x99alK\xf9t\xad\x81\x02\xd4\xc8\xb5\xc6\xb6\x94\
-OK\x0c\x14\xa0F\x96\x18\xdbR>\xad0P\x80\x1a\
-YalK\xf9\xf4\xa8\x81\x02\xd4\xc8\xa3\xc6\xb6\x94O\
-\xdb\x0c\x14r\xf4b\xb0\xf8\xac\xf5\xb58\xfeo\xae\x0d\
-y\xd9flK\xf9\xb4\xcf@!\xa7\xa1|\xcdE\xd6\
-\xd95^l\x92\x93}\xc6\xb6\x94OC\x06\x0a\x1d\x1a\
-\x8e\x7f\x1c;}\x12\xebmz\xfc{\x86]?:4\
-dlK\xdd\xd7k\x98\xd0\x81c\xc1\xca\xac\xbb\x07\xb2\
-\xf4\xc5\x7f\xc61\xd7\x93\x0e\xf4\x1a\xdfRw\x0d\x18$\
-L\xc2\x81\xec\xd3\x8f`\xf5\xe4\xb8\x06{\xe2?\xf3\x80\
-\xeb\xcb$\x0c\x18\xdfRw]e\x900\x01;\x82\xeb\
-JX\x8f\xd7\xc5\x7f\x97k\xce\xa5\x5ce|K\xddu\
-\xa3AB6\xfe\x97\xae\xfc<\xb8\xac\x82uyY\xfc\
-w\xfb\x92*\xc6s\xa3\xf1-u\xd7\x9d\x06\x09\x9f3\
-\x18\xac\x0e\xa6&\xb0>\xa7\xc6_\xcb\xa0\xfb\xc2\xe7\xdc\
-i|K\xdd\xf5\x80ABt0\xb8-\xcb\xf7\xfd\xfd\
-\xbc\xea\x89\xbf\xb6\x83\xee\x13\xd1\x03\xc6\xb7\xd4]\x9b\x0d\
-\x92\xd6\xdb\x15\x5c_\xa35{}\xfc5\xbbw\xed\xb6\
-\xd9\xf8\x96\xba\xeby\x83\xa4\xb56\x05\xb3j\xbcvg\
-\xc5\xdf\x83{\xd9N\xcf\x1b\xdfRw\xbdk\x90\xb4\xca\
-\x89\xe0\xfe\xa0\xbfAk\xb8?\xfe\x9eN\xb8\xbf\xad\xf2\
-\xae\xf1-u\x97A\xd2\x0e\x87\x83\xdb\xb3f?<\xa5\
-7\xfe\x1e\x0f\xbb\xdf\xad!\xa9\xc3\xa6\x1a \xad\xf8c\
-\xd2\x05-\x5c\xdb\x0b2oo\xb5\xc1Tc\x5c\xea\xac\
-Y\x06Hc\xfd*\xb8\xc2\x12?s\x0d~e=4\
-\xd6,K\x5c\xea\xac\xf9\x06H\xe3\xbe \xe5\x87\x99G\
-\xa4^\xa8\x81xm|\xf1U\xb3\xcc\xb7\xb4\xa5\xce\xba\
-\xcd\x00i\x84#\xc1\xf2\xcc\x97\xa3L\xa4\xdex\xad\x8e\
-X7\x8dp\x9b%-u\xd6j\x03\xa4\xd6\xf6f\x1e\
-\x87\xdaM7\xc6kh-\xd5\xd7j\xcbX\xea\xac\x9f\
-\x1b \xb5\xf4tp\xb5\xe5\x9b[W\xc7kjm\xd5\
-\xcf\xcf-_\xa9\xb3|\xebZ}\x0c\x07\xeb\x82/Z\
-\xb6\x85\xf5\xc5x\x8d\x87\xad\xb7Z}K\xa5\xa4\x0e\xf2\
-\x5c\xf5z<\xec\xe4\xde`\x8a\xe5ZZS\xe25\x7f\
-\xd7\xfa\xab\xc5\xf7WH\xea _\xb5\x9a\xae}\xc1M\
-\x96h\xe5\xdd\x14\xef\x855\x99\xeeWVK\xea\xe0\xbf\
-r\x0c\x90\xf4<\x13\xcc\xb5<\x93kn\xbc7\xd6h\
-z\xfc\xe9\x984\xc9\xa6\x1b\x1cI\xfdW\xcc\xfaxO\
-\x94\xfe\xbeY\xefO\xcf\x92b\xdfH\x93\xec\x1a\x83\xa3\
-r\xc7\x83UA\x9f\xe5X\xbb\xfa\xe2\xbd;n\x1dW\
-\xee\x1a\xcbQ\x9a\x5c7\x19\x1c\x959\x10\xdc\x12\xf4X\
-\x86\xb5\xaf'\xde\xcb\x03\xd6ue\xfc\xac\x8c4\xc9\xbe\
-ep\x94\xeeO\xc1<K\xaf\xb1\xcd\x8b\xf7\xd8Z/\
-\xd7\xb7,=ir\xad38J{\x7f\x7fC0\xd3\
-\x92kM3\xe3=\xf7s\x02\xe5Xg\xc9I\x93\xcb\
-\x93\xcf\x8a5\x18|/\xf3u\xa5mnj\x5c\x03\x83\
-\xf6C\xe1O\xc6\x944\x89<\x03\xbd\xb8\x07\x93,\xcd\
-\xbc\xbf\xaf\x7f\xd7\x13\xd7\x84\x07o\x15\xf7\x9d\x18\x92&\
-\x91\xff*\xc9\xd7s\xc1\x0d\x96\x95.\xd1\x0dq\xad\xd8\
-3\xf9\xfei\x9b\xa4I\xfc\x17\x89\xc1\x91\x8f_\x04_\
-\xb2\xa44\xc9\xbe\x14\xd7\x8e=\x94\x0f\x7f\xe2&M\xb0\
-/\x18\x18]9\x11\xac\x09\xfa-%uY\x7f\x5cK\
-'\xec\xab\xae|\xc1R\x92&\xd6\x15\x06FG\x0e\x07\
-w\x04\xbd\x96\x90r\xae7\xae\xad\xc3\xf6YG\xae\xb0\
-\x84\xa4\x89\xb5\xd0\xc0\x98\x94\xdd\xf1\x9aIe\xed\xcf\xdd\
-\xf6\xdd\xa4\xd8\x9f\xd2\x04\xbb\xdd\xc0\x98\x90-\xc1\x95\x96\
-\x8b*\xea\xca\xb8\x06\xed\xc5K\xbb\xddr\x91&\xd6\xfd\
-\x06\xc6\xb8\x86\x82\x1f\x06\x03\x96\x89\x12i \xae\xc9!\
-\xfbs\x5c\xf7[&\xd2\xc4\xfa\x85\x81q\x9e\xa3\xc1\xdd\
-\x99\xf7\xf7\x95n\xbdq\x8d\x1e\xb5_/\xf8i\x1cI\
-\x13h\x97\x81\xf1\x99\x17\x83E\x96\x84j\xd6\xa2\xb8v\
-\xed\xe1O\xed\xb2$\xa4\x89u\xc4\xc0\xc8\xfeO0\xc7\
-RP\xcd\x9b\x13\xd7r\xdb\xf7\xf3\x11KA\x9aXm\
-\x1d\x12\xc3\xc1\x8f\x82i\x96\x80\x1a\xd6\xb4\xb8\xb6\x87[\
-\xbc\xbf%]\xa2\xbe\x16\x0e\x86c\xc1\x8a`\x8a\xdb\xaf\
-\x867%\xae\xf5c-\xdc\xe7}n\xbft\xf1f\xb6\
-h \xec\x0f\xfeW\xe61\xa1j_=q\xed\xefo\
-\xd1~\xf7\x95\xdb\xd2%\xba\xae\x05\x83`{p\xad[\
--\x9d\xe9\xda\xb8'\x9a\xbe\xef\xafs\xab\xa5\x8bwK\
-C7\xffH\xf0\xd3`\x86[,]\xb0\x19q\x8f\x8c\
-4t\x06\xdc\xe2\x16K\x17oU\xc36\xfd\xf1\xe0\xdb\
-\x99\xf7\xff\xa4\x89\xd6\x17\xf7\xcc\xf1\x86\xcd\x82Un\xad\
-t\xf1\xd67d\xb3\xbf\x1a|-\xf3\xfe\xbe\xd4i=\
-q\x0f\xbd\xda\x90\x99\xb0\xde-\x95.\xde35\xdf\xe4\
-;\x83\xf9n\xa3\x94k\xf3\xe3\xde\xaa\xf3lx\xc6m\
-\x94.\xde\x81\x9an\xee\x8d\xc1\xe5n\x9fTh\x97\xc7\
-\xbdV\xc7\x19q\xc0\xed\x93.^\x9d\x1e\x142\x18\xdc\
-\x17Lu\xdb\xa4R\x9b\x1a\xf7\xde`V\xaf\x07}I\
-\x1a\xa7\xde\x9al\xe4C\xc1\xb2\xcc\xfb\xfbR\xd5\xf5\xc4\
-\xbdx\xa8&\xb3\xc3\x97yI\xe34-\xf1\xcd\xfb\x5c\
-p\x83\xdb$%\xd9\x0dq\x8f\xa6<C<\xe6[\x1a\
-\xa7\xab\x13\xdd\xb4\x9b\x83\xd9n\x8fT\x8bf\xc7=\x9b\
-\xe2,\xb9\xda\xed\x91.\xdc\xa2\x846\xeaP\xf0@\xf0\
-\x05\xb7E\xaae_\x88{x(\xa1\xb9\xe2\xab\xbd\xa5\
-q\xba;\x81\x0d:\xfa\xb5\x9dwf\xde\xab\x93\x9aR\
-o\xdc\xd3)|\xcd\xf8\xddn\x87t\xe1~X\xe1\xc6\
-\xdc\x13\xfc\xa7[ 5\xba\xff\x8c{\xbd\xaa9\xf3C\
-\xb7@\xbap[*\xd8\x90[\x83\xab\x5cz\xa9U]\
-\x15\xf7~\xd9\xf3f\x8bK/]\xb8\xb2^\x99\x8f~\
-\x1ewm0\xe0\x92K\xadn \xce\x82\xb2\x9e?\xb2\
-\xc7%\x97.\xdc\xb1\x827\xdf\xbb\xc1\xb7\x82).\xb5\
-\xa4\xb3\x9a\x12g\xc3\xbb\x05\xcf\xa0c.\xb5t~=\
-\x05n\xba\x17\x83\xc5.\xb1\xa4\x09\xb48\xce\x8c\xa2\xe6\
-\x91\x07\x88I\x9f\xab\xbf\x80\x8d\xb6-\xb8\xc6\xa5\x95\xd4\
-A\xd7\xc4\x19\x92\xf7\x5c\xeawi\xa5s\xfbR\x96\xdf\
-\xfb\xfb\x8f\x06\xd3]RI94=\xce\x94\xbc~N\
-\xe0K.\xa9tn7d\xdd\xbf\xb7\xb62\xe8s)\
-%\x15P_\x9c1\xdd\xfe\xac\x92\xc7\x89K\x9fki\
-\xd6\xf9Wl.\xc9\xbc\xaf&\xa9\x9cz\xe2\xcc\xe9\xf4\
-\xab\xcb\x97\xba\x84\xd2\xb9}o\x92\x9bhGp\x9d\xcb\
-&\xa9\xc2\xae\x8b\xb3h2\xb3\xeb{.\x9btn\x1b\
-'\xb0qF\x82\x9f\x07\x97\xb9\x5c\x92\x12\xea\xb28\x9b\
-F&0\xc76\xba\x5c\xd2\xb9\xfd\xe9\x22\x1b\xe6x\xb0\
-:\x98\xea2IJ\xb8\xa9qV\x1d\xbf\xc8<\xfb\x93\
-\xcb$\x9d\xdb\xa1\x0bl\x94\x83\xc1m\x99\xf7\xf7%\xd5\
-\xab\x9e8\xbb\x0e^`\xae\x1dry\xa4s;\xfb\x8f\
-\xcev\x05\xd7\xbb$\x92\x1a\xd0\xf5q\xa6\x9d\xfdV\xa6\
-\xa4\xd8\x94\xb816\x05\xb3\x5c\x0eI\x0dlV\x9cq\
-\x9fd\x1eG.}\xd6\xe8\xf7u{:\x96\xa46\xd4\
-\x1fg\x9e\xaa\xee\x93O>\x01\x00Z\xc6E\x00\x00/\
-\x00\x00\x00/\x00\x00\x00/\x00\x00\x00/\x00\x00\x00/\
-\x00\x00\x00/\x00\x00\x00/\x00\x00\x00/\x00\x00\x00/\
-\x00\x00\x00/\x00\x00\x80B\xfd\x7f9s\x85Z^\x96\
-y\xc5\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00B\xd7\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4x\xd4\xfa\
-\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95+\x0e\x1b\x00\x00\x04\xeeiTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 7.1-c000 79\
-.9ccc4de, 2022/0\
-3/14-11:26:19   \
-     \x22> <rdf:RDF\
- xmlns:rdf=\x22http\
-://www.w3.org/19\
-99/02/22-rdf-syn\
-tax-ns#\x22> <rdf:D\
-escription rdf:a\
-bout=\x22\x22 xmlns:xm\
-p=\x22http://ns.ado\
-be.com/xap/1.0/\x22\
- xmlns:dc=\x22http:\
-//purl.org/dc/el\
-ements/1.1/\x22 xml\
-ns:photoshop=\x22ht\
-tp://ns.adobe.co\
-m/photoshop/1.0/\
-\x22 xmlns:xmpMM=\x22h\
-ttp://ns.adobe.c\
-om/xap/1.0/mm/\x22 \
-xmlns:stEvt=\x22htt\
-p://ns.adobe.com\
-/xap/1.0/sType/R\
-esourceEvent#\x22 x\
-mp:CreatorTool=\x22\
-Adobe Photoshop \
-23.3 (Windows)\x22 \
-xmp:CreateDate=\x22\
-2024-04-22T15:02\
-:14+02:00\x22 xmp:M\
-odifyDate=\x222024-\
-04-22T15:34:39+0\
-2:00\x22 xmp:Metada\
-taDate=\x222024-04-\
-22T15:34:39+02:0\
-0\x22 dc:format=\x22im\
-age/png\x22 photosh\
-op:ColorMode=\x223\x22\
- xmpMM:InstanceI\
-D=\x22xmp.iid:c6dd9\
-2c0-ffee-114b-aa\
-0e-1f9fa390a820\x22\
- xmpMM:DocumentI\
-D=\x22xmp.did:c6dd9\
-2c0-ffee-114b-aa\
-0e-1f9fa390a820\x22\
- xmpMM:OriginalD\
-ocumentID=\x22xmp.d\
-id:c6dd92c0-ffee\
--114b-aa0e-1f9fa\
-390a820\x22> <xmpMM\
-:History> <rdf:S\
-eq> <rdf:li stEv\
-t:action=\x22create\
-d\x22 stEvt:instanc\
-eID=\x22xmp.iid:c6d\
-d92c0-ffee-114b-\
-aa0e-1f9fa390a82\
-0\x22 stEvt:when=\x222\
-024-04-22T15:02:\
-14+02:00\x22 stEvt:\
-softwareAgent=\x22A\
-dobe Photoshop 2\
-3.3 (Windows)\x22/>\
- </rdf:Seq> </xm\
-pMM:History> </r\
-df:Description> \
-</rdf:RDF> </x:x\
-mpmeta> <?xpacke\
-t end=\x22r\x22?>Fm^\x04\x00\
-\x00=\x8fIDATx\xda\xed\x9d\x09l\x9c\xd5\xb9\
-\xb0\xed\xd8\xe3}\xf7\xd8\xe3\xf1\xd8\x9e\xb1=\xbbg\x1f\
-\xcfxV{\xec\xf1\xee\xf1\x12;N\x1c\x87$\x98\x9b\
-\xebB\xfa\x83Z\x8a\xe8m\x85\x84.*j\x85\x8a\xb8\
-BT\x15U\xd5\xaaJ\x85ZP\x84z[\x10BU\
-E\xdb\xbb D)\xa8\xbd\x14zK\x17\xd2[BJ\
-\xa0\x04BB\x16\xfb\xf7\x97\x84\x16BH\xbc\xcc\xf2-\
-\xcf#=B\xa0JM\xcey\xcf\xfb~\xf3}\xe7=\
-'/\x0f\x00>B`xA\xb7\xf6\x8f\xd5\x0f4\xfb\
-\x13\x8f1*\xd2Bo\x0f=\xf6\xe19t\xf4N\xeb\
-\x18\x15\x00\x00\xf8\x08\xf1\xb1\xa5\x06W|\xeav\xa3;\
-\xf6\x94Fo9^PP\xb8\xfa\xe1\xe2!\xd8\x15\x1e\
-\xbd\x9f\x91\x92\x06F_\xff=\xf9\xf9\xf9\x1f\x99?\xe1\
-\xdf\xab\xd4\xba\x93:\x93\xf7\xf9N_\xff\xbd\xae\xdeI\
-=#\x05\x00\xa00\xc2\xf3\xb7\x96\xba\x13\xd3\xb7t\xba\
-\xa3\xffQ\xdf\xdc\xfe\xce\xb6m\x05\x1f+\xf8\x97[\xa0\
-*Zu'f\x97\x18=qc\x09\x8e.\x15\x14\xaa\
-\xae9\x9f\xf9ks^\xd3\xd8\xfaN\xab\xc5\xff\x1f\x96\
-\xc0\xc8-\xe1\xf0|)\xa3\x07\x00 C<\x03;\xfb\
-\xac\xc1\xa1C:\xa3\xebHQq\xe9\xca\xb5\x0a\xc4\x95\
-,)\xab<\xef\x1f\xda\x99`4\xc5\x89-4\x1e+\
-^\x9b\xa3\xcd\xcc\xad\xf0\x80W\xdf\xdcq\x5c\xdf\x15~\
-\xdc\x16\x1c\xdd#<#0\xa2\x00\x00\x12$0\xbe\xcf\
-h\x0f\x8f\xde\xdff\xf5\xbf\x5c^Uwn3E\xe1\
-JV\xab\x9bO\xfb\x07\xf7\xb60\xc2\xe2\xc2\x1eM\xb5\
-T\xd4jN\xa7k\x9eK+j\xcei;\x9c/w\
-x\x12\xf7\xbbc3FF\x18\x00@\xc4\xf8\x87w\x86\
-\x85_\xf9\xdav\xfb\xd1\xf5\xbc\xd6\xdf\xac\x8d\xad\xa6\xb7\
-\x12\x89\xf9\x0aF\x5c\x1c\x08\xaf\xef\x85_\xef\x99\x9ao\
-a\xff@Mc\xdb\x09\xe1\xed\x8054>\xcc\x88\x03\
-\x00\x88\x00\xdf\xc0\xfc\x94\xd9\xdf\xff\xb8Z\xd7q\x22S\
-\x05\xe0J\x0ao\x16\x18}q\xa0\xedt\xfd:\x9bs\
-_Y\xab9\xddb\xf6?m\x09\x8e\x1c\xe4S\x01\x00\
-@\x96H$\x12\x85\xc2\x06>CW\xe8\xf9\xf2\xea\xfa\
-\xb3\xd9L\xfc\x97K{`\xee\xd1;\xc2?\xcae\x0c\
-\x94V\xd4\x9c\x15:\x0b\x84\x8d\x84Bl2#\x00\x00\
-\x19\xf8\xa5/\xb4\xe9U\xd4\xa8sZ\xf4/\xd7N{\
-`\xce\xe8\xf4~\xbc\xdd/\x97\x96\x94W\x9f\xbb\xf00\
-p\xe1\xcd\x00\x00\x00l\x1a\xe1\x9b\xbe\xf0z\xbfZ\xad\
-}_LE?\xef\xb2\xdd\xe3\x9e\xc4\xcc\x01f+\xbb\
-\x08;\xf5\x85\xb1\x17k\x5c\x94U\xd6\x9d\x15>\x13X\
-#\xa9\x11f\x0b\x00`=E\x7fh\xc1k\xe9N>\
-Z\xd7\xa4\x7fW\xac\xc9=\xef\xe3\xaf\x81\xcf\x0b\x0f+\
-\xcc^v\xe8\x8aL\x85K\xca\xab\xceK%>\xaa\x1b\
-t\xef\x1a\x1c\x91G\x9d\xb1\x197\xb3\x07\x00\xf0!\x84\
-o\xa7\xc2I|B\x8f~&w\xefg4\xc9\xab\x9b\
-O\x07\x87\xae\xe3t\xb9\x0cc\x89N5U\xd6kO\
-I1F\x84\xcf\x15B\xb7\x82p\x12\xa1!\xb1\xbf\x84\
-\xd9\x04\x00\x05\xff\xda\xdf\x19\x10^\xf1\xe7z3_\xba\
-\xd4\xe8-o$H\xec\x99\x8b\x17\xff\xb2J\xddb:\
-*\x87X\x11\xde`\x08\x9f\x08l=\xa3}\xcc,\x00\
-(\xe4\xd7\xfe|\x85#2~\xaf\xd0\xab/\xa6\x0d\x5c\
-yik\x0f\xec\xa6=0C4\x1b\xdd\xbf\x92[\xbc\
-|p\xc6@\xbb+v\xc8\x19[\xace\x96\x01@~\
-\xbf\xde\x92\xbbB\x1d\xce\xc8\xd3%\x9b<\xaaUJ\x9a\
-\xfd\xfd?d\xc6\xd3\x8b\xbe+\xf4C\xb9\xc7MQi\
-\xf9y\x9d\xc5\xf7\xb4\xa5g\x22\xc4\x8c\x03\x80\xe4\xf1\xf5\
-\xcf\xedi5{^\x91\xea\xb7\xfd\xcd\xfe\xaasD\xc6\
-\xefa\xf6\xd3\x83\xc9\x9f\xbcS\x8eo\x8b\xae\x16?\xc2\
-\xa7\x0ec`\xf0vf\x1f\x00$\xc5\x07\xaf\xf9\xeb\xb5\
-\x86\xac\x9e\xce\x97G{\xa0\xec\x10{\xbb_\xa6\xadR\
-7\x9f\x14>\x0fx\x12\xd35D\x03\x00\x88\x96\xc0\xc8\
-n\xcb\x85M}i\xbc|G\xca\xd2\x1e\xb8\xc5\xe2\x1f\
-\x9d\xf4\x09\x87\xeb\x10Ky\xab\xc2-\x87\x176\x0d\x86\
-\xc6\xbdD\x06\x00\x88\x06\xff\xf0B\x5co\x0f\xfc\x8f\x92\
-\x7f\xa9}\x925\x0d\xbaS\x81\xe1\x05\x1dQ\xb21\x1c\
-\xbd\xd3\xba\xca\xba\xa6S\xc4\xd0eo\x96\x0aU\xab\xc2\
-\xdd\x07\xd6\xe8d\x9c(\x01\x80\xdc\x15\xfe\xa1\x9d\x09\xbd\
-\xad\xfbE%}\xdf\xcf\xdbT{\xa0\x95\xf6\xc0\x8d\xc4\
-\x95\x8c\xda\xfd\xf22\xb8O\xa0\xb1\xcdz\xc4\x16IM\
-\x101\x00\x905\xdc\xfds;\x84\x8d}J\xda\x98\xb5\
-U\xd7\x1e\x94^\x22r\xd6\x87\x1c\xdb\xfd\xf22\xbca\
-\xd0\x12\x1c\xd9G\xe4\x00@\xc6\xf0\xf4\xcd\xde(\xf4\xef\
-\x93x7\xdd\x1e\xf8\x03\xa2\xe8\xea\xe8\x1d\xe1\x1f\x10+\
-\x9b\xfc\xdc\xd4\xd8v\xc2\x1c\x18\xba\x8d(\x02\x80\xb4\x16\
-\xfe\xc6V\xd3[$\xd9t\xb4\x07N|\x99\x88\xba2\
-F\xff\xc0\xdd\xbcU\xda\xbauM\x86\xb7\xcc\xc1\x91\x1b\
-\x89(\x00\xd84\xc2\x15\xbc\xc2\xf9\xfc$\xd5\xf4\xb6\x07\
-\xba\x13\xb3KD\xd7G\xb1\x04G\x17\xd9D\x9a^\x85\
-{\x07\x84q%\xba\x00`\xddt'\xe7c\xc2\xe6>\
-~\x8de\xb0=0\xb9\x8b\xd3\xde.!\xb4\xb6\xad\x8d\
-\x09\xed~\x19R\xd8,h\x0d\x8d\x0f\x13i\x00\xf0\x89\
-\x08\x97\xf3\xb0\xab?{\xb7\x07\xfa\x07\xf7\xb6(\xfe\x97\
-\xbf\x84o\xf7\x93\x92\xf9kkZc\xb0\xbfB\xfb \
-\x00|\x84\xc0\xf8>c\x873\xfc,\xaf`\xb3k\x93\
-\xc1zL\xc9\xed\x81\xc2\x95\xb8\xf5\xba\xcec\xc4Bv\
-\xcf\x11\xd0\x99}\xcf\xbac3F2\x1f\x80\x82\x09\xcf\
-\xdfZj\x0d\x0e\x1dR\xc2\x05=bU\xc9\xed\x81\xcd\
-F\xcf\x0b\xc4@nT\x15\x97\xae\xe8\xbb\xc2\x8f\xdb\x13\
-\xf3\x15dB\x00\x85\xe1\x8aO\xdd.\x9cRG2\xcc\
-\xbd\x96\xee\x81G\x15\xf7\xeb\xdf\x11y\x94\xb9\xcf\xbd\xe5\
-5\x0d\xefw\xfa\xfa\xef%#\x02(\x00o\xff\xdc0\
-\xbd\xfc\xb4\x07\xe6\x12\x93OY\xb7\xfbI\xc1\x0b\x1d\x03\
-=c3dH\x00\x19\xd2=\xb1h\xe8pF\x9e.\
-(($\xe1\x89\xf5\xf6\xc0>\xf9\xb7\x07Z{\xc6\x16\
-\x0aU\xc5+\xcc\xb987\x0aj;]/\xda\xa2\x93\
-\x162&\x80\x0c\xf0//\xab\xac\x81\xa1\xef\x17\x97U\
-\x90tEnYe\xed9\xff\xe0\xee\xa0\x5cc\xb1+\
-4\x19\xe0v?\xf1[TR\xbe\xd2\xee\x8c}_\xb8\
-\x93\x81\x0c\x0a Q\xdc\x89\xd9}\xf5\xcd\x86wIj\
-\xb4\x07\xe6\x1a[|\xbb\xa6\xaa^\xfb\x1es,\x1d\x85\
-\xf6LKp\xe4 \x99\x14@B\x08m}\x86\xae\xd0\
-\xf3|g\x95l{\xe0_\xe5\xd4\x1e(\xfc\x92lh\
-5\xbf\xc6\xdcJ\xf46K\x83\xfd\x15[(\xe5\x22\xb3\
-\x02\x88\x18\xa1hX\x02\xc9\xc3E\xc5\xa5\xbc\xee\x97\xb8\
-mV\xffo\xe4\x12\x97\xb4\xfb\xc9c\x8fJ\xab5\xf0\
-\x14m\x83\x00\x22\xc4\xd5;ssmc\x0bm}r\
-j\x0f\x5c{\x98\x93z\x5c\x1a\x1c\xd1\xc3\xcc\xa5|\xac\
-\xa8ix\xdf\xdc=\xfcy2.\x80Hp\xc4Rw\
-\x92\x9c\xe4\xd9\x1e\xe8\x8cN\xde%\xd5\xb84\xf9\x93w\
-\xf1\x19J\x9e\xae\xcd\xed\x9dd^\x001<\x00\xc4'\
-\xef )\xc9\xd3\xc2\xa2bI\xb6\x07\xd2\xee'\xf3\x07\
-\x00_\xf2\x0e2/\x80\x08p\xf7\xce\xee%)\xc9\xfc\
-\xf6@\x09\xb5\x07r\xbb\x9f\x02>O\x05G\xf6\x92y\
-\x01D\x80p}/II\xde\x0a\xc76K\xa1=\x90\
-v?e\xb8\xf6\x90\x17#\xf3\x02\x88\x00\xff\xc8\x1e\x0d\
-I\x89\xdb\x03sM\x22\x91(\xa4\xddO!\x0f\x00k\
-\x0fzd^\x00\x91\xc0U\xbe\x8a\xb9=\xf0E\xb1\xc6\
- \xed~\xcap\xdb\xc5\xe3\xc4\x01@,\x08\xc7\xc8\x92\
-\x9c\x94\xa150\xf8\x88\xd8\xe2\xaf\xdd\x15;\xc4\xdc(\
-\xc3K\xc79\x03\x80X\xe0\x0c\x00\x85\xdd\x1e\x18K\xdd\
--\x96\xd83\xf9\x07\xef\x10.\x92an\x94sD0\
-\x19\x17@D4\xb6\x9a\xdf$9)GUQ\xc9\x8a\
-;1\xb7+\xd7qg\x8b\x8cO\x15\xae\xfdY\x98\x13\
-\xe5X\xa7m\x7f\x93\x8c\x0b \x22tF\xd7\xab$'\
-n\x0f\xcc&\xce\xd8\x8c\x9bv?\xe5\xd9\xd8f}\x95\
-\x8c\x0b \x22\x0c\xf6\xe0\xafHN\xca\xb3V\xd3\xfa\x9e\
-\xd9\x9fx\xac\xd3\x1d\xff\xb9\xa1\xab\xe7\x97mV\xff\xcb\
-\xcdF\xe7\x11\x8d\xder\x5c\xb8\x09\xb2Z\xad}\xbf\xb2\
-\xb6\xf1\xcc\x07\x0a\xd7B\x0b\xd7\xbd\x0a\x0a\x1bG\x85_\
-\xef\xaa\xe2\xd2\x0b\x0a\xff\xad\xac\xaa\xfe\xcc\x07V\xd46\
-\xbe_\xd3\xd8\xf2n}s\xc7\xf1\xb5\xa4\x7fD\xdb\xe1\
-|Yg\xf4\xfc\xb2\xd5\x16\xf8\xb9\xde\x1ez\x8cv?\
-e\xaa\xedt\xfd\x9a\x8c\x0b \x22\x8c\x9e\xf8OIN\
-\x88\x98i\x85K\x81\xc8\xb8\x00\x22\xc2z\xf1\xe2\x18\x12\
-\x14\x22f\xd4vg\xf4\x112.\x80\x88\xb0\x87G\x1f\
- 9!b\xa6\xed\xf4$\x1e \xe3\x02\x88\x08W|\
-\xea\x0b$'D\xcc\xb4&_\xf2\x0bd\x5c\x00\x11\xe1\
-\xee\x9b]$9!b\xa6\xb5\x04G\x17\xc9\xb8\x00\x22\
-\xc2\x9f\xdc\x15\x229!b\xc6\x1f\x00z&Bd\x5c\
-\x00\x11\x11\x1f[j 9!b\xa65'Rj2\
-.\x80\xc8\xe0B D\xcc\xa4\x05\x85*.\x02\x02\x10\
-#\xe5Uu\x9c\xca\x86\x88\x19\xf3\xd2\xc9\x8f\x00 6\
-\x84S\xe1HR\x88\x98)/\x9d\xfe\x08\x00bC\xd3\
-f9N\x92B\xc4L)\x1c\x0bM\xa6\x05\x10!-\
-&\xf7\x9fHR\x88\x98)\x1b\xf5\xb6?\x92i\x01D\
-\x88\xa1\xab\xe7\x05\x92\x14\x22f\xcaf\xa3\xe7\x052-\
-\x80\x081\xbacO\x91\xa4\x101S\xb6\xd9\x82?!\
-\xd3\x02\x88\x10k \xf90I\x0a\x113\xa5\xc1\x19}\
-\x98L\x0b B\xec\xe1\xd1\xfbIR\x88\x98);<\
-\x89\xfb\xc9\xb4\x00\x22\xc4\x15\x9f\xba\x9d$\x85\x88\x99\xd2\
-\x18\x18\xbc\x9dL\x0b B\xdc\x89\xb9]$)D\xcc\
-\x94\xd6\x9e\x91]dZ\x00\x11\xe2\x1f\xdc\x1d$I!\
-b\xa6\xec\x0aM\x06\xc8\xb4\x00\x22\xc43\xbd\xbf\x86$\
-\x85\x88\x99\xd2\x19[\xac%\xd3\x02\x88\x94\xc2\xa2b\x12\
-\x15\x22\xa6\xff\x22\xa0\x8b\x97\x8d\x01\x80X)\xaf\xae?\
-K\xb2B\xc4t[ZQs\x96\x0c\x0b b\xea\x9a\
-\xdaN\x92\xac\x101\xddV\xa9u'\xc9\xb0\x00\x22F\
-\xa3\xb7\xbcA\xb2B\xc4t[\xdf\xdc\xf9\x06\x19\x16@\
-\xc4\xb4\x98<\x7f Y!b\xba\xd5\xe8\xed\x7f \xc3\
-\x02\x88\x18CW\xe8y\x92\x15\x22\xa6[\x9d\xd1\xf3K\
-2,\x80\x881z{\x7fB\xb2B\xc4t\xdbf\xef\
-\xf91\x19\x16@\xc4X\x03\xc9\xef\x91\xac\x101\xdd\xb6\
-;\xa3\xdf#\xc3\x02\x88\x98\xae\xc8\xf8}$+DL\
-\xb7Fo\xe2>2,\x80\x88q\xf5M\xdfF\xb2B\
-\xc4tk\x0e\x0c}\x8e\x0c\x0b b|\xc9\x1d\xf3$\
-+DL\xb7\xd6\x9e\xb1\x1ddX\x001?\x00\x0c\xee\
-\xf4\x91\xac\x101\xdd\xdaB\xe3^2,\x80\x88\x89N\
-\xddPI\xb2B\xc4tk\x89NU\x92a\x01D\x8e\
-\xaa\xa8d\x85\x84\x85\x88\xe9\xb2PU\xbcBf\x05\x90\
-\x00\x155j.\x04B\xc4\xb4YVY\xc7E@\x00\
-R\xa0\xaeI\xff.I\x0b\x11\xd3eu\x83\xee]2\
-+\x80\x04h2X\xffJ\xd2B\xc4tY\xaf\xeb<\
-Ff\x05\x90\x00\xadf\xef\xefIZ\x88\x98.5\x06\
-\xfb+dV\x00\x09\xd0\xee\x08=G\xd2B\xc4t\xa9\
-3y\x7fAf\x05\x90\x00&o\xef\x8fIZ\x88\x98\
-.\xdb\xec\xa1'\xc9\xac\x00\x12\xc0\x1a\x1cz\x88\xa4\x85\
-\x88\xe9\xb2\xdd\x15{\x88\xcc\x0a \x01\x1c\x91\xf1{I\
-Z\x88\x98.;=\x89\xaf\x92Y\x01$\x80\xa7o\xe6\
-\xb3$-DL\x97\xe6\xc0\xe0g\xc8\xac\x00\x12\xc0\xdb\
-?\xbb\x9d\xa4\x85\x88\xe9\xd2\xd236Cf\x05\x90\x00\
-=\xc3\x8bn\x92\x16\x22\xa6K[(\xe5\x22\xb3\x02H\
-\x80\xf0\xfc\xad\xa5$-DL\x97\xf6\xc4|\x05\x99\x15\
-@\x22\x14\x15\x97r!\x10\x22n\xfd\x22\xa0\x8b\x97\x8b\
-\x01\x80T\xa8\xacm<C\xf2B\xc4\xadZVU\x7f\
-\x86\x8c\x0a !\xea\x9b\x0d\x5c\x08\x84\x88i\xb8\x08\xa8\
-\xe5\x1d2*\x80\x84\xd0\xb6\xdb\x8f\x91\xbc\x10q\xab\xaa\
-u\xc6\xd7\xc9\xa8\x00\x12!\x91\x98\xaf\xa8on\x7f\x87\
-\xe4\x85\x88[\xb5\xa6\xb1\xf5\x1d6\x01\x02H\x00\xff\xc8\
-\x1e\x0d\xd7\x01#b:\xadk2\xbc\xe5\xe8\x9d\xd6\x91\
-a\x01DJp\xe4\xba\xae\xba\xa6\xb6\x93$,DL\
-\xb7\x95uM\xa7l\xd1I\x1f\x99\x16@dx\x06v\
-\xf6U\xd5i\xd8\xf9\x8f\x88\x99\xeb\x08\xa8\xac;k\x0d\
-\x8d\x0f\x93q\x01D\x82\xbbwvoIy\xd5y\x12\
-\x14\x22f\xda\xa2\x92\xf2\x15K`\xe4\x00\x99\x17 \xc7\
-\xb8z\xa7?\xaf\xbaxP\x07\xc9\x09\x11\xb3s8\x90\
-\xaax\xc5\x1c\x18\xba\x8d\x0c\x0c\x90#\x9c\xb1\xa9;\x0a\
-TE$$D\xcc\xba\xdb\x0a\x0aW\x8d\xfe\x81\xbb\xc9\
-\xc4\x00\xd9.\xfe\xd1\xc9\xbb\x0a\xd6\x16 \x89\x08\x11s\
-\xf9\x10\xd0\xe9\xed\xbf\x87\x8c\x0c\x90%\x1c\x91\x89\x7f\xdb\
-\xb6\xad\x80\x04\x84\x8897??\x7f\xb5\xd3\x9d\xf8:\
-\x99\x19 \xc3\xd8\xc3\xa3\x0fP\xfc\x11Ql\x0f\x01\xed\
-\xee\xf87\xc9\xd0\x00\x19\xc2\x16\x1c\xfa\xae\xb0\xd0H8\
-\x88(\xca\x87\x00W\xefw\xc8\xd4\x00\xe9\xfe\xe5\x1f\x1a\
-\xfd\x06\xc5\x1f\x11\xc5.\x0f\x01\x00i\xc4\x11\x1e\xff*\
-\xaf\xfd\x11Q*o\x02:=\x89\x07\xc8\xdc\x00[-\
-\xfe\x91\x89/S\xfc\x11Qj\x0f\x01Fo\xe2>2\
-8\xc0&q\xf5N}\x91V?D\x94\xa2\x17\xce\x09\
-\xf0\x0d\xfc+\x99\x1c`\xa3\xc5?>u;\x87\xfc \
-\xa2\xd4\x1f\x02L\xbe\xe4\x1ddtX\x17\xfe\xc1\xdd\xc1\
-\x9e\xa1\xdd\x9dJ\x1e\x03O\xdf\xecRaQ1\x09\x04\
-\x11eql\xb0%8\xb2W\xc99\xdd\xd6\x9b\xea\xb4\
-GSA*\xfcU\xf0\xf5\xcf\xcd|\xf8{\xb7\xf0\x0b\
-\xb8\xb2\xb6\xf1\x8cZ\xd7qB\xdbn?\xdaj\xf6\xbc\
-b\xe8\x0a=ot\xc7\x9e\xb2\x04\x92\x87\x1d\x91\xf1{\
-]}3\x07}\x03\xf3S\xfe\xa1\x05\xaf\x7fyY%\
-\xf9\x07\xa0\xa1\x9d\x09.\xf6AD9YTZ~\xde\
-\x1aI\x8d\xc8\xa1N9c\x8b\xb5\xb6\xd0\xb8\xd7\x16\x19\
-\x9f2\x06\x06oow\xc7\x1f48\xa2\x87[\xad\x81\
-\xa7t&\xef\xf3\x1a\x83\xfd\x15u\x8b\xe9h\x95Zw\
-R\xc8\xe5\xf9\x97j\x9a\xb0/\xc2\xda3\xb2\x8bJ\x7f\
-%VW\xf3\x1bZ\x8c\x7f\xdbj\xa0]\xed\xa1\xc1\x1a\
-\x1c:$\x1c\xa1\xfb\xe1\x87\x86D\x22Q(\x96!\x08\
-\x8c\xec\xb6p\xa5/\x22\xca\xd1\xb2\xaa\xfa3\xb6P\xca\
-%\xd6bn\x09\x8e\x1c\xec\xf4\xf5\xdf{\xb5b\xbem\
-\x8b{\xb2j\x1a\xdbN\x08\xcf\x02\x14\xfc\xcb\xb0\xf7\x8c\
-<\x98\xb3\xa7\xd3\x92\xf2\x95ju\xf3\xe9\xcb\x1f\x1a\xcc\
-\xfe\xfe\xc7\x85?\xd7\xe5\x0f\x0d\xc2\xc3J\xba\xff\xfe\xd1\
-\xc1\x85\xa6\xba\xa6\xb6\x93$\x0aD\x94\xab\x95\xf5\xdaS\
-\xf6h\xaa%\x1b\xc5\xdc\xe4O\xde\xd5\xee\x8a\x1d\xba\xbc\
-\x98\x0bEXx\x18\xd9\x96\xa3\x0d\xd6\x1c\x9b|\x85\xe2\
-WZQ#\x99\xd7\xde\xc2\xce|\xe1\xcf\xbb\xa1\x87\x86\
-\xab\x10\x9e\xbf\xb5T\xa3\xb7\xbeA\x82@D\xb9[\xd7\
-dx\xcb\x12\x9d\xaaLW1\xaf\xac\xd5\x9c.\x94\xd0\
-\x95\xe8\xc5e\x95\xe73\xf5\x10$I\xda\x1d\xa1\xe7\xe4\
-\x1e\xf4\xc2\xa7\x89\xf2\xaa\xbas\xb5\x9a\xd6\xf74m\x96\
-\xe3-&\xf7\x1f\x0d]=/\x18\xbd\xbd?\x11\x1e \
-H\x0c\x88\xa8\x14\x85\xe2\xddf\x0b\xfe\xa4\xd9\xe8y\xa1\
-Qo\xfbc}s\xc7\xf1\xaaz\xed{k?\xac\xce\
-\x15\x14\xaad\xff\xf7_{\x88y\x8e\xca/l\xfc[\
-\xfb\x85\xccA7\x88\x88\xa8\x14\x85\x8d\x81\xd6\x9e\xb1\x1d\
-\x8a\x7f\x00hh5\xbdE@ \x22\xa2\x92\xac\xd5\xe8\
-\xdfV\xf4\x86\xc0\xae\xf0\xe8\xfd\x04\x02\x22\x22*\xd1N\
-o\xdf\xfd\x8a,\xfe\xb1\x89\xc5\xda\xf2\xea\xfa\xb3\x04\x01\
-\x22\x22*\xd1\x92\xf2\xeas\xde\xf8|\x83\xe2\x1e\x00:\
-\xdd\xb1\x9f\x11\x00\x88\x88\xa8d\x85\xce\x06E\x15\x7f\xff\
-\xd0\xce\x00G\xdd\x22\x22\xa2\xd2\x15\xba\x1e\xba\x22Sa\
-\xc5<\x00\xb4\x98\xdc\x7fb\xe2\x11\x11\x11\xf3V5\x06\
-\xfb\x1f\x14Q\xfc\xdd}3\x07\x98pDD\xc4\x7f(\
-\x1cx$\xeb\xe2/\x9c\xbb_\xdflx\x97\xc9FD\
-D\xfc\x87\xc2}\x03b\xba\x9b&\xed\xd8{\x86\xbf\xc9\
-D#\x22\x22^\xa1-P\xae\xf7\x04\xf8G\xf6h\xca\
-*k\xcf1\xc9\x88\x88\x88\x0aj\x0b\x14\xce\xbcg\x82\
-\x11\x11\x11?\xd96[\xcf\x8feU\xfc=\x03\xf3\xe6\
-\xa2\xe2\xd2\x15&\x17\x11\x11\xf1\x93\x15n6t\xc7f\
-\x8c\xb2y\x00hw\x86\x9feb\x11\x11\x11\xaf\xad\xce\
-\xe2{Z\x1e\xdf\xfe\x87\x16\xbc\x1c\xfa\x83\x88\x88\xb8>\
-/\x1c\x0e\x14\x9a\x0cH\xfe\x01@o\xeb~\x91\x09E\
-DD\x5c\xbf\xdaN\xd7\xaf%]\xfc\xbd\x03\xf3\xc9m\
-\xdb\x0a\x98LDD\xc4\x0d\x98\xbfV;m\x91\x89\x84\
-d\x1f\x00ZL\x9e?0\x91\x88\x88\x88\x1bW\xd3\xde\
-\xf5{I\x16\x7fw\xff\xdc\x8e\xfc\xfc|&\x11\x11\x11\
-q3o\x01\xd6j\xa8\xa5glFr\x0f\x00\xda\x8e\
-\xae\xd7\x98@DD\xc4\xcd\xdb\xd0j\xfe\x8b\xb4~\xfd\
-'\xe6v1q\x88\x88\x88[\xd7\xda3\xb6C2\x0f\
-\x00:\xa3\xeb\x08\x93\x86\x88\x88\x98\x86\xbd\x00\x06\xdb\x9f\
-$Q\xfc\xbb\x93\xf3#|\xfbGDDL\xdf^\x00\
-kh|X\xf4\x0f\x00\xadf\xef\xef\x980DD\xc4\
-4\x9e\x0b\xd0\xe1|Y\xec\xbf\xfec\xf4\xfd#\x22\x22\
-\xa6\xff\x5c\x00K\xcfDH\xb4\x0f\x00z{\xe0\xd7L\
-\x14\x22\x22b\xfam6z^\x10e\xf1\xef\x19^t\
-\x17\xa8\x8a\x98$DD\xc4\x0c(\xdc\x11`\x0b\xa5\x5c\
-\xa2{\x00\xe0\xc6?DD\xc4\xcc*\xba\x9b\x02\x83C\
-\xd7\xe9UE%+L\x0e\x22\x22b\xe6,T\x15\xaf\
-\xd8\xa3\xa9\x16\xd1<\x00\x98\xfd\xfd?db\x10\x11\x11\
-3\xaf\xde\x11\xfe\x81(\x8a\xbf\x7fyYUQ\xa3>\
-\xcb\xa4 \x22\x22f\xde\xd2\x8a\x9a\xb3~\xff\xb2*\xe7\
-\x0f\x00\x8e\xc8\xf8=L\x08\x22\x22b\xf64\xfa\x07\xbe\
-\x92\xf3\x07\x80\x86\x96\xce\xb7\x99\x0cDD\xc4\xecY\xdb\
-d\xf8[N\x8b\xbfo`n\x81\x89@DD\xcc\xbe\
-\x96\xe0\xc8\xde\x9c=\x00p\xec/\x22\x22bn\xd4\xb4\
-w\xfd.'\xc5\xdf;\xb0`\xe7\xe0\x1fDD\xc4\xdc\
-\xb8\xad\xa007\x07\x03\x19=\xf1\x9f2\x01\x88\x88\x88\
-\xb9\xb3\xd5\x1ax*\xab\xc5?\x91\xd8_RVY{\
-\x8e\xc1GDD\xcc\x9d%\xe5\xd5\xe7\x0ck59k\
-\x0f\x00\x8eX\xean\x06\x1e\x11\x11Q\x04-\x81\xde\xfe\
-/e\xed\x01@\xdbn?\xca\xa0#\x22\x22\xe6\xde\x86\
-V\xf3kY)\xfe\xbe\xc1\x9d\xbe\xfc\xfc|\x06\x1d\x11\
-\x11Q\x04\xe6o+X\xb5E'}\x19\x7f\x000y\
-\xfb~\xcc\x80#\x22\x22\x8a\xc76{\xe8\xc9\xccV\xff\
-\xd5\xd5\xfc\xca\xda\xc63\x0c6\x22\x22\xa2x,\xab\xac\
-;\x9bH$\x0a3V\xff]\xf1\xa9/0\xd0\x88\x88\
-\x88\xe2\xd3\x1c\x18\xba-c\x0f\x00:\xa3\xeb\x08\x83\x8c\
-\x88\x88(>\x1b\xdb\xac\xaff\xa4\xf8\x07Fv[\x0a\
-\x0a\x0a\x19dDDD\x11*\x9c\x0ch\x8fO\x9b\xd3\
-\xfe\x00`\x0d\x0c>\xc2\x00#\x22\x22\x8a\xd7vg\xec\
-\xfbi\x7f\x00\xa8\xd7\x1aN0\xb8\x88\xe2\xb4\xb0P\xb5\
-Z\xdf\xa4;c\xb0\xba\x8fw\x05z_\xea\x1eH=\
-\x19\x1e\x9d\xfbV\xdf\xd4\xe2\xdd\xc9\xb9\xeb\x0f\x0e/.\
-O\x8c.\xdch\x9fX\xfa\x8cax\xe1\xa0\xee\xf2\xf5\
-\xdd;}\xbd.9\xbbd\x88O\xee\xb5\xc7\xa7\xf6N\
-\x84Fw\x1d\x0c\x0c\xce\xde\xed\xebK}\xdb\x11\x1e\xfc\
-\xb1\xd1\x1dz\xa9\xb9\xc3\xf6f\xb5Zsf[A\x01\
-c\x8e(Rk\x1a\xdbN\xa4\xb5\xf8\xfb\x87\x17\xe2\x0c\
-,\xa28\xac\xaaU\x9f\xeb\xe8\xf2\x1d\xf5\xf6\x8e\xfcg\
-,\xb5p\xdf\xf0\xc2\x81\xf1\xe5\xe5\x07UyY\x22\xb1\
-\x7f\x7f\x89\xf0\x90\xd0=0s\x9f=\xd8\xff\x9fmf\
-\xe7\xd1\xf2\xaa\xda\xf3\xcc\x0d\xa28\xb4\x85\xc6ci[\
-\xf0&o\xe2I\x06\x151G\x1b{Z\x0c\xa7\x1c\xa1\
-\xc4\xafb\xa9]_\x1b\xde} \x96'Rz'\xf7\
-\xc7\xfd\xfdS_7y\xc2\xbf\xaeoj=\xc5\xdc!\
-\xe6\xeaL\x80\xf0\x13i[\xd85\x0d:\x163b\x96\
-,*.]\x15~\xe1\x87Ff\x0f\x8d\xee=\x18\xcc\
-\x93(\xc2\xe7\x04__\xeaA\x83\xcd{\xa4\xa4\xacb\
-\x85\xb9E\xcc\x8e\x95\xf5\xdaSiY\xc4\xbe\xe4\x8ey\
-\x06\x141\xb3\x96\x96W\xaeX}\x91W\xfa\xa6\xf7\xdc\
-5?\x7f\xb0\x22Of,//\xab\x84}\x05\x16_\
-\xec\xf9\xd2\x8a*>\x17 fXK\xcf\xd8\xcc\x96\x17\
-n\xa7+\xfa\xdf\x0c&b&Zv\x0aVM\xae\xc0\
-\x9f\x85\xa2?u\xc3\xed\x95y\x0aa\xea\x86\x1b*\x85\
-\x0d\x86z\xab\xe7/l(D\xcc\x8c\xad\xd6\xee\xff\xdc\
-\xdaJ]]\xcd\xaf\xa8Q\x9fe0\x11\xd3\xa7\xb0[\
-?0\x90zbd\xcf\xa7]y\x0a'\xbe}\xc9\xe5\
-\x8c\x0c=!t\x17\x10\x1b\x88i|\xabXQ\xb3V\
-\xbbW\xf37\xbd8=}\xb372\x90\x88\xe9Qo\
-q\xbc\xd97}\xdd\x9d\xab\xab[X\x942E\x18\x93\
-\xe0\xd0\x8e;\x9b\xdb\xado\x11+\x88\xe9\xd1\x1c\x1c\xf9\
-\xd4\xa6\x17e\xbb#\xf4\x1c\x83\x88\xb8\xb5\xd7\xfc6_\
-\xe4\xf7C\x0b\x07\x16(\xf3\xeb#<\xbe\xb0\xd8n\xf7\
-\xff\x91\xcf\x03\x88[\xb3\xc5\xe4{v\xd3\x0b\x91\x9b\xff\
-\x107g~\xfe\xb6U\xb3;xdp\xe7?\x0fS\
-\xd27Gljo\xcc\xe4\x09\xbf(\x8c%1\x85\xb8\
-q\xcb\xaa\xea\xcflj\xf1\xb1\xfb\x1fq\x93\xaf\xdd\xd6\
-\x0a\xbfp\xf2\x1e%<M\x0f\x02\x93{\xa7\xf4V\xcf\
-\x9f\x89-\xc4M\x1c\x0a\x14\x1e\xdd\xbe\xe1Eg\xf4\xf6\
-\xfe\x84\xc1C\x5c\xbfZ\xbd\xf1\xa4p\xec.%;3\
-D\xc6\x16\xf6iZ;9\x92\x1cq#\x87\x02\xd9z\
-~\xbc\xe1\xc5V\xabi}\x8f\xc1C\xbc\xb6\xc2\xd1\xbc\
-\x91\xb1\xf9\x07\xd9\xdc\x97y\x12\x89;\x0b}\x89\xc9o\
-r\xf40\xe2\xfa\xacn\xd0\xbd\xbb\xa1E\xe6O\xee\x0a\
-1p\x88\xd7\xd6\x11\xec}\xf1J\x97\xeb@f\x11.\
-/\x12\x0e\x15b\x7f\x00\xe2\xb5\xb5GS\xeb?Q\xd4\
-\x1aH\x1ef\xd0\x10\xaf\xde\xcb\xdf?{\xfdg)\xc5\
-9\xff,pc\x9dF\xf7>1\x89\xf8\xc9n\xe8\x8a\
-\xe0\xc6V\xd3\x9b\x0c\x1a\xe2\x95w\xf7{b\xc3\xff\xa5\
-\xa4\x93\xfbD\xffY`z\x7f\x8d\xb5\xbb\xf7i\xde\x06\
- ~\xc2\x0f\x96\xe6\x8e\xe3\xebZL\xc1\xa1\xeb\xf4\xdb\
-\xb6\xd1\x7f\x8b\xf8\xb1oi\xf5\x8dg\xfb\xe7\xf6\xdfB\
-\xc9\x15'\xe1\xb1]\x07\xaa\xea\x1a9\xb9\x14\xf1\xf2\x1f\
-.k5\xdd\x19\x9b5\x5cs\x119\x22\x13\xff\xc6\x80\
-!~T\x8b7\xf4\xa7\xa1\xeb\xfe\x9f\x9e2+n\x92\
-\xb3K\x06\xe1\xf6Ab\x16\xf1\xa3v\xfa\xfa\xef\xbd\xe6\
-\x02j\xb3v\xbf\xcc`!^\xb4\xb0P\xb5\x1a\x1a\x99\
-\xfd>\xa5UZ\xb8\xe3c\x879I\x10\xf1Cm\xca\
-\x1d\xce\x97\xae\xb9p\xca\xab\xeby\x85\x86x\xa9\xbd\xaf\
-\x7f\xf6\xfaOQN\xa5\x89\xb0A\x90vA\xc4\x8b^\
-\xbc\x1c\xe8*\xf8\x92\xf3\xe3\x0c\x14b\xdejK\xa7\xf5\
-\x04\xb7\xf5I\x9f\xfe\x99\x03nM\x9b\xf1\x1db\x1a1\
-o\xd5\x1a\x1a\xff\xe4\xa3\xc9\xad\x81\xc1G\x18$T\xba\
-&W\xe0\xcf\x137\xfdK-\xe5S\x1eL\xddpC\
-\xa5p\xb9\x10\xb1\x8dJ\xd7\xe0\x8c>\xfc\x89\x0b\xa5\xa9\
-\xdd~\x94AB%\xeb\x0a\x0f</\x9c6G\xd9\x94\
-\x17\xc2)\x8d\xf6\xe0\xc0S\xc48*Yu\x8b\xf1\xe8\
-\x15\x17H\x22\xb1\xbf\xa4\xa8\xb8t\x85AB%*\xf4\
-\x90\x87\x86\xb7\x7f\x8fR)o\xdc\xb1\xd1\x87\x89wT\
-\xaa\x85\xaa\xe2\x95px\xbe\xf4c\x0b\xc3\xd5;s3\
-\x03\x84J-\xfe\x91\xb1\x1d\xdf\xa4<*\x03\x7f\xff\xd4\
-\x03t\x08\xa0R\xb5\x04F?\xfd\xb1E\xd1\xe9\x8e\xff\
-\x9c\xc1A\xa5)\x14\x82xj\xe1\xab\x94Ee\xd1=\
-0s\x1f\x0f\x01\xa8D[\xad\xdd?\xfb\xd8\x82\xa8\xd7\
-\x1a\xb8f\x13\x95W\xfc'w\x7f\x89r\xa8L\x02\x83\
-\xb3w\xf3\x10\x80J\xb3\xa6\xb1\xf5\x9d\x8f\xbe\x12\x1b\xd9\
-\xa3\xe1\xf8_T\xdak\xffXj\xd7\xfd\x94A\x85\xbf\
-\x09H\xce\xdc\xc3C\x00**\xf7\xad\xd5zKt\xaa\
-\xe9\xef\x8b\xc0\x19\x9b\xba\x83\x81A%\x19\x1e\x9b\xfb\x0e\
-\xe5\x0f\x04|\x89\xc9op\x91\x10*I\x93/y\xc7\
-\xdf\x17@\x873\xf24\x83\x82J\x91\xa3}\xe1r\xdc\
-\xb11\xae@G\xc5\xa8\xb3\xf8\x9e\xfe{\xf0\xd75\xe9\
-\xdfePP\x09zbC\xcfP\xee\xe0JX\xfc\xf1\
-\xe7X#\xa8\x8c}\x00-\xef^\x08\xfa\xe8\xe0B\x13\
-\xdf\xffQ\x11\xaf\xbd\xdc\xc1#\x1c\xf2\x03\x9f\x84\x10\x1b\
-z\xab\xe7/\xac\x15\x94\xfd>\x80\xfc\xfcUW\xef\xa4\
->\x8f\xc1@E\xbc\xf2\xea\xb0\xbe\xc3\xf1\xbep\xcd\x87\
-\x80\xdd\xcb\xea\xc6\x96\x0e\xde\x88\xa2Rd\x10P\xdeV\
-T\xd7\x9e\x1f]\xbc\xd1Gy\x83\xf5 \x5c \xc4-\
-\x82\xc8\x03\x00\xa2\x0cz\xfd\x07f\xf7\xddLY\x83\x8d\
- \x5c%L{ \xf2\x00\x80(\xe5\x1d\xff\xc3\xdb\x1f\
-\xa1\x9c\xc1fpEG~\xc0\x1aBY\xeb_^V\
-\x19\xbaz^`0Pn\x0a\x9b\xfe(c\xb0\x15\xd8\
-\x14\x88rT\xdb\xe1\xfc\x8d!\xb1\xbf\xe4\xef\x81n\x0d\
-\x0e\x1d\xa2\x1b\x00\xe5bU\xad\xfa\xdc\xf8\xbeO\x1b)\
-a\xb0\x15\xe2\xd3Kf\xf6\x03\xa0\x5c\x14v\xff\xeb\xbb\
-\xc2\x8f_1\xd8\x1d\xf1\xc9;\xb8\x12\x18\xa5\x1f\xe4\xdb\
-V\xfbg\xaf\xff,\xe5\x0b\xd2A\xcf\xc8\xfc\xe7YW\
-(u\x0bTE\xabF\xff\xc0\xddW\x0dvw\xff\xdc\
-\x8e\xf2\xaa\xbas\x0c\x18JU\x0e\xfb\x81tc\xf1\xc5\
-~\xc1\xdaB\xa9ZR^u\xde\x16\x1c\xdd\xb3\xae`\
-\xf7\x0f-x\xeb\x9a\xdaN2p(5\xeb\xb5-\xef\
-\xd3\xef\x0f\xe9fb\xf1\xa6\xda\x9a\x06\xed\x19\xd6\x18J\
-\xcd\xca\xba\xa6S\x96\x9e\x89\xd0\x86\x02^\xb8!\xb0\xa9\
-\xdd~\x94\x01D)\xd9\xbf}\xdf\xe7(W\x90\xa1O\
-\x01\x9fa\x8d\xa1\xa4~\x105w\xbe\xe1\xe8\x9d\xd6m\
-*\xe0/v\x08\x84\x9eg Q\x0av\x05\xfb^\xa4\
-LA&\xe9t\x06\x7f\xcbZC)\xa8\xedt\xbd\xf8\
-\x91\x9d\xfe\x9b\xc5\x1aH\x1e\x16v\x0f2\xa8(V\x85\
-\xd3\xfeR{oi\xa1DA&I\xce.\x19J+\
-\xaa\xe8\x0a@Q\xef\xf478#\x87\xd3\x1a\xf8\xae\xde\
-\xa9/\xd2!\x80b52\xb6\xe3\xdb\x94'\xc8\x06\x9e\
-\xf8\xf8C\xac9\x14\xa3\x17v\xfa{\xfb\xbf\x94\x91\xc0\
-\xf7\xf6\xcfn/\xaf\xae?\xcb@\xa3\x98lj\xebx\
-\x8f[\xfe [,//\xab\xd4\xda\xb6S\xac=\x14\
-\x93%\xe5\xd5\xe7\xd6\xbd\xd3\x7f\xb3\xd0!\x80b\x93\xb3\
-\xfe!\xdb\x84Fw}\x96\xb5\x87b\xb1\xb2^\xbb\xf1\
-\x9d\xfe\x9b%>\xb6\xd4\xa0\xed\xe8z\x8d\x81\xc7\x5ck\
-tv\xbfF9\x82\x5c\xd0jr\xbc\xce\x1a\xc4\x5c\xbb\
-\xa5\x9d\xfe\x9b~\x13@\x87\x00\x8a\xc0\xe4\xfc\xd2.J\
-\x11\xe4\x82\xf0\xf8\xc2\x22k\x10s\xa9\xce\xe4}\xde\xef\
-_V\xe5l\x11p\x87\x00\xe6J\xb3\xa7\xe7U\xca\x10\
-\xe4\x12.\x0b\xc2\x5c\x98\x91\x9d\xfe\x9b\xc5\x15\x9f\xfa\x02\
-\x1d\x02\x98\xdd\x05\xb0muxqy\x82\x12\x04\xb9$\
-\x92\xda=#\xc4\x22k\x12\xb3e\xa1\xaax\xc5\xe4O\
-\xde%\xaa\x85@\x87\x00f\xf5\xd7?W\xfd\x02o\x01\
-P\x81;\xfd-\xc1\xd1EQ.\x84\x9e\xe1Ew]\
-\x93\xfe]&\x0a3\xed\xc0\x8e\xeb\x0fPz@\x0c\x84\
-Fw\x1ddMb\xa6\x15v\xfa\xdb\xa3\xa9\xa0\xa8\x17\
-\x83\xd0!\xd0L\x87\x00f\xd0V\x93\xfdm\xca\x0e\x88\
-\x09Mk\xe7\x09\xd6&f\xcaz\x9d\xf1\xafY\xdf\xe9\
-\xbfY\x84\x0e\x81vG\xe89&\x0e3a\xef\xd4\x9e\
-\xafPr@T9/9\xf3U\xd6&fB\x9d\xc9\
-\xfb\x5cNw\xfao\x16[\xcf\xf0w\xe8\x10\xc0tZ\
-]\xdfpny\xf9A\x15%\x07\xc4\x84p:`e\
-\x8d\xfa\x1ck\x14\xd3\xa5\xb0\xd3\xbf\xdd\x19}D\xd2\x0b\
-\x83\x0e\x01L\xa7\xbe\xde\xd1\xa7(7 F\xec\xc1\x81\
-\x9f\xb3F1\x1d\x0a;\xfd\x8d\xbe\x81\x7f\x95\xc5\xc2\xf0\
-\xf5\xcf\xcd\xd0!\x80[\x7f\x22\x16Z\xffn\x0aSj\
-@\x8cD\xa7\xf7\x84h\x09\xc4\xad*\xea\x9d\xfe\x9b\x85\
-\x0e\x01\xdc\xaa\x1dv\xef\xeb\x94\x19\x103-\xc6\xae7\
-X\xab\xb8Y%\xb1\xd3\x7f\xb3\x5c\xec\x10p\xd03\x8b\
-\x9b2\x96Z\xb8\x8f\x12\x03b\xc6\xdf?\xf5\x00k\x15\
-7c\xbd\xae\xf3\x98%:\xd5$\xef\x15\xb2\xba\x9ao\
-t\xc7\x9eb\xc2q#\x16\x15\x97\xae\xce/\xdd\xd2@\
-\x89\x01Q\xff\xc8\xd9\xbeGS\xa8*b\xcd\xe2\x86\xcf\
-\xf4O$\x12\xca\xb9\xd2\xdc\x16\xa4C\x00\xd7\xaf\xc5\x1b\
-\xfa\x13\xe5\x05\xa4\x80\xde\xea\xf93k\x16\xd7\xe3\xc53\
-\xfd\xa3\x0f+r\xa1\xb8z\xa7?O\x87\x00\xaeGz\
-\xffA*t\x0f\xcc\xdc\xc7\x9a\xc5k)\xab\x9d\xfe\x9b\
-\x85\x0e\x01\xbc\x96\xaa\xa2\xe2\xd5\x89\x9b\xfe\xa5\x96\xd2\x02\
-R`l\xfe\x96\x06>\x03`\xde5v\xfa[{\xc6\
-\x16X-k\xf8Gv\xb9\xe8\x10\xc0O\xb2\xa3\xcbw\
-\x8cU\x02RB\xd7i?\xce\xda\xc5\xbcO\xd8\xe9\xdf\
-\x15\x9a\x0c\xb0J>\xfc\x10\x90\xda\xad\xa6C\x00\xafd\
-\xcf\xd0\xcc\xc3\xac\x10\x90\x12\xee\xd8\xe8\xa3\xac]\xbc\xdc\
-\x86V\xcb_\xcc\x89\x94\x9a\x15r%\xe8\x10\xc0+8\
-\xb4\xb0\x9cdq\x80\x94\x88O\xed\x9d`\xedb\x9e\x92\
-w\xfao\x16{\xcf\xf0\xb7\xe9\x10@\xc1\xba\xc6\xe63\
-\xac\x08\x90\x22\x95\xb5j\xf66\xe1\xa53\xfdc\xdfg\
-El\x00W|\xeav:\x04\xd0\xd6\x1d\xfb_V\x03\
-H\x91\xf6\xae\xee?\xb0\x86\xd9\xe9o\xf2'\xefd5\
-l\x02\xdf\xc0\xfcTE\x0dO\xd1J6<\xba\xe3;\
-\xac\x04\x90\x22\x9e\xf8\xf8C\xaca\xa5\xef\xf4\x1f\xd9\xc5\
-J\xd8\xca\x22\x1a\x987\xabu\x1d'\x08(\x85~\xff\
-\xdfy`\x92U\x00R$2\xb1\xb8\x835\xacLk\
-\x1a[\xde\xb5\x85R.VA\x1a\xb8\xd0!\xd0\xe9\xfc\
-?\x02KY\x96\x96W\xae$\x12w\xb2i\x06$\x89\
-\x10\xbb\xc5%e|\xc6T\xdaN\xff6\xcb\xff\xb1\xd3\
-?\xdd\xd0!\xa08\xf5\x16\xc7\x9b\x04>H\x19m\xbb\
-\xe5o\xacev\xfaC\x9a\xb0\x05\x87\xbfE\x87\x802\
-t\x85\x07~A\xc4\x83\x941{\xa3/\xb0\x96\x15\xb0\
-\xd3\x7f\xad&\xb5;\xa3\xdf#\xe2\xb3\xc0\x85\x0e\x81\x92\
-r^\xad\xc9\xdc\xc8\xd8\x8eo\x12\xed e\xbc\x89\xd4\
-wX\xcb\x0a\xd8\xe9\xefc\xa7\x7fV\xb1\x04\x92\x87\x09\
->y;\xb8\xf3\x9f\xf6\x10\xe9 e\x22\xe3\x0bK\xac\
-eykpD\x0f\x13\xe9\xd9~\xb5\xe6\xef\x7f\x9c\xe0\
-\x93\xb7\xa9\xdd\x9fc#\x0dH\x9a\xc1\xa9\x1b\x9aX\xcb\
-2\xdf\xabd\x0f=F\xa4g\x99Nw\xf4?\x08>\
-\x19_\x98QS\x7f\x9e(\x079 t\xb3\xb0\xa6\xe5\
-k\xab-\xf0s\xa2<\xcb\x18\xbaB\xcf\x13|2\xde\
-M\xdba}\x87(\x079\xd0\xd8\xd2\xceM\xa7r\xce\
-UF\xcf/\x89\xf2,\xd3j\xf5\xff/\xc1'_\xcd\
-\x9e\xd0\x1f\x89r\x90\xc5\x8f\x15\x9b\xf7\x08kZ\xbej\
-;\x9c/\x13\xe5Y\xa6\xb9\xd3\xf9g\x82O\xbez\xe3\
-\xc3\xffM\x94\x83\x1c\xb0v\xf7>\xcd\x9a\x96\xaf\x8dm\
-\xd6#Dy\x96\xd1\xb4Y\x8e\x13|\xf2\xb5gx\x86\
-\x9d\xb5 \x0b\x5c\xd1\x91\x1f\xb0\xa6\xe5k}s\xe7\x1b\
-Dy\x96\xa9\xd7\x1a\xb8\x1f@\xc6F\xc7w~\x9d(\
-\x079\xe0KL~\x835-\xe7s\xff\xdbN\x10\xe5\
-Y\xa6\xae\xa9\xed$\xc1'_\x133\xd7\xddA\x94\x83\
-\x1c\x08\x0e\xed\xb8\x935-_\xab\x1bt\xef\x12\xe5Y\
-\xa6\xb6\xb1\xe5\x14\xc1'_\x93;\xfei\x1fQ\x0er\
- 4\xbap\x805-\xe3\x96\xe5z\xed)\xa2<\xcb\
-T\xab\xb5\xef\x13|\xf2ut\xcf\x8d\x83D9\xc8\x81\
-xj\xcf\x08kZ\xbeV\xd4jN\x13\xe5Y\xa6\xaa\
-Ns\x86\xe0\x93\xaf#\xbb\x96CD9\xc8\x81\xd8\xd4\
-\xde\x18kZ\xbe\x96\xd74\xbcO\x94g\x99\x8a\x1a\xf5\
-Y\x82O\xc6\x0f\x00{>\xed\x22\xcaA\x16\x0f\x00\xd3\
-\xd7yY\xd3\xf2\xb5\xac\xb2\xee,Q\x9ee\xca\xab\xea\
-\xce\x11|\xf2ub\xe93\x06\xa2\x1c\xe4@r\xe6\x80\
-\x915-_K+j\xce\x11\xe5Yfm\xd0\xcf\x13\
-|r~\x03\xb0\xac!\xcaA\x0e\xc4\xb7\xef\xd1\xb0\xa6\
-\xe5kIy\x15\xf7\x96\xf0\x00\x80<\x00\x00|\x1cn\
-\x04\xe4\x01\x00\xf8\x04\x80\x1b\xba\x0a\xf8\xc6N\xa2\x1cd\
-\xf1\x06`z\xc9\xcc\x9a\xe6\x13\x00\xa4\x116\x01\xb2\x09\
-\x10@\x0a\xb0\x09P\xe6\x9b\x00\xab\xea\xcf\x10\xe5Y\x86\
-6@y;\xbcxS\x98(\x079\xd0;\xb9?\xce\
-\x9a\x96\xf19\x00\xb4\x01f\x9fju\xf3i\x82O\xc6\
-\x0f\x00\xbb\xffy\x84(\x07Y|\x02\x98\xda;\xc1\x9a\
-\xe6  H#\x1c\x05,o\x07v\x5c\x7f\x80(\x07\
-9\x10\x19[\xb8\x915-_\xab\xea\xb5\xef\x11\xe5Y\
-\x86\xcb\x80\xe4m\xef\xf4\xe2\xbf\x12\xe5 \x07\x02\x83\xb3\
-w\xb3\xa6\xb9\x0c\x08\xd2\x08\xd7\x01\xcb\xdb\xc8\xf8\xfc7\
-\x88r\x90\x03\xbe\xc4\xe47Y\xd3\x5c\x07\x0ciD\xa3\
-\xb7\xbcA\xf0\xc9\xd7\xe0\xd0\xf4\xbf\x13\xe5 \x07\x9c\x91\
-\xa1\xc7X\xd3\xf2\xb5^g\xfc+Q\x9ee\x9a\x8d\xce\
-#\x04\x9f|u\xc7\x06\x9f!\xcaA\x0eX\xfd\xbd\xcf\
-\xb2\xa6\xe5kc\x9b\xf5\x08Q\x9ee\xda\xac\xfe\x97\x09\
->\xf9jv\x07YT \x0b\xf4V\xcf_X\xd3\xf2\
-U\xdb\xe1|\x99(\xcf2\x86\xae\x9e_\x12|2^\
-T\x06\x13\x1bk@\x16\xa8\x9b\xf5\xef\xb1\xa6\xe5\xab\xce\
-\xe4\xfd\x05Q\x9ee:\xdd\xb1\x9f\x11|2\xbec\xbb\
-\xb2\x9a\xf3\xb5A\x16\x94\x94U\xac\xb0\xa6\xe5k\x9b-\
-\xf0S\xa2<\xcbX\xfc\xfd?\x22\xf8d~\x18\xd0\xc2\
-A\x1d\x91\x0eR\xa6w\xee\xfaN\xd6\xb2\xbc58\x22\
-lX\xce6\xb6\xe0\xd0w\x09>y\xdb?{\xfd\xa7\
-\x88t\x902=#\xf37\xb3\x96\xe5m\xbb+v\x88\
-H\xcf\x22\xfe\xa1\x05/\x07\x01\xc9\xdf\xf0\xe8\xecw\x89\
-v\x902\x9e\xde\xf1\xef\xb3\x96\xe5me]\xd3)K\
-\xcfD\x88h\xcf\x02\xee\xfe\xb9\x1d\x5c\x05\xac\x0c\x1d\xa1\
-\xc4\xaf\x88x\x902&O\xf8E\xd6\xb2\xfc-)\xaf\
-:o\x09\x8e\xec%\xe23\x88#>yGQq)\
-\x1bj\x14b\xab\xc9\xfe6Q\x0fRF\xd3\xda\xc9\x89\
-\xa5\x0a\xb1@U\xb4j\xf4\x0f\xdcM\xd4g\x00K \
-y8??\x9f@S\x90\xc5%\xa5+\x89\xfd\xfbK\
-\x88~\x90\x22\xf3\xf3\xb7\x96\xaa\x8aKX\xcb\x0aR\xa8\
-Q\x06G\xe4Q\xa2?M\xf8\x97\x97U\x86\xae\x9e\x17\
-\x08.e:\xb8ci\x91U\x00R$<\xb6\xb0\xc4\
-\x1aV\xec\xe1@\xbf\x09\x87\xe7KY\x05[)\xfe#\
-{4\xdav\xfbQ\x02J\xb9\x86\x86\xb7?\xc2J\x00\
-)\xe2\x8e\x8d>\xca\x1aV\xf2\x1d\x01\x9do\xd8\xa3\xa9\
-\x16V\xc2f\x8a?;\xfdQ8\x12\xd8\xd3\xf3*\xab\
-\x01\xa4\x88\xde\xea\xf93kX\xe9\x1d\x02\x9aS]\x91\
-\xa90\xaba\x03\xf8\x92;\xe6\xd9\xe9\x8f\x82U\xb5\xea\
-s\xab\xab\xab\xf9\xac\x0a\x90\x12B\xcc\x96U\xd6\x9cg\
-\x0d#\x1d\x02\x1b\xc0\x19\x9b\xbaCUT\xc2N\x7f\xfc\
-\xd0\x89\x80\xff\xbc\x9d\x95\x01R\x22<\xbe\xb0\xc8\xda\xc5\
-\xbc\x0fw\x08x\x07\xbe\xcc\xca\xb8\x0a\x96\xee\xe4\xa3\xec\
-\xf4\xc7\xcb\x0d\x0c\xa4\x1ecu\x80\xa4~\xc8\x84\x87\x9e\
-d\xedb\x1e\x1d\x02\xd7\x86\x9d\xfex5\xdb\xcc\x8e\xb7\
-X% %\xb4\x06\xf3\xdb\xac]\xcc\xbbr\x87\xc0K\
-t\x08|P\xfc\xd9\xe9\x8f\xd7p[A\x01\x17\x03\x81\
-dH\xce.\x19\x84\x98e\xed\xe2'Y\xdf\xdcq\x5c\
-\xf1\x1d\x02\xbe\xc1\x9d\xbeZM+we\xe35\x8d\x8e\
-\xef\xfc:\xa5\x05\xa4\x8071\xf1-\xd6,^KE\
-w\x08\xb0\xd3\x1f7bG\x97\xef(\xa5\x05\xa4@\x8b\
-\xb1\xeb\x0d\xd6,\xae\xc7K\x1d\x02\xfb\x14\xb5@\x1c\x91\
-\x89/\x17\x16\x15\x13\x00\xb8\xa1\xcf\x00\xa9\xdd7vR\
-^@\xcc\xc4\xa7\x97\xcc\xbc\xfe\xc7\x8d\xa8\xa8\x0e\x01\xce\
-\xf4\xc7\xcd\x1a\x1e\x9d\xfb\x16%\x06\xc4\x8c'>q\x88\
-\xb5\x8a\x9b\xb1\xd5\x1axJ\xb6\x0b\xe3\xe2N\xff\xe0\xaf\
-\x98h\xdc\xacm\xa6\xae\xbfQb@\xccp\xfb\x1fn\
-Em\x87\xf3e\xd9u\x08\x08;\xfd\x9b\x0c\xb6\xd7\x99\
-`\xdc\xaaC;\x0fLRf@\x94\xaf\xff\xa7\xf6N\
-\xb0Fq\xab\xca\xaaC\x80\x9d\xfe\x98N\xdd\xd1\xc1g\
-)5 F,\xfe\xf8s\xacQL\x87\x15\xb5\x9a\xd3\
-\xb6\xd0xL\xd2\x0b\xc2\x9d\x98\xdb\xc5N\x7fL\xa7\xe5\
-\x95\xd5\xe7\xa7n\xb8\xbd\x92r\x03bb\xea\x86\x1b*\
-K\xcb+9\xc2\x1c\xd3fQi\xf9ysp\xe4F\
-I.\x08Gd\xfc\x1ev\xfac&\x8c\x8c\xcf\x7f\x83\
-\x92\x03\xa2z\xd3\xd9\x97\xfa6k\x13\xd3\xad\xd0!\xd0\
-\xe9\xed\xbfGZ\xaf\xc2\xd8\xe9\x8f\x19\xb4\xb1\xc5p\x8a\
-\x1b\x02A,\x08\xb1X\xa7i9\xcd\xda\xc4L)\x89\
-\x0e\x01v\xfac\xb6\xec\xdf\xbe\xef\x8b\x94\x1e\x10\x03\x81\
-\xa1\xb9;Y\x93\x98iE\xdd!\x10\x1d\x5chb\xa7\
-?fK\x83\xd5u\x9c\xd2\x03b\xa0\xb9\xdd\xfa\x16k\
-\x12\xb3\xa1\xd0!\xe0\xea\x9d\xd4\x8b\xeb\xfb\x17;\xfd1\
-\x07\x0e\xec\xb8\xfe\x00\xe5\x07rIdl\xe1F\xd6\x22\
-fSQu\x08x\xfaf\x97J+j\xce31\xc8\
-[\x00\xe0\xd7?bv:\x04,\xc1\x91\x839\x0d~\
-v\xfac\xae\xed\x9f\xdd\xf7\x19\xca\x10\xe4\x82\xd0\xe8\xfc\
-m\xacA\xcc\x95\x05\x85\xaaU\xa3/G\x1d\x02\xec\xf4\
-G1\xd8j\xb2\xbfM)\x82\x5c\xd0\xa47q\xec/\
-*\xabC \x91\xd8_b\xb0\xb3\xd3\x1f\xc5c\xef\xd4\
-\x9e\xafP\x8e \x9bt\x0f\xcc\xdc\xc7\xdaC\xb1\x98\x95\
-\x0e\x01a\xa7\xbf\xb6\xdd~\x8c\x01G1Y\xd7\xd8|\
-\x86\xd3\x01![L,\xdeT[U\xd7x\x96\xb5\x87\
-\xa2\xca\x83\xda\xf673\xd6!\xe0\x1f^\x88W\xab\x9b\
-9\xec\x02Ei 9\xf98\xa5\x09\xb2\x81#4\xf8\
-c\xd6\x1c\x8a\xd1\xf2j\xf5\x19{db0\xad\x01\xef\
-N\xcc.\x95\x94W\xb1\xd3\x1fEkqI\xe9\xca\xd0\
-\xc2\xb2\x97\xf2\x04\x19\xfd\x04\xba})\xa8*.a\xcd\
-\xa1xsai\xe5ysp8=-\xd2\xec\xf4G\
-\xa9\xd8\xd1\xe5;J\x89\x82L\xd2fq\xbf\xc6ZC\
-\xb1\xbb\xad\xa0p\xb5\xd3\x93x`K\xc1\xceN\x7f\x94\
-\x9a\xf1\xc9\x85{(S\x90\x09\xba\x933\xff\xc6\x1aC\
-)\xb9\xa9\x0e\x01a\xa7\xbf\xde\x1e\xf85\x03\x88R\xb3\
-\xb2\xa6\xfe\xfc\xc4\xd2g\x0c\x94+H'\xbds\xd7w\
-\x96Ur\xe0\x19J\xcf\xa6v\xc7o\xed\x89\xf9\x8au\
-\x05\xfa\xc53\xfd\xad\xec\xf4G\xc9j\xf5G~G\xc9\
-\x82t\xd2\xde\xd5\xfd\x07\xd6\x16J\xd5uu\x08\x5c\xdc\
-\xe9\xaf}\x9f\x01C\xa9\x1bK-\xdcG\xd9\x82t\xe0\
-\xef\x9fz\x805\x85R\xb7\xa2\xb6\xf1}kt2~\
-\xc5 g\xa7?\xca\xc9\xd2\xf2\xca\x95\xe1\xc5\x9b\xc2\x94\
-/\xd8\x0a\xc2\xae\xff\x92\xb2\x8a\x15\xd6\x14\xca\xc1\xa2\x92\
-\xf2\x15K`\xf4\xd3\x1f\x09ra\xa7\x7f\x81\xaa\x88\x01\
-BY\xd9fv\xbc\xb5\xbc\xfc\xa0\x8a2\x06\x9b*\xfe\
-\xfb\xf7\x97h\x0d\xe6\xb7YK('\x85\x0e\x81\x0eo\
-\xdf\xd7.\x04\xb9\xd9\x9fx\x8cAA\xb9\xea\x89\x0d\xff\
-\x17\xa5\x0c6\x83\xd5\xdf\xfb,k\x08\xe5\xaa\xbe+|\
-\xe1\xf04\x06\x03\xe5\xdd\x1a\x98Z\xf8*\xe5\x0c6B\
-\xf7\xe0\xf6/\xb3vP\x012\x08\xa8\x80S\x02w\x1e\
-\x98\xa4\xac\xc1z\x88\xa7\xf6\x8c\x14\x97\x94\xf1\xdd\x1fy\
-\x00@\x94\x83jm\xcb\xfb\xa9\xdd7vR\xde\xe0\xaa\
-\xc5\x7fz\xc9\x5c\xd3\xa0=\xc3\x9aAE(\x1c\xfa\xa3\
-**\xe1i\x17\xe5\xbf)\xd0\xd4\xf57n\x0d\x84O\
-\x221\xbd\xbf\xa6Io:\xc1ZA\xb9+l\xfa\xff\
-\xfb\xe1@\x1a\xbd\xf5\x0d\x06\x05\x95\xa0\xd9\xd3\xf3\xea\xea\
-\xeaj>\xe5\x0e>\x8c\x10\x13\x1d\x8e\xc0\xefY#\xa8\
-\x04\xeb\x9b;\xdf\xf8{\xf0\x9b\xfd\xfdO0(\xa8\x14\
-\xbd\xf1\xe1\xff\xa6\xe4\xc1\x87\xb1v\xf7>\xc3\xda@\xa5\
-\xf8A\x07\xc0\x05<\x89\x99\x03\x0c\x0a*\xc9\xee\x81\xd4\
-\x93\x94=\x10p\x84\x92?aM\xa0\x92\xb4\x04G\x97\
-\xfe\xf1\xed\x8b}\x00\xa8@\x83\xc9\xa9\x1fR\xfe\x94\x8d\
-'>\xf6\x08k\x01\x95d\xa1\xaax\xc5\xb0V\xf3?\
-\xb2\x10\xb4\xedv.\x00B\xc5\x19\x1e\x9d\xfd.eP\
-\xa1\xc5\xbfw\xfc!\xd6\x00*Mu\x8b\xe9\xd8\xc7\x16\
-\x83\xa5{\xe0\xdf\x19\x1cT\xe4\x9b\x80\xc1\xe9G)\x87\
-\xca\xc2\x1d\x1b}\x94\xd8GE~\xffw\x84\x7f\xf0\xb1\
-\x05\xe1\xed\x9f\xdd\xce\xe0\xa0R\xf5D\x87\x9e\xa6,*\
-\x03Wd\xf8qb\x1e\x15\xfb\xfd\xbfgl\xe6\xe3\xab\
-bu5\xbf\xb4\xa2\x86\xdb\x00Q\xb9\x0f\x01\xb1\xa1g\
-h\x11\x94/\xc2\xdcr\xbe?*\xd9\x92\xf2\xeask\
-\xff\xb8r\x8ek5{^a\x90P\xc9\x9a\x5c\x81?\
-O\xdc\xf4/\xb5\x94Ky1u\xc3\x0d\x95\xedv\xff\
-\x1f\x89qT\xb2\x9a\xf6\xae\xdf}\xe2\x22\xb1\x87G\xbf\
-\xce \xa1\xd2\xd5uX\xdf\x19\xd9w\xd0B\xd9\x94\x07\
-\xbds\xd7wr\xad/b\xde?\xae\x01\xbe\x12\xc1\x91\
-\xeb\xba\x18$\xc4\xbc\xd5\xfa&\xdd\x19.\x10\x92>\x91\
-\xd4\xee\x19\xce\xf6G\xbc\xa8-\x94r]u\xc1\xd46\
-\xb6\x9cb\xa0\x10/\xde\x22\x18K-\xdcG\x19\x95&\
-\xfe\xfe\xe9\xfbU\xc5%\xc42\xe2\x9aU\xf5\xda\xf7\xae\
-\xb9h:\x9ca\x8e\xc4D\xfc\x90\xee\xd8\xe03\x89\xfd\
-\x97\x1d\x9c\x01\xa2E\x98+\x8b/\xf6\x0bb\x17\xf1C\
-\x9f6-\xbekw:\xb9\xe2S_`\xb0\x10?j\
-s\xbb\xf9\x9d\xa1\x85\xe5$\xe5U\xdc\xf4M\xed\x0d\xf3\
-\xbd\x1f\xf1\xe3\x1a\x03\x83\xb7_s\x01y\xa6\xf7\xd7p\
-,0\xe2\x15Zh\xca\xcaWB#\xb3\x87(\xb3\xe2\
-\xa4;9soIY\x05\xb9\x0b\xf12\x85\xe3\x7f-\
-\xd1\xa9\xf5]\x85\xde\xdc\xe9\xfc3\x83\x86xe\xcd\x9e\
-\xd0\x1f\xc7\xf7}\xdaH\xc9\x15\x07\xf1\xe9%\xb3\xc1\xe6\
-{\x95\xd8D\xbc\xb2\x8dz\xeb\xab\xeb^P\xb4\x03\x22\
-^\xdd\xb2\xcaj\xde\x06\x88\xe4W\x7fiE\x15\x07\x98\
-!^\xc5NO\xe2\x81u/\xaa\x9e\xa1\xdd\x9d\xdb\xb6\
-\x150p\x88\xd7\xea\xab\xb5{_\x1f\xd9\xb5\x1c\xa2\x14\
-g\x97\xd8\xd4\xdeX\xab\xd1\xf1Wb\x10\xf1\xea\xe6\xaf\
-\xd5rgl\xd6\xb0\xa1\x05\xd6\xd8jz\x93\xc1C\xbc\
-\xb6E\xc5\xa5\xab\xfe\xc4\xf8OR\xbb?\xa7\xa64g\
-\x96\xb1\xf9[\x1a\xec\xc1\xc4\xcf\x0aUE\xc4\x1e\xe2z\
-\xce4i\xee8\xbe\xe1\x85f\x0d$\x0f3x\x88\x1b\
-\xe8\xb3\xadU\x9f\x8b\x8c\xcd?\xc8}\x02\xe9G\x18S\
-\xe1u\x7fe\xad\xfa,\xb1\x86\xb8~\x0d\xce\xe8\xc3\x1b\
-^p\xfe\xe4\xae\x10\x83\x87\xb8q5\xad\xed\xa7\xe2\xa9\
-\x85{)\xdb\xe9!8\xbc\xe3\xf6\xc6\x96\x8ew\x89-\
-\xc4\x8dk\x8f\xa6\x82\x9bZx\xb5\x9a\xd6\xf7\x18@\xc4\
-M\x1e\xbc\xd1a910\xbb\xff6J\xf8\xe6\x08\x8d\
-\xee:\xa8m\xb7\xfc\x8dXB\xdc\xe4[Iu\xf3\xc9\
-M/@\xa3\xb7\xf7'\x0c\x22\xe2\xd6\xd4\xea\x8d'\x85\
-O\x03\xcb\xcb\x0f\xaa(\xebW'\x91\xb8\xb3084\
-wW\x93\xdet\x82\xd8A\xdc\x9am\xf6\x9e\x1foz\
-1\xfa\xfa\xe7f\x18D\xc44m\xc6i\xd2\x9d\x09\x0f\
-o\x7f\x88\xcd\x82W\xde\xdc\xe7\x89\x8f?\xc4\xc5=\x88\
-\xe9\xd3\x16\x19\x9f\xda\xd2\xc2\xaci\xd0q9\x10b\x9a\
-O\x14\xec\x0a\xf6\xfdzh\xe1\xc0\x82\xd2\x0b\x7ft|\
-q\x8f\xc9\x13\xf9\x9f\xe2\x922N\xf0CL\xa3\x95\xf5\
-\xdaS[^\xa0&_\xe2\x09\x06\x131s\x9f\x07B\
-\xc3\xdb\x1f\x99\xd8\x7f\x93[)E?6}\x9d\xd7\x1d\
-\x1b;\xacn\xd6\xb3\xc7\x081c\xaf\xff\xc3Oly\
-\xb1\xd2\x0d\x80\x98\x85\xc3:\xf2\xb7\xad\xb6\x99\x1do\x85\
-\x86g\x1fJ]ws\x97\xdc\x8a~|\xfb\x92\xcb\x13\
-\x1f\xff\x9e\xb0\xa9O\xf8\xbb2\xe7\x88\x19~\xfd\x1f\x1a\
-\x8f\xa5e\xf1\xaau\x1dl\xc8A\xcc\xa2\x0d:\xfdi\
-Ot\xe8\xe9\xc4\xf6\xebn\x9f\xbf\xf5\xd6R\xa9\x15\xfc\
-\xe5\xe5e\x95\xf0z\xdf\x15\x19~\x5c\xd8\xd0G\xd1G\
-\xcc\x9e\xb5\x1a\xfd\xdbi[\xcc\xd6@\xf2a\x06\x151\
-7\x96\x96W\xaett\xf9\x8eu\x0f\xa4\x9e\x1c\x98\xdd\
-w\xf3\xc4M\xffR+\xb6\x82\x9f\xd8\xbd\xac\x0e\x8f\xee\
-\xbc\xc5\x19\x1ez\xb2\xcd\xec<\xc67}\xc4\x5c\x1e\xfe\
-\x13{(m\x8b\xdb;\xb0`\xe7n\x00Dq\xb8\xad\
-\xa0\xe0\xc2aC6_\xe4\xf7\x81\x81\xd4c\xfd\xdb\xf7\
-}qt\xef\xc1\xa0\xd0B\x97\xf1B\xbf\xf6\xff\x11\x9d\
-\xde\x13\x0a\x0e\xcf\xdd\xe1\x8c\x0c=\xd6\xe1\x08\xfc^\xad\
-m;%\xfc\x99\x98\x1bD\x11|N\x5c\xab\xd5\xb6\xe8\
-\xa4%\xad\x0b\xbf\xc9`\xe5\xe2\x0dD\x11[X\xa8\xba\
-\xd0j\xd8ns\xbf\xe1\x08\xf6\xbe\xe8\xeb\x1b\xfbi\xcf\
-\xd0\xcc\xe1Xj\xd7\xd7\x84\x87\x84\xe4\x8e\xa5\xbd\x83;\
-\xffi\xcf\xe8\xeeO%\x86v\x1e\xe8\x1b[\xfcT\xa0\
-o\xfb~_4\xb5\xb7\xafwzoBxe\x1f\x19\
-[\xd8'\x14w\x7f\xff\xf4\xd7\xdc\xf1\xb1\xc3]=\xc9\
-\x9f\x9a<\xe1\x17u\x9d\xf6\xe3B\x8b^\xc1\xda\xff\x07\
-c\x8d(^\xd5:\xe3\xebi\x7f\xf2\xb7\xf7\x8c<\xc8\
-\xe0\x22\x22\x22\x8a\xd7\x0eo\xdf\xd7\xd2\xfe\x00\x10\x1d\x5c\
-h*,*f\x80\x11\x11\x11\xc5\xf8\x16PU\xbcb\
-\x8bo\xd7d\xe4\xfb_\x9b\xd5\xff2\x83\x8c\x88\x88(\
-\xc2sE:\x9c/el\x03\x90\xbbo\xe6\x00\x83\x8c\
-\x88\x88(>-\xc1\xd1\xa5\x8c\xee\x02\xaeV7\x9ff\
-\xa0\x11\x11\x11\xc5ce\x9d\xe6T^\xa6\xb1t\x0f<\
-\xca`#\x22\x22\x8a\xa9\xf7?r8\xe3\x0f\x00\x81\xf1\
-}\xc6\x02U\x11\x03\x8e\x88\x88(\x02\xb7\x15\x14\xae\xda\
-\xe3\xd3\xe6\xbcl\xd0br\xff\x89AGDD\xcc\xbd\
-\x1a\x83\xfd\x0fy\xd9\xc2\xd57}\x1b\x83\x8e\x88\x88\x98\
-{\xcd\x81\xa1\xcfe\xed\x01 ou5\xbf\xb2\xb6\xf1\
-\x0c\x03\x8f\x88\x88\x98;\xcb\xaa\xea\xd7j\xf1j~^\
-6\xb1\xf8\xfb\x7f\xc4\xe0#\x22\x22\xe6N\xbd#\xfc\xa3\
-\xbcl\x13\x1c\xbaN\xaf**\xe1\xc6/DD\xc4\x1c\
-(l\xc8\xb7\xf5\xa6:\xf3r\x81\xde\x1e\xf85\x93\x80\
-\x88\x88\x98}\x9b\x8d\xee_\xe5\xe5\x0ao\xff\xdcp~\
-~>\x13\x81\x88\x88\x98em\xa1\xb1\xf1\xbc\x5c\xd2d\
-\xb0\x1ec\x22\x10\x11\x11\xb3gF\xae\xfd\xdd(\xae\xde\
-\xa9/2\x19\x88\x88\x88\xd9\xd3\xe4K~!\xe7\x0f\x00\
-BK`\xb5Z\xfb>\x13\x82\x88\x88\x98y+k5\
-\xa7\xb3\xde\xfa\xf7IX\x83C\x0f1)\x88\x88\x88\x99\
-\xb7\xdd\x15;\x94'\x16\xfc\xa9\xdd\xea\xe2\xb2\x0aZ\x02\
-\x11\x11\x113hQI\xf9\x8a9\x91R\xe7\x89\x89N\
-w\xecgL\x0e\x22\x22b\xe6l\xb5\x06\x9e\xca\x13\x1b\
-\xc2-\x81\x1c\x0c\x84\x88\x88\x98\x19\x0bU\xc5+9;\
-\xf8\xe7Zt8\xc3\xcf2I\x88\x88\x88\xe9\xb7\xc5\xec\
-\x7f&O\xac\xf4\x0c/\xba\x85\xa3\x09\x99(DD\xc4\
-\xf4YP\xa8Z\xb5\x85R\xae<1\xa3\xb7\x07\xfe\x87\
-\xc9BDDL\x9f9=\xf6w\xbdt'\xe7c\xdb\
-\xb6\x150a\x88\x88\x88i0\x7f\xad\xa6vE\xa6\xc2\
-yR\xa0\xd5\xec\xfd\x1d\x93\x86\x88\x88\xb8u\x9b\xda\x1d\
-\xbf\xcd\x93\x0a\xbe\xe4\xfc8\x97\x04!\x22\x22n\xf1\xd7\
-\xffZ-\xb5FR#yRBgt\xbd\xca\xe4!\
-\x22\x22n^\x8d\xc1\xf6\xa7<\xa9\xc1[\x00DD\xc4\
-\xad}\xfb\x97\xdc\xaf\xff\xbf\xef\x05\xb0\xf8~\xcb$\x22\
-\x22\x22n\x5cm\x87\xf3\xe5<\xa9\xe2\x1f\xde\x19.(\
-(d\x22\x11\x11\x117\xd8\xf7o\xe9\x99\x08\xe5I\x19\
-CW\xe8y&\x13\x11\x11q\xfd\xeaL\xde_\xe4I\
-\x9d\xc0\xc8n\x0bw\x04 \x22\x22\xaeO\xe1\xcc\x7fG\
-l{W\x9e\x1c\xe8tG\xff\x83IEDD\xbc\xb6\
-m\xb6\xc0O\xf3\xe4\x82\x7fpoKqY\x05o\x01\
-\x10\x11\x11\xaf\xa2\xaa\xb8t\xc5\x19\x9b5\xe4\xc9\x09\xb3\
-\xbf\xff\x09&\x17\x11\x11\xf1\x93\xd5;\xc2?\xca\x93\x1b\
-\xb1\x89\xc5\xda\xf2\xea\xfa\xb3L0\x22\x22\xe2\xc7-\xad\
-\xa89gN\xa4\xd4yr\xc4\x1e\x1e\xbd\x9fIFD\
-D\xfc\xb8Fo\xe2\xbe<9\xd3\xd0\xd2\xf96\x13\x8d\
-\x88\x88\xf8\x0fk\x1a[N\xac\xfd#_\xd6\x0f\x00\xee\
-\xbe\xd9E\x8e\x08FDD\xbc\xa8P\x13-\xc1\x91}\
-yJ\x80\xeb\x82\x11\x11\x11/*\xa9\xeb~\xb7Jp\
-\xe4\xba\xae\xa2\xe2R\xda\x02\x11\x11Q\xf1\x87\xfe\xd8B\
-\xe3\xde<%a\xf2&\x9ed\xf2\x11\x11Q\xc9\xb6\xd9\
-CO\xe6)\x0d\xcf\xf4\xfe\x9a\x8a\x1a5m\x81\x88\x88\
-H\xdb\x9f\xd2pD\xc6\xef%\x08\x10\x11Q\x89v\xfa\
-\xfa\xef\xcdS2\x1a\xbd\xf5\x0d\x02\x01\x11\x11\x95d\x9d\
-\xb6\xfd\xcd<\xa5\xe3M\xee\x9a\xd8\xb6\xad\x80\x80@D\
-De\xb4\xfd\xad\xd5<[xt{\x1e\xe4\xe5u8\
-#\xcf(e\xe2\x0bTE\xabe\x95\xb5\xe7j\x1b[\
-N5\xb6\x9a\xde\xd4\x19]\xaf6\x19\xac\xc7X\x14\x88\
-\xa8\x14\xebu\x9d\xc7\x1a\xdb\xac\xaf\x0a\xbf\x82+\xeb\xb5\
-\xa7J\xca\xab\xcf\x15\x14\xaa\x14\xf3\xf7o1\xfb\x9f\xa1\
-\xf2_\x22:\xb8\xd0$\x14E)NdQI\xf9J\
-\xb5\xba\xf9\xb4Z\xd7qB\xdbn?\xdaj\xf6\xbcb\
-\xe8\x0a=o\xf6\xf7?n\xef\x19y\xd0\x19\x9d\xbc\xcb\
-\xd57s\xd070?\xe5\x1fZ\xf0\xe6\xad^\xe1\xa4\
-\xa7\xb5\xff\xc6\xd9\x08\x88\xa8\x04\x1b\xf5\xb6?&\x12\x89\
-\xc2+\xd5\x02gl\xb1Vh\x89\xb3E\xc6\xa7,\xc1\
-\x91\x83&\x7f\xf2\xaevW\xecP\xab5\xf0\x94\xce\xe4\
-}^c\xb0\xbf\xa2n1\x1d\xadil;QVU\
-\x7ff[A\xa1\xe4\xfe\xfe%\xe5U\xe7\x1d\xbd\xd3:\
-*\xff\x87\xe8\x12\xc1=\x01\xc2\xaf\xf3\xca\xda\xc63\x97\
-\x17s\xa3;\xf6\x9458t\xe8\xf2b\xfeIA\xbc\
-\x19\xc2\xf3\xb7\x96\xb2\x1f\x02\x11\xe5\xfe\xdd\xdb\x12\x9d\xaa\
-Lg\xed\xb8\xfc\xa1A\xd8XgpD\x0f_\xfe\xd0\
-P\xa5\xd6\x9d\x14\x8ao\xae\x1f\x1a:<\x89\xfb\xa9\xf8\
-W\xa0\xa1\xd5\xf4V\xae\x8a\xb9\x7fyY\x95\xeb\xbf\xbf\
-?\xb5[]\xdf\xdc\xfe\x0e\x89\x02\x11\xe5fu\x83\xee\
-][|\xbbF\x0c\xb5f\xa3\x0f\x0d\xf9i\xda\xa7V\
-\xab\xd1\xbf\x9d'\xf7\xf3\xfe7\x8bo`n\xf2J\x1b\
-\x02\x85b^ZQs\xbe\xae\xa9\xed\xe4\xe5\xc5\xdc\x12\
-H\x1e\x16\xda\x09\xc5V\xcc7\x8bg`\xde\x5cU\xdf\
-\xf4>\x09\x03\x11\xe5\xa2\xf0\xba\xde\x11\xdb\xde%\xe5\xfa\
-\xf4\xe1\x87\x06c`\xf0\xf6vw\xfc\xc1\xcb\x1f\x1a\xea\
-\x9b;\x8eW\xd6jN_\xe9\xa1A\xf8wk\xcf\xd8\
-\x0e*\xfdUp\xf7\xcd\x1c\xf0\xf4\xcd\xde\xd8\x9d\x9c\x1f\
-\x11\x8a\xe1\x15\xbf\x99\xcb\x1c\xff\xd0\xce\x84\x10@$\x0e\
-D\x94\xbaB.\xb3\xf5\x8c\xf6)\xaf\x9a\xad\xe6\xdb\xe3\
-\xd3fk$5b\x0e\x8e\xdch\x09\x8c\x1c\xa0\xc2\xc3\
-\xfa\x1e\x84\x12s\xbb\x84\x0d\x86$\x10D\x94\xaaB\x0e\
-\xb3\xf6L\xcc\x93\xd1\x016\xfeId\x81\x87\x00D\x94\
-\xa2\x85E%+\x8a\xb9\xe2\x16 S\x9fDTk\x0b\
-\x89\x84\x82\x88RQ\xd8\xb7e\x0a\x0c\xddL\x06\x07\xd8\
-\x22\xc2\x06\xc7\xc2\xa2b\x12\x0b\x22\x8a\xbf\xf8\x17\xaa\xd6\
-\x8a\xff\xf0g\xc9\xdc\x00\xe9z\x08\xe8\x9d\xfe\xbc\xf0T\
-M\x82AD\xb1*\xf4\xd8\x9b\xfc\xc9;\xc9\xd8\x00i\
-\xc6\x11\x9d\xf8R\x81\x04O\xbeBD\xc5\x14\xff\xbb\xc8\
-\xd4\x00\x99z\x08\x88O\xde\xc1\x9b\x00D\x14[\xf17\
-z\xfb\xbfD\x86\x06\xc8\xf8\xe7\x80\x99\x9b\xd9\x18\x88\x88\
-bP\xf8A\x22\x1c\x8cCf\x06\xc8\x12\xc2aIE\
-\xc5\xa5<\x04 bN[\xfd\xcc\xc1\x91O\x91\x91\x01\
-\xb2\x8c\xaf\x7fnOqY\x05\x0f\x01\x88\x98uUk\
-?@,\xc1\xd1%21@\x8e\x10N\x0c\xe4\xd8`\
-D\xcc\xa6\xc5e\x95\xe79\xd7\x1e@\x04\xf8\x87\x17\xe2\
-\x5c \x84\x88\xd9P\xb8\xd8\xc7\x1e\x99\x18$\xf3\x02\x88\
-\x84\xc0\xf8>c\xbd\xd6p\x82\x04\x85\x88\x99R\xb8\xd2\
-\xd7\x11\x9f\xb4\x93q\x01DF|l\xa9\xa1\xc9`=\
-F\xa2B\xc4t[\xa7m\x7f\xd3\xd1;\xad#\xd3\x02\
-\x88\x94Db\x7fI\x9b\xb5\xfbe\x12\x16\x22\xa6KM\
-{\xd7\xef\xc3\xe1\xf9R2,\x80\xd8Y]\xcdo\xb3\
-\xfay\x08@\xc4-\xab\xedp\xae\xe5\x92\xd5|\x12+\
-\x80D0\xfb\xfb\x7fH\xf2B\xc4\xadjpD\xfe\x9d\
-\x8c\x0a !:]\xd1\xff&y!\xe2Vm\xb1\xf8\
-\xff\x8b\x8c\x0a !\xf4\xb6\xee\x97H^\x88\x98\x86O\
-\x00\xbf!\xa3\x02H\x88\xe6\x0e\xc7_H^\x88\xb8U\
-\x1b\xda,\xffGF\x05\x90\x10\x0d-\x9do\x93\xbc\x10\
-q\xab\xd66\x19\xfeFF\x05\x90\x10\xd5j-'\x03\
-\x22\xe2\x96\xad\xac\xd5\x9c&\xa3\x02H\x88\x92\xb2J\xee\
-\x07@\xc4\xad\x9f\xfb_z!\x97\x00\x80\x14H$\x12\
-\x85\xf9\xf9\xf9$/D\xdc\xb2B.\x11r\x0a\x99\x15\
-@\x02\xf4\x0c\xed\xee$q!b\xbat\xc6f\x0dd\
-V\x00\x09\xe0\xed\x9f\x1b&i!b\xba\xe4\xf6?\x00\
-\x89\xe0\xe9\xdb\xfe)\x92\x16\x22\xa6KK`\xe4\x00\x99\
-\x15@\x028\xa2\x13_\x22i!b\xba4\xf9\x93w\
-\x91Y\x01$\x80-8\xfc-\x92\x16\x22\xa6\xcbvw\
-\xfc\x9bdV\x00\x09`\xf6'\x1e#i!b\xba\xd4\
-;\xc2?\x22\xb3\x02H\x80\x0eg\xe4i\x92\x16\x22\xa6\
-\xcb\x16\xb3\xffi2+\x80\x04h\xb3v\xbfL\xd2B\
-\xc4t\xa9\xedp\xbeDf\x05\x90\x00\xcd\x1d]\xaf\x91\
-\xb4\x101]6\xb4\x9a\xffBf\x05\x90\x00j]\xc7\
-\x09\x92\x16\x22\xa6\xcbZ\x8d\xfem2+\x80\x04\xa8\xaa\
-o\xe2\x22 DL\x9b\x15\xb5\x8d\xef\x93Y\x01$@\
-qY\xc5\x0aI\x0b\x11\xd3eQi9\x17\x02\x01\x88\
-\x1d.\x02B\xc4t\xcb\x85@\x00\x12\xc030o&\
-a!b\xbau\xc7f\x8cdX\x00\x11\xe3K\xce\x8f\
-\x93\xac\x101\xddZ#\xa9\x112,\x80\x88q\xf5\xcd\
-\x1c$Y!b\xba5\x07Gn$\xc3\x02\x88\x18G\
-d\xe2\xcb$+DL\xb7F\xff\xc0\xdddX\x00\x11\
-c\x0b\x0e\x7f\x87d\x85\x88\xe9\xb6\xc3\xdd\xfbm2,\
-\x80\x881\xfb\xfb\x1f'Y!b\xba\xd5\xdbC\x8f\x91\
-a\x01DL\x873\xf2\x0c\xc9\x0a\x11\xd3\xad\xce\xe2\xe3\
-B \x001\xd3j\xf1\xfd\x96d\x85\x88\xe9V\xdb\xe1\
-|\x99\x0c\x0b b\x9a\xda\xedGIV\x88\x98n\x1b\
-Z\xcd\xaf\x91a\x01DL\xbd\xd6\xc0E@\x88\x98v\
-k\x1a\xdbN\x90a\x01DLU\x9d\xe6\x0c\xc9\x0a\x11\
-\xd3myM\x03\x17\x02\x01\x88\x99\xa2\x92r.\x02B\
-\xc4\xf4_\x08t1\xb7\x00\x80\x18\xf1//\xab\xb8\x08\
-\x08\x113\xa1\x90[\xfc\xfee\x15\x99\x16@\x84x\x07\
-\x16\xec$*D\xcc\x94\xb6\xe8\xa4\x85L\x0b B|\
-\x03s\x93$)D\xcc\xd8\x03@$5A\xa6\x05\x10\
-!\xae\xde\x99\x9bIR\x88\x98)-\x81\xd1O\x93i\
-\x01D\x88#6\xf1\x15\x92\x14\x22fJ\xa3w\xe0\xcb\
-dZ\x00\x11b\xeb\xe1\x22 D\xcc\xe0\x85@\xae\xf8\
-w\xc8\xb4\x00\x22\xc4\xe4K<A\x92B\xc4L\xd9f\
-\x0f?A\xa6\x05\x10!\xed\xce\xf0\xb3$)D\xcc\x94\
--f\xff3dZ\x00\x11\xd2j\xf6\xfe\x8e$\x85\x88\
-\x99\xb2\xa9\xdd\xf1\xbfdZ\x00\x11\xd2d\xb0\xbdN\x92\
-B\xc4L\xa9n1\x1d%\xd3\x02\x88\x90z\xad\xe1\x1d\
-\x92\x14\x22f\xca\x9a\xc6\xd6w\xc8\xb4\x00\x22\x84\x8b\x80\
-\x101\x93\x96W\xab\xcf\x90i\x01D\x08\x17\x01!b\
-&U\x15\x97r!\x10\x80\xd8\x08\xcf\xdfZJ\x82B\
-\xc4L\x1b\x0e\xcf\x97\x92q\x01D\x84\x7fd\x97\x8b\xe4\
-\x84\x88\x99\xd6\x11\xdb\xdeE\xc6\x05\x10\x11\xbe\xfe\xb9\x19\
-\x92\x13\x22fZ[d|\x8a\x8c\x0b \x22\xdc\x89\xe9\
-[HN\x88\x98iM\x81\xa1\x9b\xc9\xb8\x00\x22\xc2\x11\
-\x19\xbf\x87\xe4\xa4<\x8b\x8aKW\xec=\xc3\xdf\xb6\x06\
-\x87\x0e\x99\xfd\x89\xc7:\xdd\xf1\x9f\xb7;B\xcf\xb5Y\
-\xbb_\xd6\x19]G4z\xcb\x1bk\x1eol5\xbd\
-Y\xd7\xd4v\xf2\x03\xab\xd5\xcd\xa7K\xca*\xcf\x97U\
-\xd5\x9f\xa9\xa8\xd5\x9c\xaeR\xebN~`\x9d\xb6\xfd\xcd\
-\xfa\xe6\x8e\xe3\xf5\xba\xce7\x1a\xdb\xacG\xb4\x1d\xce\x97\
-t&\xefs\xad\xb6\xc0\xcf\xf5\xf6\xd0c\xed\xae\xd8\xa1\
-\x0ew\xef\xb7\x0b\x8bJ\xd8t\xaa@;\xbd\xfd\xf7\x90\
-q\x01D\x84-8\xf4]\x92\x93\xb2\xdc\xb6\xad`\xd5\
-\x15\x9f\xfaB\xaeb\xce\x1c\x18\xfc\xcc\xb6\x82B\xe6B\
-a\x0a\x0f\x80d\x5c\x00\x11a\xf2&\x9e$9)K\
-k \xf9\xbd\x5c\xc7\x9d\xf0&\x80\xb9P\xda\x85@\xa1\
-'\xc9\xb8\x00\x22\xa2\xbd\xab\xe7\x17$'\x05]\xcb\xea\
-\x8c\x88\xe6R\x96K\x17\xc40/J\xb9\x10\xc8\xe4{\
-\x96\x8c\x0b \x22Z\xcd\x9eWHN\xcaP\xdbn?\
-\xea_^V\x89%\xf6\x12\x89DaC\x9b\xe5\xff\x98\
-\x1b\xa5\x5c\x08\xd4\xf5;2.\x80\x88h2X\x8f\x91\
-\x9c\xe4\xaf\xb0\x81/>\xb6\xd4 \xb6\xf8s\xc6\x16k\
-/\x9d\x13\xcf<\xc9\xffB\xa0cd\x5c\x00\x11Q\xdf\
-lx\x97\xe4$o\xcb*k\xcf\xf9\x06w\xfa\xc4\x1a\
-\x83\xb6P\xcaUZQs\x96\xb9\x92\xb7\xd5\x0d-\x5c\
-\x08\x04 &*k\x1b\xb9\x08H\xceg\xb0\x17\x95\xac\
-\xb8\xfb\xe7v\x88=\x0e-=\x13\x93\x97\xce\x8bg\xde\
-\xe4\xfa ZU\xcf\x85@\x00b\xa2\x88\xa4+[\xf3\
-\xf3\xf3W\x1d\xd1\xd4\xbfJ%\x16M\xddC_\xcc\xdf\
-V\xc0\xdc\xc9\xd4K\xe7?\x00\x80\x18H$\xe6+H\
-L\xb4\xfb\x89\x09\xda\x03\xe5\xad\xfdb\xce\x01\x80\x5c\xd3\
-=\xb1h(,*&1\xc9\xb2\xdd/,\xd9\x96\xab\
-K\xedb\xcc\xa3\xcc,P\x15\xad:c\xb3\x062/\
-\x80H\x106\x87\xd1\x0a(\xb3v+\x83\xedu1\xb5\
-\xfbm\xfc\xcdT\xa2\xb0\xa1\xd5\xf2\x17\xe6RV\x1d\x00\
-G\xad\xd1\xc98\x19\x17@\x84\xb8\xe2\xd3\x9f\x13\xcey\
-'Y\xd1\xee'\x06\x84\xf6\xc0K\xbb\xc6\x99W\x09[\
-^\xad>c\xf2%\xef$\xc3\x02\x88\x9c\xf0\xfc\xad\xa5\
-\x96@\xf2\xb0\x8a\xcbZ$\xdb\xee\xe7\x1f\xda\x19\x90K\
-<:c3n\xda\x03\xa5\xfb\xba\xbf\xd5\x1ax\xca\x12\
-\x9d\xaa$\xb3\x02H\x08\xff\xd0\x82\x97\xcf\x02\xd2k\xf7\
-\xf3%w\xcc\xcb-\x16\x85\xf6@n\x0f\x94\xde\xeb\xfe\
-\xae\xc8T\x98L\x0a \xf1\xcf\x025\x0d\xbaS$5\
-\xf1\xdf\xee\xe7\x8cM\xdd!\xd784\xf9\x07\xef\xa0=\
-P\xfcV\xd6iN\x99\x03C\x9f#s\x02\xc8\x04a\
-C\x96\xbdg\xe4\xc1\x92\xf2\xaa\xf3$9\xb1\xb6\xfb\x0d\
-}_\xeeq\xd8\xe1\x8a\x7f\x87\xb9\x16\xa7E%\xe5+\
-\x06G\xf4\xb0!\xb1\xbf\x84\x8c\x09 C\x82C\xd7\xe9\
-;\x9c\x91\xa7\x0b\xb8\xc7]\x5cw\xac_\xbc\xcdQ\x11\
-\xe8L\xde\xe7\x98s\x11\x1d4\xb5\xad`U\xdb\xe9z\
-\xd1\x1e\x9f6\x93!\x01\x14@\xf7\xe0\xc2\xa0\xce\xe8:\
-B\x02\x14\xc5\xed~\xc7\xa4\xdc\xee\xb7\x99\xb7Q\x0d\xad\
-f\xda\x03E`}s\xc7q[d|\x8a\x8c\x08\xa0\
-@\x5c}\xd3\xb7\xd56\xb6\xb0? \x87\xed~\xfe\x91\
-=\x1a\xa5\xc5\xdd\xc5\xdb\x03[\xb8\xc0*GV\xd46\
-\xbeO[\x1f\x00\xac\xfd\x22\xdb_b\x0b\x0e}Wh\
-?#9f\xb1\xb7\xba\xaa\xee\x9c\xd0\xa9\xa1\xd4\xb8\xb3\
-\x85\xc6\xbd\xa5\x155\xc4\x5c\x16-)\xaf>\xd7\xee\x8a\
-\x1d\xe2;?\x00\x5c\xf6 0_a\x0d\x0e\x1db\xa3\
- \xed~Y{\x08\x88\x8cO\xd1\x1e\x98\x9d\x0d~\xfa\
-\xae\xf0\xe3\xc2\x9b\x172\x1d\x00|\x22\xc2+i\xb3\xbf\
-\xffqn\x18\xcc\xe4\xed~\x13_\x22\xd2.b\xf2%\
-i\x0f\xcc\xe0A>-f\xff\xd3\xae\xdeI=\x91\x06\
-\x00\xeb&0\xbe\xcfx\xa1c`-\x89\x90L\xd3z\
-\xbb\xdf\xc3D\xd7Giw\xf5\xd2\x1e\x98\xce3%\x0a\
-\x0a/\xec\xecw\xc4\xb6w\x11]\x00\xb0\xf97\x02\x83\
-\xbb\x83mV\xffoh\x1d\xdc\xba\x86\xae\x9e_\x12Q\
-WFg\xf4\xfc\x92\x18IC\xe1\xefp\xfe\xa6+4\
-\x19 \xa2\x00 }\x0f\x02\xc9]!CW\xe8y\xae\
-\x1e\xa6\xdd/\x13\x5cj\x0f|\x8dX\xd9\xfc/~{\
-4\x15$\x92\x00 c\x04Fv[\x8c\xee\xd8S\xc2\
-\xc6\x22\x92\xef\xfa\xac\xd5\xb4\xbe\xa7\xc4v\xbf\x8dbN\
-\xa4\xd4\xb4\x07\xae\xdfBU\xf1\x8a\xce\xe4}^\xe8\xa8\
- z\x00 {\x0f\x02\xc3\x0b:a\xb3`qY\x05\
-\x0f\x02\xd7\xba\xddop7\xbf\xcc\xd6\xc9\xa5\xdb\x03i\
-\x0f\xbcZ\xe1/*Y\x116\xf7\xd9zS\x9dD\x0c\
-\x00\xe4\x8c\xe8\xe0B\x93\xc5\xdf\xff\xa3\xb5\xa4M\xfb\xe0\
-\x15\xda\xfd\xdc\x89\xb9]D\xc9\xc6\xb0\xf6\x8c\xec\x12~\
-\xdd\x12C\x97\xf7\xf1W\x9d\xd7w\x85~h\x8bo\xe7\
-m\x12\x00\x88\x07\xe1\x1c\x01Gd\xfc\xdez\xad\xe1\x04\
-\xc9\xfaR\xbb_,u7\x91\xb19\xb8=\xf0\x1fV\
-\xd5k\xdf\x13\x0e\xf0\xf1$\xa6k\x88\x0c\x00\x105\xbe\
-\xfe\xb9=\xadf\xcf+\xdb\x14\x9c\xc0\xad\x81\xc1G\x88\
-\x84\xad!\x14=%?@\xaa[LG\x8d\x81\xc1\xdb\
-\x89\x04\x00\x90\x1c\xc2Q\xb7\xc2\x86A\xa5\xed\x13\x10\xba\
-%\x98\xfd\xf4\xd0l\xf4\xbc\x90\xa7\xb0\xef\xfb\x976\xf6\
-\xc5\x98}\x00\x90\xfe\x83\xc0\xc8\x1e\x8dp\xdf}\xb5\xba\
-\xf9t\x9e\xfc\xdb\xfd\x8e\xd2\xee\x97\xc6\xd8\xf1/\xab\x84\
-_\xc2r\x8f\x1b\xe1\x82\x1e\x833\xfa0\xdf\xf7\x01@\
-\xb6\x08\x9f\x07\xf4\xb6\xee\x17U2<\x03\xbe\xa6Aw\
-\xca?\xb8\xb7\x85YN/BQ\x14\xbe\x83\xcb-^\
-\x0a\x0aU\xab\x8dm\xd6#\x17_\xf3\xaf\xe63\xd3\x00\
-\xa0\x08\x846B{\xcf\xc8\x83\x1a\xbd\xe5\xb8\x1c\x92\xb9\
-\xd0\x05A\xbb_\x06\x1f\x02dt{`\x95Zw\xd2\
-\xe0\x88\x1e\xa6\x8d\x0f\x00x+007)\xdc;P\
-RV)\xc9VB\xe1tDO\xdf\xec\x123\x99Y\
-\xac=c\x0bRm\x0f\x14\xbe\xed\x0b\xa7\xf5\x09\x7f\x07\
-f\x12\x00\xe02b\x13\x8b\xb5\x8e\xc8\xc4\xbf5wt\
-\xbd&\x95\xbb\x07\x84\xdd\xda\xce\xe8\xe4]\xcc^v0\
-\xf9\x93w\x09c.\x85\xd8\x10\x8e\xe8\x15\x8e76z\
-\x13\xf7\xd1\xc2\x07\x00\xb0N\x82C\xd7\xe9\x85O\x04\xc2\
-\xa6:1\xb7\x13Z\x03\xc9\xc3\xccVv\x11^\x9f\x8b\
-\xf9\x81\xb0\xa6\xb1\xed\xc4\x85W\xfc\xd1I\x0b\xb3\x05\x00\
-\xb0\x05\x84vB\xcbZ\xa1U\xeb:Du\xc8\x90p\
-K\x22\xb3\x93\x1b\xc4\xd6\x1eXY\xab9\xddj\x0d<\
-e\x8dN\xc6\x99\x1d\x00\x80\x0c\xd0\x9d\x9c\x1f1\xfb\xfa\
-\x9e\xack\xd2\xe7\xf4\xd2\x18n\xf7\xcb\xf1C\xe1\xc5\xf6\
-\xc0c\xb9\x8c\x81\xea\x06\xdd\xbbm\xf6\xd0\x93\xd6\xd0\xf8\
-03\x02\x00\x90E\x84\x9b\x09?\xf8L\x90\xcd=\x03\
-\xc2y\x06\xb4\xfb\xe5\x1eKt\xaa\xa9\xb2^{*/\
-\x07\xaf\xf7\xbbB\x93\x01f\x00\x00@\x0c\xbf\x08S\xbb\
-\xd5\xc2f<\xe1\x08\xe2\xa2\xe2\xd2\x8c\xed\x14\xbf\xd0\xee\
-\x97\xdc\x15b\xc4\xc5A\xa6\xdb\x03\x0bTE\x17\x8e\xe4\
-mw\xc7\x1f\xb4GS<\xf4\x01\x00\x88\x19\xe1b\x22\
-W\xdf\xf4mBka\xad\xa6\xf5\xbdt\xed\x1a\x17\xda\
-\xfd\xdc}\xb3\x8b\x8c\xb0\xc8\xde\x04\x04G\x17\x85B\x9d\
-\xae_\xf9U\xea\xe6\x93\xc2u\xbb\xe6\xc0\xd0\xe7\xeck\
-\xb1\xc4\x08\x03\x00H\x14\xcf\xc0\xbcY\xb8\xa9P8\x81\
-\xb0\xbc\xba\xfe\xecf\x0b\x83#2\xf1eFS\x9c\x98\
-|\xc9;7\xfb\xa0W\x5cVy^8\x91O\xb8|\
-\xc8\x16\x9d\xf41\x9a\x00\x002\xc570?e\xe9\x1e\
-x\xb4\xc9`{}\xbdG\x12[\xba\x93\x8f2r\xe2\
-\xc6\xe0\x88<\xba\x9e\xb9\x14\x0e\x13R\xeb\x8c\xaf\x0b\xff\
-{[d|\x8a\x91\x03\x00P \xc2N~\xe1~\x02\
-\xa1\xcdPgt\x1d\xb9\xd2\xfe\x01\xbd\xad\xfb%FJ\
-\x1a4\x1b\xdd\xbf\xca\xbb\xc2w\xfc\xfa\xe6\x8e\xe3B\x9b\
-\x9ep\xee>\xaf\xf5\x01\x00\xe0c$\x12\xfbK./\
- \x97\xfe\x1bH\xe1-\xc0\x15\xe6\xcf\xc0\xfc\x01|\x8c\
-\xff\x0f*h\xde\x115\x13\xe4\x88\x00\x00\x00\x00IE\
-ND\xaeB`\x82\
-\x00\x00\x22V\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4x\xd4\xfa\
-\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95+\x0e\x1b\x00\x00\x04\xeeiTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 7.1-c000 79\
-.9ccc4de, 2022/0\
-3/14-11:26:19   \
-     \x22> <rdf:RDF\
- xmlns:rdf=\x22http\
-://www.w3.org/19\
-99/02/22-rdf-syn\
-tax-ns#\x22> <rdf:D\
-escription rdf:a\
-bout=\x22\x22 xmlns:xm\
-p=\x22http://ns.ado\
-be.com/xap/1.0/\x22\
- xmlns:dc=\x22http:\
-//purl.org/dc/el\
-ements/1.1/\x22 xml\
-ns:photoshop=\x22ht\
-tp://ns.adobe.co\
-m/photoshop/1.0/\
-\x22 xmlns:xmpMM=\x22h\
-ttp://ns.adobe.c\
-om/xap/1.0/mm/\x22 \
-xmlns:stEvt=\x22htt\
-p://ns.adobe.com\
-/xap/1.0/sType/R\
-esourceEvent#\x22 x\
-mp:CreatorTool=\x22\
-Adobe Photoshop \
-23.3 (Windows)\x22 \
-xmp:CreateDate=\x22\
-2024-04-22T15:08\
-:39+02:00\x22 xmp:M\
-odifyDate=\x222024-\
-04-22T15:34:22+0\
-2:00\x22 xmp:Metada\
-taDate=\x222024-04-\
-22T15:34:22+02:0\
-0\x22 dc:format=\x22im\
-age/png\x22 photosh\
-op:ColorMode=\x223\x22\
- xmpMM:InstanceI\
-D=\x22xmp.iid:1bbc9\
-f41-cae2-8f44-8b\
-a0-75fa93dbb85f\x22\
- xmpMM:DocumentI\
-D=\x22xmp.did:1bbc9\
-f41-cae2-8f44-8b\
-a0-75fa93dbb85f\x22\
- xmpMM:OriginalD\
-ocumentID=\x22xmp.d\
-id:1bbc9f41-cae2\
--8f44-8ba0-75fa9\
-3dbb85f\x22> <xmpMM\
-:History> <rdf:S\
-eq> <rdf:li stEv\
-t:action=\x22create\
-d\x22 stEvt:instanc\
-eID=\x22xmp.iid:1bb\
-c9f41-cae2-8f44-\
-8ba0-75fa93dbb85\
-f\x22 stEvt:when=\x222\
-024-04-22T15:08:\
-39+02:00\x22 stEvt:\
-softwareAgent=\x22A\
-dobe Photoshop 2\
-3.3 (Windows)\x22/>\
- </rdf:Seq> </xm\
-pMM:History> </r\
-df:Description> \
-</rdf:RDF> </x:x\
-mpmeta> <?xpacke\
-t end=\x22r\x22?>E\xd71\xd5\x00\
-\x00\x1d\x0eIDATx\xda\xed\xddkh\x9d\xf7a\
-\xc7\xf1\xc8\xd6\xfd~\xbf\x1d\xdd,Y\x92%\xdb\xf2U\
-\x8e$\xcb\xb6\xac\xfb]\x96m\xd9\xb2\xdc88\x8c\xec\
-R\x1a\xda\x06R\x08\x85B\xf1h)\x83\x95A\x09\x86\
-\xb21\x02\xa3}Q\xc6^,/J\x08y\x19J\xe8\
-:\xcaz[J\x97\xf4Bi\x9btk\xd2\xe5\x1e\xcf\
-\x8f2;\xe9\x96&G\xf7\xf3\x9c\xff\xe7\xc5'\xaf\xc3\
-y\xfe>\xfa\xea<\xe7\xf9\xe9\x9e[\xb7n\xdd\x03\x00\
-\x84\xc5\x8b\x00\x00\x02\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\
-\x00\x00 \x00\x00\x00\x01\x00\x00\x08\x00\x00@\x00\x00\x00\
-\x02\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00 \x00\x00\
-\x00\x01\x00\x00\x08\x00\x00@\x00\x00\x00\x02\x00\x00\x04\x00\
-\x00 \x00\x00\x00\x01\x00\x00\x08\x00\x00@\x00\x00\x00\x02\
-\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00 \x00\x00\x00\
-\x01\x00\x00\x08\x00\x00@\x00\x00\x00\x02\x00\x00\x10\x00\x00\
-\x80\x00\x00\x00\x04\x00\x00\x08\x00\x00@\x00\x00\x00\x02\x00\
-\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00 \x00\x00\xfe\xb8\
-\xce\x95\xe9\xfe\xbd\xe7\x86?\xd9vn\xe4\x91\xb6\xb9\xa1\
-\x1bm\x8b\xa3\x8fv,O\xcc\x1fX^Hx}H\
-\xf9\xf3\xfb\xc0|m\xe7\xa5\xb1km\xb3\xa7\xfe\xaau\
-f\xf0\xb1=\x13\xfd\x8f\xef\x99\x1a\xb8\xd9\xb18\xfc\xf0\
-\xbeK\x13\xe3\xfd\x9f^\xca\x13\x00\x00\xb7\xb5_\x9e\x5c\
-j8}\xfc\xe9\x92\xd6\xc6\x973ss\xde\xb9\xe7\xf6\
-\xdb\xd0\x1f\x93WQ\xfaf\xf5\xd1\xae\xe7\xf6L\x0d~\
-\xf5\xe0\xf5\x99\x16\xaf\x1f)\xf0\x03\xbf\xa8\xfd\xdc\xd0g\
-\xeb\xee=\xf0\xbd\xfc\xaa\xb27?\xec\xfcFv\xe7d\
-\xdf\xaa\xe8n\xfdu\xd3p\xef?w]\x1a;#\x00\
-\x80\xe0\xde4\x9b'N>^P[\xf9\xfaG\xbda\
-\xfe\xd17\xd2\xec\xac[5\xc7\xf7\xff{\xfb\xc5\xb1k\
-^S\xb6\xdb\xbek\xd3{\x1b\x87\x8e?\x95]T\xf0\
-\xf6z\xcfp\xc6\xae\x8c(\x06~\xd5\xbe0\xf49\x01\
-\x00\xa4\xfb=\xc6\x8c\x96\xc9\xc1\xbf\xcf-+~k\xbd\
-o\x9a\x1f\xa4\xeaP\xe7O;/O\xf4y\x8d\xd9j\
-\xd1G\xf8M\xc3\xc7\x9f\xfc\xa8O\xab\xd6\xaa\xac\xa3\xe9\
-?;\x96\xc6.\x0b\x00 -\xef\xed\x97\xef\xdb\xf3\xe2\
-f\xbei\xfe\xdf\x8fV\x9bF\xfb\xfe)\x8a\x0c\xaf7\
-[!\xfa\x01]\xdcT\xfb\xdf[u\x86322n\
-%N\x1ez\xb6\xe5\xfe\xa1\x5c\x01\x00\xa4\x85\xd6\xb93\
-_\xca\xcc\xcf}g\xab\xde8\xff\xe0\xd3\x80\xc3\x9d/\
-t]\x9d\xa8\xf1\xba\xb3\x99\xf6L\xf4\x7f}WV\xe6\
-\xad\xed8\xc3\xd1\xa7\x01\x07>6\xbb_\x00\x00\xb1\xfe\
-\xb8\xb4\xee\xe4\x91g\xb7\xe3M\xf3\xfd\x8an\xff\x96\xd6\
-ue\xb6\xcd5`\xa3\xa2\x98\xac9\xba\xef'\xdb}\
-\x86\xf3*K\xdf\xec\xba2>(\x00\x80\xf8}\x5c\xba\
-<\xd7]\xd6\xd9\xf2\xd2v\xbfq\xbe?\x02:?6\
-\xd7\xecZ\xb0\xee/\xfa]\x9a\x18/j\xa8~u\xa7\
-\xcep~u\xf9\x1b]\xcb\xd3G\x04\x00\x10\x1bm\x8b\
-\xa3\x0fg\x97\x14\xbe\xbdSo\x9cw?J\xbd\x1d \
-\xc7\x1e|0\xcb5a\xad\xf6\xce\x9d\xfa\xf2f\x7f\xd1\
-o]!{;@:\xae\xccV\x0a\x00 \xe5\xbf\xe5\
-\xdf46\xf0\x8d\x8c\xdd\xbbn\xed\xf4\x1b\xe7\x1d\x8d\xc3\
-\xbd\xdftmHV\xf4\x05\xbc\xc4\xe0\xe1gR\xe5\xfc\
-F\xea\xef=\xf8o\x02\x00H\xddA\x9f\xeb\xe7[*\
-\xf6\xef\xfde*\xbdq\xae~\xb3\xfav\x8c\xb4_\x1c\
-\xbf\xee\x1a\xf1Q\xf6\xafL\xf5\x96\xb6&~\x97jg\
-8\xb2w\xfe\xcc_\x0a\x00 \x05\x1f\x8f\x9aZ\xce\xaf\
-\xaex#\x15\xdf8#\xc5-\xf5\xafx<\x90\x0f=\
-\xc3\xe7\xcf~2\xb7\xb4\xe8\xedT=\xc3\xd1\xca`\xf7\
-\xd2R\xa1\x00\x00RF\xf3\xe4\xa9\x9b\xd1*_\xaa\xbe\
-q\xde\xd1:?\xf4\x05\xd7\x8b\x0f\xbam\xd5<r\xe2\
-\x89\xe8\x19\xfcT?\xc3-\xe3\xfd_\x13\x00\xc0\xce\xff\
-\xc6te\xb6\xb2\xfah\xf7s\xa9\xfe\xa6y\xf7S\x80\
-\xe6\xfa\xdf\xbbn\xfc\xc1#~Wf\xdb*\x0f\xb4\xfd\
-*.g8\xb7\xa2\xe4\xad\xad\xfcR\xabC\x01|\xa4\
-\xce\xe5\x99\xd1\xc2\xc6\xdaW\xe3\xf2\xc6yG\xfb\xd2\xf8\
-E\xd7\x8f\xd53|qt%\xbf\xa6\xfc\x8d\xb8\x9d\xe1\
-\xbd\x8bg\x1f\x11\x00\xc0\x8e\xd83w\xf6FVA\xde\
-;q{\xe3\x5c\xfd6\xf5\xe0\x91o\xb9\x86D\x7f\x9e\
-7\x0e\xb7\xad>H\xcd\xb1\xae\xe7\x04\x00\xb0\xadVW\
-\xfd\x06\xb6\x7f\xd5o3E\x7f}\xd0\xb5\x0c\xfb\xb6U\
-\xcd\xd1}?\x8e\xf3\x19\xce.\xca\x7fg\xab\xbe\xd0\xea\
-\x90\x00\xff\xff\x8d3Z\xf5\xeb\xd8\xf3R\x9c\xdf8\xef\
-0\x11\x1c\xa6\xee\xab\x93\xa3E\x8d5\xaf\xa6\xc3\x19\xee\
-\x5c\x9e\x1c\x11\x00\xc0\x96k[\x9cx(\xa7\xb4\xf8\xed\
-tx\xe3\x8c\xb4-\x0e?\xea\xba\x86e\xef\xdc\x99\xd8\
-\xde\xb6\xfa\xc0'ZfO}E\x00\x00[\xfaxT\
-\xe3\xd8\xc9od\xec\xde}+]\xde8#\xcd\xe3\x03\
-_w}\xc3\x90\x8a\xab~\x9b\xb2n9t\xfc)\x01\
-\x00l\xcdo\xfd\xcb\x0b\x89\x8a\x9e\xce\x9f\xa7\xdb\x1b\xe7\
-\xea\x9b\xe7\x99\xde\xa7\x5c\xe3\xf4w`y\xb2\xbb\xbc\xb3\
-\xf9\xa5t<\xc3\x89\x81C\xdf\x16\x00\xc0\xe6\xff\xf0_\
-\x9aZ\xceK\xe1U\xbf\x8d\xaa\xeb\xeb\xf9\x17\xd79\xbd\
-\xb5\x9f\x1f\xfeDN\x0a\xaf\xfa\xa5\xea\x93\x00\x0e\x0f\x04\
-\xac)&\xab~\x1bQ{\xe2\xe0\xf7\x5c\xeb\xf4\xbdm\
-\xd52\xde\x97R\x7f\x8cj+T\x1d\xea\xf8\xa9\x00\x00\
-6\xc5\xe1\xfb\x17Jkz\x0f\xfe \x9d\xdf4\x05@\
-\xba\x7f\xe4?\x9e\xa8\xeai\xffY\x08gX\x00\x00\x9b\
-\xb8\xeaW\xf7j\x08o\x9c\x02 M\x1fS]\x1a\xbb\
-\x9c_]\xfeF(gX\x00\x00\x1b\xff\x96\xf4\xec\xd9\
-\xb4z<J\x00\x04\xba\xea\x97\x9b}+\xa43,\x00\
-\x80\x0d<\x1eu\x7fn\xdd\xc9c\xcf\x84\xf4\xa6)\x00\
-\xd2\xef\xb6U]o\xf7\xf7C<\xc3\x02\x00X\xf7\xaa\
-_i\x9a\xac\xfa\x09\x800\xed_\x99\xee/i\xa9\x7f\
-%\xd43,\x00\x80\xe0W\xfd\x04@\x80\xab~\xe7\xce\
-|>\xb4\xdbV\x02\x00\xd8\xd0\xe3Q\x0d\xa3\xe9\xb7\xea\
-'\x00\xc2q\xec\xc1\x07\xb3\x1a\xcf\x1c}:cWF\
-\xf0gX\x00\x00\xc9\xaf\xfa\x1dL\xcfU?\x01\x10\x86\
-\xaeks\x9d\xe5\xfbZ^t~\x05\x00`\xd5O\x00\
-\x84\xf2\x98\xea\xc5\xd1\x8f\xa7\xf3\xaa\x9f\x00\x00\xb6`\xd5\
-\xef\xcc\xcd]i\xbe\xea'\x00\xac\xfa\x09\x00\x01\x00\xdc\
-}\xc4o\xa1\xb4:\x90U?\x01\x90\xa6\xbf\xf5?0\
-_\x1b\xfd\x90s^\x05\x00\x90\xec7\xa4\x97\xe7G\x0b\
-\x1b\xc2Y\xf5\x13\x00ix\xbf\x7fer\xa6\xb0\xbe\xea\
-ugU\x00\x00I\xaf\xfa\x0d\xdf\xc8*\xc8\x7f\xc7\x1b\
-\xa4\x00\x88\xedwVf\x06\x1f\x0bm\xd5O\x00\x00\x1b\
-[\xf5\x1b\x08s\xd5O\x00\xa4\xcdG\xfeE\xf5\x03=\
-\xdfq>\x05\x00`\xd5O\x00\x84\xf2\xc3\xff\xf2D_\
-ik\xe2\x15gS\x00\x00Ij\xb5\xea'\x00b\xae\
-}a\xe8s\xa1\xaf\xfa\x09\x00\xc0\xaa\x9f\x00\xb0\xea\x87\
-\x00\x00>l\xd5o\x9fU?\x01\x10\xf3U\xbf=V\
-\xfd\x04\x00\x90\xfc\xaa\xdf\xacU?\x01\x10\xef\xfb\xfd\x97\
-\xc6\xae\xe5U\x94\xbe\xe9\x1c\x0a\x00 I\x8dV\xfd\x04\
-@\xcc\xed\x99\xe8\x7f|WV\xa63(\x00\x80\xe4W\
-\xfd\x0eY\xf5\x13\x00\xb1^\xf5\xab>\xdc\xf1\x82\xb3'\
-\x00\x00\xab~;\xaaF\x00l\xdf\xfd\xfe\xe5\xf1\xe9\xc2\
-D\xf5k\xce\x9d\x00\x00\xac\xfa\x09\x80P\x1eS\x9d=\
-\xf5\x95\xdd9V\xfd\x04\x00\x90\xf4\xaa_\xed\xc0q\xab\
-~\x02\xc0\xaa\x1f\x02\x00BZ\xf5+\xe9h\xb5\xea'\
-\x00b\xab\xfb\xbe\xc9\x13\xa5\xad\x89\x97\x9d3\x01\x00$\
-\xbd\xea7i\xd5O\x00\xc4\xfb;+\x0bg>\x97]\
-\xe4\xb6\x95\x00\x00\xd6\xb0\xea7h\xd5O\x00\xc4\xfa\x0c\
-7\x8f\x9cx\xc2\xaa\x9f\x00\x00\xac\xfa\x09\x80P>\xf2\
-\xbf:\xd5Q\xd1\xb5\xe77\xce\x95\x00\x00\xac\xfa\x09\x80\
-P\xbe\xecwq\xe4\xbe\xfc\xaa2\xab~\x02\x00Hz\
-\xd5o\xc2\xaa\x9f\x00\xb0\xea\x87\x00\x80\xa0V\xfd\xaa\x8e\
-[\xf5\x13\x001\x1e\xf6\xb9:QSsd\xdf\xf3\xce\
-\x91\x00\x00\xd6\xb0\xeaW`\xd5O\x00\xc4\xd8\xbe+\xe3\
-\x13E\x0d\xd5\xce\xb0\x00\x00\x92\xd5<;z#\xd3\xaa\
-\x9f\x00\x88\xf5\xaa\xdf\xe0\xdfd\xe6\xe68\xc3\x02\x00\xb0\
-\xea'\x00\xc28\xc3C\xb9\x89\xc1\xc3\xce\xb0\x00\x00\x92\
-\xfe\x92\x94U?\x01\x10s\xfbW\xa6zK[\x13\xbf\
-sf\x04\x00\xb0\x86U\xbfl\xab~\x02 \xc6\xda/\
-\x8e|*\xa7\xa4\xd0\x19\x16\x00@\xf2\xab~\xa7\xac\xfa\
-\x09\x80X\x9f\xe1\xa6h\xd5/\xc3\xaa\x9f\x00\x00\x92^\
-\xf5+?\xd8e\xd5O\x00\xc4\xf7[\xfe\xd7\xa6\xf7V\
-t\xb7\xfe\xda\x19\x11\x00@\xb2\xf7\xfb/D\xab~\x95\
-V\xfd\x04@lu\x5c\x1a\xbf\x9ag\xd5O\x00\xf8\xc7\
-\x00\xc9k\x988k\xd5O\x00\xc4\xfb\x9b\xfe\x13\x03\x8f\
-\xef\xca\xb4\xea'\x00\x04\x00X\xf5\x13\x00A8\xf8\xe7\
-3e\xb5\xbd\xfb\x7f\xe8L\x08\x00\x01\x00kZ\xf5\xab\
-\xb7\x88&\x00\xe2{\xbf\xff\xd2\xc4xa\xc2\xaa\x9f\x00\
-\x10\x00\x90\xfc\xaa\xdf\x8cU?\x01\x10\xf3/\xac\xce\x0f\
-}!3?\xd7\x19\x16\x00\x02\x00\x92]\xf5\xab\x19\xe8\
-\xb5\x88&\x00b\xbd\xeaW\x7f\xf2\x883,\x00\x04\x00\
-\xaci\xd5\xaf\xdd\xaa_\xfa\x04@Op\x01\xd0\xb52\
-y\xb4\xb4\xad\xd1\xaa\x9f\x00\x10\x00\x90\xf4oM\x0b\xd3\
-\x0fe\x97\x96XD\x13\x00\xf1\xfd\xce\xca\xf9\xe1O\xe6\
-\x94\x169\xc3\x02@\x00@\xb2\x8bh\x89\x11\xab~\x02\
-\xc0\xaa\x1f\x02\x00\xac\xfa!\x00b\xa2\xfb\xbe\xd9\x86\xca\
-\x9e\xf6_\xb8\xde\x02@\x00\x80U?\x02\x09\x80\x8e\xe5\
-\x89\xe5\xfc\xeargX\x00\x08\x00\xb0\xeaG(\x01\xd0\
-25xs\xb73,\x00\x04\x00$\xbf\xeaWy\xfc\
-\xb0U?\x01\x10[\x87o\x9f\xe1\xda\xde\x03\xce\xb0\x00\
-\x10\x00\x90\xf4\x0f\xff\xe5E\xab~\x02 \xd6:\xaf\xce\
-\x8c\x165\xd6:\xc3\x02@\x00@\xb2\x1ag\xc6\xac\xfa\
-\x09\x80x\x7faun\xe8FVA\x9e3,\x00\x04\
-\x00$\xbb\xeaWm\xd5O\x00X\xf5C\x00\x08\x00B\
-Z\xf5\xbb\xd0]\xd2\xdef\xd5O\x00\xc4\xf8[\xfes\
-\xdde\x9d-\xce\xb0\x00\x10\x00`\xd5\x8fP\x02\xa0\xed\
-\xfc\xc8'rJ\x8b\x9da\x01 \x00 \xd9E\xb4\xfa\
-\x91\xd3V\xfd\x88m\x00\xac\xae\xfa\x8d\xf5\xdf>\xc3\xbb\
-\x5cC\x04\x00$\xbd\xeaw\xc0\xaa\x1f\xf1\x0d\x80\x03\xb7\
-\xcfpeO\xc7\xcf\x5c;\x04\x00$\xbd\xea7\xbf\x9c\
-k\xd5\x8f\x18\x07@\xc7\xd2\xc4e\xab~\x08\x00X\x83\
-\xc4\xf8\xb0U?b\x1d\x00\xab\xab~9\xd9\xae\x19\x02\
-\x00\xac\xfa\x11B\x00D\xab~5\xbd\x07\xbe\xefZ!\
-\x00\xc0\xaa\x1f\x81\x04@\xe7\xcat\x7fqK\xe2\x15\xd7\
-\x09\x01\x00V\xfd\x08$\x00\xda\x16\x86?o\xd5\x0f\x01\
-\x00kZ\xf5;a\x11\x8d\xd8\x06\xc0\xb1\x07\x1f\xccJ\
-\x9c>\xfetFF\x86\xeb\x83\x00\x80dW\xfd\x8a\xad\
-\xfa\x11\xe3\x00\xe8\xba6\xd7Y\xb6o\xcf\x8b\xae\x0b\x02\
-\x00\x92\xd4d\xd5\x8f\x98\x07@\xfb\x85\xf1\x8f\xe7\x94\x15\
-\xbf\xe5\x9a \x00 \xc9E\xb4\xba\xe13V\xfd\x88m\
-\x00\xbc\xbb\xea7`\xd5\x0f\x01\x00kY\xf5+;\xd0\
-m\xd5\x8f\xd8\x06@\xe7\x03\xf3\xb5U=\x9d?u\x1d\
-\x10\x00\x90\xa4\xe6h\xd5\xaf\xca\xaa\x1f\xf1\x0d\x80\x8e\xcb\
-\xb33\x05\xf5\xd5\xaf\xbb\x06\x08\x00\xb0\xeaG \x01\xd0\
-<}\xfa1\xab~\x08\x00X\xd3\xaa\xdf\x11\xab~l\
-\xaa\xeam\x0c\x80\xce\x07\xe6\x8bj\xfb\x0f\x7f\xc7\xeb\x8e\
-\x00\x80d\x7f\xf8_\xb4\xeaG\xbc\x03\xa0\xf3\xf2L_\
-qK\xe2e\xaf9\x02\x00\x92\xd403a\xd5\x8fX\
-\x07@\xeb\xfc\xc8\xe7\xb2\x8a\x0a\x9ca\x04\x00$\xbd\xea\
-\xd7o\xd5\x8f\xf8\x06\x80U?\x04\x00X\xf5#\xb0\x00\
-h\xbf\xba\xd0Q\xb6\xaf\xed7^c\x04\x00$\xbd\xea\
-7k\xd5\x8fX\x07@\xfb\xc5\x89k\xb9\x15\xa5oz\
-}\x11\x00`\xd5\x8f@\x02\xa0i|\xf0\xf1]\x99\x99\
-^[\x04\x00X\xf5#\x84\x00\x88V\xfd*\x0f\xed{\
-\xc1k\x8a\x00\x00\xab~\x04\x12\x00\x1dKS\xd3\x05\xf5\
-5\xafy=\x11\x00\x90\xa4\xfa\xf1\x91\x9b\xbbsr\xfc\
-#&\xb6\x01\xd02}\xe6+V\xfd\x10\x00\xb0\x86U\
-\xbf\x8acV\xfd\x88o\x00\xac\xae\xfa\xf5\x1d\xb1\xea\x87\
-\x00\x80\xb5\xac\xfa\xe57$\xac\xfa\x11\xdb\x00\xe8\xb82\
-{\xa2\xb8\xb5\xd1\xaa\x1f\x02\x00\x92^\xf5\x9b\xb2\xeaG\
-\xbc\x03\xa0ma\xec\xe1\xec\x92\x22\x8f\xa9\x22\x00 \xd9\
-U\xbf\xaa\xfe{\xad\xfa\x11\xdb\x00\x88\x1eSm\x18\xee\
-\x7f\xc2\xaa\x1f\x02\x00\xac\xfa\x11H\x00X\xf5C\x00\x80\
-U?\x02\x0b\x80\xd6\xf3\x13\xf7\xe5U\x95[\xf5C\x00\
-@\xb2\x1f\x97\xd6\x0e\x0fY\xf5#\xd6\x01\xd04~\xca\
-\xaa\x1f\x02\x00\x92_\xf5[N\x94\x1e\xd8o\xd5\x8f\xd8\
-\x06@\xd7\xd5\xc5\x9a\xca\xc3\xdd\xcf{}\x10\x00\x90\xf4\
-\xaa\xdf\xe2rnU\x95U?b\x1b\x00{\xaf\xccN\
-\x14$j=\xa6\x8a\x00\xf0C\x8d\xe4W\xfdF\xad\xfa\
-\x11\xc3\x008t7\x00\xf6\xcc\x0d\x7f13?\xd7c\
-\xaa\x08\x00\x01\x80U?B\x08\x80\xe81\xd5\xba\x93\xc7\
-<\xa6\x8a\x00\x10\x00$\xff\x91\xff\xb9\xf1\xfc\xfaz\x1f\
-\x97\x02\x08\x00B\x91\x98\x9a\xb4\xea\x07 \x00\x08j\xd5\
-\xaf\xcf\xaa\x1f\x80\x00 \xa8U\xbf\xa2\xf6\xbdV\xfd\x00\
-\x04\x00\xc1\xfc!\x9f9\xab~\x00\x02\x80\xb0V\xfd\xce\
-\x9e\xb5\xea\x07 \x00\xb0\xea\x07\x80\x00 =?\xf2\xb7\
-\xea\x07 \x00\x08K\xdd\x98U?\x00\x01@H\x8f\xf8\
-\x95V\x1c;j\xd5\x0f@\x00\xf8\xa1\x18\x8a\xc6\x8b\x17\
-G\xf3\x1b\x12V\xfd\x00\x04\x80\x00\xb0\xea\x07\x80\x00\xc0\
-\xaa\x1f\x00\x02\x80\x98\xaf\xfa]\xb0\xea\x07 \x00\x04@\
-`\xab~s\x0fe\x97X\xf5\x03\x10\x00\x02 \x98U\
-\xbf\x1a\xab~\x00\x02@\x00\x84\xb5\xeaW\xb2\xdf\xaa\x1f\
-\x80\x00\x10\x00\xe1|\xe4\xbf\xb8\xb8\x9cc\xd5\x0f@\x00\
-\x08\x80\x90V\xfd\xc6n\xee\xb2\xea\x07 \x00\x04@8\
-\xab~\xe5\xc7\x8eY\xf5\x03\x10\x00\x02 \xa8U\xbf\x84\
-U?\x00\x01 \x00\xc2\xf9\xc8\x7fj\xeaFfA\x81\
-U?\x00\x01 \x00BY\xf5\xab\xec\xeb\xb3\xea\x07 \
-\x00\x04@0\xdf\xf2_]\xf5k\xb7\xea\x07 \x00\x04\
-@H\xab~YV\xfd\x00\x04\x80\x00\xb0\xea\x07\x80\x00\
-\x10\x00\xe9\xf8\xe7{WW\xfd\x0eX\xf5\x03\x10\x00\x02\
- \x9cU\xbf\x0bV\xfd\x00\x10\x00!\xa9\xb5\xea\x07\x80\
-\x00\x08l\xd5\xef\xa8U?\x00\x04@P\xab~y\x89\
-\x06\xab~\x00\x08\x80`V\xfd&\xa7nd\xe6[\xf5\
-\x03@\x00\x04\xb3\xeaW\xd1\xd7o\xd5\x0f\x00\x01\x10\xce\
-\xaa\xdfrw\xd1^\xab~\x00\x08\x80p\x9e\xef\x9f[\
-x(\xab\xa4\xd4\xaa\x1f\x00\x02 \x9cU\xbfa\xab~\
-\x00\x08\x00\xab~\x00 \x00\xac\xfa\x01\x80\x00\x88\xbf\x9a\
-\xb1q\xab~\x00\x08\x80\x90V\xfd\xca\x8e\x1e\xb7\xea\x07\
-\x80\x00\xb0\xea\x07\x00\x02 =\xff\x90\xcf\xe4\x8cU?\
-\x00\x04@P\xab~\xf7Z\xf5\x03@\x00\x04\xb5\xeaW\
-h\xd5\x0f\x00\x01`\xd5\x0f\x00\x04@\x9a\xae\xfaU\x9f\
-\x1d\xb1\xea\x07\x80\x00\xb0\xea\x07\x00\x02 \x8dW\xfd\xaa\
-\xad\xfa\x01 \x00\x82Y\xf5\x1b\xb5\xea\x07\x80\x00\xb0\xea\
-\x07\x00\x02 ]W\xfd\x96\xad\xfa\x01 \x00B[\xf5\
-\xdbm\xd5\x0f\x00\x01\x10\xce\xaa_\xf9\xbd\x03V\xfd\x00\
-\x10\x00V\xfd\x00@\x00\xa4\xe7\xf3\xfd\xb3V\xfd\x00\x10\
-\x00A\xad\xfaUY\xf5\x03@\x00\x84\xb5\xeaW\xbc\xff\
-\xa0U?\x00\x04@(\xea\x17\x97\xac\xfa\x01 \x00B\
-R=:a\xd5\x0f\x00\x01\x10\xd2\xaa_\xa9U?\x00\
-\x04@8\x01Po\xd5\x0f\x00\x01\x10V\x00\xd4N\xce\
-Z\xf5\x03@\x00\x84\x12\x00V\xfd\x00\x10\x00\x81\x05\xc0\
-\xbb\xab~\x1dV\xfd\x00\x10\x00\xa1\x04@\xdd\xec\xa2U\
-?\x00\x04@(\x01\xb0\xba\xea74j\xd5\x0f\x00\x01\
-\x10J\x00X\xf5\x03@\x00\x04\x16\x00V\xfd\x00\x10\x00\
-\x81\x05@\xf5\xe8\xa4U?\x00\x04@(\x01\xd0\xb2p\
-\x7fi\xe9\x91^\xab~\x00\x08\x80P\x02\xa0~1Z\
-\xf5k\xb4\xea\x07\x80\x00\x08%\x00j\xac\xfa\x01 \x00\
-\xc2\x09\x80wW\xfdNZ\xf5\x03@\x00\x84\x12\x00V\
-\xfd\x00\x10\x00\x81\x05\x80U?\x00\x04@@\x01\x10\xad\
-\xfaU\x0e\x8dY\xf5\x03@\x00\x84\x12\x00\xd1\xaa_\xd1\
-\xfe\x1e\xab~\x00\x08\x80P\x02 Z\xf5\xcb\xb6\xea\x07\
-\x00\xe1\x04@\x95U?\x00\x08'\x00\xa2U\xbf\x12\xab\
-~\x00\x10N\x00D\xab~\xb9V\xfd\x00 \x9c\x00\xa8\
-\x99\x98\xb3\xea\x07\x00\xa1\x04@\xb4\xeaWf\xd5\x0f\x00\
-\xc2\x09\x80\xa6\x95\xeb-\x05m\x1d\xbfuQ\x01 \x90\
-\x00h8\xbf\xd2\x9f[[\xff\xba\x0b\x0a\x00\x81\x04@\
-\xed\x85k\x9d95\xb5~\xf8\x03@(\x01\x10=\xe6\
-\x97\xd7\xd8\xfc{\x17\x12\x00\x02\x0a\x80\xd2c}\xdfu\
-\x11\x01 \xa0\x00\xa8\x9eZ\xf8\xac\x0b\x08\x00\xeb\x0d\x80\
-\xce\xf8\x05@\xf4\xb8_n]\xe25\x17\x10\x00\x02\x0a\
-\x80\xca\xa1\xf1\xaf\xb9x\x00\x10P\x00\xdc\xfeOFN\
-M\x9do\xfd\x03@H\x01\xe0\xde?\x00\x04\x18\x00\xc5\
-=\xc7\x9es\xe1\x00 \xa0\x00\xb8gh(3\xb3\xb8\
-\xe4m\x17\x0e\x00\x02\x0a\x80\xba\xb9Ks.\x1a\x00\x04\
-\x16\x00U\xe3s_v\xd1\x00 \xb0\x00(\xef?\xfd\
-\xb4\x8b\x06\x00\x81\x05@\xe9\xf1\xfe\x7fu\xd1\x00 \xb0\
-\x00\xf0\x04\x00\x00\x08\x00\x00\xc0-\x00\x00 =\xbf\x04\
-80\xf4\x94\x8b\x06\x00\x1e\x03\x04\x00\xd2=\x00\x0c\x01\
-\x01@\x80\x01\x10M\x01g\x95\x94\x9a\x02\x06\x80\x90\x02\
- Rr\xb8\xf7\x87.\x1c\x00\x04\x16\x00\xd5S\xe7\xfc\
-9`\x00\x08-\x00n\xff'#\xa7\xa6\xeeu\x17\x0f\
-\x00\x02\x0a\x80H\xc5\xd0\xe4?\xb8x\x00\x10X\x00\xb4\
-\xdc\x7f\x7fnNm\xe25\x17\x10\x00\x02\x0a\x80\xd5M\
-\x80\xe9\xc5G]@\x00\x08,\x00V\x9f\x080\x0d\x0c\
-\x00\xe1\x05@\xcb\xc2\xfd\xa5y\x8d-\xaf\xb8\x90\x00\x10\
-P\x00Dj\x97\xaev\xe4\xd4\xd6{*\x00\x00B\x0a\
-\x80\xd5\x08X\xb8\xdc'\x02\x00 \xb0\x00X\x1d\x08Z\
-\xb9\xde\x92\xdf\xd6\xf1[\x17\x15\x00\x02\x0a\x80;\x8f\x07\
-\x96\x9d\x18|\xc6\x85\x05\x80\x80\x02\xe0\xee#\x82\x13s\
-7v\xe7\x17\xbc\xe3\x02\x03@@\x01\x10\xa9_\xbc:\
-\x9a[\xdf\xf8\xaa\x8b\x0c\x00\x01\x05\xc0\x9d\xc7\x04K\x8e\
-\x9c\xf8\x81\x0b\x0d\x00\x01\x05\xc0\x1d\x95#S7w\xe5\
-\xe4\xba\xe0\x00\x10R\x00\xac>*8\xbf\xbc\x9c]Y\
-\xfd\x86\x8b\x0e\x00\x01\x05@$\xb1\xb0\x9c(\xea>\xf4\
-s\x17\x1e\x00\x01\x10P\x00\xfc\xef\xffXF\xc5\x99\xf1\
-od\xec\xde\xed\x00\x00 \x00B\x09\x80;jf/\
-<\x94UR\xfa\xb6C\x00\x80\x00\x08(\x00\x22\x0d\x17\
-\x96\xbb\x0b\xda:_r\x10\x00\x10\x00\x01\x05\x80\xf5@\
-\x00\x04@\xa0\x01`=\x10\x00\x01\x10p\x00X\x0f\x04\
-@\x00\x04\x1a\x00\xd6\x03\x01\x10\x00\x81\x06\xc0\xdd[\x02\
-\xd6\x03\x01H\xe7\x00\xe8\x11\x00\xd6\x03\x01\x10\x00\x02\xc0\
-z \x00\x02 \xf8\x00\xb0\x1e\x08\x80\x00\x084\x00\xac\
-\x07\x02 \x00\x02\x0e\x00\xeb\x81\x00\x08\x80@\x03\xe0\xbd\
-\xf5\xc0\x93\xd6\x03\x01\x10\x00!\x05\x80\xf5@\x00\x04@\
-\xc0\x01`=\x10\x00\x01\x10h\x00\xbc\xb7\x1e\xd8k=\
-\x10\x00\x01\x10R\x00\xfc\xe1z`\x8e\x83\x05\x80\x00\x08\
-\x8d\xf5@\x00\xe2\xa0R\x00l\xd5z`\x8f\xf5@\x00\
-\x04@h\xac\x07\x02 \x00\x02f=\x10\x00\x01\x10(\
-\xeb\x81\x00\x08\x80@\xad\xae\x07\xdek=\x10\x00\x01\x10\
-\xe6\xa3\x82\xd6\x03\x01\x10\x00aZ]\x0fLX\x0f\x04\
-`'\x03`\x9f\x00\xb0\x1e\x08\x80\x00\x10\x00\xd6\x03\x01\
-\x10\x00\x02\xc0z \x00\x02@\x00l\xd5z\xe0\xb2\xf5\
-@\x00\x04@\xb8\xeb\x81C\xd6\x03\x01\x10\x00\xd6\x03\x01\
-@\x00X\x0f\x04\x00\x01`=\x10\x00\x04\x80\xf5@\x00\
-\x10\x00\xd6\x03\x01@\x00X\x0f\x04\x00\x01`=\x10\x00\
-\x01 \x00\xac\x07\x02 \x00\x04\x80\xf5@\x00\x04\x80\x00\
-H\xed\xf5\xc0J\xeb\x81\x00\x08\x00\xeb\x81\x00 \x00\xac\
-\x07\x02\x80\x00\xb0\x1e\x08\x00\x02 }o\x09X\x0f\x04\
-@\x00X\x0f\x04\x00\x01`=\x10\x00\x01 \x00\xac\x07\
-\x02 \x00\x04\x80\xf5@\x00\x04\x80\x00\xb0\x1e\x08\x80\x00\
-\x10\x00i\xb3\x1e8f=\x10@\x00\x08\x00\xeb\x81\x00\
-\x08\x00\x01`=\x10\x00\x01 \x00\xac\x07\x02 \x00\x04\
-\x80\xf5@\x00\x04\x80\x00H\xaf\xf5\xc0e\xeb\x81\x00\x02\
-@\x00X\x0f\x04@\x00\x08\x00\xeb\x81\x00\x08\x00\x01\x10\
-\xc2z\xe0\x92\xf5@\x00\x01 \x00\xac\x07\x02 \x00\x04\
-\x80\xf5@\x00\x04\x80\x00\xb0\x1e\x08\x80\x00\xc0z \x00\
-\x02\x00\xeb\x81\x00\x08\x00\xac\x07\x02 \x00\xb0\x1e\x08\x80\
-\x00\xc0z \x00\x02\x00\xeb\x81\x00\x08\x00\xac\x07\x02\xb0\
-!\x15\x02\x00\xeb\x81\x00\x02@\x00`=\x10 \x88\x00\
-\xe8\x12\x00X\x0f\x04\x10\x00\x02\x00\xeb\x81\x00\x02@\x00\
-`=\x10@\x00\x08\x00\xac\x07\x02\x08\x00\x01\xc0\xfa\xd4\
-\x9d\xbb4\x9e[\x97\xb0\x1e\x08 \x00\xb0\x1e\x081z\
-\xf3<~\xec{\xd1m\xad\xaa\xbe{\xdd\xd6B\x00\x08\
-\x00\xac\x07\x12R\x00\xdc\xdd\xbd\x98\x9e\xfc\xe2\xee\xbc<\
-\xb7\xb5\x10\x00\x02\x805\xffA!\xeb\x81\xc48\x00\x22\
-MK\x17&\xf2\xeb\xeb\xdd\xd6B\x00\xf8\xa1\x86\xf5@\
-B\x0a\x80\xd5\x08XY)+?r\xf8G^\x1f\x04\
-\x00X\x0f$\xa0\x00\xb8\xfb\xf70F\xce>\xbe+3\
-\xd3\xeb\x84\x00\x805?%`=\x90\x18\x07@\xa4q\
-q\xe1jNe\xc5\x9b^+\x04\x00\xack=\xb0\xc3\
-z \xb1\x0c\x80\xc8\x9e\xcb\x97\xf7\x96\xec\xeb\xfc\xb5\xd7\
-\x0b\x01\x00\xd6\x03\x09(\x00\xee\xdc\xd6\xaa\x19:\xfdD\
-FF\x86\xd7\x0d\x01\x00\xd6\x03\x09%\x00\xee\xde\x12\x98\
-\x9f\xfbTVq\xb1\xdbZ\x08\x00X\xf3\xa3\x82\x8b\xcb\
-\xa3\xb9\x89F\x8fY\x11\xcb\x00X}J\xe0\xd2bo\
-aK\xf3\xef\xbc~\x08\x00\xb0\x1eH@\x01p\xe7\xb6\
-\x96\xf5@\x04\x00\xac{=p\xd2z \xb1\x0c\x00\xeb\
-\x81\x08\x00\xb0\x1eH\xc0\x01\xf0\xdez`\x9d\xdbZ\x08\
-\x00\xb0\x1eHH\x01\x10i^\x5c\xac)\xeb9\xf8\x1f\
-^S\x04\x00X\x0f$\xa0\x00\xb8;~e=\x10\x01\
-\x00\xeb]\x0f\x5c\xb4\x1eHl\x03\xc0z \x02\x00\xac\
-\x07\x12h\x00X\x0fD\x00\x80\xf5@\x02\x0d\x00\xeb\x81\
-\x08\x00\xb0\x1eH\xa0\x01`=\x10\x01\x00\xd6\x03\x098\
-\x00\xac\x07\x22\x00\xc0z \x81\x06\xc0\xdd\xf5\xc0~\xeb\
-\x81\x08\x00X\xdfz\xe0\xe8\xe4\xcd]Y\xd9\xfe\xe1\x13\
-\xbb\x00\xb0\x1e\x88\x00\x80\x0d\xdf\x12XZ\xce\xae\xb2\x1e\
-H<\x03\xc0z \x02\x006\xba\x1e\xb8\xdfz \xf1\
-\x0c\x80\xd5\xf5\xc0\xab\xd6\x03\x11\x00`=\x90\xe0\x02\xc0\
-z \x02\x00\xac\x07\xb2So\x9e\xc7v>\x00\xac\x07\
-\x22\x00`\xa3\xeb\x81{\xad\x07\x12\xcf\x00\xb0\x1e\x88\x00\
-\x00\xeb\x81\x04\x1a\x00\xd6\x03\x11\x00\xb0\xd1\xf5\xc0I\xeb\
-\x81\xc43\x00\xac\x07\x22\x00\xc0z \xdb\xa0<E\x03\
-\xc0z \x02\x00\xac\x07\x12h\x00X\x0fD\x00\x80\xf5\
-@\x02\x0d\x00\xeb\x81\x08\x00\xb0\x1eH\xc0\x01`=\x10\
-\x01\x00\xd6\x03\x094\x00\xac\x07\x22\x00\xc0z \x81\x06\
-\x80\xf5@\x04\x00X\x0f$\xe0\x00\xb0\x1e\x88\x00\x80\x0d\
-\xae\x07\x16Z\x0f\x14\x001>\xc3\xd6\x03\x11\x00\xb0\x81\
-\xc7\xac\xca\xad\x07\x0a\x80\x98\xdf\xd6\xb2\x1e(\x00\x04\x00\
-X\x0f$\xb0\x00\xb0\x1e(\x00\x04\x00l\xc2z`\x9e\
-\xf5@\x01\x10c\xd6\x03\x05\x80\x00\x80\x0d\xac\x07\x96Z\
-\x0f\x14\x001\xbf\xade=P\x00\x08\x00X\xa7j\xeb\
-\x81\x02 \xee\xbb\x17\xd6\x03\x05\x80\x00\x80\xf5\xaf\x07\xe6\
-X\x0f\x14\x00q\xbe%`=P\x00\x08\x00X\xffz\
-`\xf1\xfe\x83\xd6\x03\x05@l\xbd\xbb\x1ex\xc0z\xa0\
-\x00\x10\x00\xb0\xbe\xf5\xc0Q\xeb\x81\x02 \xde\xe3W\xd6\
-\x03\x05\x80\x00\x00\xeb\x81\x84\x17\x00\xab_\x10\xb4\x1e(\
-\x00\x04\x00X\x0f$\xbc\x00xo=\xb0\xc3z\xa0\x00\
-\x10\x00`=P\x00\x84x[\xabv\xe8\x94\xf5@\x01\
- \x00`}\xeb\x81\xb3\xd6\x03\x05@\xcc\xd7\x03g\xac\
-\x07\x0a\x00\x01\x00\xd6\x03\x05@\x88\xac\x07\x0a\x00\x01\x00\
-\xd6\x03\x05@\xc0\xb7\xb5\xac\x07\x0a\x00\x01\x00\xd6\x03\x05\
-@\xa8_r\x9d\x9e\xb0\x1e(\x00\x04\x00X\x0f\x14\x00\
-A\xde\x12\xb0\x1e(\x00\x04\x00X\x0f\x14\x00a\xb2\x1e\
-(\x00\xfcC\x00\xeb\x81\x02 \xe4\xf1+\xeb\x81\x02\x00\
-\xb0\x1e(\x00\x02\xfd\x82\xa0\xf5@\x01\x00X\x0fL\xbf\
-\x008.\x00\xac\x07\x0a\x00\x01\x00\xd6\x03\x05\x00\xd6\x03\
-\x05\x80\x00\x00\xeb\x81\x02\x00\xeb\x81\x02\x00\xb0\x1e(\x00\
-\xb0\x1e\x98rgX\x00\x80\xf5@\x04\x80\xf5@\x01 \
-\x00\xc0z \x02\xc0z\xa0\x00\x10\x00`=\x10\x01`\
-=P\x00\x08\x00\xb0\x1e\x88\x00\xb0\x1e(\x00\x04\x00X\
-\x0f\x14\x00X\x0f\x14\x00\x02\x00\xac\x07\x0a\x00\xac\x07\x0a\
-\x00\x07\x19\xac\x07\x0a\x00\xac\x07\x0a\x00\xc0z\xa0\x00\xc0\
-z\xa0\x00\x00\xac\x07\x0a\x00\xac\x07\x0a\x00\xc0z\xa0\x00\
-\xc0z\xa0\x00\x00\xac\x07\x0a\x00\xac\x07nm\x00t\x0b\
-\x00\xb0\x1e\x88\x00\xb0\x1e(\x00\x04\x00X\x0fD\x00X\
-\x0f\x14\x00\x02\x00\xac\x07\x22\x00Rq=\xb0\xfc\xd0\xc1\
-\xe7\x9dE\x01\x00\xac\xe31\xab*\xeb\x81\x02\xc0z\xa0\
-\x00\x10\x00`=\x10\x01`=P\x00\x08\x00\xb0\x1e\x88\
-\x00\xb0\x1e(\x00\x04\x00\x84\xb1\x1e8\xe01+\x01`\
-=P\x00\x08\x00\xb0\x1e\x88\x00\xb0\x1e(\x00\x04\x00\x04\
-\xb6\x1e\xd8\xe01+\x01`=P\x00\x08\x00\xb0\x1e\x88\
-\x00\x88\xe3z\xe0\x09\xb7\xb5\x04\x00`=P\x00\x84\xba\
-\x1e\x98i=P\x00\x00\xd6\x03\x05@\x88\xeb\x81\x0b\xd6\
-\x03\x05\x00`=P\x00X\x0fD\x00\x00\xd6\x03\x05@\
-X\x9fh\x8d\x0cY\x0f\x14\x00\x80\xf5@\x01\x10\xeaz\
-`n\xe0\xeb\x81\x02\x00\xb0\x1e(\x00\xac\x07\x0a\x00\x01\
-\x00X\x0f\x14\x00\xd6\x03\x05\x80\x00\x00\xac\x07\x0a\x80\x10\
-\xbe \x18\xe0z\xa0\x00\x00\xac\x07\x0a\x00nk\x0dl\
-=P\x00\x00\xd6\x03\x05\x00\xef\xbb\xadU\x1d\xc8z\xa0\
-\x00\x00\xb6f=0;[\x00\x10\xdf/\xb9\xce\xa4\xff\
-z\xa0\x00\x00\xac\x07\xaeC\xc5\x89\xbeo\xbb\xcei~\
-K \xcd\xd7\x03+\x8e\x1c|N\x00\x00\xd6\x03\xd7\xa8\
-j\xf0\xf4\x93\xae\xb1\xf5\xc08\xab\xee?\xfe\xac\x00\x00\
-\xb6v=\xf0l\xfa\xad\x07V\x0f\x8f|\xcd\xf5\x0d\xe8\
-\x13\xad\xd1\xf4[\x0f\xac;s\xf2\x9b\x02\x00\xb0\x1e\xb8\
-F\x89\xd9\xb9\xcf\xb8\xae\xd6\x03\xe3\xacaz\xf4\xaf\x05\
-\x00`=p\x8d\x9aVVZ\x5c\xd3\x00\xd7\x03\xaf\xa5\
-\xcfz`\xdb\xa5\xf3\xfd\x02\x00\xd8\xbe\x08X\xfat^\
-\xf9\x89\x81g\xe3\xfc\xc6\x99[[\xf7\xbak\x19\xae\xa1\
-\xa1\xa1\xcc\x9a\xc1\xfe\xa7\xe3\xbc\x1e\x98]\x5c\xf4\xf6\x16\
-\xde\xf6sH\x80\xf4\x5c\x0f\xac\xe8\xeb\x7f\xc65$\xce\
-\xeb\x81\x95\xc7\x0e}_\x00\x00;\xf7\xc5\xaa\x8b\xf1\x5c\
-\x0fl8w~\xd1\xf5#\xce\xeb\x81\xcd\x8b3\x1f\x17\
-\x00\xc0\xce~9\xf0\xca\x95\xca\x92CG\x9e\x8b\xcb\x1b\
-g~c\xd3\xef]7\xde\xaf{i\xa9\xb0\xf2\xc4\xb1\
-\xef\xc6\xe6\x16Vu\xe5\x1b\xd1\xd39\x02\x00\xb0\x1e\xb8\
-\x96G\xa7\xa6f?\xefz\xf1\x81\xdfo\x89\xc9z`\
-\xc3\xf8\xf0\xcd-~\xf4\xd7a\x00\xd2k=\xb0\xa0\xb9\
-\xe5\x95\xad\xfc\xcd\x894\xb8%\x90\xe2\xeb\x81\xf9u5\
-\xafG\x7f\xef@\x00\x00)'z\xbc\xaeh\xdf\xfe_\
-\xa6\xda\x1bg4d\x94\x98?\x7f\xdd5\xe2#\xbf\x1c\
-\x98\xa2\xeb\x81\xd1S\x0bM\xf3\x93\x8fl\xc3\xf8\x97C\
-\x00\xac\xfb\x0d$\xe5\xd6\x03\xabN\x9d\xf9\xa6k\xc3\x9a\
->\xd1J\xb1\xf5\xc0\xea\xfe\xdeom\xd3\xbf_\x17\x1f\
-\xd8\xe0\x17\x04g\x17\x1e\xce,.\xd9\xf1\xc7\xac\x8a\xda\
-;_\xbcgh(\xd35a\xcd\x9fh\x9d\x9b\xfd\x93\
-\x9c\xf2\xb2\xb7v\xfa\x0c\x17\xb64\xbe\x1c}YQ\x00\
-\x00\xf1\xf9b\xd5\x0e\xaf\x07\xe67\xb7\xbc\xdc\xb8\xbc\x5c\
-\xebZ\xb0^;\xbd\x1e\x18}'!\xfa\x7f\xd8\xc6O\
-\xf0\x5ct`\x93\x22`\x87\xd6\x03\xa3G\xfeL\xfe\xb2\
-\x19vj=0\xfa\xd2_\xdb\xe5\xc5\x9em\xbe\x85\xe7\
-\x82\x03\x9b\xabfb\xf6K\xbb\xb7\xe91\xab\xd2\x9e\xc3\
-\xcf\xb7_\xbf^\xe5ug35\xceO?\x9aUT\
-\xb8-\xb7\xb5J\xbb:\x7f\xd9|\xf1b\xf3\x0e|\x87\
-\xc7\x85\x06\xb6\xe2\x96\xc0\xe5\xbe\xc2\x8e}\xbf\xd9\xaa7\
-\xcd]99\xb7\xaa\x86\x86\xff\xd1k\xcd\x96=%p\
-\xfb7\xf2\xb2\x03]\xbf\xd8\xb23\x9c\x99y\xab\xee\xf4\
-\xc0\x93C;\xf4\xbd\x15\x17\x19\xd8\xd2\xa7\x04\xaaG'\
-\xbe\x9a]V\xbe\xa9_\xae*9\xd0\xf3B\x14\x18^\
-c\xb6%f\xa7\xc7\xbf\x9c[U\xf9\xc6f\xff\xd6\xbf\
-giad\x87\xff}\xba\xb8\xc0\xd6\xaaZZ*\xac\
-\x19\x99\xf8\xbb\xe8\xaf\xf3m\xe47\xfe\xd2\xc3G\x7fT\
-\x7f\xee\xfc5\xaf)\xdb-\x1a\xe5IL\x8e<V\xd0\
-P\xff\xeaF~\xe3/?t\xf0'\xcd\xe7\xa6\xff\x22\
-E\x02\xdd\x85\x05\xb6\xf1\x99\xebsK\x8b\x95\x83g\x9e\
-,hm\xfb\xaf\x8f\xfa+\x83\xd9\x15\x95oF?\xf4\
-k\xc7&\x1fk\xbe\xf8\xb1f\xaf\x1f\xa9 Z\x11\xac\
-\x1d\x1a|\xa2xo\xebo\xb3\x0a?\xfc\x0cG\x8f\x16\
-\x96\x1f>\xf8\xe3\xc4\xd8\xd9\xbfmZZ\xe8H\xb1O\
-\xe8\x5cL`\x07\x83`\xf1Ro\xdd\xfc\xf9?\xab\x9d\
-\x99\x7f\xa4nv\xe13\xd1\xa6@\xfd\xe2\xe5\x19_\xec\
-#.\xdaV\x96\x0e5\xcdO\xffi\xd3\xfc\xd4#\xab\
-\xe6\xa6?\xb3\xe7\xc2\xdc\x5cg\x8a?\x96\xea\xe2\x01@\
-\x98\xdf\xd1\xf1\x22\x00\x80\x00\x00\x00\x04\x00\x00 \x00\x00\
-\x00\x01\x00\x00\x08\x00\x00@\x00\x00\x00\x02\x00\x00\x10\x00\
-\x00\x80\x00\x00\x00\x04\x00\x00 \x00\x00\x00\x01\x00\x00\x08\
-\x00\x00@\x00\x00\x00\x02\x00\x00\x10\x00\x00\x80\x17\x01\x00\
-\x04\x00\x00 \x00\x00\x00\x01\x00\x00\x08\x00\x00@\x00\x00\
-\x00\x02\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00 \x00\
-\x00\x00\x01\x00\x00\x08\x00\x00@\x00\x00\x00\x02\x00\x00\x10\
-\x00\x00\x80\x00\x00\x00\x04\x00\x00\x08\x00\x00@\x00\x00\x00\
-\x02\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00\x90\xca\xfe\
-\x07\xe6\xa8\xa9\x0b\x9a7\x1b\xfd\x00\x00\x00\x00IEN\
-D\xaeB`\x82\
-"
-
-qt_resource_name = b"\
-\x00\x08\
-\x08\xcd\x08#\
-\x00p\
-\x00r\x00e\x00v\x00i\x00o\x00u\x00s\
-\x00\x08\
-\x0c\xbb\x0b\xc3\
-\x00s\
-\x00e\x00t\x00t\x00i\x00n\x00g\x00s\
-\x00\x08\
-\x08\xd6\x9d%\
-\x00f\
-\x00a\x00v\x00o\x00r\x00i\x00t\x00e\
-\x00\x06\
-\x07\x8b\x9cT\
-\x00r\
-\x00e\x00c\x00e\x00n\x00t\
-\x00\x04\
-\x00\x07(\xa4\
-\x00l\
-\x00a\x00s\x00t\
-\x00\x05\
-\x00m\x09\xa4\
-\x00f\
-\x00i\x00r\x00s\x00t\
-\x00\x06\
-\x07\x9b\x88\x98\
-\x00s\
-\x00e\x00a\x00r\x00c\x00h\
-\x00\x04\
-\x00\x07L\xf4\
-\x00n\
-\x00e\x00x\x00t\
-\x00\x08\
-\x0c\xf7Y\xc7\
-\x00n\
-\x00e\x00x\x00t\x00.\x00p\x00n\x00g\
-\x00\x0a\
-\x08\x94`G\
-\x00s\
-\x00e\x00a\x00r\x00c\x00h\x00.\x00p\x00n\x00g\
-\x00\x09\
-\x09\xa7\x8dG\
-\x00f\
-\x00i\x00r\x00s\x00t\x00.\x00p\x00n\x00g\
-\x00\x08\
-\x08\xa7Y\x07\
-\x00l\
-\x00a\x00s\x00t\x00.\x00p\x00n\x00g\
-\x00\x0a\
-\x0cX@g\
-\x00r\
-\x00e\x00c\x00e\x00n\x00t\x00.\x00p\x00n\x00g\
-\x00\x0c\
-\x0d9\xfag\
-\x00f\
-\x00a\x00v\x00o\x00r\x00i\x00t\x00e\x00.\x00p\x00n\x00g\
-\x00\x0c\
-\x0b\xdf!G\
-\x00s\
-\x00e\x00t\x00t\x00i\x00n\x00g\x00s\x00.\x00p\x00n\x00g\
-\x00\x0c\
-\x087\xcdG\
-\x00p\
-\x00r\x00e\x00v\x00i\x00o\x00u\x00s\x00.\x00p\x00n\x00g\
-"
-
-qt_resource_struct = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x08\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00T\x00\x02\x00\x00\x00\x01\x00\x00\x00\x10\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x84\x00\x02\x00\x00\x00\x01\x00\x00\x00\x0f\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00b\x00\x02\x00\x00\x00\x01\x00\x00\x00\x0e\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00B\x00\x02\x00\x00\x00\x01\x00\x00\x00\x0d\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00r\x00\x02\x00\x00\x00\x01\x00\x00\x00\x0c\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x0b\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00,\x00\x02\x00\x00\x00\x01\x00\x00\x00\x0a\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x16\x00\x02\x00\x00\x00\x01\x00\x00\x00\x09\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x01(\x00\x00\x00\x00\x00\x01\x00\x00\xdfx\
-\x00\x00\x01\x8f\x06\x04\x0e\xdd\
-\x00\x00\x01\x0a\x00\x00\x00\x00\x00\x01\x00\x00\xbd\xf5\
-\x00\x00\x01\x8f\x06\x03_\x14\
-\x00\x00\x01F\x00\x00\x00\x00\x00\x01\x00\x01\x22S\
-\x00\x00\x01\x8f\x06\x03\xceo\
-\x00\x00\x00\xa8\x00\x00\x00\x00\x00\x01\x00\x00\x12\xd0\
-\x00\x00\x01\x8f\x06\x03\xf7L\
-\x00\x00\x00\xf0\x00\x00\x00\x00\x00\x01\x00\x00u\x07\
-\x00\x00\x01\x8f\x06\x03\xe2J\
-\x00\x00\x00\xc2\x00\x00\x00\x00\x00\x01\x00\x006<\
-\x00\x00\x01\x8f\x06\x03y\xfb\
-\x00\x00\x00\x92\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x8f\x06\x03\xb4\xed\
-\x00\x00\x00\xda\x00\x00\x00\x00\x00\x01\x00\x00P\xc1\
-\x00\x00\x01\x8f\x06\x03\x94\x07\
-"
-
-def qInitResources():
-    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
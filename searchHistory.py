@@ -0,0 +1,29 @@
+from collections.abc import Sequence
+from searchQuery import narrows, parseQuery
+
+class SearchHistory():
+    def __init__(self, limit: int = 16):
+        self.entries: list[tuple[str, list, Sequence]] = [] # (query, exact matches, displayed results), each query narrows the one below it
+        self.limit = limit
+
+    def clear(self):
+        self.entries.clear()
+
+    # Returns the latest entry whose results are a superset of the query results
+    def lookup(self, query: str) -> tuple[str, list, Sequence] | None:
+        if not parseQuery(query):
+            return None
+        while self.entries and not narrows(query, self.entries[-1][0]):
+            self.entries.pop()
+        if not self.entries:
+            return None
+        return self.entries[-1]
+
+    def push(self, query: str, exact: list[tuple[str, list[str]]], results: Sequence[tuple[str, list[str]]]):
+        if not parseQuery(query):
+            return
+        if self.entries and self.entries[-1][0] == query:
+            return
+        self.entries.append((query, exact, results))
+        if len(self.entries) > self.limit:
+            del self.entries[0]
@@ -0,0 +1,228 @@
+from array import array
+from math import log1p
+from kaomojiStore import KaomojiStore
+from tagTable import TagTable
+from bkTree import BKTree
+from searchQuery import QueryTerm, matchesQuery, parseQuery
+from rankedResults import RankedResults
+
+# Relevance of a matched tag, divided by 1 + POSITION_DECAY * its position among the kaomoji tags
+EXACT_HIT = 4.0
+PREFIX_HIT = 2.0
+SUBSTRING_HIT = 1.0
+POSITION_DECAY = 0.25
+USAGE_WEIGHT = 1.0 # per log of the kaomoji frecency
+
+def normalize(text: str) -> str:
+    return text.casefold()
+
+def haystack(tags: list[str]) -> str:
+    return normalize(' '.join(tags))
+
+class SearchIndex():
+    def __init__(self, kaomojis: dict[str, list[str]] | KaomojiStore, haystacks: list[str] | None = None, tagTable: TagTable | None = None):
+        if isinstance(kaomojis, KaomojiStore):
+            # Columns decode from the memory-mapped set on access
+            self.kaomojis = kaomojis.kaomojis
+            self.tags = kaomojis.tagLists
+            self.haystacks = kaomojis.haystacks
+            self.ids = kaomojis.ids
+            tagTable = kaomojis.tagTable
+        else:
+            self.kaomojis: list[str] = list(kaomojis)
+            self.tags: list[list[str]] = list(kaomojis.values())
+            self.haystacks: list[str] = haystacks if haystacks is not None else [haystack(tags) for tags in self.tags] # parallel to kaomojis
+            self.ids: dict[str, int] = {kaomoji: id for id, kaomoji in enumerate(self.kaomojis)}
+
+        if tagTable is None:
+            tagTable = TagTable()
+            for tags in self.tags:
+                tagTable.add(tags)
+        self.tagTable = tagTable
+        self.normalizedTags: list[str] = [normalize(tag) for tag in tagTable.tags]
+
+        trigrams: dict[str, list[int]] = {}
+        for tagId, tag in enumerate(self.normalizedTags):
+            for trigram in {tag[i:i + 3] for i in range(len(tag) - 2)}:
+                trigrams.setdefault(trigram, []).append(tagId)
+        self.trigrams: dict[str, array] = {trigram: array('I', tagIds) for trigram, tagIds in trigrams.items()} # trigram -> sorted tag ids
+
+        postings: list[list[int]] = [[] for tag in tagTable.tags]
+        tagIds, tagStarts = tagTable.tagIds.tolist(), tagTable.tagStarts.tolist()
+        for id in range(len(tagStarts) - 1):
+            for tagId in set(tagIds[tagStarts[id]:tagStarts[id + 1]]):
+                postings[tagId].append(id)
+        self.postings: list[array] = [array('I', ids) for ids in postings] # tag id -> sorted kaomoji ids
+
+        # Built on the first fuzzy search
+        self.words: dict[str, list[int]] | None = None # word of a normalized tag -> tag ids
+        self.wordTree: BKTree | None = None
+
+    def haystack(self, kaomoji: str, tags: list[str]) -> str:
+        id = self.ids.get(kaomoji)
+        if id is None:
+            return haystack(tags)
+        return self.haystacks[id]
+
+    def search(self, query: str) -> list[int]:
+        terms = parseQuery(normalize(query))
+        if not terms:
+            return list(range(len(self.haystacks)))
+
+        # Intersect the terms smallest first, then drop the excluded kaomojis
+        included = sorted((self.termIds(term) for term in terms if not term.negated), key=len)
+        if included:
+            ids = included[0]
+            for termIds in included[1:]:
+                if not ids:
+                    break
+                ids &= termIds
+        else:
+            ids = set(range(len(self.haystacks)))
+        for term in terms:
+            if term.negated and ids:
+                ids -= self.termIds(term)
+        return sorted(ids)
+
+    def termIds(self, term: QueryTerm) -> set[int]:
+        ids = set()
+        for alternative in term.alternatives:
+            ids |= self.substringIds(alternative)
+        return ids
+
+    # Kaomojis whose normalized tags contain the text
+    def substringIds(self, text: str) -> set[int]:
+        ids = set()
+        # A space-free text can only match inside a single tag, so every kaomoji of a matching tag matches
+        if ' ' not in text:
+            for tagId in self.matchingTags(text):
+                ids.update(self.postings[tagId])
+            return ids
+
+        haystacks = self.haystacks
+        fragment = max(text.split(' '), key=len)
+        if not fragment:
+            return {id for id, haystack in enumerate(haystacks) if text in haystack}
+        for tagId in self.matchingTags(fragment):
+            ids.update(self.postings[tagId])
+        return {id for id in ids if text in haystacks[id]}
+
+    # Tag ids whose normalized tag contains the fragment
+    def matchingTags(self, fragment: str) -> list[int]:
+        normalizedTags = self.normalizedTags
+        if len(fragment) < 3:
+            return [tagId for tagId, tag in enumerate(normalizedTags) if fragment in tag]
+
+        # Intersect the tags of every trigram of the fragment, smallest first, then verify
+        postings = []
+        for trigram in {fragment[i:i + 3] for i in range(len(fragment) - 2)}:
+            tagIds = self.trigrams.get(trigram)
+            if tagIds is None:
+                return []
+            postings.append(tagIds)
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for tagIds in postings[1:]:
+            candidates.intersection_update(tagIds)
+            if not candidates:
+                return []
+        return [tagId for tagId in candidates if fragment in normalizedTags[tagId]]
+
+    def results(self, query: str) -> list[tuple[str, list[str]]]:
+        return [(self.kaomojis[id], self.tags[id]) for id in self.search(query)]
+
+    # For tabs holding a subset of the kaomojis (recently used, favorites)
+    def filter(self, query: str, items) -> list[tuple[str, list[str]]]:
+        terms = parseQuery(normalize(query))
+        return [(kaomoji, tags) for kaomoji, tags in items if matchesQuery(terms, self.haystack(kaomoji, tags))]
+
+    # Scores every result: tag hits of each alternative of the included terms, then usage
+    def rank(self, query: str, items: list[tuple[str, list[str]]], usage: dict[str, float], tail: list | None = None) -> RankedResults:
+        terms = parseQuery(normalize(query))
+        hits = [self.tagHits(alternative) for term in terms if not term.negated for alternative in term.alternatives]
+        tagIds = self.tagTable.ids
+
+        def score(item: tuple[str, list[str]]) -> float:
+            kaomoji, tags = item
+            total = 0.0
+            for tagHits in hits:
+                best = 0.0
+                for position, tag in enumerate(tags):
+                    hit = tagHits.get(tagIds.get(tag))
+                    if hit is not None:
+                        best = max(best, hit / (1 + POSITION_DECAY * position))
+                total += best
+            frecency = usage.get(kaomoji)
+            if frecency:
+                total += USAGE_WEIGHT * log1p(frecency)
+            return total
+
+        return RankedResults(items, score, tail)
+
+    # Hit weight of every tag containing the alternative
+    def tagHits(self, alternative: str) -> dict[int, float]:
+        fragment = max(alternative.split(' '), key=len)
+        if not fragment:
+            return {}
+        hits = {}
+        for tagId in self.matchingTags(fragment):
+            tag = self.normalizedTags[tagId]
+            if tag == alternative:
+                hits[tagId] = EXACT_HIT
+            elif tag.startswith(alternative) or ' ' + alternative in tag:
+                hits[tagId] = PREFIX_HIT
+            elif alternative in tag:
+                hits[tagId] = SUBSTRING_HIT
+        return hits
+
+    # The word of a query made of a single plain word, the only queries matched fuzzily
+    def fuzzyWord(self, query: str) -> str | None:
+        terms = parseQuery(normalize(query))
+        if len(terms) != 1 or terms[0].negated or len(terms[0].alternatives) != 1 or ' ' in terms[0].alternatives[0]:
+            return None
+        return terms[0].alternatives[0]
+
+    # Tag words within the edit distance of the word, with their distance
+    def fuzzyWords(self, word: str | None, distance: int) -> dict[str, int]:
+        if distance <= 0 or not word:
+            return {}
+        if self.wordTree is None:
+            words: dict[str, list[int]] = {}
+            for tagId, tag in enumerate(self.normalizedTags):
+                for tagWord in set(tag.split(' ')):
+                    words.setdefault(tagWord, []).append(tagId)
+            self.words = words
+            self.wordTree = BKTree(words)
+        return {tagWord: wordDistance for wordDistance, tagWord in self.wordTree.search(word, distance)}
+
+    # Kaomojis only matching the query within the edit distance, closest first.
+    # Exact matches are left out, they are already part of the regular results
+    def fuzzy(self, query: str, distance: int) -> list[int]:
+        word = self.fuzzyWord(query)
+        haystacks = self.haystacks
+        best: dict[int, int] = {}
+        for tagWord, wordDistance in self.fuzzyWords(word, distance).items():
+            for tagId in self.words[tagWord]:
+                for id in self.postings[tagId]:
+                    if wordDistance < best.get(id, distance + 1) and word not in haystacks[id]:
+                        best[id] = wordDistance
+        return sorted(best, key=lambda id: (best[id], id))
+
+    def fuzzyResults(self, query: str, distance: int) -> list[tuple[str, list[str]]]:
+        return [(self.kaomojis[id], self.tags[id]) for id in self.fuzzy(query, distance)]
+
+    def fuzzyFilter(self, query: str, distance: int, items) -> list[tuple[str, list[str]]]:
+        word = self.fuzzyWord(query)
+        words = self.fuzzyWords(word, distance)
+        if not words:
+            return []
+        matches = []
+        for kaomoji, tags in items:
+            text = self.haystack(kaomoji, tags)
+            if word in text:
+                continue
+            distances = [words[textWord] for textWord in text.split(' ') if textWord in words]
+            if distances:
+                matches.append((min(distances), kaomoji, tags))
+        matches.sort(key=lambda match: match[0])
+        return [(kaomoji, tags) for wordDistance, kaomoji, tags in matches]
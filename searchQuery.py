@@ -0,0 +1,49 @@
+import re
+from functools import lru_cache
+from typing import NamedTuple
+
+# Query syntax: terms separated by spaces must all match, "-term" excludes,
+# "a|b" matches either alternative and "..." matches a phrase including spaces
+TERM = re.compile(r'(-?)(?:"([^"]*)"?|(\S+))')
+LAST_WORD = re.compile(r'(.*[\s|"]-?|-?)([^\s|"]*)', re.DOTALL)
+
+class QueryTerm(NamedTuple):
+    negated: bool
+    alternatives: tuple[str, ...] # substrings of the normalized tags, any of them matches
+
+    def matches(self, text: str) -> bool:
+        return any(alternative in text for alternative in self.alternatives)
+
+    # Whether every kaomoji matching this term also matches the other one
+    def implies(self, other: 'QueryTerm') -> bool:
+        if self.negated or other.negated:
+            return self == other
+        return all(any(alternative in own for alternative in other.alternatives) for own in self.alternatives)
+
+@lru_cache(maxsize=64)
+def parseQuery(query: str) -> tuple[QueryTerm, ...]:
+    terms = []
+    for match in TERM.finditer(query):
+        negated, phrase, word = match.groups()
+        if phrase is not None:
+            alternatives = (phrase,) if phrase else ()
+        elif word == '-':
+            continue # exclusion still being typed
+        else:
+            alternatives = tuple(alternative for alternative in word.split('|') if alternative)
+        if alternatives:
+            terms.append(QueryTerm(bool(negated), alternatives))
+    return tuple(terms)
+
+# Splits the query before the word being typed, for completion
+def splitLastWord(query: str) -> tuple[str, str]:
+    head, word = LAST_WORD.fullmatch(query).groups()
+    return head, word
+
+def matchesQuery(terms: tuple[QueryTerm, ...], text: str) -> bool:
+    return all(term.matches(text) != term.negated for term in terms)
+
+# Whether the results of the query are a subset of the previous query results
+def narrows(query: str, previous: str) -> bool:
+    terms = parseQuery(query)
+    return all(any(term.implies(previousTerm) for term in terms) for previousTerm in parseQuery(previous))
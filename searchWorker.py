@@ -0,0 +1,23 @@
+from typing import Callable
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+class SearchSignals(QObject):
+    finished = Signal(int, object, str, object, object) # generation, tab data, query, exact matches, displayed results
+
+class SearchWorker(QRunnable):
+    def __init__(self, signals: SearchSignals, generation: int, isCurrent: Callable[[int], bool], data, query: str, search: Callable[[], tuple[list, list]]):
+        super().__init__()
+        self.signals = signals
+        self.generation = generation
+        self.isCurrent = isCurrent
+        self.data = data
+        self.query = query
+        self.search = search
+
+    def run(self):
+        # Drop queries that were superseded while waiting in the pool
+        if not self.isCurrent(self.generation):
+            return
+        exact, results = self.search()
+        if self.isCurrent(self.generation):
+            self.signals.finished.emit(self.generation, self.data, self.query, exact, results)
@@ -0,0 +1,45 @@
+from PySide6.QtCore import QSettings
+from keybinds import Keybinds, DEFAULT_KEY_SEQUENCES
+
+class Settings():
+    def __init__(self):
+        self.settings = QSettings('KaomojiHelper', 'KaomojiHelper')
+
+    @property
+    def pagination(self) -> bool:
+        return self.settings.value('pagination', True, type=bool)
+
+    @pagination.setter
+    def pagination(self, enabled: bool):
+        self.settings.setValue('pagination', enabled)
+
+    @property
+    def fuzzyDistance(self) -> int:
+        return self.settings.value('fuzzyDistance', 0, type=int)
+
+    @fuzzyDistance.setter
+    def fuzzyDistance(self, distance: int):
+        self.settings.setValue('fuzzyDistance', distance)
+
+    @property
+    def pasteInsertion(self) -> bool:
+        return self.settings.value('pasteInsertion', False, type=bool)
+
+    @pasteInsertion.setter
+    def pasteInsertion(self, enabled: bool):
+        self.settings.setValue('pasteInsertion', enabled)
+
+    # Qt portable text, empty when unbound
+    def keySequence(self, keybind: Keybinds) -> str:
+        return self.settings.value(f'keybinds/{keybind.name}', DEFAULT_KEY_SEQUENCES[keybind], type=str)
+
+    def setKeySequence(self, keybind: Keybinds, keySequence: str):
+        self.settings.setValue(f'keybinds/{keybind.name}', keySequence)
+
+    @property
+    def mappedStore(self) -> bool:
+        return self.settings.value('mappedStore', False, type=bool)
+
+    @mappedStore.setter
+    def mappedStore(self, enabled: bool):
+        self.settings.setValue('mappedStore', enabled)
@@ -0,0 +1,338 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'settingsTab.ui'
+##
+## Created by: Qt User Interface Compiler version 6.7.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QCheckBox, QComboBox, QFontComboBox,
+    QFrame, QGroupBox, QHBoxLayout, QKeySequenceEdit,
+    QLabel, QLineEdit, QPushButton, QScrollArea,
+    QSizePolicy, QSpinBox, QToolButton, QVBoxLayout,
+    QWidget)
+
+class Ui_SettingsTab(object):
+    def setupUi(self, SettingsTab):
+        if not SettingsTab.objectName():
+            SettingsTab.setObjectName(u"SettingsTab")
+        self.verticalLayout_9 = QVBoxLayout(SettingsTab)
+        self.verticalLayout_9.setObjectName(u"verticalLayout_9")
+        self.SettingsScrollArea = QScrollArea(SettingsTab)
+        self.SettingsScrollArea.setObjectName(u"SettingsScrollArea")
+        self.SettingsScrollArea.setFrameShadow(QFrame.Sunken)
+        self.SettingsScrollArea.setWidgetResizable(True)
+        self.scrollAreaWidgetContents = QWidget()
+        self.scrollAreaWidgetContents.setObjectName(u"scrollAreaWidgetContents")
+        self.scrollAreaWidgetContents.setGeometry(QRect(0, 0, 537, 533))
+        self.verticalLayout_14 = QVBoxLayout(self.scrollAreaWidgetContents)
+        self.verticalLayout_14.setObjectName(u"verticalLayout_14")
+        self.GeneralGroupBox = QGroupBox(self.scrollAreaWidgetContents)
+        self.GeneralGroupBox.setObjectName(u"GeneralGroupBox")
+        self.verticalLayout_12 = QVBoxLayout(self.GeneralGroupBox)
+        self.verticalLayout_12.setObjectName(u"verticalLayout_12")
+        self.KaomojiSetHorizontalLayout = QHBoxLayout()
+        self.KaomojiSetHorizontalLayout.setObjectName(u"KaomojiSetHorizontalLayout")
+        self.KaomojiSetLabel = QLabel(self.GeneralGroupBox)
+        self.KaomojiSetLabel.setObjectName(u"KaomojiSetLabel")
+
+        self.KaomojiSetHorizontalLayout.addWidget(self.KaomojiSetLabel)
+
+        self.KaomojiSetLineEdit = QLineEdit(self.GeneralGroupBox)
+        self.KaomojiSetLineEdit.setObjectName(u"KaomojiSetLineEdit")
+        self.KaomojiSetLineEdit.setReadOnly(True)
+
+        self.KaomojiSetHorizontalLayout.addWidget(self.KaomojiSetLineEdit)
+
+        self.KaomojiSetButton = QToolButton(self.GeneralGroupBox)
+        self.KaomojiSetButton.setObjectName(u"KaomojiSetButton")
+
+        self.KaomojiSetHorizontalLayout.addWidget(self.KaomojiSetButton)
+
+
+        self.verticalLayout_12.addLayout(self.KaomojiSetHorizontalLayout)
+
+        self.DefaultTabHorizontalLayout = QHBoxLayout()
+        self.DefaultTabHorizontalLayout.setObjectName(u"DefaultTabHorizontalLayout")
+        self.DefaultTabLabel = QLabel(self.GeneralGroupBox)
+        self.DefaultTabLabel.setObjectName(u"DefaultTabLabel")
+
+        self.DefaultTabHorizontalLayout.addWidget(self.DefaultTabLabel)
+
+        self.DefaultTabComboBox = QComboBox(self.GeneralGroupBox)
+        self.DefaultTabComboBox.setObjectName(u"DefaultTabComboBox")
+
+        self.DefaultTabHorizontalLayout.addWidget(self.DefaultTabComboBox)
+
+
+        self.verticalLayout_12.addLayout(self.DefaultTabHorizontalLayout)
+
+        self.FuzzyDistanceHorizontalLayout = QHBoxLayout()
+        self.FuzzyDistanceHorizontalLayout.setObjectName(u"FuzzyDistanceHorizontalLayout")
+        self.FuzzyDistanceLabel = QLabel(self.GeneralGroupBox)
+        self.FuzzyDistanceLabel.setObjectName(u"FuzzyDistanceLabel")
+
+        self.FuzzyDistanceHorizontalLayout.addWidget(self.FuzzyDistanceLabel)
+
+        self.FuzzyDistanceSpinBox = QSpinBox(self.GeneralGroupBox)
+        self.FuzzyDistanceSpinBox.setObjectName(u"FuzzyDistanceSpinBox")
+        self.FuzzyDistanceSpinBox.setMaximum(3)
+
+        self.FuzzyDistanceHorizontalLayout.addWidget(self.FuzzyDistanceSpinBox)
+
+
+        self.verticalLayout_12.addLayout(self.FuzzyDistanceHorizontalLayout)
+
+        self.LaunchAtStartupCheckbox = QCheckBox(self.GeneralGroupBox)
+        self.LaunchAtStartupCheckbox.setObjectName(u"LaunchAtStartupCheckbox")
+
+        self.verticalLayout_12.addWidget(self.LaunchAtStartupCheckbox)
+
+        self.ClearSearchEntryCheckbox = QCheckBox(self.GeneralGroupBox)
+        self.ClearSearchEntryCheckbox.setObjectName(u"ClearSearchEntryCheckbox")
+
+        self.verticalLayout_12.addWidget(self.ClearSearchEntryCheckbox)
+
+        self.PaginationCheckbox = QCheckBox(self.GeneralGroupBox)
+        self.PaginationCheckbox.setObjectName(u"PaginationCheckbox")
+        self.PaginationCheckbox.setChecked(True)
+
+        self.verticalLayout_12.addWidget(self.PaginationCheckbox)
+
+        self.MappedStoreCheckbox = QCheckBox(self.GeneralGroupBox)
+        self.MappedStoreCheckbox.setObjectName(u"MappedStoreCheckbox")
+
+        self.verticalLayout_12.addWidget(self.MappedStoreCheckbox)
+
+        self.PasteInsertionCheckbox = QCheckBox(self.GeneralGroupBox)
+        self.PasteInsertionCheckbox.setObjectName(u"PasteInsertionCheckbox")
+
+        self.verticalLayout_12.addWidget(self.PasteInsertionCheckbox)
+
+
+        self.verticalLayout_14.addWidget(self.GeneralGroupBox)
+
+        self.AppearanceGroupBox = QGroupBox(self.scrollAreaWidgetContents)
+        self.AppearanceGroupBox.setObjectName(u"AppearanceGroupBox")
+        self.verticalLayout_11 = QVBoxLayout(self.AppearanceGroupBox)
+        self.verticalLayout_11.setObjectName(u"verticalLayout_11")
+        self.ThemeHorizontalLayout = QHBoxLayout()
+        self.ThemeHorizontalLayout.setObjectName(u"ThemeHorizontalLayout")
+        self.ThemeLabel = QLabel(self.AppearanceGroupBox)
+        self.ThemeLabel.setObjectName(u"ThemeLabel")
+
+        self.ThemeHorizontalLayout.addWidget(self.ThemeLabel)
+
+        self.ThemeComboBox = QComboBox(self.AppearanceGroupBox)
+        self.ThemeComboBox.setObjectName(u"ThemeComboBox")
+
+        self.ThemeHorizontalLayout.addWidget(self.ThemeComboBox)
+
+
+        self.verticalLayout_11.addLayout(self.ThemeHorizontalLayout)
+
+        self.FontHorizontalLayout = QHBoxLayout()
+        self.FontHorizontalLayout.setObjectName(u"FontHorizontalLayout")
+        self.FontLabel = QLabel(self.AppearanceGroupBox)
+        self.FontLabel.setObjectName(u"FontLabel")
+
+        self.FontHorizontalLayout.addWidget(self.FontLabel)
+
+        self.FontComboBox = QFontComboBox(self.AppearanceGroupBox)
+        self.FontComboBox.setObjectName(u"FontComboBox")
+
+        self.FontHorizontalLayout.addWidget(self.FontComboBox)
+
+
+        self.verticalLayout_11.addLayout(self.FontHorizontalLayout)
+
+        self.FontColorHorizontalLayout = QHBoxLayout()
+        self.FontColorHorizontalLayout.setObjectName(u"FontColorHorizontalLayout")
+        self.FontColorLabel = QLabel(self.AppearanceGroupBox)
+        self.FontColorLabel.setObjectName(u"FontColorLabel")
+
+        self.FontColorHorizontalLayout.addWidget(self.FontColorLabel)
+
+        self.FontColorButton = QPushButton(self.AppearanceGroupBox)
+        self.FontColorButton.setObjectName(u"FontColorButton")
+
+        self.FontColorHorizontalLayout.addWidget(self.FontColorButton)
+
+
+        self.verticalLayout_11.addLayout(self.FontColorHorizontalLayout)
+
+
+        self.verticalLayout_14.addWidget(self.AppearanceGroupBox)
+
+        self.MiscellaneousGroupBox = QGroupBox(self.scrollAreaWidgetContents)
+        self.MiscellaneousGroupBox.setObjectName(u"MiscellaneousGroupBox")
+        self.verticalLayout_13 = QVBoxLayout(self.MiscellaneousGroupBox)
+        self.verticalLayout_13.setObjectName(u"verticalLayout_13")
+        self.ShowSoundHorizontalLayout = QHBoxLayout()
+        self.ShowSoundHorizontalLayout.setObjectName(u"ShowSoundHorizontalLayout")
+        self.ShowSoundLabel = QLabel(self.MiscellaneousGroupBox)
+        self.ShowSoundLabel.setObjectName(u"ShowSoundLabel")
+        self.ShowSoundLabel.setMinimumSize(QSize(74, 0))
+
+        self.ShowSoundHorizontalLayout.addWidget(self.ShowSoundLabel)
+
+        self.ShowSoundLineEdit = QLineEdit(self.MiscellaneousGroupBox)
+        self.ShowSoundLineEdit.setObjectName(u"ShowSoundLineEdit")
+        self.ShowSoundLineEdit.setReadOnly(True)
+
+        self.ShowSoundHorizontalLayout.addWidget(self.ShowSoundLineEdit)
+
+        self.ShowSoundButton = QToolButton(self.MiscellaneousGroupBox)
+        self.ShowSoundButton.setObjectName(u"ShowSoundButton")
+
+        self.ShowSoundHorizontalLayout.addWidget(self.ShowSoundButton)
+
+
+        self.verticalLayout_13.addLayout(self.ShowSoundHorizontalLayout)
+
+        self.HideSoundHorizontalLayout = QHBoxLayout()
+        self.HideSoundHorizontalLayout.setObjectName(u"HideSoundHorizontalLayout")
+        self.HideSoundLabel = QLabel(self.MiscellaneousGroupBox)
+        self.HideSoundLabel.setObjectName(u"HideSoundLabel")
+        self.HideSoundLabel.setMinimumSize(QSize(74, 0))
+
+        self.HideSoundHorizontalLayout.addWidget(self.HideSoundLabel)
+
+        self.HideSoundLineEdit = QLineEdit(self.MiscellaneousGroupBox)
+        self.HideSoundLineEdit.setObjectName(u"HideSoundLineEdit")
+        self.HideSoundLineEdit.setReadOnly(True)
+
+        self.HideSoundHorizontalLayout.addWidget(self.HideSoundLineEdit)
+
+        self.HideSoundButton = QToolButton(self.MiscellaneousGroupBox)
+        self.HideSoundButton.setObjectName(u"HideSoundButton")
+
+        self.HideSoundHorizontalLayout.addWidget(self.HideSoundButton)
+
+
+        self.verticalLayout_13.addLayout(self.HideSoundHorizontalLayout)
+
+
+        self.verticalLayout_14.addWidget(self.MiscellaneousGroupBox)
+
+        self.KeybindsGroupBox = QGroupBox(self.scrollAreaWidgetContents)
+        self.KeybindsGroupBox.setObjectName(u"KeybindsGroupBox")
+        self.verticalLayout_10 = QVBoxLayout(self.KeybindsGroupBox)
+        self.verticalLayout_10.setObjectName(u"verticalLayout_10")
+        self.ShowWindowHorizontalLayout = QHBoxLayout()
+        self.ShowWindowHorizontalLayout.setObjectName(u"ShowWindowHorizontalLayout")
+        self.ShowWindowLabel = QLabel(self.KeybindsGroupBox)
+        self.ShowWindowLabel.setObjectName(u"ShowWindowLabel")
+        self.ShowWindowLabel.setMinimumSize(QSize(74, 0))
+
+        self.ShowWindowHorizontalLayout.addWidget(self.ShowWindowLabel)
+
+        self.ShowWindowKeySequence = QKeySequenceEdit(self.KeybindsGroupBox)
+        self.ShowWindowKeySequence.setObjectName(u"ShowWindowKeySequence")
+
+        self.ShowWindowHorizontalLayout.addWidget(self.ShowWindowKeySequence)
+
+
+        self.verticalLayout_10.addLayout(self.ShowWindowHorizontalLayout)
+
+        self.HideWindowHorizontalLayout = QHBoxLayout()
+        self.HideWindowHorizontalLayout.setObjectName(u"HideWindowHorizontalLayout")
+        self.HideWindowLabel = QLabel(self.KeybindsGroupBox)
+        self.HideWindowLabel.setObjectName(u"HideWindowLabel")
+        self.HideWindowLabel.setMinimumSize(QSize(74, 0))
+
+        self.HideWindowHorizontalLayout.addWidget(self.HideWindowLabel)
+
+        self.HideWindowKeySequence = QKeySequenceEdit(self.KeybindsGroupBox)
+        self.HideWindowKeySequence.setObjectName(u"HideWindowKeySequence")
+
+        self.HideWindowHorizontalLayout.addWidget(self.HideWindowKeySequence)
+
+
+        self.verticalLayout_10.addLayout(self.HideWindowHorizontalLayout)
+
+        self.PreviousPageHorizontalLayout = QHBoxLayout()
+        self.PreviousPageHorizontalLayout.setObjectName(u"PreviousPageHorizontalLayout")
+        self.PreviousPageLabel = QLabel(self.KeybindsGroupBox)
+        self.PreviousPageLabel.setObjectName(u"PreviousPageLabel")
+        self.PreviousPageLabel.setMinimumSize(QSize(74, 0))
+
+        self.PreviousPageHorizontalLayout.addWidget(self.PreviousPageLabel)
+
+        self.PreviousPageKeySequence = QKeySequenceEdit(self.KeybindsGroupBox)
+        self.PreviousPageKeySequence.setObjectName(u"PreviousPageKeySequence")
+
+        self.PreviousPageHorizontalLayout.addWidget(self.PreviousPageKeySequence)
+
+
+        self.verticalLayout_10.addLayout(self.PreviousPageHorizontalLayout)
+
+        self.NextPageHorizontalLayout = QHBoxLayout()
+        self.NextPageHorizontalLayout.setObjectName(u"NextPageHorizontalLayout")
+        self.NextPageLabel = QLabel(self.KeybindsGroupBox)
+        self.NextPageLabel.setObjectName(u"NextPageLabel")
+        self.NextPageLabel.setMinimumSize(QSize(74, 0))
+
+        self.NextPageHorizontalLayout.addWidget(self.NextPageLabel)
+
+        self.NextPageKeySequence = QKeySequenceEdit(self.KeybindsGroupBox)
+        self.NextPageKeySequence.setObjectName(u"NextPageKeySequence")
+
+        self.NextPageHorizontalLayout.addWidget(self.NextPageKeySequence)
+
+
+        self.verticalLayout_10.addLayout(self.NextPageHorizontalLayout)
+
+
+        self.verticalLayout_14.addWidget(self.KeybindsGroupBox)
+
+        self.SettingsScrollArea.setWidget(self.scrollAreaWidgetContents)
+
+        self.verticalLayout_9.addWidget(self.SettingsScrollArea)
+
+
+        self.retranslateUi(SettingsTab)
+
+        QMetaObject.connectSlotsByName(SettingsTab)
+    # setupUi
+
+    def retranslateUi(self, SettingsTab):
+        self.GeneralGroupBox.setTitle(QCoreApplication.translate("SettingsTab", u"General", None))
+        self.KaomojiSetLabel.setText(QCoreApplication.translate("SettingsTab", u"Kaomoji set", None))
+        self.KaomojiSetButton.setText(QCoreApplication.translate("SettingsTab", u"...", None))
+        self.DefaultTabLabel.setText(QCoreApplication.translate("SettingsTab", u"Default tab", None))
+        self.FuzzyDistanceLabel.setText(QCoreApplication.translate("SettingsTab", u"Typo tolerance", None))
+        self.FuzzyDistanceSpinBox.setSpecialValueText(QCoreApplication.translate("SettingsTab", u"Off", None))
+        self.FuzzyDistanceSpinBox.setSuffix(QCoreApplication.translate("SettingsTab", u" typo(s)", None))
+        self.LaunchAtStartupCheckbox.setText(QCoreApplication.translate("SettingsTab", u"Launch at startup", None))
+        self.ClearSearchEntryCheckbox.setText(QCoreApplication.translate("SettingsTab", u"Clear search entry upon clicking on a kaomoji", None))
+        self.PaginationCheckbox.setText(QCoreApplication.translate("SettingsTab", u"Split results into pages", None))
+        self.MappedStoreCheckbox.setText(QCoreApplication.translate("SettingsTab", u"Keep the kaomoji set memory-mapped (applies on restart)", None))
+        self.PasteInsertionCheckbox.setText(QCoreApplication.translate("SettingsTab", u"Insert kaomojis by pasting from the clipboard", None))
+        self.AppearanceGroupBox.setTitle(QCoreApplication.translate("SettingsTab", u"Appearance", None))
+        self.ThemeLabel.setText(QCoreApplication.translate("SettingsTab", u"Theme", None))
+        self.FontLabel.setText(QCoreApplication.translate("SettingsTab", u"Font", None))
+        self.FontColorLabel.setText(QCoreApplication.translate("SettingsTab", u"Font color", None))
+        self.FontColorButton.setText(QCoreApplication.translate("SettingsTab", u"Change color", None))
+        self.MiscellaneousGroupBox.setTitle(QCoreApplication.translate("SettingsTab", u"Miscellaneous", None))
+        self.ShowSoundLabel.setText(QCoreApplication.translate("SettingsTab", u"Show sound", None))
+        self.ShowSoundButton.setText(QCoreApplication.translate("SettingsTab", u"...", None))
+        self.HideSoundLabel.setText(QCoreApplication.translate("SettingsTab", u"Hide sound", None))
+        self.HideSoundButton.setText(QCoreApplication.translate("SettingsTab", u"...", None))
+        self.KeybindsGroupBox.setTitle(QCoreApplication.translate("SettingsTab", u"Keybinds", None))
+        self.ShowWindowLabel.setText(QCoreApplication.translate("SettingsTab", u"Show window", None))
+        self.HideWindowLabel.setText(QCoreApplication.translate("SettingsTab", u"Hide window", None))
+        self.PreviousPageLabel.setText(QCoreApplication.translate("SettingsTab", u"Previous page", None))
+        self.NextPageLabel.setText(QCoreApplication.translate("SettingsTab", u"Next page", None))
+        pass
+    # retranslateUi
+
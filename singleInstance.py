@@ -0,0 +1,71 @@
+import argparse
+import getpass
+import json
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtNetwork import QLocalServer, QLocalSocket
+
+# One instance per user, later invocations hand their command over a local socket
+# as a JSON array per line: ['show'], ['search', query] or ['insert', kaomoji id]
+SERVER_NAME = f'KaomojiHelper-{getpass.getuser()}'
+TIMEOUT = 500 # ms
+
+def parseArguments(argv: list[str]) -> tuple[argparse.Namespace, list[str]]:
+    parser = argparse.ArgumentParser(description="Search and insert kaomojis.")
+    parser.add_argument('--resident', action='store_true', help="keep running in the tray with the window hidden until the hotkey is pressed")
+    parser.add_argument('--profile-startup', action='store_true', help="print the time spent in each import and startup phase")
+    commands = parser.add_mutually_exclusive_group()
+    commands.add_argument('--show', dest='command', action='store_const', const=['show'], help="show the window (default)")
+    commands.add_argument('--search', dest='command', metavar='QUERY', type=lambda query: ['search', query], help="show the window searching for the query")
+    commands.add_argument('--insert', dest='command', metavar='ID', type=lambda id: ['insert', int(id)], help="insert the kaomoji with this id into the focused application")
+    arguments, qtArguments = parser.parse_known_args(argv)
+    if arguments.command is None and not arguments.resident:
+        arguments.command = ['show']
+    return arguments, qtArguments
+
+# Returns False when no instance is running. Without a command it only checks for one
+def sendCommand(command: list | None) -> bool:
+    socket = QLocalSocket()
+    socket.connectToServer(SERVER_NAME)
+    if not socket.waitForConnected(TIMEOUT):
+        return False
+    if command is not None:
+        socket.write((json.dumps(command) + '\n').encode('utf-8'))
+        socket.waitForBytesWritten(TIMEOUT)
+    socket.disconnectFromServer()
+    return True
+
+class InstanceServer(QObject):
+    commandReceived = Signal(list)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.server = QLocalServer(self)
+        self.server.newConnection.connect(self.newConnection)
+
+    # Returns False when another instance holds the name, e.g. one started at the same time
+    def listen(self) -> bool:
+        if self.server.listen(SERVER_NAME):
+            return True
+        socket = QLocalSocket()
+        socket.connectToServer(SERVER_NAME)
+        if socket.waitForConnected(TIMEOUT):
+            socket.disconnectFromServer()
+            return False
+        # Nobody answers, left behind by an instance that crashed
+        QLocalServer.removeServer(SERVER_NAME)
+        return self.server.listen(SERVER_NAME)
+
+    def newConnection(self):
+        while (socket := self.server.nextPendingConnection()) is not None:
+            socket.readyRead.connect(lambda socket=socket: self.read(socket))
+            socket.disconnected.connect(lambda socket=socket: (self.read(socket), socket.deleteLater()))
+            self.read(socket) # the command may have arrived with the connection
+
+    def read(self, socket: QLocalSocket):
+        while socket.canReadLine():
+            try:
+                command = json.loads(bytes(socket.readLine()))
+            except ValueError:
+                continue
+            if isinstance(command, list) and command and isinstance(command[0], str):
+                self.commandReceived.emit(command)
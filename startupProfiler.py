@@ -0,0 +1,73 @@
+import builtins
+import sys
+import time
+from contextlib import contextmanager
+
+# --profile-startup: times the imports made while it runs and named startup phases,
+# then prints them to stderr once the event loop is reached
+class StartupProfiler():
+    def __init__(self):
+        self.enabled: bool = False
+        self.timing: bool = False
+        self.started: float = 0.0
+        self.imports: list[list] = [] # [depth, module, seconds], in the order they started
+        self.phases: list[tuple[str, float]] = []
+        self.depth: int = 0
+        self.originalImport = None
+
+    def start(self):
+        if self.enabled:
+            return
+        self.enabled = True
+        self.timing = True
+        self.started = time.perf_counter()
+        self.originalImport = builtins.__import__
+        builtins.__import__ = self.timedImport
+
+    def timedImport(self, name, globals=None, locals=None, fromlist=(), level=0):
+        # Modules already loaded and relative imports cost nothing worth reporting on their own
+        if not self.timing or level or name in sys.modules:
+            return self.originalImport(name, globals, locals, fromlist, level)
+        entry = [self.depth, name, 0.0]
+        self.imports.append(entry)
+        self.depth += 1
+        start = time.perf_counter()
+        try:
+            return self.originalImport(name, globals, locals, fromlist, level)
+        finally:
+            entry[2] = time.perf_counter() - start
+            self.depth -= 1
+
+    @contextmanager
+    def phase(self, name: str):
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - start))
+
+    def stop(self):
+        self.timing = False
+        # PySide6 wraps __import__ in turn, only unhook when nothing was layered on top
+        if builtins.__import__ == self.timedImport:
+            builtins.__import__ = self.originalImport
+
+    def report(self, file=sys.stderr, maxDepth: int = 1):
+        if not self.enabled:
+            return
+        total = time.perf_counter() - self.started
+        self.stop()
+        print("Startup profile (ms, nested imports included in their parent)", file=file)
+        print("Imports:", file=file)
+        for depth, name, seconds in self.imports:
+            if depth <= maxDepth:
+                print(f"  {seconds * 1000:9.1f}  {'  ' * depth}{name}", file=file)
+        print("Phases:", file=file)
+        for name, seconds in self.phases:
+            print(f"  {seconds * 1000:9.1f}  {name}", file=file)
+        print(f"  {total * 1000:9.1f}  until the event loop", file=file)
+
+profiler = StartupProfiler()
@@ -1,18 +1,36 @@
-from PySide6.QtGui import QStandardItemModel
+from collections.abc import Sequence
 from PySide6.QtWidgets import (
     QLabel,
     QTableView
 )
+from searchIndex import SearchIndex
+from kaomojiStore import KaomojiStore
+from searchHistory import SearchHistory
+from kaomojiTableModel import KaomojiTableModel
 
 class TabData():
     def __init__(self, tab=None):
         self.list = {}
-        self.results: list[tuple[str, list[str]]] = []
-        self.model = QStandardItemModel()
+        self.index: SearchIndex | None = None
+        self.history = SearchHistory()
+        self.results: Sequence[tuple[str, list[str]]] = [] # a list, or RankedResults for the Search tab
+        self.model = KaomojiTableModel(self)
         self.currentPage: int = 1
         self.resultsPerPage: int = 10
+        self.pagination: bool = True # otherwise the table view scrolls through every result
         self.limit: int = 100
         self.tab = tab
-        self.label: QLabel = QLabel()
+        self.label: QLabel | None = None # None until the tab is built
         self.searchQuery = str()
-        self.tableView = QTableView()
\ No newline at end of file
+        self.stale: bool = False # results outdated by a settings change, searched again when the tab is opened
+        self.tableView: QTableView | None = None
+        self.listResults: Sequence[tuple[str, list[str]]] | None = None # results of the empty query, built once per list change
+
+    # Every kaomoji of the list, the results of the empty query
+    def allResults(self) -> Sequence[tuple[str, list[str]]]:
+        if self.listResults is None:
+            self.listResults = self.list.sequence if isinstance(self.list, KaomojiStore) else list(self.list.items())
+        return self.listResults
+
+    def listChanged(self):
+        self.listResults = None
\ No newline at end of file
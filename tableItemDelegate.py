@@ -1,12 +1,16 @@
+from collections import OrderedDict
 from PySide6.QtCore import QPersistentModelIndex, QSize, Qt, QEvent, Signal, QModelIndex
 from PySide6.QtWidgets import QStyleOptionViewItem, QStyledItemDelegate
 from PySide6.QtGui import QMouseEvent, QFontMetrics
 
 class TableItemDelegate(QStyledItemDelegate):
     kaomojiClicked = Signal(QModelIndex)
+    sizeHintCacheLimit: int = 4096
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.sizeHintCache: OrderedDict[tuple[str, str, int], QSize] = OrderedDict() # (text, font, column width) -> size, least recently used first
+        self.sizeHintFont: str = ''
 
     def editorEvent(self, event, model, option, index):
         if event.type() == QEvent.Type.MouseButtonRelease:
@@ -19,13 +23,30 @@ class TableItemDelegate(QStyledItemDelegate):
 
     def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex | QPersistentModelIndex) -> QSize:
         kaomoji = index.data(Qt.ItemDataRole.DisplayRole)
+        column_width = option.rect.width()
+        font = option.font.key()
+        if font != self.sizeHintFont:
+            self.sizeHintCache.clear()
+            self.sizeHintFont = font
+
+        # Sizes measured for another column width are left to be evicted
+        key = (kaomoji, font, column_width)
+        size = self.sizeHintCache.get(key)
+        if size is not None:
+            self.sizeHintCache.move_to_end(key)
+            return QSize(size)
+
         opt = option
         self.initStyleOption(opt, index)
         
         font_metrics = QFontMetrics(opt.font)
         text_width = font_metrics.horizontalAdvance(kaomoji)
-        column_width = option.rect.width()
         num_lines = text_width // column_width + 1
         font_height = font_metrics.height()
         height = num_lines * font_height
-        return QSize(option.rect.width(), height)
\ No newline at end of file
+        size = QSize(column_width, height)
+
+        self.sizeHintCache[key] = size
+        if len(self.sizeHintCache) > self.sizeHintCacheLimit:
+            self.sizeHintCache.popitem(last=False)
+        return QSize(size)
\ No newline at end of file
@@ -0,0 +1,30 @@
+from bisect import bisect_left
+from heapq import nlargest
+from searchIndex import SearchIndex
+
+class TagCompleter():
+    shortPrefixLength: int = 2 # top tags of prefixes up to this length are kept once computed
+
+    def __init__(self, index: SearchIndex):
+        # Distinct normalized tags sorted for bisect, with the number of kaomojis using them
+        counts: dict[str, int] = {}
+        for tag, count in zip(index.normalizedTags, index.tagTable.counts):
+            counts[tag] = counts.get(tag, 0) + count
+        self.tags: list[str] = sorted(counts)
+        self.counts: list[int] = [counts[tag] for tag in self.tags]
+        self.cache: dict[tuple[str, int], list[str]] = {}
+
+    def complete(self, prefix: str, limit: int = 10) -> list[str]:
+        key = (prefix, limit)
+        if key in self.cache:
+            return self.cache[key]
+
+        start = bisect_left(self.tags, prefix)
+        end = bisect_left(self.tags, prefix + '\U0010ffff', start)
+        counts = self.counts
+        best = nlargest(limit, range(start, end), key=counts.__getitem__)
+        completions = [self.tags[position] for position in best]
+
+        if len(prefix) <= self.shortPrefixLength:
+            self.cache[key] = completions
+        return completions
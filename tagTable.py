@@ -0,0 +1,32 @@
+from array import array
+
+# Dictionary encoding of the tags of a kaomoji set: every distinct tag is stored
+# once and kaomojis refer to it by id through flat uint32 arrays
+class TagTable():
+    def __init__(self, tags: list[str] | None = None, tagStarts=None, tagIds=None):
+        self.tags: list[str] = tags if tags is not None else []
+        self.ids: dict[str, int] = {tag: tagId for tagId, tag in enumerate(self.tags)}
+        self.tagStarts = tagStarts if tagStarts is not None else array('I', [0]) # first entry in tagIds of each kaomoji
+        self.tagIds = tagIds if tagIds is not None else array('I')
+        self.counts: list[int] = [0] * len(self.tags) # kaomojis using each tag
+        for tagId in self.tagIds:
+            self.counts[tagId] += 1
+
+    def __len__(self) -> int:
+        return len(self.tags)
+
+    # Appends the tags of the next kaomoji, returning them as the shared tag strings
+    def add(self, tags: list[str]) -> list[str]:
+        interned = []
+        for tag in tags:
+            tagId = self.ids.get(tag)
+            if tagId is None:
+                tagId = len(self.tags)
+                self.ids[tag] = tagId
+                self.tags.append(tag)
+                self.counts.append(0)
+            self.counts[tagId] += 1
+            self.tagIds.append(tagId)
+            interned.append(self.tags[tagId])
+        self.tagStarts.append(len(self.tagIds))
+        return interned